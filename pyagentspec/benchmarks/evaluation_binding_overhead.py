@@ -0,0 +1,217 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+"""
+Micro-benchmark measuring the per-call overhead of binding samples to evaluation metrics.
+
+The suite compares, on a cheap ``ExactBinaryMatchMetric`` computed on samples with extra
+features, the binding plan that metrics and intermediates compute once at construction
+(``compiled``) with the former binding that inspected the signature of ``compute_metric`` on
+every call (``legacy``). It measures the binding alone, full metric calls, and the
+``compute_metric`` call that they wrap as a baseline. No network access is needed.
+
+Results are printed (or written to ``--output``) as a JSON document, so that they can be
+compared across commits, e.g.::
+
+    python benchmarks/evaluation_binding_overhead.py --iterations 20000 --output results.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pyagentspec.evaluation._utils import _bind_kwargs_to_func, _map_names
+from pyagentspec.evaluation.metrics.implementations import ExactBinaryMatchMetric
+
+BenchmarkResult = Dict[str, Any]
+
+
+class _LegacyArgumentsBinder:
+    """Binding of the arguments as done before the binding plans, on every call."""
+
+    def __init__(self, f: Callable[..., Any], input_mapping: Optional[Dict[str, str]]) -> None:
+        self.f = f
+        self.input_mapping = input_mapping
+
+    def bind(self, *args: Any, **kwargs: Any) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        if self.input_mapping is not None:
+            kwargs = _map_names(kwargs, self.input_mapping)
+        bound_args = _bind_kwargs_to_func(self.f, *args, **kwargs)
+        return bound_args.args, bound_args.kwargs
+
+
+class _LegacyExactBinaryMatchMetric(ExactBinaryMatchMetric):
+    def _get_arguments_binder(self) -> Any:
+        return _LegacyArgumentsBinder(self.compute_metric, self.input_mapping)
+
+
+def _build_sample(num_extra_features: int) -> Dict[str, Any]:
+    sample: Dict[str, Any] = {"expected_answer": "The Answer", "answer": "the answer"}
+    sample.update({f"feature_{i}": f"value {i}" for i in range(num_extra_features)})
+    return sample
+
+
+def _build_metric(metric_class: type) -> ExactBinaryMatchMetric:
+    return metric_class(  # type: ignore[no-any-return]
+        ignore_case=True,
+        reference_feature_name="expected_answer",
+        response_feature_name="answer",
+    )
+
+
+def _summarize(name: str, durations_ns: List[int], **parameters: Any) -> BenchmarkResult:
+    sorted_durations = sorted(durations_ns)
+    return {
+        "benchmark": name,
+        "status": "ok",
+        "parameters": parameters,
+        "iterations": len(sorted_durations),
+        "mean_ns": statistics.fmean(sorted_durations),
+        "median_ns": statistics.median(sorted_durations),
+        "p95_ns": sorted_durations[
+            min(len(sorted_durations) - 1, int(len(sorted_durations) * 0.95))
+        ],
+        "min_ns": sorted_durations[0],
+        "max_ns": sorted_durations[-1],
+    }
+
+
+def _measure(function: Callable[[], Any], iterations: int, warmup: int) -> List[int]:
+    for _ in range(warmup):
+        function()
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        function()
+        durations.append(time.perf_counter_ns() - start)
+    return durations
+
+
+async def _measure_async(function: Callable[[], Any], iterations: int, warmup: int) -> List[int]:
+    for _ in range(warmup):
+        await function()
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        await function()
+        durations.append(time.perf_counter_ns() - start)
+    return durations
+
+
+def benchmark_binding(
+    iterations: int, warmup: int, num_extra_features: int
+) -> List[BenchmarkResult]:
+    sample = _build_sample(num_extra_features)
+    results = []
+    for variant, metric_class in (
+        ("legacy", _LegacyExactBinaryMatchMetric),
+        ("compiled", ExactBinaryMatchMetric),
+    ):
+        metric = _build_metric(metric_class)
+
+        def bind() -> None:
+            metric._get_arguments_binder().bind(**sample)
+
+        results.append(
+            _summarize(
+                f"binding/{variant}",
+                _measure(bind, iterations, warmup),
+                num_extra_features=num_extra_features,
+            )
+        )
+    return results
+
+
+def benchmark_metric_call(
+    iterations: int, warmup: int, num_extra_features: int
+) -> List[BenchmarkResult]:
+    sample = _build_sample(num_extra_features)
+
+    async def run() -> List[BenchmarkResult]:
+        baseline_metric = _build_metric(ExactBinaryMatchMetric)
+
+        async def compute_metric() -> None:
+            await baseline_metric.compute_metric(reference="The Answer", response="the answer")
+
+        results = [
+            _summarize(
+                "compute_metric/baseline",
+                await _measure_async(compute_metric, iterations, warmup),
+                num_extra_features=num_extra_features,
+            )
+        ]
+        for variant, metric_class in (
+            ("legacy", _LegacyExactBinaryMatchMetric),
+            ("compiled", ExactBinaryMatchMetric),
+        ):
+            metric = _build_metric(metric_class)
+
+            async def call_metric() -> None:
+                await metric(**sample)
+
+            results.append(
+                _summarize(
+                    f"metric_call/{variant}",
+                    await _measure_async(call_metric, iterations, warmup),
+                    num_extra_features=num_extra_features,
+                )
+            )
+        return results
+
+    return asyncio.run(run())
+
+
+def run_benchmarks(iterations: int, num_extra_features: int, warmup: int) -> Dict[str, Any]:
+    """Run the whole benchmark suite and return its results as a JSON-serializable dictionary."""
+    results: List[BenchmarkResult] = []
+    results.extend(benchmark_binding(iterations, warmup, num_extra_features))
+    results.extend(benchmark_metric_call(iterations, warmup, num_extra_features))
+    return {
+        "suite": "pyagentspec.evaluation.binding",
+        "environment": {
+            "python_version": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--iterations", type=int, default=10000, help="Iterations of the micro-benchmarks"
+    )
+    parser.add_argument(
+        "--extra-features",
+        type=int,
+        default=8,
+        help="Features of the samples that the metric does not use",
+    )
+    parser.add_argument("--warmup", type=int, default=100, help="Untimed iterations run first")
+    parser.add_argument("--output", type=str, default=None, help="JSON file to write results to")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        iterations=args.iterations,
+        num_extra_features=args.extra_features,
+        warmup=args.warmup,
+    )
+    serialized_results = json.dumps(results, indent=2)
+    if args.output is None:
+        sys.stdout.write(serialized_results + "\n")
+    else:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(serialized_results + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,451 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+"""
+Offline benchmark suite measuring the overhead of Agent Spec Tracing.
+
+The suite measures the per-span and per-event cost of the tracing primitives
+(``Span.start``/``Span.end``/``Span.add_event``, the serialization of every event type,
+the manipulation of the active span stack) and of the framework callback bridges,
+driven by a fake LLM streaming a configurable number of tokens. No network access is needed.
+
+Results are printed (or written to ``--output``) as a JSON document, so that they can be
+compared across commits, e.g.::
+
+    python benchmarks/tracing_overhead.py --iterations 2000 --tokens 256 --output results.json
+
+Benchmarks that need an optional dependency that is not installed (LangGraph, CrewAI)
+are reported with ``"status": "skipped"``.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from pyagentspec.agent import Agent
+from pyagentspec.flows.edges import ControlFlowEdge
+from pyagentspec.flows.flow import Flow
+from pyagentspec.flows.nodes import EndNode, StartNode
+from pyagentspec.llms import OpenAiConfig
+from pyagentspec.managerworkers import ManagerWorkers
+from pyagentspec.property import StringProperty
+from pyagentspec.swarm import Swarm
+from pyagentspec.tools import ServerTool
+from pyagentspec.tracing.events import (
+    AgentExecutionEnd,
+    AgentExecutionStart,
+    Event,
+    ExceptionRaised,
+    FlowExecutionEnd,
+    FlowExecutionStart,
+    HumanInTheLoopRequest,
+    HumanInTheLoopResponse,
+    LlmGenerationChunkReceived,
+    LlmGenerationRequest,
+    LlmGenerationResponse,
+    ManagerWorkersExecutionEnd,
+    ManagerWorkersExecutionStart,
+    NodeExecutionEnd,
+    NodeExecutionStart,
+    StateSnapshotEmitted,
+    SwarmExecutionEnd,
+    SwarmExecutionStart,
+    ToolConfirmationRequest,
+    ToolConfirmationResponse,
+    ToolExecutionRequest,
+    ToolExecutionResponse,
+    ToolExecutionStreamingChunkReceived,
+)
+from pyagentspec.tracing.messages.message import Message
+from pyagentspec.tracing.spanprocessor import SpanProcessor
+from pyagentspec.tracing.spans import AgentExecutionSpan, Span
+from pyagentspec.tracing.spans.span import _append_span_to_active_stack, _pop_span_from_active_stack
+from pyagentspec.tracing.trace import Trace
+
+BenchmarkResult = Dict[str, Any]
+
+
+class _NoOpSpanProcessor(SpanProcessor):
+    """SpanProcessor that does nothing, used to measure the cost of the dispatch itself."""
+
+    def on_start(self, span: Span) -> None:
+        pass
+
+    async def on_start_async(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: Span) -> None:
+        pass
+
+    async def on_end_async(self, span: Span) -> None:
+        pass
+
+    def on_event(self, event: Event, span: Span) -> None:
+        pass
+
+    async def on_event_async(self, event: Event, span: Span) -> None:
+        pass
+
+    def startup(self) -> None:
+        pass
+
+    async def startup_async(self) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        pass
+
+    async def shutdown_async(self) -> None:
+        pass
+
+
+def _summarize(name: str, durations_ns: List[int], **parameters: Any) -> BenchmarkResult:
+    sorted_durations = sorted(durations_ns)
+    return {
+        "benchmark": name,
+        "status": "ok",
+        "parameters": parameters,
+        "iterations": len(sorted_durations),
+        "mean_ns": statistics.fmean(sorted_durations),
+        "median_ns": statistics.median(sorted_durations),
+        "p95_ns": sorted_durations[
+            min(len(sorted_durations) - 1, int(len(sorted_durations) * 0.95))
+        ],
+        "min_ns": sorted_durations[0],
+        "max_ns": sorted_durations[-1],
+    }
+
+
+def _skipped(name: str, reason: str) -> BenchmarkResult:
+    return {"benchmark": name, "status": "skipped", "reason": reason}
+
+
+def _measure(function: Callable[[], Any], iterations: int, warmup: int) -> List[int]:
+    for _ in range(warmup):
+        function()
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        function()
+        durations.append(time.perf_counter_ns() - start)
+    return durations
+
+
+async def _measure_async(function: Callable[[], Any], iterations: int, warmup: int) -> List[int]:
+    for _ in range(warmup):
+        await function()
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        await function()
+        durations.append(time.perf_counter_ns() - start)
+    return durations
+
+
+def _build_sample_events() -> List[Event]:
+    llm_config = OpenAiConfig(name="benchmark_llm", model_id="benchmark-model")
+    tool = ServerTool(
+        name="benchmark_tool",
+        inputs=[StringProperty(title="query")],
+        outputs=[StringProperty(title="result")],
+    )
+    agent = Agent(name="benchmark_agent", llm_config=llm_config, system_prompt="Be brief.")
+    other_agent = Agent(name="other_agent", llm_config=llm_config, system_prompt="Be kind.")
+    start_node, end_node = StartNode(name="start"), EndNode(name="end")
+    flow = Flow(
+        name="benchmark_flow",
+        start_node=start_node,
+        nodes=[start_node, end_node],
+        control_flow_connections=[
+            ControlFlowEdge(name="start_to_end", from_node=start_node, to_node=end_node)
+        ],
+    )
+    managerworkers = ManagerWorkers(
+        name="benchmark_managerworkers", group_manager=agent, workers=[other_agent]
+    )
+    swarm = Swarm(name="benchmark_swarm", first_agent=agent, relationships=[(agent, other_agent)])
+    prompt = [Message(content="What is the weather like today?", role="user")]
+    payload = {"query": "weather", "result": "sunny"}
+    return [
+        Event(name="benchmark_event"),
+        ExceptionRaised(exception_type="ValueError", exception_message="benchmark"),
+        AgentExecutionStart(agent=agent, inputs=payload),
+        AgentExecutionEnd(agent=agent, outputs=payload),
+        FlowExecutionStart(flow=flow, inputs=payload),
+        FlowExecutionEnd(flow=flow, outputs=payload, branch_selected="next"),
+        NodeExecutionStart(node=start_node, inputs=payload),
+        NodeExecutionEnd(node=end_node, outputs=payload, branch_selected="next"),
+        ManagerWorkersExecutionStart(managerworkers=managerworkers, inputs=payload),
+        ManagerWorkersExecutionEnd(managerworkers=managerworkers, outputs=payload),
+        SwarmExecutionStart(swarm=swarm, inputs=payload),
+        SwarmExecutionEnd(swarm=swarm, outputs=payload),
+        HumanInTheLoopRequest(request_id="request", content=payload),
+        HumanInTheLoopResponse(request_id="request", content=payload),
+        LlmGenerationRequest(llm_config=llm_config, prompt=prompt, tools=[tool], request_id="r"),
+        LlmGenerationResponse(llm_config=llm_config, content="It is sunny.", request_id="r"),
+        LlmGenerationChunkReceived(llm_config=llm_config, content="It", request_id="r"),
+        StateSnapshotEmitted(conversation_id="conversation", state_snapshot=payload),
+        ToolExecutionRequest(tool=tool, inputs=payload, request_id="t"),
+        ToolExecutionResponse(tool=tool, outputs=payload, request_id="t"),
+        ToolExecutionStreamingChunkReceived(tool=tool, content="sun", request_id="t"),
+        ToolConfirmationRequest(tool=tool, request_id="c"),
+        ToolConfirmationResponse(tool=tool, execution_confirmed=True, request_id="c"),
+    ]
+
+
+def benchmark_span_lifecycle(iterations: int, warmup: int) -> List[BenchmarkResult]:
+    results = []
+    for number_of_processors in (0, 1, 4):
+        processors: List[SpanProcessor] = [
+            _NoOpSpanProcessor() for _ in range(number_of_processors)
+        ]
+        with Trace(span_processors=processors):
+
+            def start_and_end_span() -> None:
+                span = Span(name="benchmark_span")
+                span.start()
+                span.end()
+
+            def add_event() -> None:
+                span.add_event(Event(name="benchmark_event"))
+
+            results.append(
+                _summarize(
+                    "span.start_end",
+                    _measure(start_and_end_span, iterations, warmup),
+                    span_processors=number_of_processors,
+                )
+            )
+            with Span(name="benchmark_span") as span:
+                results.append(
+                    _summarize(
+                        "span.add_event",
+                        _measure(add_event, iterations, warmup),
+                        span_processors=number_of_processors,
+                    )
+                )
+    return results
+
+
+def benchmark_span_lifecycle_async(iterations: int, warmup: int) -> List[BenchmarkResult]:
+    async def run() -> List[BenchmarkResult]:
+        results = []
+        for number_of_processors in (0, 1, 4):
+            processors: List[SpanProcessor] = [
+                _NoOpSpanProcessor() for _ in range(number_of_processors)
+            ]
+            async with Trace(span_processors=processors):
+
+                async def start_and_end_span() -> None:
+                    span = Span(name="benchmark_span")
+                    await span.start_async()
+                    await span.end_async()
+
+                async def add_event() -> None:
+                    await span.add_event_async(Event(name="benchmark_event"))
+
+                results.append(
+                    _summarize(
+                        "span.start_end_async",
+                        await _measure_async(start_and_end_span, iterations, warmup),
+                        span_processors=number_of_processors,
+                    )
+                )
+                async with Span(name="benchmark_span") as span:
+                    results.append(
+                        _summarize(
+                            "span.add_event_async",
+                            await _measure_async(add_event, iterations, warmup),
+                            span_processors=number_of_processors,
+                        )
+                    )
+        return results
+
+    return asyncio.run(run())
+
+
+def benchmark_event_serialization(iterations: int, warmup: int) -> List[BenchmarkResult]:
+    results = []
+    for event in _build_sample_events():
+        for mask_sensitive_information in (True, False):
+            results.append(
+                _summarize(
+                    "event.model_dump",
+                    _measure(
+                        lambda: event.model_dump(
+                            mask_sensitive_information=mask_sensitive_information
+                        ),
+                        iterations,
+                        warmup,
+                    ),
+                    event_type=type(event).__name__,
+                    mask_sensitive_information=mask_sensitive_information,
+                )
+            )
+    return results
+
+
+def benchmark_active_span_stack(iterations: int, warmup: int) -> List[BenchmarkResult]:
+    results = []
+    span = Span(name="benchmark_span")
+    for depth in (1, 16):
+        for _ in range(depth - 1):
+            _append_span_to_active_stack(span)
+
+        def push_and_pop() -> None:
+            _append_span_to_active_stack(span)
+            _pop_span_from_active_stack()
+
+        results.append(
+            _summarize(
+                "active_span_stack.push_pop",
+                _measure(push_and_pop, iterations, warmup),
+                stack_depth=depth,
+            )
+        )
+        for _ in range(depth - 1):
+            _pop_span_from_active_stack()
+    return results
+
+
+def benchmark_langgraph_bridge(iterations: int, warmup: int, tokens: int) -> List[BenchmarkResult]:
+    name = "langgraph.llm_stream"
+    try:
+        from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+        from langchain_core.messages import AIMessage
+
+        from pyagentspec.adapters.langgraph.tracing import AgentSpecLlmCallbackHandler
+    except ImportError as e:
+        return [_skipped(name, f"LangGraph is not installed: {e}")]
+
+    llm_config = OpenAiConfig(name="benchmark_llm", model_id="benchmark-model")
+    # The fake chat model streams the content split on whitespaces, one chunk per token
+    content = " ".join(["token"] * tokens)
+
+    def build_llm(with_tracing: bool) -> Any:
+        return GenericFakeChatModel(
+            messages=iter([AIMessage(content=content)]),
+            callbacks=[AgentSpecLlmCallbackHandler(llm_config)] if with_tracing else [],
+        )
+
+    results = []
+    for with_tracing in (False, True):
+
+        def stream_tokens() -> None:
+            llm = build_llm(with_tracing)
+            with Trace(span_processors=[_NoOpSpanProcessor()]):
+                for _ in llm.stream("benchmark"):
+                    pass
+
+        results.append(
+            _summarize(
+                name,
+                _measure(stream_tokens, iterations, warmup),
+                tokens=tokens,
+                tracing=with_tracing,
+            )
+        )
+    return results
+
+
+def benchmark_crewai_bridge(iterations: int, warmup: int, tokens: int) -> List[BenchmarkResult]:
+    name = "crewai.llm_stream"
+    try:
+        from crewai.events.types.llm_events import (
+            LLMCallCompletedEvent,
+            LLMCallStartedEvent,
+            LLMCallType,
+            LLMStreamChunkEvent,
+        )
+
+        from pyagentspec.adapters.crewai.tracing import _CrewAiEventListener
+    except ImportError as e:
+        return [_skipped(name, f"CrewAI is not installed: {e}")]
+
+    llm_config = OpenAiConfig(name="benchmark_llm", model_id="benchmark-model")
+    agent = Agent(name="benchmark_agent", llm_config=llm_config, system_prompt="Be brief.")
+    messages = [{"role": "user", "content": "benchmark"}]
+
+    def stream_tokens() -> None:
+        with Trace(span_processors=[_NoOpSpanProcessor()]):
+            with AgentExecutionSpan(agent=agent):
+                # The listener captures the active span stack when it is created
+                listener = _CrewAiEventListener({id(llm_config): llm_config, id(agent): agent})
+                listener._add_event_and_handle_events_list(
+                    LLMCallStartedEvent(messages=messages, model=llm_config.model_id)
+                )
+                for _ in range(tokens):
+                    listener._add_event_and_handle_events_list(LLMStreamChunkEvent(chunk="token"))
+                listener._add_event_and_handle_events_list(
+                    LLMCallCompletedEvent(
+                        messages=messages,
+                        response="token",
+                        call_type=LLMCallType.LLM_CALL,
+                        model=llm_config.model_id,
+                    )
+                )
+
+    return [_summarize(name, _measure(stream_tokens, iterations, warmup), tokens=tokens)]
+
+
+def run_benchmarks(
+    iterations: int, tokens: int, bridge_iterations: int, warmup: int
+) -> Dict[str, Any]:
+    """Run the whole benchmark suite and return its results as a JSON-serializable dictionary."""
+    results: List[BenchmarkResult] = []
+    results.extend(benchmark_span_lifecycle(iterations, warmup))
+    results.extend(benchmark_span_lifecycle_async(iterations, warmup))
+    results.extend(benchmark_event_serialization(iterations, warmup))
+    results.extend(benchmark_active_span_stack(iterations, warmup))
+    results.extend(benchmark_langgraph_bridge(bridge_iterations, warmup, tokens))
+    results.extend(benchmark_crewai_bridge(bridge_iterations, warmup, tokens))
+    return {
+        "suite": "pyagentspec.tracing",
+        "environment": {
+            "python_version": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--iterations", type=int, default=1000, help="Iterations of the micro-benchmarks"
+    )
+    parser.add_argument(
+        "--bridge-iterations", type=int, default=20, help="Iterations of the bridge benchmarks"
+    )
+    parser.add_argument(
+        "--tokens", type=int, default=128, help="Tokens streamed by the fake LLM in the bridges"
+    )
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed iterations run first")
+    parser.add_argument("--output", type=str, default=None, help="JSON file to write results to")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        iterations=args.iterations,
+        tokens=args.tokens,
+        bridge_iterations=args.bridge_iterations,
+        warmup=args.warmup,
+    )
+    serialized_results = json.dumps(results, indent=2)
+    if args.output is None:
+        sys.stdout.write(serialized_results + "\n")
+    else:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(serialized_results + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+"""Backoff delays between the attempts following a ``RetryPolicy``."""
+
+from secrets import SystemRandom
+from typing import Optional
+
+from pyagentspec.retrypolicy import RetryPolicy
+
+_JITTER_RANDOM = SystemRandom()
+
+
+def _compute_wait_seconds(
+    retry_policy: RetryPolicy, attempt_num: int, status_code: Optional[int]
+) -> float:
+    """Compute exponential backoff with the configured jitter strategy."""
+    base = min(
+        float(retry_policy.initial_retry_delay)
+        * (float(retry_policy.backoff_factor) ** attempt_num),
+        float(retry_policy.max_retry_delay),
+    )
+
+    jitter = retry_policy.jitter
+    if jitter is None:
+        return base
+    if retry_policy.jitter == "equal":
+        return base / 2.0 + _JITTER_RANDOM.random() * (base / 2.0)
+    if jitter == "full":
+        return _JITTER_RANDOM.random() * base
+    if (
+        jitter == "full_and_equal_for_throttle"
+        and status_code is not None
+        and 400 <= status_code < 500
+    ):
+        return base / 2.0 + _JITTER_RANDOM.random() * (base / 2.0)
+    if jitter == "full_and_equal_for_throttle":
+        return _JITTER_RANDOM.random() * base
+    if jitter == "decorrelated":
+        return min(base + _JITTER_RANDOM.random(), float(retry_policy.max_retry_delay))
+    return base
@@ -1,22 +1,24 @@
-# Copyright © 2025 Oracle and/or its affiliates.
+# Copyright © 2025, 2026 Oracle and/or its affiliates.
 #
 # This software is under the Apache License 2.0
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+import asyncio
 import ssl
 import time
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
-from secrets import SystemRandom
-from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Mapping, Optional
 
 from pyagentspec._lazy_loader import LazyLoader
+from pyagentspec._retrybackoff import _compute_wait_seconds
 from pyagentspec.adapters._url_validation import (
     maybe_warn_about_unrestricted_templated_url,
     validate_url_against_allow_list,
 )
 from pyagentspec.adapters._utils import render_nested_object_template, render_template
+from pyagentspec.adapters.httpclientpool import HttpClientPool, get_default_http_client_pool
 from pyagentspec.retrypolicy import RetryPolicy
 from pyagentspec.tools.remotetool import RemoteTool as AgentSpecRemoteTool
 
@@ -25,12 +27,13 @@ if TYPE_CHECKING:
 else:
     httpx = LazyLoader("httpx")
 
-_JITTER_RANDOM = SystemRandom()
 _DEFAULT_TOTAL_ELAPSED_TIME_SECONDS = 600.0
 _MAX_RETRY_AFTER_SECONDS = 30.0
 
 
-def _create_remote_tool_func(remote_tool: AgentSpecRemoteTool) -> Callable[..., Any]:
+def _create_remote_tool_func(
+    remote_tool: AgentSpecRemoteTool, http_client_pool: Optional[HttpClientPool] = None
+) -> Callable[..., Any]:
     maybe_warn_about_unrestricted_templated_url(
         url=remote_tool.url,
         url_allow_list=remote_tool.url_allow_list,
@@ -38,53 +41,30 @@ def _create_remote_tool_func(remote_tool: AgentSpecRemoteTool) -> Callable[...,
     )
 
     def _remote_tool(**kwargs: Any) -> Any:
-        remote_tool_data = render_nested_object_template(remote_tool.data, kwargs)
-        remote_tool_headers = {
-            render_template(k, kwargs): render_nested_object_template(v, kwargs)
-            for k, v in remote_tool.headers.items()
-        }
-        remote_tool_query_params = {
-            render_template(k, kwargs): render_nested_object_template(v, kwargs)
-            for k, v in remote_tool.query_params.items()
-        }
-        remote_tool_url = render_template(remote_tool.url, kwargs)
-
-        content_type_headers = remote_tool_headers.get("Content-Type") or remote_tool_headers.get(
-            "content-type"
-        )
-        expect_urlencoded_form_data = (
-            ("application/x-www-form-urlencoded" in content_type_headers)
-            if content_type_headers is not None
-            else False
-        )
-        data = None
-        json_data = None
-        content = None
-        if isinstance(remote_tool_data, dict) and expect_urlencoded_form_data:
-            data = remote_tool_data
-        elif isinstance(remote_tool_data, (str, bytes)):
-            content = remote_tool_data
-        else:
-            json_data = remote_tool_data
-
-        validate_url_against_allow_list(remote_tool_url, remote_tool.url_allow_list)
-
-        request_kwargs = {
-            "method": remote_tool.http_method,
-            "url": remote_tool_url,
-            "params": remote_tool_query_params,
-            "headers": remote_tool_headers,
-            "data": data,
-            "json": json_data,
-            "content": content,
-        }
-        if (
-            remote_tool.retry_policy is not None
-            and remote_tool.retry_policy.request_timeout is not None
-        ):
-            request_kwargs["timeout"] = httpx.Timeout(remote_tool.retry_policy.request_timeout)
+        request_kwargs = _build_remote_tool_request_kwargs(remote_tool, kwargs)
+        response = _request_with_retry(remote_tool.retry_policy, request_kwargs, http_client_pool)
+        if remote_tool.retry_policy is not None and not response.is_success:
+            response.raise_for_status()
+        return response.json()
+
+    return _remote_tool
 
-        response = _request_with_retry(remote_tool.retry_policy, request_kwargs)
+
+def _create_async_remote_tool_func(
+    remote_tool: AgentSpecRemoteTool, http_client_pool: Optional[HttpClientPool] = None
+) -> Callable[..., Awaitable[Any]]:
+    """
+    Async counterpart of ``_create_remote_tool_func``, that does not block during retries.
+
+    It is meant to be created together with the sync callable, which already warns about
+    unrestricted templated URLs.
+    """
+
+    async def _remote_tool(**kwargs: Any) -> Any:
+        request_kwargs = _build_remote_tool_request_kwargs(remote_tool, kwargs)
+        response = await _arequest_with_retry(
+            remote_tool.retry_policy, request_kwargs, http_client_pool
+        )
         if remote_tool.retry_policy is not None and not response.is_success:
             response.raise_for_status()
         return response.json()
@@ -92,74 +72,179 @@ def _create_remote_tool_func(remote_tool: AgentSpecRemoteTool) -> Callable[...,
     return _remote_tool
 
 
+def _build_remote_tool_request_kwargs(
+    remote_tool: AgentSpecRemoteTool, inputs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Render the request of a RemoteTool call with the given inputs."""
+    remote_tool_data = render_nested_object_template(remote_tool.data, inputs)
+    remote_tool_headers = {
+        render_template(k, inputs): render_nested_object_template(v, inputs)
+        for k, v in remote_tool.headers.items()
+    }
+    remote_tool_query_params = {
+        render_template(k, inputs): render_nested_object_template(v, inputs)
+        for k, v in remote_tool.query_params.items()
+    }
+    remote_tool_url = render_template(remote_tool.url, inputs)
+
+    content_type_headers = remote_tool_headers.get("Content-Type") or remote_tool_headers.get(
+        "content-type"
+    )
+    expect_urlencoded_form_data = (
+        ("application/x-www-form-urlencoded" in content_type_headers)
+        if content_type_headers is not None
+        else False
+    )
+    data = None
+    json_data = None
+    content = None
+    if isinstance(remote_tool_data, dict) and expect_urlencoded_form_data:
+        data = remote_tool_data
+    elif isinstance(remote_tool_data, (str, bytes)):
+        content = remote_tool_data
+    else:
+        json_data = remote_tool_data
+
+    validate_url_against_allow_list(remote_tool_url, remote_tool.url_allow_list)
+
+    request_kwargs = {
+        "method": remote_tool.http_method,
+        "url": remote_tool_url,
+        "params": remote_tool_query_params,
+        "headers": remote_tool_headers,
+        "data": data,
+        "json": json_data,
+        "content": content,
+    }
+    if (
+        remote_tool.retry_policy is not None
+        and remote_tool.retry_policy.request_timeout is not None
+    ):
+        request_kwargs["timeout"] = httpx.Timeout(remote_tool.retry_policy.request_timeout)
+    return request_kwargs
+
+
 def _request_with_retry(
-    retry_policy: Optional[RetryPolicy], request_kwargs: dict[str, Any]
+    retry_policy: Optional[RetryPolicy],
+    request_kwargs: dict[str, Any],
+    http_client_pool: Optional[HttpClientPool] = None,
 ) -> "httpx.Response":
     """Execute an HTTP request with retry-policy handling."""
+    if http_client_pool is None:
+        http_client_pool = get_default_http_client_pool()
+    client = http_client_pool.get_client(request_kwargs["url"])
     if retry_policy is None:
-        return httpx.request(**request_kwargs)
+        return client.request(**request_kwargs)
 
     total_attempts = retry_policy.max_attempts + 1
-    previous_wait_time_seconds: Optional[float] = None
     time_started = time.monotonic()
 
     for request_attempt_num in range(total_attempts):
         try:
-            response = httpx.request(**request_kwargs)
+            response = client.request(**request_kwargs)
         except httpx.TransportError as exc:
-            if _is_tls_or_cert_error(exc) or request_attempt_num >= total_attempts - 1:
-                raise
-
-            wait_time_seconds = _compute_wait_before_next_attempt(
-                policy=retry_policy,
-                attempt_num=request_attempt_num,
-                status_code=None,
-                retry_after_value=None,
-                previous_wait_seconds=previous_wait_time_seconds,
-                time_started=time_started,
-                elapsed_time_seconds_fn=time.monotonic,
-                total_elapsed_time_seconds=_DEFAULT_TOTAL_ELAPSED_TIME_SECONDS,
+            wait_time_seconds = _get_wait_after_transport_error(
+                retry_policy, exc, request_attempt_num, time_started
             )
             if wait_time_seconds is None:
                 raise
-            previous_wait_time_seconds = wait_time_seconds
-            # RemoteTool execution is currently exposed as a synchronous callable across
-            # adapters, so retry backoff blocks until async RemoteTool support is consistent.
             time.sleep(wait_time_seconds)
             continue
 
-        if response.is_success:
+        wait_time_seconds = _get_wait_after_response(
+            retry_policy, response, request_attempt_num, time_started
+        )
+        if wait_time_seconds is None:
             return response
+        response.close()
+        time.sleep(wait_time_seconds)
 
-        response_error_text = _get_response_error_text(response)
-        if request_attempt_num >= total_attempts - 1 or not _is_retryable_http_error(
-            retry_policy,
-            response.status_code,
-            response_error_text,
-        ):
-            return response
+    raise RuntimeError("Request failed after retry attempts were exhausted.")
+
+
+async def _arequest_with_retry(
+    retry_policy: Optional[RetryPolicy],
+    request_kwargs: dict[str, Any],
+    http_client_pool: Optional[HttpClientPool] = None,
+) -> "httpx.Response":
+    """Execute an HTTP request with retry-policy handling, without blocking the event loop."""
+    if http_client_pool is None:
+        http_client_pool = get_default_http_client_pool()
+    client = http_client_pool.get_async_client(request_kwargs["url"])
+    if retry_policy is None:
+        return await client.request(**request_kwargs)
+
+    total_attempts = retry_policy.max_attempts + 1
+    time_started = time.monotonic()
+
+    for request_attempt_num in range(total_attempts):
+        try:
+            response = await client.request(**request_kwargs)
+        except httpx.TransportError as exc:
+            wait_time_seconds = _get_wait_after_transport_error(
+                retry_policy, exc, request_attempt_num, time_started
+            )
+            if wait_time_seconds is None:
+                raise
+            await asyncio.sleep(wait_time_seconds)
+            continue
 
-        wait_time_seconds = _compute_wait_before_next_attempt(
-            policy=retry_policy,
-            attempt_num=request_attempt_num,
-            status_code=response.status_code,
-            retry_after_value=_get_retry_after_value_from_headers(response.headers),
-            previous_wait_seconds=previous_wait_time_seconds,
-            time_started=time_started,
-            elapsed_time_seconds_fn=time.monotonic,
-            total_elapsed_time_seconds=_DEFAULT_TOTAL_ELAPSED_TIME_SECONDS,
+        wait_time_seconds = _get_wait_after_response(
+            retry_policy, response, request_attempt_num, time_started
         )
         if wait_time_seconds is None:
             return response
-        previous_wait_time_seconds = wait_time_seconds
-        response.close()
-        # RemoteTool execution is currently exposed as a synchronous callable across
-        # adapters, so retry backoff blocks until async RemoteTool support is consistent.
-        time.sleep(wait_time_seconds)
+        await response.aclose()
+        await asyncio.sleep(wait_time_seconds)
 
     raise RuntimeError("Request failed after retry attempts were exhausted.")
 
 
+def _get_wait_after_transport_error(
+    retry_policy: RetryPolicy, exc: BaseException, attempt_num: int, time_started: float
+) -> Optional[float]:
+    """Return the delay before retrying a request that raised, or None if it must not be retried."""
+    if _is_tls_or_cert_error(exc) or attempt_num >= retry_policy.max_attempts:
+        return None
+    return _compute_wait_before_next_attempt(
+        policy=retry_policy,
+        attempt_num=attempt_num,
+        status_code=None,
+        retry_after_value=None,
+        previous_wait_seconds=None,
+        time_started=time_started,
+        elapsed_time_seconds_fn=time.monotonic,
+        total_elapsed_time_seconds=_DEFAULT_TOTAL_ELAPSED_TIME_SECONDS,
+    )
+
+
+def _get_wait_after_response(
+    retry_policy: RetryPolicy, response: "httpx.Response", attempt_num: int, time_started: float
+) -> Optional[float]:
+    """Return the delay before retrying a request, or None if its response must be returned."""
+    if response.is_success:
+        return None
+
+    response_error_text = _get_response_error_text(response)
+    if attempt_num >= retry_policy.max_attempts or not _is_retryable_http_error(
+        retry_policy,
+        response.status_code,
+        response_error_text,
+    ):
+        return None
+
+    return _compute_wait_before_next_attempt(
+        policy=retry_policy,
+        attempt_num=attempt_num,
+        status_code=response.status_code,
+        retry_after_value=_get_retry_after_value_from_headers(response.headers),
+        previous_wait_seconds=None,
+        time_started=time_started,
+        elapsed_time_seconds_fn=time.monotonic,
+        total_elapsed_time_seconds=_DEFAULT_TOTAL_ELAPSED_TIME_SECONDS,
+    )
+
+
 def _is_tls_or_cert_error(exc: BaseException) -> bool:
     """Return whether an exception chain represents TLS/certificate validation failure."""
     current: Optional[BaseException] = exc
@@ -274,36 +359,6 @@ def _compute_wait_before_next_attempt(
     return min(wait_time_seconds, remaining)
 
 
-def _compute_wait_seconds(
-    retry_policy: RetryPolicy, attempt_num: int, status_code: Optional[int]
-) -> float:
-    """Compute exponential backoff with the configured jitter strategy."""
-    base = min(
-        float(retry_policy.initial_retry_delay)
-        * (float(retry_policy.backoff_factor) ** attempt_num),
-        float(retry_policy.max_retry_delay),
-    )
-
-    jitter = retry_policy.jitter
-    if jitter is None:
-        return base
-    if retry_policy.jitter == "equal":
-        return base / 2.0 + _JITTER_RANDOM.random() * (base / 2.0)
-    if jitter == "full":
-        return _JITTER_RANDOM.random() * base
-    if (
-        jitter == "full_and_equal_for_throttle"
-        and status_code is not None
-        and 400 <= status_code < 500
-    ):
-        return base / 2.0 + _JITTER_RANDOM.random() * (base / 2.0)
-    if jitter == "full_and_equal_for_throttle":
-        return _JITTER_RANDOM.random() * base
-    if jitter == "decorrelated":
-        return min(base + _JITTER_RANDOM.random(), float(retry_policy.max_retry_delay))
-    return base
-
-
 def _get_response_error_text(response: "httpx.Response") -> str:
     """Return a response body string suitable for retry-code matching."""
     try:
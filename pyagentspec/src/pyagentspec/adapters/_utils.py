@@ -4,8 +4,12 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+import hashlib
+import json
 import re
-from typing import Any, Dict, List, Literal, Tuple, Union
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 from pydantic import BaseModel, ConfigDict, Field, create_model
 
@@ -100,6 +104,100 @@ class SchemaRegistry:
         self.models: Dict[str, type[BaseModel]] = {}
 
 
+DEFAULT_MAX_CACHED_PYDANTIC_MODELS = 1024
+"""Maximum number of pydantic models kept by the cache shared by the adapters"""
+
+_CachedModelT = Tuple[type[BaseModel], List[Tuple[str, type[BaseModel]]]]
+
+
+class _PydanticModelsCache:
+    """
+    Thread-safe, size-bounded LRU cache of the pydantic models created from Agent Spec schemas.
+
+    Each entry also stores the nested models that were registered in the ``SchemaRegistry``
+    while creating the model, so that a cache hit registers the same names as a creation.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_CACHED_PYDANTIC_MODELS) -> None:
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _CachedModelT]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[_CachedModelT]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: _CachedModelT) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_PYDANTIC_MODELS_CACHE = _PydanticModelsCache()
+
+
+def _get_canonical_hash(*parts: Any) -> Optional[str]:
+    """Return a hash of the given JSON-serializable parts, or None if they are not serializable."""
+    try:
+        # Keys are not sorted: the order of the properties of a schema is the order of the fields
+        # of its model, which is the order of the arguments shown to the LLM
+        canonical_json = json.dumps(parts, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+
+
+def _get_properties_signature(properties: List[AgentSpecProperty]) -> List[Dict[str, Any]]:
+    signature: List[Dict[str, Any]] = []
+    for property_ in properties:
+        property_signature = {
+            "title": property_.title,
+            "description": property_.description,
+            "json_schema": property_.json_schema,
+        }
+        if property_.default is not _agentspec_empty_default:
+            property_signature["default"] = property_.default
+            property_signature["default_type"] = type(property_.default).__name__
+        signature.append(property_signature)
+    return signature
+
+
+def get_cached_pydantic_model_from_properties(
+    cache_namespace: str,
+    model_name: str,
+    properties: List[AgentSpecProperty],
+    model_factory: Callable[[str, List[AgentSpecProperty]], type[BaseModel]],
+) -> type[BaseModel]:
+    """
+    Return the model created by ``model_factory`` for the given name and properties.
+
+    Models are cached by a canonical hash of the name and of the properties, so that identical
+    schemas share the same model class. ``cache_namespace`` separates the models of factories
+    that build different models from the same properties.
+    """
+    key = _get_canonical_hash(cache_namespace, model_name, _get_properties_signature(properties))
+    if key is None:
+        # e.g., a default value that is not JSON serializable
+        return model_factory(model_name, properties)
+    entry = _PYDANTIC_MODELS_CACHE.get(key)
+    if entry is None:
+        entry = (model_factory(model_name, properties), [])
+        _PYDANTIC_MODELS_CACHE.put(key, entry)
+    return entry[0]
+
+
 def _build_type_from_schema(
     name: str,
     schema: Dict[str, Any],
@@ -145,6 +243,18 @@ def _build_type_from_schema(
             suffix += 1
             unique_name = f"{model_name}_{suffix}"
 
+        # Names of nested models depend on the names already taken in the registry
+        cache_key = _get_canonical_hash(
+            "object_schema", unique_name, schema, sorted(registry.models)
+        )
+        cached_entry = _PYDANTIC_MODELS_CACHE.get(cache_key) if cache_key is not None else None
+        if cached_entry is not None:
+            model_cls, nested_models = cached_entry
+            registry.models.update(nested_models)
+            registry.models[unique_name] = model_cls
+            return model_cls
+
+        registered_model_names = set(registry.models)
         props = schema.get("properties", {}) or {}
         required = set(schema.get("required", []))
 
@@ -167,6 +277,13 @@ def _build_type_from_schema(
             model_kwargs["__config__"] = ConfigDict(extra="forbid")
 
         model_cls = create_model(unique_name, **fields, **model_kwargs)  # type: ignore
+        if cache_key is not None:
+            nested_models = [
+                (nested_model_name, nested_model_cls)
+                for nested_model_name, nested_model_cls in registry.models.items()
+                if nested_model_name not in registered_model_names
+            ]
+            _PYDANTIC_MODELS_CACHE.put(cache_key, (model_cls, nested_models))
         registry.models[unique_name] = model_cls
         return model_cls
 
@@ -186,6 +303,14 @@ def _build_type_from_schema(
 
 def create_pydantic_model_from_properties(
     model_name: str, properties: List[AgentSpecProperty]
+) -> type[BaseModel]:
+    return get_cached_pydantic_model_from_properties(
+        "adapters", model_name, properties, _create_pydantic_model_from_properties
+    )
+
+
+def _create_pydantic_model_from_properties(
+    model_name: str, properties: List[AgentSpecProperty]
 ) -> type[BaseModel]:
     registry = SchemaRegistry()
     fields: Dict[str, Tuple[Any, Any]] = {}
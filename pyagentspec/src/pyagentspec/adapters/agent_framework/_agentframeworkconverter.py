@@ -9,6 +9,7 @@ from typing import Any, Literal, cast
 from pydantic import BaseModel, Field, create_model
 
 from pyagentspec.adapters._tools_common import _create_remote_tool_func
+from pyagentspec.adapters._utils import get_cached_pydantic_model_from_properties
 from pyagentspec.adapters.agent_framework._types import (
     AgentFrameworkComponent,
     AgentFrameworkMCPTool,
@@ -36,6 +37,14 @@ from pyagentspec.tools import Tool as AgentSpecTool
 
 def _create_pydantic_model_from_properties(
     model_name: str, properties: list[AgentSpecProperty]
+) -> type[BaseModel]:
+    return get_cached_pydantic_model_from_properties(
+        "agent_framework", model_name, properties, _build_pydantic_model_from_properties
+    )
+
+
+def _build_pydantic_model_from_properties(
+    model_name: str, properties: list[AgentSpecProperty]
 ) -> type[BaseModel]:
     # Create a pydantic model whose attributes are the given properties
     fields: dict[str, Any] = {}
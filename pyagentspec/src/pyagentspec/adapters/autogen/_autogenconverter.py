@@ -14,6 +14,7 @@ from urllib.parse import urljoin
 from pydantic import BaseModel, Field, create_model
 
 from pyagentspec.adapters._tools_common import _create_remote_tool_func
+from pyagentspec.adapters._utils import get_cached_pydantic_model_from_properties
 from pyagentspec.adapters.autogen._functiontool import FunctionTool
 from pyagentspec.adapters.autogen._types import (
     AutogenAssistantAgent,
@@ -52,6 +53,14 @@ def fits_literal(value: Any, literal_type: Any) -> bool:
 
 def _create_pydantic_model_from_properties(
     model_name: str, properties: List[AgentSpecProperty]
+) -> type[BaseModel]:
+    return get_cached_pydantic_model_from_properties(
+        "autogen", model_name, properties, _build_pydantic_model_from_properties
+    )
+
+
+def _build_pydantic_model_from_properties(
+    model_name: str, properties: List[AgentSpecProperty]
 ) -> type[BaseModel]:
     # Create a pydantic model whose attributes are the given properties
     fields: Dict[str, Any] = {}
@@ -0,0 +1,194 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+"""Pool of reusable HTTP clients used to execute ApiNodes and RemoteTools."""
+
+import asyncio
+import atexit
+import ssl
+import threading
+import weakref
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+from pyagentspec._lazy_loader import LazyLoader
+
+if TYPE_CHECKING:
+    import httpx
+else:
+    httpx = LazyLoader("httpx")
+
+VerifyTypes = Union[bool, str, ssl.SSLContext]
+CertTypes = Union[str, Tuple[str, str], Tuple[str, str, str]]
+
+_ClientKey = Tuple[str, str, Optional[int], Any, Any]
+
+
+class HttpClientPool:
+    """
+    Pool of ``httpx`` clients that keep their connections alive across requests.
+
+    One synchronous client, and one asynchronous client per event loop, is created for each
+    base URL (scheme, host and port) and TLS settings, so that consecutive calls to the same
+    service reuse the same connections instead of opening a new connection, and doing a new
+    TLS handshake, for every request.
+
+    Clients do not persist cookies: like one-shot requests, every request only sends the
+    cookies set in its own headers.
+
+    Parameters
+    ----------
+    http2:
+        Whether the clients can use HTTP/2. Requires the ``h2`` package to be installed.
+    limits:
+        Connection limits of each client, defaults to the ``httpx`` default limits.
+    verify:
+        Default TLS verification setting of the clients: either a boolean, the path to a CA
+        bundle or an ``ssl.SSLContext``.
+    cert:
+        Default client certificate of the clients, if any.
+    """
+
+    def __init__(
+        self,
+        http2: bool = False,
+        limits: Optional["httpx.Limits"] = None,
+        verify: VerifyTypes = True,
+        cert: Optional[CertTypes] = None,
+    ) -> None:
+        self.http2 = http2
+        self.limits = limits
+        self.verify = verify
+        self.cert = cert
+        self._lock = threading.Lock()
+        self._clients: Dict[_ClientKey, "httpx.Client"] = {}
+        # Async clients are bound to the event loop they are used in
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, Dict[_ClientKey, "httpx.AsyncClient"]
+        ] = weakref.WeakKeyDictionary()
+
+    def _get_client_key(
+        self, url: Union[str, "httpx.URL"], verify: Optional[VerifyTypes], cert: Optional[CertTypes]
+    ) -> _ClientKey:
+        parsed_url = httpx.URL(url)
+        return (
+            parsed_url.scheme,
+            parsed_url.host,
+            parsed_url.port,
+            self.verify if verify is None else verify,
+            self.cert if cert is None else cert,
+        )
+
+    def _get_client_kwargs(self, client_key: _ClientKey) -> Dict[str, Any]:
+        _, _, _, verify, cert = client_key
+        client_kwargs: Dict[str, Any] = {
+            "http2": self.http2,
+            "verify": verify,
+            "cert": cert,
+            "cookies": CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        }
+        if self.limits is not None:
+            client_kwargs["limits"] = self.limits
+        return client_kwargs
+
+    def get_client(
+        self,
+        url: Union[str, "httpx.URL"],
+        verify: Optional[VerifyTypes] = None,
+        cert: Optional[CertTypes] = None,
+    ) -> "httpx.Client":
+        """
+        Return the synchronous client to use to send requests to the given url.
+
+        ``verify`` and ``cert`` override the TLS settings of the pool when given.
+        """
+        client_key = self._get_client_key(url, verify, cert)
+        with self._lock:
+            client = self._clients.get(client_key)
+            if client is None:
+                client = httpx.Client(**self._get_client_kwargs(client_key))
+                self._clients[client_key] = client
+            return client
+
+    def get_async_client(
+        self,
+        url: Union[str, "httpx.URL"],
+        verify: Optional[VerifyTypes] = None,
+        cert: Optional[CertTypes] = None,
+    ) -> "httpx.AsyncClient":
+        """
+        Return the asynchronous client to use to send requests to the given url.
+
+        Must be called from a running event loop. ``verify`` and ``cert`` override the TLS
+        settings of the pool when given.
+        """
+        client_key = self._get_client_key(url, verify, cert)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            loop_clients = self._async_clients.setdefault(loop, {})
+            async_client = loop_clients.get(client_key)
+            if async_client is None:
+                async_client = httpx.AsyncClient(**self._get_client_kwargs(client_key))
+                loop_clients[client_key] = async_client
+            return async_client
+
+    def _pop_all_clients(self) -> Tuple[List["httpx.Client"], List["httpx.AsyncClient"]]:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            try:
+                loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            async_clients = list(self._async_clients.pop(loop, {}).values()) if loop else []
+            # Async clients of other event loops cannot be closed from here, their
+            # connections are released together with their event loop
+            self._async_clients.clear()
+        return clients, async_clients
+
+    def close(self) -> None:
+        """Close all the synchronous clients of the pool and release the asynchronous ones."""
+        clients, _ = self._pop_all_clients()
+        for client in clients:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close all the clients of the pool, including the asynchronous clients of the running loop."""
+        clients, async_clients = self._pop_all_clients()
+        for client in clients:
+            client.close()
+        for async_client in async_clients:
+            await async_client.aclose()
+
+    def __enter__(self) -> "HttpClientPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "HttpClientPool":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+_DEFAULT_HTTP_CLIENT_POOL: Optional[HttpClientPool] = None
+_DEFAULT_HTTP_CLIENT_POOL_LOCK = threading.Lock()
+
+
+def get_default_http_client_pool() -> HttpClientPool:
+    """
+    Return the pool shared by the adapters when no pool is given to them.
+
+    It is closed when the interpreter exits.
+    """
+    global _DEFAULT_HTTP_CLIENT_POOL
+    with _DEFAULT_HTTP_CLIENT_POOL_LOCK:
+        if _DEFAULT_HTTP_CLIENT_POOL is None:
+            _DEFAULT_HTTP_CLIENT_POOL = HttpClientPool()
+            atexit.register(_DEFAULT_HTTP_CLIENT_POOL.close)
+        return _DEFAULT_HTTP_CLIENT_POOL
@@ -0,0 +1,107 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+"""Process-level cache of the LangGraph components compiled by the AgentSpecLoader."""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from pyagentspec.component import Component as AgentSpecComponent
+from pyagentspec.serialization.serializationcontext import _SerializationContextImpl
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CACHED_COMPILED_COMPONENTS = 64
+"""Maximum number of compiled components kept by the process-level cache"""
+
+
+def _get_structural_hash(agentspec_component: AgentSpecComponent) -> Optional[str]:
+    """
+    Return a hash of the full configuration of the component, or None if it cannot be computed.
+
+    Sensitive fields are included, so that components that only differ by their credentials
+    do not share the same hash.
+    """
+    try:
+        serialization_context = _SerializationContextImpl(include_sensitive_fields=True)
+        component_as_dict = serialization_context._save_to_dict(agentspec_component)
+    except Exception as e:
+        # e.g., components of plugins whose serialization plugin is not available
+        logger.debug("Component `%s` cannot be hashed: %s", agentspec_component.name, e)
+        return None
+    serialized_component = json.dumps(component_as_dict, sort_keys=True, default=str)
+    return hashlib.sha256(serialized_component.encode("utf-8")).hexdigest()
+
+
+def _freeze(value: Any, referenced_objects: List[Any]) -> Hashable:
+    """
+    Return a hashable representation of a loader option.
+
+    Objects that are not plain data are represented by their identity, and added to
+    ``referenced_objects`` so that their ids cannot be reused while the cache entry exists.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return tuple(
+            sorted(
+                ((str(key), _freeze(item, referenced_objects)) for key, item in value.items()),
+                key=lambda entry: entry[0],
+            )
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item, referenced_objects) for item in value)
+    referenced_objects.append(value)
+    return ("object", id(value))
+
+
+class _CompiledComponentsCache:
+    """Thread-safe, size-bounded LRU cache of compiled components."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_CACHED_COMPILED_COMPONENTS) -> None:
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # Entries store the objects referenced by their key next to the compiled component
+        self._entries: "OrderedDict[Hashable, Tuple[List[Any], Any]]" = OrderedDict()
+
+    def get_key(
+        self, agentspec_component: AgentSpecComponent, loader_options: Dict[str, Any]
+    ) -> Optional[Tuple[Hashable, List[Any]]]:
+        """Return the cache key of a component loaded with the given options, if it has one."""
+        structural_hash = _get_structural_hash(agentspec_component)
+        if structural_hash is None:
+            return None
+        referenced_objects: List[Any] = []
+        return (structural_hash, _freeze(loader_options, referenced_objects)), referenced_objects
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Hashable, referenced_objects: List[Any], compiled_component: Any) -> None:
+        with self._lock:
+            self._entries[key] = (referenced_objects, compiled_component)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_COMPILED_COMPONENTS_CACHE = _CompiledComponentsCache()
@@ -30,14 +30,20 @@ from pydantic import BaseModel, SecretStr
 from typing_extensions import NotRequired, Required, TypedDict
 
 from pyagentspec import Component as AgentSpecComponent
-from pyagentspec.adapters._tools_common import _create_remote_tool_func
+from pyagentspec.adapters._tools_common import (
+    _create_async_remote_tool_func,
+    _create_remote_tool_func,
+)
 from pyagentspec.adapters._utils import (
     SchemaRegistry,
     _build_type_from_schema,
     create_pydantic_model_from_properties,
 )
+from pyagentspec.adapters.httpclientpool import HttpClientPool
 from pyagentspec.adapters.langgraph._node_execution import (
+    DEFAULT_MAX_CONCURRENCY,
     NodeExecutor,
+    _DataFlowRoute,
     extract_outputs_from_invoke_result,
 )
 from pyagentspec.adapters.langgraph._types import (
@@ -67,7 +73,6 @@ from pyagentspec.adapters.langgraph.tracing import (
 )
 from pyagentspec.agent import Agent as AgentSpecAgent
 from pyagentspec.flows.edges import ControlFlowEdge as AgentSpecControlFlowEdge
-from pyagentspec.flows.edges import DataFlowEdge as AgentSpecDataFlowEdge
 from pyagentspec.flows.flow import Flow as AgentSpecFlow
 from pyagentspec.flows.node import Node as AgentSpecNode
 from pyagentspec.flows.nodes import AgentNode as AgentSpecAgentNode
@@ -80,6 +85,8 @@ from pyagentspec.flows.nodes import InputMessageNode as AgentSpecInputMessageNod
 from pyagentspec.flows.nodes import LlmNode as AgentSpecLlmNode
 from pyagentspec.flows.nodes import MapNode as AgentSpecMapNode
 from pyagentspec.flows.nodes import OutputMessageNode as AgentSpecOutputMessageNode
+from pyagentspec.flows.nodes import ParallelFlowNode as AgentSpecParallelFlowNode
+from pyagentspec.flows.nodes import ParallelMapNode as AgentSpecParallelMapNode
 from pyagentspec.flows.nodes import StartNode as AgentSpecStartNode
 from pyagentspec.flows.nodes import ToolNode as AgentSpecToolNode
 from pyagentspec.llms.llmconfig import LlmConfig as AgentSpecLlmConfig
@@ -189,7 +196,61 @@ def _create_agent_state_typed_dict(
     )
 
 
+def _get_max_concurrency(config: RunnableConfig) -> Optional[int]:
+    """
+    Return the maximum number of subflows that nodes can execute concurrently, taken from
+    the standard ``max_concurrency`` entry of the ``RunnableConfig`` given to the converter.
+    """
+    max_concurrency = config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError(
+            f"`max_concurrency` must be None or a positive integer, got {max_concurrency}"
+        )
+    return max_concurrency
+
+
+def _get_data_flow_routes(flow: AgentSpecFlow) -> List[_DataFlowRoute]:
+    """Return the data flow connections of the flow, creating the implicit ones if none is given."""
+    if flow.data_flow_connections is not None:
+        return [
+            _DataFlowRoute.from_data_flow_edge(data_flow_edge)
+            for data_flow_edge in flow.data_flow_connections
+        ]
+
+    # We manually create data flow connections if they are not given in the flow, between
+    # outputs and inputs with the same title, as recommended in the Agent Spec language
+    # specification. Producers are indexed by output title to avoid comparing all node pairs.
+    producers_by_output_title: Dict[str, List[AgentSpecNode]] = {}
+    for source_node in flow.nodes:
+        for source_output in source_node.outputs or []:
+            producers_by_output_title.setdefault(source_output.title, []).append(source_node)
+
+    data_flow_routes: List[_DataFlowRoute] = []
+    for destination_node in flow.nodes:
+        for destination_input in destination_node.inputs or []:
+            for source_node in producers_by_output_title.get(destination_input.title, []):
+                data_flow_routes.append(
+                    _DataFlowRoute(
+                        source_node=source_node,
+                        source_output=destination_input.title,
+                        destination_node=destination_node,
+                        destination_input=destination_input.title,
+                    )
+                )
+    return data_flow_routes
+
+
 class AgentSpecToLangGraphConverter:
+    def __init__(
+        self,
+        http_client_pool: Optional[HttpClientPool] = None,
+        stream_llm_outputs: bool = False,
+    ) -> None:
+        # HTTP clients used by ApiNodes and RemoteTools, the shared default pool if None
+        self.http_client_pool = http_client_pool
+        # Whether LlmNodes and AgentNodes stream the text generated by their LLM
+        self.stream_llm_outputs = stream_llm_outputs
+
     def convert(
         self,
         agentspec_component: AgentSpecComponent,
@@ -381,12 +442,14 @@ class AgentSpecToLangGraphConverter:
         def _find_property(properties: List[AgentSpecProperty], name: str) -> AgentSpecProperty:
             return next((property_ for property_ in properties if property_.title == name))
 
+        data_flow_routes = _get_data_flow_routes(flow)
+
         # We tell the MapNodes which inputs they should iterate over
         # Based on the type of the outputs they are connected to
         for agentspec_node in flow.nodes:
-            if isinstance(agentspec_node, AgentSpecMapNode):
+            if isinstance(agentspec_node, (AgentSpecMapNode, AgentSpecParallelMapNode)):
                 inputs_to_iterate = []
-                for data_flow_edge in flow.data_flow_connections or []:
+                for data_flow_edge in data_flow_routes:
                     if data_flow_edge.destination_node is agentspec_node:
                         source_property = _find_property(
                             data_flow_edge.source_node.outputs or [],
@@ -417,29 +480,8 @@ class AgentSpecToLangGraphConverter:
             )
             graph_builder.add_node(node_id, runnable)
 
-        data_flow_connections: List[AgentSpecDataFlowEdge] = []
-        if flow.data_flow_connections is None:
-            # We manually create data flow connections if they are not given in the flow
-            # This is the conversion recommended in the Agent Spec language specification
-            for source_node in flow.nodes:
-                for destination_node in flow.nodes:
-                    for source_output in source_node.outputs or []:
-                        for destination_input in destination_node.inputs or []:
-                            if source_output.title == destination_input.title:
-                                data_flow_connections.append(
-                                    AgentSpecDataFlowEdge(
-                                        name=f"{source_node.name}-{destination_node.name}-{source_output.title}",
-                                        source_node=source_node,
-                                        source_output=source_output.title,
-                                        destination_node=destination_node,
-                                        destination_input=destination_input.title,
-                                    )
-                                )
-        else:
-            data_flow_connections = flow.data_flow_connections
-
-        for data_flow_edge in data_flow_connections:
-            node_executors[data_flow_edge.source_node.id].attach_edge(data_flow_edge)
+        for data_flow_route in data_flow_routes:
+            node_executors[data_flow_route.source_node.id].attach_edge(data_flow_route)
 
         control_flow: "ControlFlow" = self._create_control_flow(flow.control_flow_connections)
         self._add_conditional_edges_to_graph(control_flow, graph_builder)
@@ -504,17 +546,9 @@ class AgentSpecToLangGraphConverter:
             if not isinstance(inputs, dict):
                 inputs = {}
             span = AgentSpecFlowExecutionSpan(name=span_name, flow=flow)
+            await span.start_async()
             try:
-                await span.start_async()
-            except NotImplementedError:
-                span.start()
-            try:
-                try:
-                    await span.add_event_async(
-                        AgentSpecFlowExecutionStart(flow=flow, inputs=inputs)
-                    )
-                except NotImplementedError:
-                    span.add_event(AgentSpecFlowExecutionStart(flow=flow, inputs=inputs))
+                await span.add_event_async(AgentSpecFlowExecutionStart(flow=flow, inputs=inputs))
                 original_result: dict[str, Any] | Any = {}
                 result: dict[str, Any]
                 # This is going to patch stream and astream, that return iterators and yield chunks
@@ -531,15 +565,9 @@ class AgentSpecToLangGraphConverter:
                     outputs=result.get("outputs", {}),
                     branch_selected=result.get("node_execution_details", {}).get("branch", ""),
                 )
-                try:
-                    await span.add_event_async(span_end_event)
-                except NotImplementedError:
-                    span.add_event(span_end_event)
+                await span.add_event_async(span_end_event)
             finally:
-                try:
-                    await span.end_async()
-                except NotImplementedError:
-                    span.end()
+                await span.end_async()
 
         # Monkey patch invocation functions to inject tracing
         # No need to patch `(a)invoke` as the internally use `(a)stream`
@@ -611,7 +639,7 @@ class AgentSpecToLangGraphConverter:
             return self._input_message_node_convert_to_langgraph(node)
         elif isinstance(node, AgentSpecOutputMessageNode):
             return self._output_message_node_convert_to_langgraph(node)
-        elif isinstance(node, AgentSpecMapNode):
+        elif isinstance(node, (AgentSpecMapNode, AgentSpecParallelMapNode)):
             return self._map_node_convert_to_langgraph(
                 node,
                 tool_registry=tool_registry,
@@ -620,6 +648,15 @@ class AgentSpecToLangGraphConverter:
                 config=config,
                 middleware=middleware,
             )
+        elif isinstance(node, AgentSpecParallelFlowNode):
+            return self._parallel_flow_node_convert_to_langgraph(
+                node,
+                tool_registry=tool_registry,
+                converted_components=converted_components,
+                checkpointer=checkpointer,
+                config=config,
+                middleware=middleware,
+            )
         else:
             raise NotImplementedError(
                 f"The AgentSpec component of type {type(node)} is not yet supported for conversion"
@@ -643,7 +680,7 @@ class AgentSpecToLangGraphConverter:
 
     def _map_node_convert_to_langgraph(
         self,
-        map_node: AgentSpecMapNode,
+        map_node: Union[AgentSpecMapNode, AgentSpecParallelMapNode],
         tool_registry: Dict[str, "LangGraphTool"],
         converted_components: Dict[str, Any],
         checkpointer: Optional[Checkpointer],
@@ -663,7 +700,41 @@ class AgentSpecToLangGraphConverter:
         if not isinstance(subflow, CompiledStateGraph):
             raise TypeError("MapNodeExecutor can only be initialized with MapNode")
 
-        return MapNodeExecutor(map_node, subflow, config)
+        return MapNodeExecutor(
+            map_node, subflow, config, max_concurrency=_get_max_concurrency(config)
+        )
+
+    def _parallel_flow_node_convert_to_langgraph(
+        self,
+        parallel_flow_node: AgentSpecParallelFlowNode,
+        tool_registry: Dict[str, "LangGraphTool"],
+        converted_components: Dict[str, Any],
+        checkpointer: Optional[Checkpointer],
+        config: RunnableConfig,
+        middleware: List[Any],
+    ) -> "NodeExecutor":
+        from pyagentspec.adapters.langgraph._node_execution import ParallelFlowNodeExecutor
+
+        subflows = []
+        for agentspec_subflow in parallel_flow_node.subflows:
+            subflow = self.convert(
+                agentspec_subflow,
+                tool_registry=tool_registry,
+                converted_components=converted_components,
+                checkpointer=checkpointer,
+                config=config,
+                middleware=middleware,
+            )
+            if not isinstance(subflow, CompiledStateGraph):
+                raise TypeError(
+                    "Internal error: ParallelFlowNodeExecutor expects `subflows` "
+                    f"to be CompiledStateGraphs, was {type(subflow)}"
+                )
+            subflows.append(subflow)
+
+        return ParallelFlowNodeExecutor(
+            parallel_flow_node, subflows, config, max_concurrency=_get_max_concurrency(config)
+        )
 
     def _flow_node_convert_to_langgraph(
         self,
@@ -727,7 +798,7 @@ class AgentSpecToLangGraphConverter:
     def _api_node_convert_to_langgraph(self, api_node: AgentSpecApiNode) -> "NodeExecutor":
         from pyagentspec.adapters.langgraph._node_execution import ApiNodeExecutor
 
-        return ApiNodeExecutor(api_node)
+        return ApiNodeExecutor(api_node, self.http_client_pool)
 
     def _branching_node_convert_to_langgraph(
         self, branching_node: AgentSpecBranchingNode
@@ -754,6 +825,8 @@ class AgentSpecToLangGraphConverter:
             checkpointer=checkpointer,
             config=config,
             middleware=middleware,
+            stream_llm_outputs=self.stream_llm_outputs,
+            http_client_pool=self.http_client_pool,
         )
 
     def _llm_node_convert_to_langgraph(
@@ -773,7 +846,7 @@ class AgentSpecToLangGraphConverter:
             checkpointer=checkpointer,
             config=config,
         )
-        return LlmNodeExecutor(llm_node, llm)
+        return LlmNodeExecutor(llm_node, llm, stream_llm_outputs=self.stream_llm_outputs)
 
     def _tool_node_convert_to_langgraph(
         self,
@@ -813,7 +886,12 @@ class AgentSpecToLangGraphConverter:
         tool_name = remote_tool.name
         tool_description = remote_tool.description or ""
         _remote_tool = _confirm_then(
-            func=_create_remote_tool_func(remote_tool),
+            func=_create_remote_tool_func(remote_tool, self.http_client_pool),
+            tool_name=tool_name,
+            requires_confirmation=remote_tool.requires_confirmation,
+        )
+        _aremote_tool = _confirm_then(
+            func=_create_async_remote_tool_func(remote_tool, self.http_client_pool),
             tool_name=tool_name,
             requires_confirmation=remote_tool.requires_confirmation,
         )
@@ -829,7 +907,7 @@ class AgentSpecToLangGraphConverter:
             description=tool_description,
             args_schema=args_model,
             func=_remote_tool,
-            coroutine=_as_structured_tool_coroutine(_remote_tool),
+            coroutine=_aremote_tool,
             callbacks=[
                 AgentSpecToolCallbackHandler(tool=remote_tool),
             ],
@@ -1214,17 +1292,9 @@ class AgentSpecToLangGraphConverter:
             if not isinstance(inputs, dict):
                 inputs = {}
             span = AgentSpecAgentExecutionSpan(name=span_name, agent=agent)
+            await span.start_async()
             try:
-                await span.start_async()
-            except NotImplementedError:
-                span.start()
-            try:
-                try:
-                    await span.add_event_async(
-                        AgentSpecAgentExecutionStart(agent=agent, inputs=inputs)
-                    )
-                except NotImplementedError:
-                    span.add_event(AgentSpecAgentExecutionStart(agent=agent, inputs=inputs))
+                await span.add_event_async(AgentSpecAgentExecutionStart(agent=agent, inputs=inputs))
                 original_result: dict[str, Any] | Any = {}
                 result: dict[str, Any]
                 # This is going to patch stream and astream, that return iterators and yield chunks
@@ -1238,17 +1308,9 @@ class AgentSpecToLangGraphConverter:
                     result = original_result
 
                 outputs = extract_outputs_from_invoke_result(result, agent.outputs or [])
-                try:
-                    await span.add_event_async(
-                        AgentSpecAgentExecutionEnd(agent=agent, outputs=outputs)
-                    )
-                except NotImplementedError:
-                    span.add_event(AgentSpecAgentExecutionEnd(agent=agent, outputs=outputs))
+                await span.add_event_async(AgentSpecAgentExecutionEnd(agent=agent, outputs=outputs))
             finally:
-                try:
-                    await span.end_async()
-                except NotImplementedError:
-                    span.end()
+                await span.end_async()
 
         # Monkey patch invocation functions to inject tracing
         # No need to patch `(a)invoke` as they internally use `(a)stream`
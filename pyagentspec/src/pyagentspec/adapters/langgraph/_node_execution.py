@@ -4,20 +4,42 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+import asyncio
+import contextvars
+import functools
+import hashlib
 import json
 import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import anyio
 
-from pyagentspec._lazy_loader import LazyLoader
 from pyagentspec.adapters._url_validation import (
     maybe_warn_about_unrestricted_templated_url,
     validate_url_against_allow_list,
 )
 from pyagentspec.adapters._utils import render_nested_object_template, render_template
+from pyagentspec.adapters.httpclientpool import HttpClientPool, get_default_http_client_pool
 from pyagentspec.adapters.langgraph._types import (
+    AIMessageChunk,
     BaseChatModel,
     BaseMessage,
     Checkpointer,
@@ -30,10 +52,17 @@ from pyagentspec.adapters.langgraph._types import (
     NodeOutputsType,
     RunnableConfig,
     StructuredTool,
+    get_stream_writer,
     interrupt,
     langgraph_graph,
 )
 from pyagentspec.adapters.langgraph.mcp_utils import run_async_in_sync
+from pyagentspec.adapters.langgraph.streaming import (
+    FlowStreamChunk,
+    LlmOutputChunk,
+    MapNodeIterationChunk,
+    NodeOutputsChunk,
+)
 from pyagentspec.agent import Agent as AgentSpecAgent
 from pyagentspec.flows.edges import DataFlowEdge
 from pyagentspec.flows.node import Node
@@ -47,10 +76,14 @@ from pyagentspec.flows.nodes import InputMessageNode as AgentSpecInputMessageNod
 from pyagentspec.flows.nodes import LlmNode as AgentSpecLlmNode
 from pyagentspec.flows.nodes import MapNode as AgentSpecMapNode
 from pyagentspec.flows.nodes import OutputMessageNode as AgentSpecOutputMessageNode
+from pyagentspec.flows.nodes import ParallelFlowNode as AgentSpecParallelFlowNode
+from pyagentspec.flows.nodes import ParallelMapNode as AgentSpecParallelMapNode
 from pyagentspec.flows.nodes import StartNode as AgentSpecStartNode
 from pyagentspec.flows.nodes import ToolNode as AgentSpecToolNode
+from pyagentspec.flows.nodes.mapnode import ReductionMethod
 from pyagentspec.property import Property as AgentSpecProperty
 from pyagentspec.property import _empty_default as pyagentspec_empty_default
+from pyagentspec.templating import get_placeholders_from_string
 from pyagentspec.tracing.events import NodeExecutionEnd as AgentSpecNodeExecutionEnd
 from pyagentspec.tracing.events import NodeExecutionStart as AgentSpecNodeExecutionStart
 from pyagentspec.tracing.events.exception import ExceptionRaised
@@ -58,24 +91,187 @@ from pyagentspec.tracing.spans import NodeExecutionSpan as AgentSpecNodeExecutio
 from pyagentspec.tracing.spans.span import get_current_span
 
 if TYPE_CHECKING:
-    import httpx
     from langchain_core.messages.content import (
         FileContentBlock,
         ImageContentBlock,
         TextContentBlock,
     )
-else:
-    httpx = LazyLoader("httpx")
 
 MessageLike = Union[BaseMessage, List[str], Tuple[str, str], str, Dict[str, Any]]
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 8
+"""Default maximum number of subflow executions that nodes like the MapNode run concurrently"""
+
+DEFAULT_MAX_CACHED_AGENTS = 32
+"""Default maximum number of agents, one per rendering of its system prompt, an AgentNode keeps"""
+
+_AGENT_STREAM_MODES: List[Any] = ["messages", "updates", "values"]
+"""Stream modes used to execute the agent of an AgentNode when its LLM outputs are streamed"""
+
+
+def _run_concurrently(
+    functions: Sequence[Callable[[], T]], max_concurrency: Optional[int]
+) -> List[T]:
+    """
+    Run the given functions in a thread pool of at most ``max_concurrency`` threads, and
+    return their results in the same order. Each function runs in a copy of the current
+    context, so that tracing spans are correctly nested. If a function raises, the functions
+    that did not start yet are cancelled, and the exception is raised.
+    """
+    if max_concurrency is None:
+        max_concurrency = len(functions)
+    if max_concurrency <= 1 or len(functions) <= 1:
+        return [function() for function in functions]
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(functions))) as executor:
+        futures: List[Future[T]] = [
+            executor.submit(contextvars.copy_context().run, function) for function in functions
+        ]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+async def _arun_concurrently(
+    coroutine_functions: Sequence[Callable[[], Awaitable[T]]], max_concurrency: Optional[int]
+) -> List[T]:
+    """
+    Run the given coroutine functions as concurrent tasks, at most ``max_concurrency`` at a
+    time, and return their results in the same order. If a task raises or the caller is
+    cancelled, all the other tasks are cancelled before propagating the exception.
+    """
+    if max_concurrency is not None and max_concurrency <= 1:
+        return [await coroutine_function() for coroutine_function in coroutine_functions]
+    semaphore = asyncio.Semaphore(max_concurrency or len(coroutine_functions) or 1)
+
+    async def run_with_semaphore(coroutine_function: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            return await coroutine_function()
+
+    tasks = [
+        asyncio.ensure_future(run_with_semaphore(coroutine_function))
+        for coroutine_function in coroutine_functions
+    ]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _write_stream_chunk(chunk: FlowStreamChunk) -> None:
+    """
+    Write the chunk to the LangGraph ``custom`` stream of the running graph.
+
+    The chunk is dropped when the graph is not streamed in ``custom`` mode, or when the executor
+    does not run inside a graph.
+    """
+    try:
+        stream_writer = get_stream_writer()
+    except (RuntimeError, KeyError):
+        return
+    stream_writer(chunk)
+
+
+def _cast_to_string(value: Any) -> Any:
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def _cast_to_boolean(value: Any) -> Any:
+    return bool(value) if isinstance(value, (int, float)) else value
+
+
+def _cast_to_integer(value: Any) -> Any:
+    if isinstance(value, (float, bool)):
+        return int(value)
+    if isinstance(value, str):
+        # Try converting numeric strings to integers; if it fails, leave as-is
+        try:
+            return int(value.strip())
+        except ValueError as e:
+            if not str(e).startswith("could not convert string to int:"):
+                raise e
+    return value
+
+
+def _cast_to_number(value: Any) -> Any:
+    if isinstance(value, (int, bool)):
+        return float(value)
+    if isinstance(value, str):
+        # Try converting numeric strings to floats; if it fails, leave as-is
+        try:
+            return float(value.strip())
+        except ValueError as e:
+            if not str(e).startswith("could not convert string to float:"):
+                raise e
+    return value
+
+
+_VALUE_CASTERS: Dict[str, Callable[[Any], Any]] = {
+    "string": _cast_to_string,
+    "boolean": _cast_to_boolean,
+    "integer": _cast_to_integer,
+    "number": _cast_to_number,
+}
+
+_PropertiesCastingPlan = List[Tuple[str, Optional[Callable[[Any], Any]], Any]]
+"""For each property: its title, the function casting its values if any, and its default value"""
+
+
+def _compile_properties_casting_plan(
+    properties: List[AgentSpecProperty],
+) -> _PropertiesCastingPlan:
+    return [
+        (
+            property_.title,
+            _VALUE_CASTERS.get(property_.type) if isinstance(property_.type, str) else None,
+            property_.default,
+        )
+        for property_ in properties
+    ]
+
+
+@dataclass(frozen=True)
+class _DataFlowRoute:
+    """
+    Lightweight record of a data flow connection between two nodes of a converted flow.
+
+    Unlike ``DataFlowEdge`` components, these records are not validated, so that the
+    connections that are implicitly created between outputs and inputs with the same
+    title are cheap to build.
+    """
+
+    source_node: Node
+    source_output: str
+    destination_node: Node
+    destination_input: str
+
+    @classmethod
+    def from_data_flow_edge(cls, edge: DataFlowEdge) -> "_DataFlowRoute":
+        return cls(
+            source_node=edge.source_node,
+            source_output=edge.source_output,
+            destination_node=edge.destination_node,
+            destination_input=edge.destination_input,
+        )
+
 
 class NodeExecutor(ABC):
     def __init__(self, node: Node) -> None:
         self.node = node
-        self.edges: List[DataFlowEdge] = []
+        # Routing and casting plans are compiled once, so that the bookkeeping done at every
+        # step only depends on the inputs, outputs and outgoing edges of the node
+        self._routes: List[Tuple[str, str, str]] = []
+        self._inputs_casting_plan = _compile_properties_casting_plan(node.inputs or [])
+        self._outputs_casting_plan = _compile_properties_casting_plan(node.outputs or [])
 
     def __call__(self, state: FlowStateSchema) -> Any:
         inputs = self._get_inputs(state)
@@ -84,6 +280,7 @@ class NodeExecutor(ABC):
             span.add_event(AgentSpecNodeExecutionStart(node=self.node, inputs=inputs))
             outputs, execution_details = self._execute(inputs, state.get("messages", []))
             updated_status = self._update_status(outputs, execution_details, state)
+            self._write_outputs_chunk(updated_status)
             span.add_event(
                 AgentSpecNodeExecutionEnd(
                     node=self.node,
@@ -101,6 +298,7 @@ class NodeExecutor(ABC):
             # Prefer native async execution when available.
             outputs, execution_details = await self._aexecute(inputs, state.get("messages", []))
             updated_status = self._update_status(outputs, execution_details, state)
+            self._write_outputs_chunk(updated_status)
             await span.add_event_async(
                 AgentSpecNodeExecutionEnd(
                     node=self.node,
@@ -110,8 +308,26 @@ class NodeExecutor(ABC):
             )
             return updated_status
 
-    def attach_edge(self, edge: DataFlowEdge) -> None:
-        self.edges.append(edge)
+    def _write_outputs_chunk(self, updated_status: FlowStateSchema) -> None:
+        _write_stream_chunk(
+            NodeOutputsChunk(
+                node_id=self.node.id,
+                node_name=self.node.name,
+                outputs=updated_status["outputs"],
+                branch=updated_status["node_execution_details"]["branch"],
+            )
+        )
+
+    def _write_llm_output_chunk(self, message_chunk: Any) -> None:
+        # Chunks without text, e.g., tool call chunks, are not streamed
+        content = message_chunk.text
+        if content:
+            _write_stream_chunk(
+                LlmOutputChunk(node_id=self.node.id, node_name=self.node.name, content=content)
+            )
+
+    def attach_edge(self, edge: _DataFlowRoute) -> None:
+        self._routes.append((edge.destination_node.id, edge.destination_input, edge.source_output))
 
     @abstractmethod
     def _execute(self, inputs: Dict[str, Any], messages: Messages) -> ExecuteOutput:
@@ -125,42 +341,19 @@ class NodeExecutor(ABC):
     def _cast_values_and_add_defaults(
         self,
         values_dict: Dict[str, Any],
-        properties: List[AgentSpecProperty],
+        casting_plan: _PropertiesCastingPlan,
     ) -> Dict[str, Any]:
         results_dict: Dict[str, Any] = {}
-        for property_ in properties:
-            key = property_.title
+        for key, cast_value, default in casting_plan:
             if key in values_dict:
-                value = values_dict.get(key)
-                if property_.type == "string" and not isinstance(value, str):
-                    value = json.dumps(value)
-                elif property_.type == "boolean" and isinstance(value, (int, float)):
-                    value = bool(value)
-                elif property_.type == "integer" and isinstance(value, (float, bool)):
-                    value = int(value)
-                elif property_.type == "integer" and isinstance(value, str):
-                    # Try converting numeric strings to integers; if it fails, leave as-is
-                    try:
-                        value = int(value.strip())
-                    except ValueError as e:
-                        if not str(e).startswith("could not convert string to int:"):
-                            raise e
-                elif property_.type == "number" and isinstance(value, (int, bool)):
-                    value = float(value)
-                elif property_.type == "number" and isinstance(value, str):
-                    # Try converting numeric strings to floats; if it fails, leave as-is
-                    try:
-                        value = float(value.strip())
-                    except ValueError as e:
-                        if not str(e).startswith("could not convert string to float:"):
-                            raise e
-                results_dict[key] = value
-            elif property_.default is not pyagentspec_empty_default:
-                results_dict[key] = property_.default
+                value = values_dict[key]
+                results_dict[key] = value if cast_value is None else cast_value(value)
+            elif default is not pyagentspec_empty_default:
+                results_dict[key] = default
             else:
                 raise ValueError(
                     f"Expected node `{self.node.name}` to have a value "
-                    f"for property `{property_.title}`, but none was found."
+                    f"for property `{key}`, but none was found."
                 )
         return results_dict
 
@@ -174,17 +367,9 @@ class NodeExecutor(ABC):
 
     def _get_inputs(self, state: FlowStateSchema) -> Dict[str, Any]:
         """Retrieve the inputs for this node, adding default values when missing, and casting to right type."""
-        inputs = self.node.inputs or []
-        # We retrieve the inputs related to this node
-        io_inputs = {
-            input_name: value
-            for node_id, node_inputs in state["inputs"].items()
-            if node_id == self.node.id
-            for input_name, value in node_inputs.items()
-            # We select only the entries that are generated for specific steps
-            # i.e., the key is a tuple (node_name, node_input)
-        }
-        return self._cast_values_and_add_defaults(io_inputs, inputs)
+        # The inputs generated for this node are stored under its id
+        io_inputs = state["inputs"].get(self.node.id, {})
+        return self._cast_values_and_add_defaults(io_inputs, self._inputs_casting_plan)
 
     def _update_status(
         self,
@@ -193,14 +378,12 @@ class NodeExecutor(ABC):
         previous_state: FlowStateSchema,
     ) -> FlowStateSchema:
         """Updates the status of the flow with the given information"""
-        outputs = self._cast_values_and_add_defaults(outputs, self.node.outputs or [])
+        outputs = self._cast_values_and_add_defaults(outputs, self._outputs_casting_plan)
         next_node_inputs = previous_state.get("inputs", {})
 
-        for edge in self.edges:
-            if edge.destination_node.id not in next_node_inputs:
-                next_node_inputs[edge.destination_node.id] = {}
-            next_node_inputs[edge.destination_node.id][edge.destination_input] = outputs[
-                edge.source_output
+        for destination_node_id, destination_input, source_output in self._routes:
+            next_node_inputs.setdefault(destination_node_id, {})[destination_input] = outputs[
+                source_output
             ]
 
         if "branch" not in execution_details:
@@ -233,8 +416,6 @@ class StartNodeExecutor(NodeExecutor):
         For the StartNode this works in a slightly different way, because inputs do not have the node id
         in their name, as when flows are first invoked they just have the input name as key.
         """
-        inputs = self.node.inputs or []
-
         state_inputs = state.get("inputs", {})
         # The start node takes the key entries that have no node name (i.e., they are not a tuple)
         io_inputs = {
@@ -247,7 +428,7 @@ class StartNodeExecutor(NodeExecutor):
         for node_input in io_inputs:
             state_inputs.pop(node_input)
 
-        return self._cast_values_and_add_defaults(io_inputs, inputs)
+        return self._cast_values_and_add_defaults(io_inputs, self._inputs_casting_plan)
 
     def _execute(self, inputs: Dict[str, Any], messages: Messages) -> ExecuteOutput:
         return inputs, NodeExecutionDetails()
@@ -488,6 +669,9 @@ class AgentNodeExecutor(NodeExecutor):
         checkpointer: Optional[Checkpointer],
         config: RunnableConfig,
         middleware: Optional[List[Any]] = None,
+        max_cached_agents: int = DEFAULT_MAX_CACHED_AGENTS,
+        stream_llm_outputs: bool = False,
+        http_client_pool: Optional[HttpClientPool] = None,
     ) -> None:
         super().__init__(node)
         if not isinstance(self.node, AgentSpecAgentNode):
@@ -497,7 +681,26 @@ class AgentNodeExecutor(NodeExecutor):
         self.converted_components = converted_components
         self.config = config
         self._middleware: List[Any] = list(middleware or [])
-        self._agents_cache: Dict[str, CompiledStateGraph[Any, Any]] = {}
+        # The agents compiled for the different renderings of the system prompt, in LRU order,
+        # keyed by a hash of the values of the inputs used in the system prompt template
+        self._agents_cache: "OrderedDict[str, CompiledStateGraph[Any, Any]]" = OrderedDict()
+        self._agents_cache_lock = threading.Lock()
+        self.max_cached_agents = max_cached_agents
+        self.stream_llm_outputs = stream_llm_outputs
+        self.http_client_pool = http_client_pool
+        self._system_prompt_placeholders = (
+            sorted(get_placeholders_from_string(self.node.agent.system_prompt))
+            if isinstance(self.node.agent, AgentSpecAgent)
+            else []
+        )
+
+    def _get_agents_cache_key(self, inputs: Dict[str, Any]) -> str:
+        prompt_inputs = [
+            [placeholder, str(inputs[placeholder])]
+            for placeholder in self._system_prompt_placeholders
+            if placeholder in inputs
+        ]
+        return hashlib.sha256(json.dumps(prompt_inputs).encode("utf-8")).hexdigest()
 
     def _create_react_agent_with_given_input_values(
         self, inputs: Dict[str, Any]
@@ -507,27 +710,40 @@ class AgentNodeExecutor(NodeExecutor):
         if not isinstance(self.node.agent, AgentSpecAgent):
             raise TypeError("AgentNodeExecutor can only be used with AgentSpecAgent agents")
 
+        cache_key = self._get_agents_cache_key(inputs)
+        with self._agents_cache_lock:
+            agent = self._agents_cache.get(cache_key)
+            if agent is not None:
+                self._agents_cache.move_to_end(cache_key)
+                return agent
+
         agentspec_component = self.node.agent
         system_prompt = render_template(agentspec_component.system_prompt, inputs)
-        if system_prompt not in self._agents_cache:
-            self._agents_cache[
-                system_prompt
-            ] = AgentSpecToLangGraphConverter()._create_react_agent_with_given_info(
-                name=agentspec_component.name,
-                system_prompt=system_prompt,
-                agent=agentspec_component,
-                llm_config=agentspec_component.llm_config,
-                tools=agentspec_component.tools,
-                toolboxes=agentspec_component.toolboxes,
-                inputs=agentspec_component.inputs or [],
-                outputs=agentspec_component.outputs or [],
-                tool_registry=self.tool_registry,
-                converted_components=self.converted_components,
-                checkpointer=self.checkpointer,
-                config=self.config,
-                middleware=self._middleware,
-            )
-        return self._agents_cache[system_prompt]
+        # The agent is converted with the options of the loader, e.g., its RemoteTools send their
+        # requests through the HTTP client pool of the loader
+        converter = AgentSpecToLangGraphConverter(
+            http_client_pool=self.http_client_pool, stream_llm_outputs=self.stream_llm_outputs
+        )
+        agent = converter._create_react_agent_with_given_info(
+            name=agentspec_component.name,
+            system_prompt=system_prompt,
+            agent=agentspec_component,
+            llm_config=agentspec_component.llm_config,
+            tools=agentspec_component.tools,
+            toolboxes=agentspec_component.toolboxes,
+            inputs=agentspec_component.inputs or [],
+            outputs=agentspec_component.outputs or [],
+            tool_registry=self.tool_registry,
+            converted_components=self.converted_components,
+            checkpointer=self.checkpointer,
+            config=self.config,
+            middleware=self._middleware,
+        )
+        with self._agents_cache_lock:
+            self._agents_cache[cache_key] = agent
+            while len(self._agents_cache) > self.max_cached_agents:
+                self._agents_cache.popitem(last=False)
+        return agent
 
     def _prepare_agent_and_inputs(
         self, inputs: Dict[str, Any], messages: Messages
@@ -557,15 +773,46 @@ class AgentNodeExecutor(NodeExecutor):
         outputs = extract_outputs_from_invoke_result(result, self.node.outputs or [])
         return outputs, NodeExecutionDetails()
 
+    def _accumulate_agent_stream_part(
+        self, stream_mode: str, payload: Any, result: Dict[str, Any]
+    ) -> None:
+        # Builds the same result as `invoke`, which also collects the interrupts from the updates
+        if stream_mode == "messages":
+            message_chunk, _ = payload
+            if isinstance(message_chunk, AIMessageChunk):
+                self._write_llm_output_chunk(message_chunk)
+        elif stream_mode == "values":
+            interrupts = result.get("__interrupt__")
+            result.clear()
+            result.update(payload)
+            if interrupts:
+                result["__interrupt__"] = interrupts
+        elif isinstance(payload, dict) and "__interrupt__" in payload:
+            result.setdefault("__interrupt__", []).extend(payload["__interrupt__"])
+
     def _execute(self, inputs: Dict[str, Any], messages: Messages) -> ExecuteOutput:
         agent, prepared_inputs = self._prepare_agent_and_inputs(inputs, messages)
-        result = agent.invoke(prepared_inputs, self.config)
-        return self._format_agent_result(result)
+        if not self.stream_llm_outputs:
+            result = agent.invoke(prepared_inputs, self.config)
+            return self._format_agent_result(result)
+        streamed_result: Dict[str, Any] = {}
+        for stream_mode, payload in agent.stream(
+            prepared_inputs, self.config, stream_mode=_AGENT_STREAM_MODES
+        ):
+            self._accumulate_agent_stream_part(stream_mode, payload, streamed_result)
+        return self._format_agent_result(streamed_result)
 
     async def _aexecute(self, inputs: Dict[str, Any], messages: Messages) -> ExecuteOutput:
         agent, prepared_inputs = self._prepare_agent_and_inputs(inputs, messages)
-        result = await agent.ainvoke(prepared_inputs, self.config)
-        return self._format_agent_result(result)
+        if not self.stream_llm_outputs:
+            result = await agent.ainvoke(prepared_inputs, self.config)
+            return self._format_agent_result(result)
+        streamed_result: Dict[str, Any] = {}
+        async for stream_mode, payload in agent.astream(
+            prepared_inputs, self.config, stream_mode=_AGENT_STREAM_MODES
+        ):
+            self._accumulate_agent_stream_part(stream_mode, payload, streamed_result)
+        return self._format_agent_result(streamed_result)
 
 
 class InputMessageNodeExecutor(NodeExecutor):
@@ -594,7 +841,9 @@ class OutputMessageNodeExecutor(NodeExecutor):
 class LlmNodeExecutor(NodeExecutor):
     node: AgentSpecLlmNode
 
-    def __init__(self, node: AgentSpecLlmNode, llm: BaseChatModel) -> None:
+    def __init__(
+        self, node: AgentSpecLlmNode, llm: BaseChatModel, stream_llm_outputs: bool = False
+    ) -> None:
         super().__init__(node)
         if not isinstance(self.node, AgentSpecLlmNode):
             raise TypeError("LlmNodeExecutor can only be initialized with LlmNode")
@@ -607,6 +856,8 @@ class LlmNodeExecutor(NodeExecutor):
             raise TypeError("Llm can only be initialized with a BaseChatModel")
 
         self.llm: BaseChatModel = llm
+        # Structured generations are only returned once complete, so they are never streamed
+        self.stream_llm_outputs = stream_llm_outputs
 
         node_outputs = self.node.outputs or []
         self.requires_structured_generation = not (
@@ -659,6 +910,16 @@ class LlmNodeExecutor(NodeExecutor):
                 raise RuntimeError("Structured LLM was not initialized")
             generated_raw = self.structured_llm.invoke(invoke_inputs)
             return self._format_structured_output(node_outputs, generated_raw)
+        elif self.stream_llm_outputs:
+            generated_message: Any = None
+            for message_chunk in self.llm.stream(invoke_inputs):
+                self._write_llm_output_chunk(message_chunk)
+                generated_message = (
+                    message_chunk
+                    if generated_message is None
+                    else generated_message + message_chunk
+                )
+            return self._format_unstructured_output(node_outputs, generated_message)
         else:
             generated_message = self.llm.invoke(invoke_inputs)
             return self._format_unstructured_output(node_outputs, generated_message)
@@ -670,6 +931,16 @@ class LlmNodeExecutor(NodeExecutor):
                 raise RuntimeError("Structured LLM was not initialized")
             generated_raw = await self.structured_llm.ainvoke(invoke_inputs)
             return self._format_structured_output(node_outputs, generated_raw)
+        elif self.stream_llm_outputs:
+            generated_message: Any = None
+            async for message_chunk in self.llm.astream(invoke_inputs):
+                self._write_llm_output_chunk(message_chunk)
+                generated_message = (
+                    message_chunk
+                    if generated_message is None
+                    else generated_message + message_chunk
+                )
+            return self._format_unstructured_output(node_outputs, generated_message)
         else:
             generated_message = await self.llm.ainvoke(invoke_inputs)
             return self._format_unstructured_output(node_outputs, generated_message)
@@ -688,8 +959,11 @@ class LlmNodeExecutor(NodeExecutor):
 class ApiNodeExecutor(NodeExecutor):
     node: AgentSpecApiNode
 
-    def __init__(self, node: AgentSpecApiNode) -> None:
+    def __init__(
+        self, node: AgentSpecApiNode, http_client_pool: Optional[HttpClientPool] = None
+    ) -> None:
         super().__init__(node)
+        self.http_client_pool = http_client_pool or get_default_http_client_pool()
         if not isinstance(self.node, AgentSpecApiNode):
             raise TypeError("ApiNodeExecutor can only be initialized with ApiNode")
         maybe_warn_about_unrestricted_templated_url(
@@ -746,13 +1020,13 @@ class ApiNodeExecutor(NodeExecutor):
 
     def _execute(self, inputs: Dict[str, Any], messages: Messages) -> ExecuteOutput:
         kwargs = self._build_request_kwargs(inputs)
-        response = httpx.request(**kwargs)
+        response = self.http_client_pool.get_client(kwargs["url"]).request(**kwargs)
         return response.json(), NodeExecutionDetails()
 
     async def _aexecute(self, inputs: Dict[str, Any], messages: Messages) -> ExecuteOutput:
         kwargs = self._build_request_kwargs(inputs)
-        async with httpx.AsyncClient() as client:
-            response = await client.request(**kwargs)
+        client = self.http_client_pool.get_async_client(kwargs["url"])
+        response = await client.request(**kwargs)
         return response.json(), NodeExecutionDetails()
 
 
@@ -840,42 +1114,84 @@ class CatchExceptionNodeExecutor(NodeExecutor):
 
 
 class MapNodeExecutor(NodeExecutor):
-    node: AgentSpecMapNode
+    """Executor of both the MapNode and the ParallelMapNode, which share the same semantics"""
+
+    node: Union[AgentSpecMapNode, AgentSpecParallelMapNode]
 
     def __init__(
         self,
-        node: AgentSpecMapNode,
+        node: Union[AgentSpecMapNode, AgentSpecParallelMapNode],
         subflow: CompiledStateGraph[Any, Any],
         config: RunnableConfig,
+        max_concurrency: Optional[int] = DEFAULT_MAX_CONCURRENCY,
     ) -> None:
         super().__init__(node)
-        if not isinstance(self.node, AgentSpecMapNode):
-            raise TypeError("MapNodeExecutor can only be initialized with MapNode")
+        if not isinstance(self.node, (AgentSpecMapNode, AgentSpecParallelMapNode)):
+            raise TypeError(
+                "MapNodeExecutor can only be initialized with MapNode or ParallelMapNode"
+            )
         if not self.node.inputs:
             raise ValueError("MapNode has no inputs")
         self.subflow = subflow
         self.config = config
         self.inputs_to_iterate: List[str] = []
+        # Maximum number of iterations executed concurrently, ``None`` means no limit
+        self.max_concurrency = max_concurrency
+
+    def _run_iteration(
+        self, iteration: int, subflow_inputs: Dict[str, Any], messages: Messages
+    ) -> Any:
+        subflow_result = self.subflow.invoke({"inputs": subflow_inputs, "messages": messages})
+        self._write_iteration_chunk(iteration, subflow_result)
+        return subflow_result
+
+    async def _arun_iteration(
+        self, iteration: int, subflow_inputs: Dict[str, Any], messages: Messages
+    ) -> Any:
+        subflow_result = await self.subflow.ainvoke(
+            {"inputs": subflow_inputs, "messages": messages}
+        )
+        self._write_iteration_chunk(iteration, subflow_result)
+        return subflow_result
+
+    def _write_iteration_chunk(self, iteration: int, subflow_result: Any) -> None:
+        _write_stream_chunk(
+            MapNodeIterationChunk(
+                node_id=self.node.id,
+                node_name=self.node.name,
+                iteration=iteration,
+                outputs=subflow_result["outputs"],
+            )
+        )
 
     def _execute(self, inputs: Dict[str, Any], messages: Messages) -> ExecuteOutput:
-        # TODO: handle different reducers
         subflow_inputs_list, outputs = self._prepare_iterations(inputs)
-        for subflow_inputs in subflow_inputs_list:
-            subflow_result = self.subflow.invoke({"inputs": subflow_inputs, "messages": messages})
+        subflow_results = _run_concurrently(
+            [
+                functools.partial(self._run_iteration, iteration, subflow_inputs, messages)
+                for iteration, subflow_inputs in enumerate(subflow_inputs_list)
+            ],
+            self.max_concurrency,
+        )
+        for subflow_result in subflow_results:
             self._accumulate_outputs(outputs, subflow_result["outputs"])
-        return outputs, NodeExecutionDetails()
+        return self._reduce_outputs(outputs), NodeExecutionDetails()
 
     def set_inputs_to_iterate(self, inputs_to_iterate: list[str]) -> None:
         self.inputs_to_iterate = inputs_to_iterate
 
     async def _aexecute(self, inputs: Dict[str, Any], messages: Messages) -> ExecuteOutput:
         subflow_inputs_list, outputs = self._prepare_iterations(inputs)
-        for subflow_inputs in subflow_inputs_list:
-            subflow_result = await self.subflow.ainvoke(
-                {"inputs": subflow_inputs, "messages": messages}
-            )
+        subflow_results = await _arun_concurrently(
+            [
+                functools.partial(self._arun_iteration, iteration, subflow_inputs, messages)
+                for iteration, subflow_inputs in enumerate(subflow_inputs_list)
+            ],
+            self.max_concurrency,
+        )
+        for subflow_result in subflow_results:
             self._accumulate_outputs(outputs, subflow_result["outputs"])
-        return outputs, NodeExecutionDetails()
+        return self._reduce_outputs(outputs), NodeExecutionDetails()
 
     def _prepare_iterations(
         self, inputs: Dict[str, Any]
@@ -918,6 +1234,90 @@ class MapNodeExecutor(NodeExecutor):
             if collected_output_name in outputs:
                 outputs[collected_output_name].append(output_value)
 
+    def _reduce_outputs(self, outputs: Dict[str, List[Any]]) -> Dict[str, Any]:
+        reducers = self.node.reducers or {}
+        reduced_outputs: Dict[str, Any] = {}
+        for collected_output_name, output_values in outputs.items():
+            output_name = collected_output_name.replace("collected_", "", 1)
+            reducer = reducers.get(output_name, ReductionMethod.APPEND)
+            if reducer == ReductionMethod.APPEND:
+                reduced_outputs[collected_output_name] = output_values
+            elif reducer == ReductionMethod.SUM:
+                reduced_outputs[collected_output_name] = sum(output_values)
+            elif not output_values:
+                # Average, max and min are not defined on empty collections
+                reduced_outputs[collected_output_name] = None
+            elif reducer == ReductionMethod.AVERAGE:
+                reduced_outputs[collected_output_name] = sum(output_values) / len(output_values)
+            elif reducer == ReductionMethod.MAX:
+                reduced_outputs[collected_output_name] = max(output_values)
+            elif reducer == ReductionMethod.MIN:
+                reduced_outputs[collected_output_name] = min(output_values)
+            else:
+                raise NotImplementedError(f"Reduction method {reducer} is not supported")
+        return reduced_outputs
+
+
+class ParallelFlowNodeExecutor(NodeExecutor):
+    node: AgentSpecParallelFlowNode
+
+    def __init__(
+        self,
+        node: AgentSpecParallelFlowNode,
+        subflows: List[CompiledStateGraph[Any, Any]],
+        config: RunnableConfig,
+        max_concurrency: Optional[int] = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        super().__init__(node)
+        if not isinstance(self.node, AgentSpecParallelFlowNode):
+            raise TypeError(
+                "ParallelFlowNodeExecutor can only be initialized with ParallelFlowNode"
+            )
+        if len(subflows) != len(self.node.subflows):
+            raise ValueError("ParallelFlowNodeExecutor expects one compiled graph per subflow")
+        self.subflows = subflows
+        self.config = config
+        # Maximum number of subflows executed concurrently, ``None`` means no limit
+        self.max_concurrency = max_concurrency
+
+    def _get_subflows_inputs(self, inputs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        # Every subflow only receives the inputs it declares, inputs with the same name are shared
+        return [
+            {
+                input_.title: inputs[input_.title]
+                for input_ in agentspec_subflow.inputs or []
+                if input_.title in inputs
+            }
+            for agentspec_subflow in self.node.subflows
+        ]
+
+    def _merge_outputs(self, subflow_results: List[Any]) -> ExecuteOutput:
+        # Outputs of different subflows cannot have the same name, so the merge is unambiguous
+        outputs: Dict[str, Any] = {}
+        for subflow_result in subflow_results:
+            outputs.update(subflow_result["outputs"])
+        return outputs, NodeExecutionDetails()
+
+    def _execute(self, inputs: Dict[str, Any], messages: Messages) -> ExecuteOutput:
+        subflow_results = _run_concurrently(
+            [
+                functools.partial(subflow.invoke, {"inputs": subflow_inputs, "messages": messages})
+                for subflow, subflow_inputs in zip(self.subflows, self._get_subflows_inputs(inputs))
+            ],
+            self.max_concurrency,
+        )
+        return self._merge_outputs(subflow_results)
+
+    async def _aexecute(self, inputs: Dict[str, Any], messages: Messages) -> ExecuteOutput:
+        subflow_results = await _arun_concurrently(
+            [
+                functools.partial(subflow.ainvoke, {"inputs": subflow_inputs, "messages": messages})
+                for subflow, subflow_inputs in zip(self.subflows, self._get_subflows_inputs(inputs))
+            ],
+            self.max_concurrency,
+        )
+        return self._merge_outputs(subflow_results)
+
 
 def extract_outputs_from_invoke_result(
     result: Dict[str, Any], expected_outputs: List[AgentSpecProperty]
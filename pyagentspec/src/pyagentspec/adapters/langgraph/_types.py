@@ -22,10 +22,11 @@ if TYPE_CHECKING:
     from langchain.agents.middleware.types import AgentState
     from langchain_core.callbacks import BaseCallbackHandler
     from langchain_core.language_models import BaseChatModel
-    from langchain_core.messages import BaseMessage, SystemMessage, ToolMessage
+    from langchain_core.messages import AIMessageChunk, BaseMessage, SystemMessage, ToolMessage
     from langchain_core.outputs import ChatGenerationChunk, GenerationChunk, LLMResult
     from langchain_core.runnables import RunnableConfig, RunnableLambda
     from langchain_core.tools import BaseTool, StructuredTool
+    from langgraph.config import get_stream_writer
     from langgraph.graph import StateGraph
     from langgraph.graph._branch import BranchSpec
     from langgraph.graph._node import StateNodeSpec
@@ -43,6 +44,7 @@ else:
     StructuredTool = LazyType("langchain_core.tools", "StructuredTool")
     Checkpointer = LazyType("langgraph.types", "Checkpointer")
     interrupt = LazyLoader("langgraph.types", "interrupt")
+    get_stream_writer = LazyLoader("langgraph.config", "get_stream_writer")
     StateGraph = LazyType("langgraph.graph", "StateGraph")
     Messages = LazyLoader("langgraph.graph.message", "Messages")
     CompiledStateGraph = LazyType("langgraph.graph.state", "CompiledStateGraph")
@@ -53,6 +55,7 @@ else:
     BranchSpec = LazyType("langgraph.graph._branch", "BranchSpec")
     SystemMessage = LazyType("langchain_core.messages", "SystemMessage")
     BaseMessage = LazyType("langchain_core.messages", "BaseMessage")
+    AIMessageChunk = LazyType("langchain_core.messages", "AIMessageChunk")
     ToolMessage = LazyType("langchain_core.messages", "ToolMessage")
     BaseChatModel = LazyType("langchain_core.language_models", "BaseChatModel")
     ChatGenerationChunk = LazyType("langchain_core.outputs", "ChatGenerationChunk")
@@ -133,11 +136,13 @@ __all__ = [
     "RunnableLambda",
     "SystemMessage",
     "BaseMessage",
+    "AIMessageChunk",
     "ToolMessage",
     "BaseChatModel",
     "AgentState",
     "Checkpointer",
     "interrupt",
+    "get_stream_writer",
     "RunnableConfig",
     "Messages",
     "BranchSpec",
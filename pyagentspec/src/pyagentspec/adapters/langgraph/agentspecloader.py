@@ -8,7 +8,9 @@
 from typing import Any, Dict, List, Optional, Union, cast
 
 from pyagentspec.adapters._agentspecloader import AdapterAgnosticAgentSpecLoader
+from pyagentspec.adapters.httpclientpool import HttpClientPool
 from pyagentspec.adapters.langgraph._agentspecconverter import LangGraphToAgentSpecConverter
+from pyagentspec.adapters.langgraph._compiledcomponentscache import _COMPILED_COMPONENTS_CACHE
 from pyagentspec.adapters.langgraph._langgraphconverter import AgentSpecToLangGraphConverter
 from pyagentspec.adapters.langgraph._types import (
     Checkpointer,
@@ -39,6 +41,8 @@ class AgentSpecLoader(AdapterAgnosticAgentSpecLoader):
         enables features that require a checkpointer (e.g., client tools).
     config:
         Optional ``RunnableConfig`` to pass to created runnables/graphs.
+        Its ``max_concurrency`` entry sets the maximum number of subflow executions that
+        nodes like the ``MapNode`` run concurrently (``None`` for no limit, default is 8).
     middleware:
         Optional list of LangChain agent middleware instances forwarded verbatim to
         ``langchain_agents.create_agent(middleware=...)`` when compiling an Agent Spec
@@ -55,6 +59,25 @@ class AgentSpecLoader(AdapterAgnosticAgentSpecLoader):
         type names match only the exact serialized component type. When allow and
         block entries both match, the closest match in the component class hierarchy
         wins; block entries win same-distance ties.
+    http_client_pool:
+        Optional pool of HTTP clients used by the ``ApiNode`` and ``RemoteTool`` components to
+        reuse connections across calls. If omitted, a pool shared by the whole process is used.
+        The caller is responsible for closing the given pool.
+    stream_llm_outputs:
+        Whether the ``LlmNode`` and ``AgentNode`` components stream the text generated by their
+        LLM as ``LlmOutputChunk`` chunks of the ``custom`` stream mode of the loaded flows,
+        instead of only returning it once complete. Structured generations are never streamed.
+        The outputs of the nodes and of the iterations of the ``MapNode`` are always written to
+        the ``custom`` stream, see ``pyagentspec.adapters.langgraph.streaming``.
+        Defaults to ``False``.
+    cache_compiled_components:
+        Whether to reuse the LangGraph components compiled by previous loads of the same
+        Agent Spec component, with the same tool registry, checkpointer, config, middleware and
+        HTTP client pool objects. The cache is shared by all the loaders of the process and only
+        keeps the most recently used compiled components. Loads are never cached when a
+        checkpointer is given without a config, because each load creates a new thread id.
+        Since the same compiled object is returned by cached loads, it must not be mutated.
+        Defaults to ``False``.
     """
 
     def __init__(
@@ -66,6 +89,9 @@ class AgentSpecLoader(AdapterAgnosticAgentSpecLoader):
         middleware: Optional[List[Any]] = None,
         allowed_components: Optional[ComponentPolicyInput] = None,
         blocked_components: Optional[ComponentPolicyInput] = None,
+        http_client_pool: Optional[HttpClientPool] = None,
+        cache_compiled_components: bool = False,
+        stream_llm_outputs: bool = False,
     ) -> None:
         super().__init__(
             plugins=plugins,
@@ -76,10 +102,20 @@ class AgentSpecLoader(AdapterAgnosticAgentSpecLoader):
         self.checkpointer = checkpointer
         self.config = config
         self._middleware: List[Any] = list(middleware or [])
+        self.http_client_pool = http_client_pool
+        self.cache_compiled_components = cache_compiled_components
+        self.stream_llm_outputs = stream_llm_outputs
+
+    @staticmethod
+    def clear_compiled_components_cache() -> None:
+        """Remove all the compiled components from the cache shared by the loaders."""
+        _COMPILED_COMPONENTS_CACHE.clear()
 
     @property
     def agentspec_to_runtime_converter(self) -> AgentSpecToLangGraphConverter:
-        return AgentSpecToLangGraphConverter()
+        return AgentSpecToLangGraphConverter(
+            http_client_pool=self.http_client_pool, stream_llm_outputs=self.stream_llm_outputs
+        )
 
     @property
     def runtime_to_agentspec_converter(self) -> LangGraphToAgentSpecConverter:
@@ -287,6 +323,31 @@ class AgentSpecLoader(AdapterAgnosticAgentSpecLoader):
     def load_component(self, agentspec_component: AgentSpecComponent) -> LangGraphRuntimeComponent:
         # Need to override to make it use config and checkpointer, while preserving base policy validation
         self.component_load_policy.validate_component_tree(agentspec_component)
+        if not self.cache_compiled_components or (
+            self.checkpointer is not None and self.config is None
+        ):
+            return self._convert(agentspec_component)
+        cache_key_and_references = _COMPILED_COMPONENTS_CACHE.get_key(
+            agentspec_component,
+            loader_options={
+                "tool_registry": self.tool_registry,
+                "checkpointer": self.checkpointer,
+                "config": self.config,
+                "middleware": self._middleware,
+                "http_client_pool": self.http_client_pool,
+                "stream_llm_outputs": self.stream_llm_outputs,
+            },
+        )
+        if cache_key_and_references is None:
+            return self._convert(agentspec_component)
+        cache_key, referenced_objects = cache_key_and_references
+        compiled_component = _COMPILED_COMPONENTS_CACHE.get(cache_key)
+        if compiled_component is None:
+            compiled_component = self._convert(agentspec_component)
+            _COMPILED_COMPONENTS_CACHE.put(cache_key, referenced_objects, compiled_component)
+        return cast(LangGraphRuntimeComponent, compiled_component)
+
+    def _convert(self, agentspec_component: AgentSpecComponent) -> LangGraphRuntimeComponent:
         return cast(
             LangGraphRuntimeComponent,
             self.agentspec_to_runtime_converter.convert(
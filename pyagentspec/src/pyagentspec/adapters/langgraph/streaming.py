@@ -0,0 +1,63 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+"""
+Chunks streamed by the flows converted to LangGraph.
+
+The nodes of converted flows write these chunks to the LangGraph ``custom`` stream as soon as
+they are produced. They are received by streaming the converted graph with
+``graph.stream(..., stream_mode="custom")`` or ``graph.astream(..., stream_mode="custom")``.
+Pass ``subgraphs=True`` to also receive the chunks of the nodes of nested subflows, which are
+then yielded together with the namespace of the subflow that produced them.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict
+
+
+@dataclass(frozen=True)
+class FlowStreamChunk:
+    """Base class of the chunks streamed by the nodes of converted flows."""
+
+    node_id: str
+    """Id of the Agent Spec node that produced the chunk"""
+
+    node_name: str
+    """Name of the Agent Spec node that produced the chunk"""
+
+
+@dataclass(frozen=True)
+class LlmOutputChunk(FlowStreamChunk):
+    """
+    Text generated by the LLM of an ``LlmNode`` or of the agent of an ``AgentNode``.
+
+    Only streamed when the flow was loaded with ``stream_llm_outputs=True``.
+    """
+
+    content: str
+    """Text generated since the previous chunk"""
+
+
+@dataclass(frozen=True)
+class MapNodeIterationChunk(FlowStreamChunk):
+    """Outputs of one iteration of a ``MapNode`` or ``ParallelMapNode``, when it finishes."""
+
+    iteration: int
+    """Index of the iterated element, iterations can finish in any order"""
+
+    outputs: Dict[str, Any]
+    """Outputs of the subflow for this iteration"""
+
+
+@dataclass(frozen=True)
+class NodeOutputsChunk(FlowStreamChunk):
+    """Outputs of a node, when its execution finishes."""
+
+    outputs: Dict[str, Any]
+    """Outputs of the node"""
+
+    branch: str
+    """Branch selected by the node"""
@@ -6,7 +6,10 @@
 
 import json
 import logging
+import threading
+import time
 import typing
+import weakref
 from typing import (
     Any,
     Awaitable,
@@ -50,6 +53,7 @@ from pyagentspec.tracing.spans import LlmGenerationSpan as AgentSpecLlmGeneratio
 from pyagentspec.tracing.spans import Span as AgentSpecSpan
 from pyagentspec.tracing.spans import ToolExecutionSpan as AgentSpecToolExecutionSpan
 from pyagentspec.tracing.spans.span import _ACTIVE_SPAN_STACK, get_active_span_stack
+from pyagentspec.tracing.trace import Trace, get_trace
 
 MessageInProgress = TypedDict(
     "MessageInProgress",
@@ -115,51 +119,128 @@ def _normalize_tool_inputs(
 # via Context.run and keeps the behavior aligned with the crewai adapter.
 
 
-class _SpanStack:
-    """Singleton containing the full set of span stacks. Used across sync and async handlers"""
-
-    _instance: "_SpanStack | None" = None
-    _span_stacks: Dict[str, List[AgentSpecSpan]] = {}
-
-    def __init__(self) -> None:
-        if _SpanStack._instance is not None:
-            raise RuntimeError("_SpanStack should not be instantiated multiple times")
-
-    @classmethod
-    def get_instance(cls) -> "_SpanStack":
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+# The span stacks, spans and streamed tool calls of the runs are kept in a registry owned by the
+# Trace active when the callbacks run, so that concurrent graph runs in the same process do not
+# share any state. The registries are cleared when their Trace ends, including when it is exited
+# because its run was cancelled, and they are weakly referenced by their Trace, which releases
+# them when the trace is garbage collected. Outside of any Trace, the runs that never reached
+# their end callback (e.g., errors raised in callbacks) are evicted once they were not accessed
+# for a given time.
+
+_SPAN_STACK_TTL_SECONDS = 3600.0
+
+
+class _SpanStackRegistry:
+    """Thread-safe registry of the span stacks of the runs of a Trace, keyed by run id"""
+
+    def __init__(self, ttl_seconds: float = _SPAN_STACK_TTL_SECONDS) -> None:
+        self.ttl_seconds = ttl_seconds
+        # Every entry stores the span stack, and the last time it was accessed
+        self._span_stacks: Dict[str, Tuple[List[AgentSpecSpan], float]] = {}
+        # Spans of the runs, and tool calls being streamed by the LLM runs
+        self.spans: Dict[str, AgentSpecSpan] = {}
+        self.messages_in_progress: MessagesInProgressRecord = {}
+        # All the operations are short and never await, so a thread lock is safe in asyncio too
+        self._lock = threading.Lock()
+        self._next_eviction_time = time.monotonic() + ttl_seconds
+
+    def __len__(self) -> int:
+        return len(self._span_stacks)
+
+    def _evict_expired_span_stacks(self, now: float) -> None:
+        if now < self._next_eviction_time:
+            return
+        expiration_time = now - self.ttl_seconds
+        expired_keys = [
+            key
+            for key, (_, last_access_time) in self._span_stacks.items()
+            if last_access_time < expiration_time
+        ]
+        for key in expired_keys:
+            del self._span_stacks[key]
+            self.spans.pop(key, None)
+            self.messages_in_progress.pop(key, None)
+        if expired_keys:
+            logger.debug("Evicted %d abandoned LangGraph span stacks", len(expired_keys))
+        self._next_eviction_time = now + self.ttl_seconds
 
     def pop(self, key: str, raise_if_not_present: bool = True) -> List[AgentSpecSpan]:
-        try:
-            return self._span_stacks.pop(key)
-        except KeyError as e:
-            if raise_if_not_present:
-                raise e
-            return []
+        with self._lock:
+            try:
+                return self._span_stacks.pop(key)[0]
+            except KeyError as e:
+                if raise_if_not_present:
+                    raise e
+                return []
 
     def get(self, key: str) -> List[AgentSpecSpan] | None:
-        return self._span_stacks.get(key)
+        with self._lock:
+            entry = self._span_stacks.get(key)
+            if entry is None:
+                return None
+            span_stack, _ = entry
+            self._span_stacks[key] = (span_stack, time.monotonic())
+            return span_stack
 
     def insert(self, key: str, value: List[AgentSpecSpan]) -> None:
-        self._span_stacks[key] = value
+        with self._lock:
+            now = time.monotonic()
+            self._evict_expired_span_stacks(now)
+            self._span_stacks[key] = (value, now)
 
-    def __setitem__(self, key: Any, value: Any) -> None:
+    def __setitem__(self, key: str, value: List[AgentSpecSpan]) -> None:
         self.insert(key, value)
 
+    def clear(self) -> None:
+        """Drop the state of all the runs, e.g., when their trace ends"""
+        with self._lock:
+            self._span_stacks.clear()
+            self.spans.clear()
+            self.messages_in_progress.clear()
+
+
+_SPAN_STACK_REGISTRIES: "weakref.WeakKeyDictionary[Trace, _SpanStackRegistry]" = (
+    weakref.WeakKeyDictionary()
+)
+_SPAN_STACK_REGISTRIES_LOCK = threading.Lock()
+# Registry used by the callbacks that run outside of any Trace
+_UNTRACED_SPAN_STACK_REGISTRY = _SpanStackRegistry()
+
+
+def _get_span_stack_registry() -> _SpanStackRegistry:
+    """Return the span stack registry of the Trace active in the current context"""
+    trace = get_trace()
+    if trace is None:
+        return _UNTRACED_SPAN_STACK_REGISTRY
+    registry = _SPAN_STACK_REGISTRIES.get(trace)
+    if registry is not None:
+        return registry
+    # The lock is only needed to create the registry once, the callbacks then read it without it
+    with _SPAN_STACK_REGISTRIES_LOCK:
+        registry = _SPAN_STACK_REGISTRIES.get(trace)
+        if registry is None:
+            registry = _SPAN_STACK_REGISTRIES[trace] = _SpanStackRegistry()
+            trace._add_end_callback(registry.clear)
+        return registry
+
 
 class AgentSpecCallbackHandler(BaseCallbackHandler):
 
     def __init__(self) -> None:
-        # Track spans per run_id
-        self.agentspec_spans_registry: Dict[str, AgentSpecSpan] = {}
-        # Track the active span stack captured right after span.start()
-        # so we can run subsequent callbacks against the same stack
-        self._span_stacks: _SpanStack = _SpanStack.get_instance()
         self.raise_error = True
         self._events_handled: Set[str] = set()
 
+    @property
+    def _span_stacks(self) -> _SpanStackRegistry:
+        # Track the active span stack captured right after span.start()
+        # so we can run subsequent callbacks against the same stack
+        return _get_span_stack_registry()
+
+    @property
+    def agentspec_spans_registry(self) -> Dict[str, AgentSpecSpan]:
+        # Track spans per run_id, released together with the trace
+        return self._span_stacks.spans
+
     def _get_stack(self, run_id_str: str) -> List[AgentSpecSpan]:
         stack = self._span_stacks.get(run_id_str)
         if stack is None:
@@ -200,25 +281,19 @@ class AgentSpecCallbackHandler(BaseCallbackHandler):
         finally:
             self._span_stacks[run_id_str] = get_active_span_stack(return_copy=True)
 
+    # The Trace dispatches the async calls to the sync hooks of the span processors that only
+    # implement those (see SpanProcessor.capabilities), so no fallback is needed here
+
     async def _add_event_async(self, run_id_str: str, span: AgentSpecSpan, event: Any) -> None:
-        try:
-            await self._run_in_ctx_async(run_id_str, span.add_event_async, event)
-        except NotImplementedError:
-            self._run_in_ctx(run_id_str, span.add_event, event)
+        await self._run_in_ctx_async(run_id_str, span.add_event_async, event)
 
     async def _end_span_async(self, run_id_str: str, span: AgentSpecSpan) -> None:
-        try:
-            await self._run_in_ctx_async(run_id_str, span.end_async)
-        except NotImplementedError:
-            self._run_in_ctx(run_id_str, span.end)
+        await self._run_in_ctx_async(run_id_str, span.end_async)
         self._span_stacks.pop(run_id_str, False)
 
     async def _start_and_copy_ctx_async(self, run_id_str: str, span: AgentSpecSpan) -> None:
         self._span_stacks[run_id_str] = get_active_span_stack(return_copy=True)
-        try:
-            await self._run_in_ctx_async(run_id_str, span.start_async)
-        except NotImplementedError:
-            self._run_in_ctx(run_id_str, span.start)
+        await self._run_in_ctx_async(run_id_str, span.start_async)
 
     def _in_async_trace(self) -> bool:
         try:
@@ -243,10 +318,15 @@ class AgentSpecLlmCallbackHandler(AgentSpecCallbackHandler):
     ) -> None:
         super().__init__()
         self.llm_config = llm_config
+        self._events_handled.update(
+            ("on_chat_model_start", "on_llm_new_token", "on_llm_end", "on_llm_error")
+        )
+
+    @property
+    def messages_in_process(self) -> MessagesInProgressRecord:
         # This is only added during tool-call streaming to associate run_id with tool_call_id
         # (tool_call_id is not available mid-stream)
-        self.messages_in_process: MessagesInProgressRecord = {}
-        self._events_handled.update(("on_chat_model_start", "on_llm_new_token", "on_llm_end"))
+        return self._span_stacks.messages_in_progress
 
     def on_chat_model_start(
         self,
@@ -264,6 +344,9 @@ class AgentSpecLlmCallbackHandler(AgentSpecCallbackHandler):
         span = AgentSpecLlmGenerationSpan(llm_config=self.llm_config)
         self.agentspec_spans_registry[run_id_str] = span
         self._start_and_copy_ctx(run_id_str, span)
+        if not span.is_recording():
+            # The trace was not sampled, no need to build the events
+            return
 
         # this is a list of lists because it can be batched, but we assume it to be a batch of size 1
         if len(messages) != 1:
@@ -334,6 +417,8 @@ class AgentSpecLlmCallbackHandler(AgentSpecCallbackHandler):
         span = self.agentspec_spans_registry.get(run_id_str)
         if not isinstance(span, AgentSpecLlmGenerationSpan):
             raise RuntimeError("LLM span not started; on_chat_model_start must run first")
+        if not span.is_recording():
+            return
         chunk_message = chunk.message  # type: ignore
 
         # Note that chunk_message.response_metadata.id is None during streaming, but it's populated when not streaming
@@ -359,13 +444,13 @@ class AgentSpecLlmCallbackHandler(AgentSpecCallbackHandler):
                 tool_call_chunk["id"],
             )
             if call_id is None:
-                current_stream = self.messages_in_process[run_id]
+                current_stream = self.messages_in_process[run_id_str]
                 tool_name, call_id = (
                     current_stream["tool_call_name"],
                     current_stream["tool_call_id"],
                 )
             else:
-                self.messages_in_process[run_id] = {
+                self.messages_in_process[run_id_str] = {
                     "id": message_id,
                     "tool_call_id": call_id,
                     "tool_call_name": tool_name,
@@ -396,19 +481,35 @@ class AgentSpecLlmCallbackHandler(AgentSpecCallbackHandler):
         span = self.agentspec_spans_registry.get(run_id_str)
         if not isinstance(span, AgentSpecLlmGenerationSpan):
             raise RuntimeError("LLM span not started; on_chat_model_start must run first")
-        message_id, content, tool_calls = _extract_message_content_and_tool_calls(response)
-        event = AgentSpecLlmGenerationResponse(
-            llm_config=self.llm_config,
-            request_id=run_id_str,
-            completion_id=message_id,
-            content=content,
-            tool_calls=tool_calls,
-        )
-        self._add_event(run_id_str, span, event)
+        if span.is_recording():
+            message_id, content, tool_calls = _extract_message_content_and_tool_calls(response)
+            event = AgentSpecLlmGenerationResponse(
+                llm_config=self.llm_config,
+                request_id=run_id_str,
+                completion_id=message_id,
+                content=content,
+                tool_calls=tool_calls,
+            )
+            self._add_event(run_id_str, span, event)
         self._end_span(run_id_str, span)
         self.agentspec_spans_registry.pop(run_id_str)
         self.messages_in_process.pop(run_id_str, None)
 
+    def on_llm_error(
+        self,
+        error: BaseException,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> Any:
+        # Also called when the run is cancelled, the span ends without a response
+        run_id_str = str(run_id)
+        span = self.agentspec_spans_registry.pop(run_id_str, None)
+        self.messages_in_process.pop(run_id_str, None)
+        if span is not None:
+            self._end_span(run_id_str, span)
+
     async def on_chat_model_start_async(
         self,
         serialized: Dict[str, Any],
@@ -422,6 +523,9 @@ class AgentSpecLlmCallbackHandler(AgentSpecCallbackHandler):
         span = AgentSpecLlmGenerationSpan(llm_config=self.llm_config)
         self.agentspec_spans_registry[run_id_str] = span
         await self._start_and_copy_ctx_async(run_id_str, span)
+        if not span.is_recording():
+            # The trace was not sampled, no need to build the events
+            return
 
         if len(messages) != 1:
             raise ValueError(
@@ -475,6 +579,8 @@ class AgentSpecLlmCallbackHandler(AgentSpecCallbackHandler):
         span = self.agentspec_spans_registry.get(run_id_str)
         if not isinstance(span, AgentSpecLlmGenerationSpan):
             raise RuntimeError("LLM span not started; on_chat_model_start must run first")
+        if not span.is_recording():
+            return
         chunk_message = chunk.message  # type: ignore
 
         if not isinstance(chunk_message.id, str):
@@ -498,13 +604,13 @@ class AgentSpecLlmCallbackHandler(AgentSpecCallbackHandler):
                 tool_call_chunk["id"],
             )
             if call_id is None:
-                current_stream = self.messages_in_process[run_id]
+                current_stream = self.messages_in_process[run_id_str]
                 tool_name, call_id = (
                     current_stream["tool_call_name"],
                     current_stream["tool_call_id"],
                 )
             else:
-                self.messages_in_process[run_id] = {
+                self.messages_in_process[run_id_str] = {
                     "id": message_id,
                     "tool_call_id": call_id,
                     "tool_call_name": tool_name,
@@ -535,19 +641,34 @@ class AgentSpecLlmCallbackHandler(AgentSpecCallbackHandler):
         span = self.agentspec_spans_registry.get(run_id_str)
         if not isinstance(span, AgentSpecLlmGenerationSpan):
             raise RuntimeError("LLM span not started; on_chat_model_start must run first")
-        message_id, content, tool_calls = _extract_message_content_and_tool_calls(response)
-        event = AgentSpecLlmGenerationResponse(
-            llm_config=self.llm_config,
-            request_id=run_id_str,
-            completion_id=message_id,
-            content=content,
-            tool_calls=tool_calls,
-        )
-        await self._add_event_async(run_id_str, span, event)
+        if span.is_recording():
+            message_id, content, tool_calls = _extract_message_content_and_tool_calls(response)
+            event = AgentSpecLlmGenerationResponse(
+                llm_config=self.llm_config,
+                request_id=run_id_str,
+                completion_id=message_id,
+                content=content,
+                tool_calls=tool_calls,
+            )
+            await self._add_event_async(run_id_str, span, event)
         await self._end_span_async(run_id_str, span)
         self.agentspec_spans_registry.pop(run_id_str)
         self.messages_in_process.pop(run_id_str, None)
 
+    async def on_llm_error_async(
+        self,
+        error: BaseException,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> Any:
+        run_id_str = str(run_id)
+        span = self.agentspec_spans_registry.pop(run_id_str, None)
+        self.messages_in_process.pop(run_id_str, None)
+        if span is not None:
+            await self._end_span_async(run_id_str, span)
+
 
 class AgentSpecToolCallbackHandler(AgentSpecCallbackHandler):
 
@@ -567,13 +688,6 @@ class AgentSpecToolCallbackHandler(AgentSpecCallbackHandler):
     ) -> Any:
         # get run_id and tool config
         run_id_str = str(run_id)
-        # instead of the real tool_call_id, we use the run_id to correlate between tool request and tool result
-        request_event = AgentSpecToolExecutionRequest(
-            request_id=run_id_str,
-            tool=self.tool,
-            # LangChain should provide structured `inputs` in the `kwargs`, the others are fallback options
-            inputs=_normalize_tool_inputs(self.tool, input_str, kwargs.get("inputs")),
-        )
         # starting a tool span for this tool
         span_name = f"ToolExecution[{self.tool.name}]"
         # Hack: transmit the tool_call_id as the span's description
@@ -588,6 +702,15 @@ class AgentSpecToolCallbackHandler(AgentSpecCallbackHandler):
         )
         self.agentspec_spans_registry[run_id_str] = tool_span
         self._start_and_copy_ctx(run_id_str, tool_span)
+        if not tool_span.is_recording():
+            return
+        # instead of the real tool_call_id, we use the run_id to correlate between tool request and tool result
+        request_event = AgentSpecToolExecutionRequest(
+            request_id=run_id_str,
+            tool=self.tool,
+            # LangChain should provide structured `inputs` in the `kwargs`, the others are fallback options
+            inputs=_normalize_tool_inputs(self.tool, input_str, kwargs.get("inputs")),
+        )
         self._add_event(run_id_str, tool_span, request_event)
 
     def on_tool_end(
@@ -605,6 +728,10 @@ class AgentSpecToolCallbackHandler(AgentSpecCallbackHandler):
             raise ValueError(
                 f"Expected tool_span to be a ToolExecutionSpan but got {type(tool_span)}"
             )
+        if not tool_span.is_recording():
+            self._end_span(run_id_str, tool_span)
+            self.agentspec_spans_registry.pop(run_id_str)
+            return
 
         if isinstance(output, ToolMessage):
             try:
@@ -665,12 +792,6 @@ class AgentSpecToolCallbackHandler(AgentSpecCallbackHandler):
         **kwargs: Any,
     ) -> Any:
         run_id_str = str(run_id)
-        request_event = AgentSpecToolExecutionRequest(
-            request_id=run_id_str,
-            tool=self.tool,
-            # LangChain should provide structured `inputs` in the `kwargs`, the others are fallback options
-            inputs=_normalize_tool_inputs(self.tool, input_str, kwargs.get("inputs")),
-        )
         # starting a tool span for this tool
         span_name = f"ToolExecution[{self.tool.name}]"
         # Hack: transmit the tool_call_id as the span's description
@@ -685,6 +806,14 @@ class AgentSpecToolCallbackHandler(AgentSpecCallbackHandler):
         )
         self.agentspec_spans_registry[run_id_str] = tool_span
         await self._start_and_copy_ctx_async(run_id_str, tool_span)
+        if not tool_span.is_recording():
+            return
+        request_event = AgentSpecToolExecutionRequest(
+            request_id=run_id_str,
+            tool=self.tool,
+            # LangChain should provide structured `inputs` in the `kwargs`, the others are fallback options
+            inputs=_normalize_tool_inputs(self.tool, input_str, kwargs.get("inputs")),
+        )
         await self._add_event_async(run_id_str, tool_span, request_event)
 
     async def on_tool_end_async(
@@ -701,6 +830,10 @@ class AgentSpecToolCallbackHandler(AgentSpecCallbackHandler):
             raise ValueError(
                 f"Expected tool_span to be a ToolExecutionSpan but got {type(tool_span)}"
             )
+        if not tool_span.is_recording():
+            await self._end_span_async(run_id_str, tool_span)
+            self.agentspec_spans_registry.pop(run_id_str)
+            return
 
         if isinstance(output, ToolMessage):
             try:
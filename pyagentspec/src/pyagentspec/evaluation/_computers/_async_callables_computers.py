@@ -12,12 +12,34 @@ The helpers are considered internal, hence the leading underscore prefixes.
 """
 
 import json
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Generic, Hashable, Tuple, TypeVar
+import os
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import anyio
 
 from pyagentspec._lazy_loader import LazyLoader
+from pyagentspec.evaluation._computers._checkpoint import _CheckpointFile
+from pyagentspec.evaluation._concurrency import _use_concurrency_budget, _use_sample_shared_values
+from pyagentspec.evaluation._llm.invocation import _use_request_coalescing
+from pyagentspec.evaluation.caching._fingerprint import (
+    _get_arguments_fingerprint,
+    _get_callable_fingerprint,
+)
+from pyagentspec.evaluation.caching.results_cache import ResultsCache
 from pyagentspec.evaluation.datasets.dataset import Dataset
+from pyagentspec.evaluation.scheduling.llm_scheduler import LlmScheduler, _use_llm_scheduler
 
 if TYPE_CHECKING:
     import numpy as np
@@ -37,12 +59,15 @@ class _AsyncRegistry(Generic[K, V]):
         self.store: Dict[K, V] = {}
         self._lock = anyio.Lock()
 
-    async def register(self, key: K, value: V) -> None:
-        """Insert ``value`` under ``key`` while ensuring uniqueness."""
+    async def register_many(self, items: Dict[K, V]) -> None:
+        """Insert all ``items`` at once while ensuring uniqueness, taking the lock a single time."""
         async with self._lock:
-            if key in self.store:
-                raise RuntimeError(f"A value of key {key} is already registered.")
-            self.store[key] = value
+            already_registered_keys = [key for key in items if key in self.store]
+            if already_registered_keys:
+                raise RuntimeError(
+                    f"Values of keys {already_registered_keys} are already registered."
+                )
+            self.store.update(items)
 
 
 class _AsyncCallablesComputer(Generic[T]):
@@ -55,31 +80,90 @@ class _AsyncCallablesComputer(Generic[T]):
         dataset: Dataset,
         callables: Dict[str, Callable[..., Awaitable[T]]],
         max_concurrency: int,
+        cache: Optional[ResultsCache] = None,
+        checkpoint_path: Optional[str | os.PathLike[str]] = None,
+        scheduler: Optional[LlmScheduler] = None,
+        reuse_llm_responses: bool = False,
     ) -> None:
-        """Configure the computer with the dataset, callables, and concurrency cap."""
+        """Configure the computer with the dataset, callables, concurrency cap and run options."""
         self.dataset = dataset
         self.callables = callables
         self.max_concurrency = max_concurrency
+        self.cache = cache
+        self.scheduler = scheduler
+        self.reuse_llm_responses = reuse_llm_responses
+        self._checkpoint = _CheckpointFile(checkpoint_path) if checkpoint_path is not None else None
+        # Fingerprinting a callable walks its whole configuration, it is only done once per run
+        self._callables_fingerprints = (
+            {
+                callable_id: _get_callable_fingerprint(callable_)
+                for callable_id, callable_ in callables.items()
+            }
+            if cache is not None or checkpoint_path is not None
+            else {}
+        )
         if max_concurrency == -1:
             self.semaphore = None
         else:
             self.semaphore = anyio.Semaphore(max_concurrency)
         self._registry = _AsyncRegistry[Tuple[Any, str], T]()
 
-    async def _compute(self, sample_id: Any, callable_id: str) -> None:
-        """Run a single callable against a dataset sample and store the result."""
-        # Fetch the sample lazily so IO is naturally parallelised by the caller.
+    async def _compute_sample(self, sample_id: Any, callable_ids: List[str]) -> None:
+        """Run the callables against a dataset sample and store their results together."""
+        # Fetch the sample lazily so IO is naturally parallelised by the caller, and only once
+        # for all the callables.
         sample = await self.dataset.get_sample(sample_id)
-        result = await self.callables[callable_id](**sample)
-        await self._registry.register((sample_id, callable_id), result)
+        results: Dict[Tuple[Any, str], T] = {}
 
-    async def _queue(self, sample_id: Any, callable_id: str) -> None:
+        async def compute(callable_id: str) -> None:
+            results[(sample_id, callable_id)] = await self._queue(sample_id, sample, callable_id)
+
+        # The callables computed on the sample can share the values they have in common
+        with _use_sample_shared_values():
+            if len(callable_ids) == 1:
+                await compute(callable_ids[0])
+            else:
+                async with anyio.create_task_group() as tg:
+                    for callable_id in callable_ids:
+                        tg.start_soon(compute, callable_id)
+        await self._registry.register_many(results)
+
+    async def _compute(self, sample_id: Any, sample: Dict[str, Any], callable_id: str) -> T:
+        """Run a single callable against a dataset sample and return the result."""
+        if self.cache is None:
+            result = await self.callables[callable_id](**sample)
+        else:
+            result = await self._compute_with_cache(self.cache, callable_id, sample)
+        # Failed results are not checkpointed, so that they are computed again when resuming
+        if self._checkpoint is not None and not _is_failed_result(result):
+            self._checkpoint.append(
+                sample_id, callable_id, self._callables_fingerprints[callable_id], result
+            )
+        return result
+
+    async def _compute_with_cache(
+        self, cache: ResultsCache, callable_id: str, sample: Dict[str, Any]
+    ) -> T:
+        """Return the cached result of the callable on the sample, computing it when missing."""
+        callable_ = self.callables[callable_id]
+        cache_key = _get_cache_key(
+            self._callables_fingerprints[callable_id],
+            _get_arguments_fingerprint(callable_, sample),
+        )
+        cached_result = await cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result  # type: ignore[return-value]
+        result = await callable_(**sample)
+        if not _is_failed_result(result):
+            await cache.set(cache_key, callable_id, result)  # type: ignore[arg-type]
+        return result
+
+    async def _queue(self, sample_id: Any, sample: Dict[str, Any], callable_id: str) -> T:
         """Wrapper that honours the semaphore before delegating to ``_compute``."""
         if self.semaphore is not None:
             async with self.semaphore:
-                await self._compute(sample_id, callable_id)
-        else:
-            await self._compute(sample_id, callable_id)
+                return await self._compute(sample_id, sample, callable_id)
+        return await self._compute(sample_id, sample, callable_id)
 
     async def run(self) -> Dict[Tuple[Hashable, str], T]:
         """Kick off all pending computations and return the populated registry."""
@@ -88,50 +172,111 @@ class _AsyncCallablesComputer(Generic[T]):
         if not metrics_names:
             return {}
 
+        # The tasks computing the callables inherit the scheduler, the concurrency budget and the
+        # coalescing of the LLM requests from the current context
+        with (
+            _use_llm_scheduler(self.scheduler),
+            _use_concurrency_budget(self.semaphore),
+            _use_request_coalescing("reuse_completed" if self.reuse_llm_responses else "in_flight"),
+        ):
+            if self._checkpoint is None:
+                await self._run_pending(metrics_names)
+                return self._registry.store
+
+            # Resume from the results of the previous runs, only the missing pairs are computed
+            checkpointed_results = {
+                key: result
+                for key, result in self._checkpoint.load(self._callables_fingerprints).items()
+                if not _is_failed_result(result)
+            }
+            self._checkpoint.open()
+            try:
+                await self._run_pending(metrics_names, checkpointed_results)
+            finally:
+                self._checkpoint.close()
+            return self._registry.store
+
+    async def _run_pending(
+        self,
+        metrics_names: List[str],
+        checkpointed_results: Optional[Dict[Tuple[Any, str], T]] = None,
+    ) -> None:
+        """Compute the (sample, callable) pairs whose result is not registered yet.
+
+        Work is scheduled per sample: each sample is fetched once, and its pending callables
+        run concurrently on it. The checkpointed results of the samples of the dataset are
+        registered instead of being computed, the ones of other samples are ignored.
+        """
+
+        def get_pending_metrics_names(sample_id: Any) -> List[str]:
+            pending_metrics_names = []
+            for metric_name in metrics_names:
+                key = (sample_id, metric_name)
+                if key in self._registry.store:
+                    continue
+                if checkpointed_results is not None and key in checkpointed_results:
+                    self._registry.store[key] = checkpointed_results.pop(key)
+                else:
+                    pending_metrics_names.append(metric_name)
+            return pending_metrics_names
+
         # For "unlimited" concurrency we still spawn one task per work item since callers
         # explicitly opted out of concurrency caps. The producer/worker pattern below
         # is primarily meant to prevent memory blow-ups when a bounded concurrency limit is used.
         if self.semaphore is None:
             async with anyio.create_task_group() as tg:
                 async for sample_id in self.dataset.ids():
-                    for metric_name in metrics_names:
-                        tg.start_soon(self._queue, sample_id, metric_name)
-            return self._registry.store
+                    pending_metrics_names = get_pending_metrics_names(sample_id)
+                    if pending_metrics_names:
+                        tg.start_soon(self._compute_sample, sample_id, pending_metrics_names)
+            return
 
-        # Avoid spawning one task per (sample, metric) pair: for large datasets
+        # Avoid spawning one task per sample: for large datasets
         # that can create millions of tasks and consume large amounts of memory.
         #
         # Instead, use a producer/worker pattern:
         # - one producer enumerates dataset sample ids and enqueues work items
-        # - N workers consume items from the queue and run computations
+        # - N workers consume samples from the queue and run their computations, which
+        #   are bounded by the semaphore
 
         num_workers = max(1, self.max_concurrency)
         queue_max_size = max(1, num_workers * self._QUEUE_BUFFER_FACTOR)
-        work_queue: anyio.abc.ObjectSendStream[Tuple[Any, str]]
-        receive_stream: anyio.abc.ObjectReceiveStream[Tuple[Any, str]]
+        work_queue: anyio.abc.ObjectSendStream[Tuple[Any, List[str]]]
+        receive_stream: anyio.abc.ObjectReceiveStream[Tuple[Any, List[str]]]
         work_queue, receive_stream = anyio.create_memory_object_stream(queue_max_size)
 
         async def producer() -> None:
             async with work_queue:
                 async for sample_id in self.dataset.ids():
-                    for metric_name in metrics_names:
-                        await work_queue.send((sample_id, metric_name))
+                    pending_metrics_names = get_pending_metrics_names(sample_id)
+                    if pending_metrics_names:
+                        await work_queue.send((sample_id, pending_metrics_names))
 
         async def worker(worker_id: int) -> None:
             del worker_id
             while True:
                 try:
-                    sample_id, metric_name = await receive_stream.receive()
+                    sample_id, pending_metrics_names = await receive_stream.receive()
                 except anyio.EndOfStream:
                     return
-                await self._queue(sample_id, metric_name)
+                await self._compute_sample(sample_id, pending_metrics_names)
 
         async with anyio.create_task_group() as tg:
             tg.start_soon(producer)
             for i in range(num_workers):
                 tg.start_soon(worker, i)
 
-        return self._registry.store
+
+def _get_cache_key(callable_fingerprint: str, arguments_fingerprint: str) -> str:
+    return f"{callable_fingerprint}:{arguments_fingerprint}"
+
+
+def _is_failed_result(result: Any) -> bool:
+    """Return whether ``result`` is the fallback value of a metric whose attempts all failed."""
+    if not (isinstance(result, tuple) and len(result) == 2 and isinstance(result[1], dict)):
+        return False
+    computation_details = result[1].get("__computation_details")
+    return isinstance(computation_details, dict) and computation_details.get("status") == "failed"
 
 
 def _try_to_dict_or_str(value: Any) -> Any:
@@ -0,0 +1,103 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+"""Append-only checkpoint files of the results computed over datasets.
+
+Each finished (sample, callable) result is appended to the file as soon as it is computed, so
+that an interrupted run can be resumed by only computing the pairs that are missing.
+"""
+
+import logging
+import os
+import pickle
+import struct
+from typing import IO, Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_RECORD_HEADER = struct.Struct(">Q")
+"""Header of the records, holding the size of the pickled record that follows it"""
+
+
+class _CheckpointFile:
+    """
+    Append-only file of size-prefixed, pickled
+    ``(sample_id, callable_id, callable_fingerprint, result)`` records.
+
+    The fingerprint of the callable is stored next to every result, so that the results of a
+    metric or intermediate whose configuration changed since they were checkpointed are not
+    restored.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self._file: Optional[IO[bytes]] = None
+
+    def load(self, callables_fingerprints: Dict[str, str]) -> Dict[Tuple[Any, str], Any]:
+        """
+        Return the checkpointed results of the callables with the given fingerprints.
+
+        A record truncated by an interruption during its write is removed from the file, so
+        that the next records are appended after the last complete one.
+        """
+        results: Dict[Tuple[Any, str], Any] = {}
+        if not os.path.exists(self.path):
+            return results
+        with open(self.path, "rb+") as checkpoint_file:
+            end_of_last_record = 0
+            while True:
+                header = checkpoint_file.read(_RECORD_HEADER.size)
+                if len(header) < _RECORD_HEADER.size:
+                    break
+                (record_size,) = _RECORD_HEADER.unpack(header)
+                record = checkpoint_file.read(record_size)
+                if len(record) < record_size:
+                    break
+                end_of_last_record = checkpoint_file.tell()
+                try:
+                    sample_id, callable_id, callable_fingerprint, result = pickle.loads(record)
+                except Exception as e:
+                    # e.g., the class of a checkpointed value was removed, it is computed again
+                    logger.warning("A record of checkpoint `%s` cannot be loaded: %s", self.path, e)
+                    continue
+                if callables_fingerprints.get(callable_id) == callable_fingerprint:
+                    results[(sample_id, callable_id)] = result
+            if end_of_last_record < os.path.getsize(self.path):
+                logger.warning(
+                    "Checkpoint `%s` is truncated after its last complete record (%d bytes).",
+                    self.path,
+                    end_of_last_record,
+                )
+                checkpoint_file.truncate(end_of_last_record)
+        return results
+
+    def open(self) -> None:
+        self._file = open(self.path, "ab")
+
+    def append(
+        self, sample_id: Any, callable_id: str, callable_fingerprint: str, result: Any
+    ) -> None:
+        """Append a result to the file, and flush it so that it survives a crash of the process."""
+        if self._file is None:
+            raise RuntimeError(f"Checkpoint `{self.path}` must be opened before appending to it.")
+        try:
+            record = pickle.dumps((sample_id, callable_id, callable_fingerprint, result))
+        except Exception as e:
+            # The result is computed again when resuming
+            logger.warning(
+                "The result of `%s` for sample `%s` cannot be checkpointed: %s",
+                callable_id,
+                sample_id,
+                e,
+            )
+            return
+        self._file.write(_RECORD_HEADER.pack(len(record)) + record)
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,119 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+"""Concurrency helpers shared by the callables computer and the metric wrappers.
+
+The computer exposes, through context variables, the concurrency budget of the evaluation and
+the intermediate values shared by the callables computed on the current sample. Context
+variables are inherited by the tasks spawned while computing a callable, so that wrappers can
+fan out their children within the budget of the evaluation.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, TypeVar
+
+import anyio
+
+T = TypeVar("T")
+
+_CONCURRENCY_BUDGET: ContextVar[Optional[anyio.Semaphore]] = ContextVar(
+    "_CONCURRENCY_BUDGET", default=None
+)
+
+
+@contextmanager
+def _use_concurrency_budget(semaphore: Optional[anyio.Semaphore]) -> Iterator[None]:
+    """Make the computations of the current context run within the slots of ``semaphore``."""
+    token = _CONCURRENCY_BUDGET.set(semaphore)
+    try:
+        yield
+    finally:
+        _CONCURRENCY_BUDGET.reset(token)
+
+
+async def _gather_within_budget(functions: Sequence[Callable[[], Awaitable[T]]]) -> List[T]:
+    """
+    Run ``functions`` concurrently and return their results in order.
+
+    The caller already holds a slot of the concurrency budget, which is lent to the functions
+    one at a time. The other functions only run concurrently when they can take a free slot of
+    the budget, so that wrappers never exceed the concurrency budget of the evaluation, nor wait
+    for slots held by their own callers.
+    """
+    if len(functions) == 1:
+        return [await functions[0]()]
+
+    budget = _CONCURRENCY_BUDGET.get()
+    callers_slot = anyio.Lock()
+    results: List[Any] = [None] * len(functions)
+
+    async def run(index: int) -> None:
+        if budget is None:
+            results[index] = await functions[index]()
+            return
+        try:
+            budget.acquire_nowait()
+        except anyio.WouldBlock:
+            async with callers_slot:
+                results[index] = await functions[index]()
+            return
+        try:
+            results[index] = await functions[index]()
+        finally:
+            budget.release()
+
+    async with anyio.create_task_group() as tg:
+        for index in range(len(functions)):
+            tg.start_soon(run, index)
+    return results
+
+
+class _SharedValues:
+    """Values shared by the computations of one sample, each computed at most once at a time."""
+
+    def __init__(self) -> None:
+        self._values: Dict[str, Any] = {}
+        self._computations: Dict[str, anyio.Event] = {}
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[T]]) -> T:
+        """Return the value of ``key``, computing it if no other computation did it."""
+        computation = self._computations.get(key)
+        if computation is not None:
+            await computation.wait()
+            if key in self._values:
+                return self._values[key]  # type: ignore[no-any-return]
+            # The other computation failed, its error was raised to its caller
+            return await compute()
+
+        computation = anyio.Event()
+        self._computations[key] = computation
+        try:
+            value = await compute()
+            self._values[key] = value
+            return value
+        finally:
+            computation.set()
+
+
+_SAMPLE_SHARED_VALUES: ContextVar[Optional[_SharedValues]] = ContextVar(
+    "_SAMPLE_SHARED_VALUES", default=None
+)
+
+
+def _get_sample_shared_values() -> Optional[_SharedValues]:
+    """Return the values shared by the computations of the current sample, if any."""
+    return _SAMPLE_SHARED_VALUES.get()
+
+
+@contextmanager
+def _use_sample_shared_values() -> Iterator[None]:
+    """Share values between the computations run on one sample in the current context."""
+    token = _SAMPLE_SHARED_VALUES.set(_SharedValues())
+    try:
+        yield
+    finally:
+        _SAMPLE_SHARED_VALUES.reset(token)
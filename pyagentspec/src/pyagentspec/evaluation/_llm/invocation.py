@@ -4,10 +4,34 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
-from typing import TYPE_CHECKING, Any, Dict, List, cast
+import copy
+import functools
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    cast,
+)
 from urllib.parse import urlparse, urlunparse
 
+import anyio
+
 from pyagentspec._lazy_loader import LazyLoader
+from pyagentspec.evaluation.caching._fingerprint import _fingerprint, _hash_fingerprint
 from pyagentspec.llms import (
     LlmConfig,
     OciGenAiConfig,
@@ -31,6 +55,7 @@ else:
     acompletion = LazyLoader("litellm", "acompletion")
 
 
+@functools.lru_cache(maxsize=256)
 def _prepare_openai_compatible_url(url: str) -> str:
     """Normalize an OpenAI-compatible server URL.
 
@@ -47,13 +72,100 @@ def _prepare_openai_compatible_url(url: str) -> str:
     return str(urlunparse(normalized))
 
 
+_MAX_CACHED_CLIENT_CONFIGS = 64
+"""Maximum number of OCI client configurations kept by the process-level cache"""
+
+_FileSignature = Optional[Tuple[int, int]]
+
+
+def _get_file_signature(path: str) -> _FileSignature:
+    """Return the modification time and size of a file, or None if it cannot be read."""
+    try:
+        file_stat = os.stat(path)
+    except OSError:
+        return None
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+class _OciClientConfigsCache:
+    """
+    Thread-safe, size-bounded LRU cache of the ``litellm`` arguments of OCI client configurations.
+
+    Building them reads the OCI config file and loads the private key of the signer, which is too
+    slow to be done for every request. Entries store the signatures of the files they were built
+    from, and they are dropped as soon as one of these files changes.
+    """
+
+    def __init__(self, max_size: int = _MAX_CACHED_CLIENT_CONFIGS) -> None:
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[Dict[str, _FileSignature], Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            files_signatures, client_config_kwargs = entry
+            if any(
+                _get_file_signature(path) != signature
+                for path, signature in files_signatures.items()
+            ):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return client_config_kwargs
+
+    def put(
+        self,
+        key: Hashable,
+        files_signatures: Dict[str, _FileSignature],
+        client_config_kwargs: Dict[str, Any],
+    ) -> None:
+        with self._lock:
+            self._entries[key] = (files_signatures, client_config_kwargs)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_OCI_CLIENT_CONFIGS_CACHE = _OciClientConfigsCache()
+
+
 def _get_oci_client_config(client_config: OciClientConfig) -> Dict[str, Any]:
     """Translate an OCI client configuration into ``litellm`` keyword arguments."""
     if isinstance(client_config, (OciClientConfigWithApiKey, OciClientConfigWithSecurityToken)):
+        # The key holds every field used below, so that equal configurations share their entry
+        # and modified configurations do not reuse a stale one
+        key = (
+            type(client_config),
+            client_config.service_endpoint,
+            client_config.auth_file_location,
+            client_config.auth_profile,
+        )
+        cached_client_config_kwargs = _OCI_CLIENT_CONFIGS_CACHE.get(key)
+        if cached_client_config_kwargs is not None:
+            return dict(cached_client_config_kwargs)
+
+        # Signatures are taken before reading the files, so that a change during the read
+        # invalidates the entry
+        auth_file_path = os.path.expanduser(client_config.auth_file_location)
+        auth_file_signature = _get_file_signature(auth_file_path)
         config_file = oci.config.from_file(
             client_config.auth_file_location, client_config.auth_profile
         )
-        return {
+        key_file_path = os.path.expanduser(config_file["key_file"])
+        key_file_signature = _get_file_signature(key_file_path)
+        client_config_kwargs = {
             "oci_endpoint_id": client_config.service_endpoint,
             "oci_region": config_file["region"],
             "oci_signer": oci.signer.Signer(
@@ -64,6 +176,12 @@ def _get_oci_client_config(client_config: OciClientConfig) -> Dict[str, Any]:
                 pass_phrase=config_file.get("pass_phrase"),
             ),
         }
+        _OCI_CLIENT_CONFIGS_CACHE.put(
+            key,
+            {auth_file_path: auth_file_signature, key_file_path: key_file_signature},
+            client_config_kwargs,
+        )
+        return dict(client_config_kwargs)
 
     raise NotImplementedError(f"OciClientConfig type not supported: {type(client_config)}")
 
@@ -90,16 +208,183 @@ def _get_llm_config_as_litellm_dict(llm: LlmConfig) -> Dict[str, Any]:
     )
 
 
+class _InFlightRequest:
+    """Request sent to the LLM provider, whose outcome is shared with identical requests."""
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.response: Dict[str, Any] | None = None
+        self.error: BaseException | None = None
+
+
+class _RequestCoalescer:
+    """
+    Share the response of identical LLM requests that are in flight, or recently completed.
+
+    Completed responses are only reused by the requests that opt in, every other request is
+    sent again once the identical ones completed. The errors of failed requests are raised to
+    the identical requests waiting for them, but they are not kept, so that the next identical
+    request is sent again. Every caller receives its own copy of the response.
+    """
+
+    def __init__(self, ttl_seconds: float = 300, max_size: int = 1024) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._completed: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # In-flight requests are awaited with the primitives of the event loop that sent them
+        self._in_flight: Dict[Tuple[int, str], _InFlightRequest] = {}
+        self._lock = threading.Lock()
+
+    def _get_completed(self, key: str) -> Dict[str, Any] | None:
+        with self._lock:
+            completed = self._completed.get(key)
+            if completed is None:
+                return None
+            completion_time, response = completed
+            if time.monotonic() - completion_time > self.ttl_seconds:
+                del self._completed[key]
+                return None
+            self._completed.move_to_end(key)
+            return response
+
+    def _set_completed(self, key: str, response: Dict[str, Any]) -> None:
+        with self._lock:
+            self._completed[key] = (time.monotonic(), response)
+            self._completed.move_to_end(key)
+            while len(self._completed) > self.max_size:
+                self._completed.popitem(last=False)
+
+    async def complete(
+        self,
+        key: str,
+        send_request: Callable[[], Awaitable[Dict[str, Any]]],
+        reuse_completed: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Return the response of the request identified by ``key``, sending it if needed.
+
+        The request waits for an identical request in flight, if any. With ``reuse_completed``,
+        it also reuses the response of an identical request that completed recently, and its
+        own response is kept for the next requests that reuse completed responses.
+        """
+        if reuse_completed:
+            response = self._get_completed(key)
+            if response is not None:
+                return copy.deepcopy(response)
+
+        in_flight_key = (threading.get_ident(), key)
+        in_flight_request = self._in_flight.get(in_flight_key)
+        if in_flight_request is not None:
+            await in_flight_request.done.wait()
+            if in_flight_request.error is not None:
+                raise in_flight_request.error
+            if in_flight_request.response is None:
+                # The request was cancelled with the task that sent it, it is sent again
+                return await self.complete(key, send_request, reuse_completed)
+            return copy.deepcopy(in_flight_request.response)
+
+        in_flight_request = _InFlightRequest()
+        self._in_flight[in_flight_key] = in_flight_request
+        try:
+            response = await send_request()
+        except Exception as e:
+            in_flight_request.error = e
+            raise
+        else:
+            in_flight_request.response = response
+            if reuse_completed:
+                self._set_completed(key, response)
+            return copy.deepcopy(response)
+        finally:
+            del self._in_flight[in_flight_key]
+            in_flight_request.done.set()
+
+    def clear(self) -> None:
+        """Forget the responses of the completed requests."""
+        with self._lock:
+            self._completed.clear()
+
+
+_REQUEST_COALESCER = _RequestCoalescer()
+"""Coalescer of the requests sent by ``complete_conversation``, shared by the process"""
+
+_RequestCoalescing = Literal["disabled", "in_flight", "reuse_completed"]
+
+_REQUEST_COALESCING: ContextVar[_RequestCoalescing] = ContextVar(
+    "_REQUEST_COALESCING", default="in_flight"
+)
+
+
+@contextmanager
+def _use_request_coalescing(coalescing: _RequestCoalescing) -> Iterator[None]:
+    """
+    Set how the LLM requests sent in the current context are coalesced with identical ones.
+
+    - ``"disabled"``: every request is sent;
+    - ``"in_flight"``: requests wait for the response of an identical request in flight;
+    - ``"reuse_completed"``: requests also reuse the response of an identical request that
+      completed in the last minutes.
+    """
+    token = _REQUEST_COALESCING.set(coalescing)
+    try:
+        yield
+    finally:
+        _REQUEST_COALESCING.reset(token)
+
+
+def _get_request_key(messages: List[Dict[str, str]], llm_config: LlmConfig) -> str:
+    # The ``id`` of the configuration does not change the request, it is not fingerprinted
+    return _hash_fingerprint(_fingerprint([messages, llm_config], []))
+
+
+async def _complete_with_coalescing(
+    messages: List[Dict[str, str]],
+    llm_config: LlmConfig,
+    send_request: Callable[[], Awaitable[Dict[str, Any]]],
+    coalescing: Optional[_RequestCoalescing] = None,
+) -> Dict[str, Any]:
+    """
+    Return the response of ``send_request``, shared with the identical requests.
+
+    ``coalescing`` defaults to the coalescing of the current context. Only the requests that
+    are actually sent run ``send_request``, so that requests served by identical ones do not
+    consume the budget of the scheduler when ``send_request`` schedules them.
+    """
+    if coalescing is None:
+        coalescing = _REQUEST_COALESCING.get()
+    if coalescing == "disabled":
+        return await send_request()
+    return await _REQUEST_COALESCER.complete(
+        _get_request_key(messages, llm_config),
+        send_request,
+        reuse_completed=coalescing == "reuse_completed",
+    )
+
+
 async def complete_conversation(
     conversation: str | List[Dict[str, str]],
     llm_config: LlmConfig,
+    coalescing: Optional[_RequestCoalescing] = None,
 ) -> Dict[str, Any]:
-    """Execute a chat completion request and surface the provider response as a dict."""
+    """
+    Execute a chat completion request and surface the provider response as a dict.
+
+    By default, identical requests (same messages and LLM configuration) that are in flight
+    share a single response, unless it is changed in the current context, e.g., by
+    ``RepeatMetric``, which needs independent responses, or by an ``Evaluator`` reusing the
+    responses of completed requests. ``coalescing`` overrides the coalescing of the context.
+    """
     if isinstance(conversation, str):
         messages = [{"role": "user", "content": conversation}]
     else:
         messages = conversation
 
+    return await _complete_with_coalescing(
+        messages, llm_config, lambda: _send_request(messages, llm_config), coalescing
+    )
+
+
+async def _send_request(messages: List[Dict[str, str]], llm_config: LlmConfig) -> Dict[str, Any]:
     response = await acompletion(
         messages=messages,
         **_get_llm_config_as_litellm_dict(llm_config),
@@ -13,7 +13,7 @@ datasets, metrics, and aggregators without causing circular imports.
 
 import inspect
 from collections import Counter
-from typing import Any, Callable, Collection, Dict, List, Sequence, TypeVar
+from typing import Any, Callable, Collection, Dict, List, Optional, Sequence, Tuple, TypeVar
 
 T = TypeVar("T")
 
@@ -64,6 +64,80 @@ def _bind_kwargs_to_func(
         raise RuntimeError("Unexpected error in binding args to function.") from e
 
 
+class _ArgumentsBinder:
+    """Binding plan of the arguments of calls to ``f``, computed once from its signature.
+
+    Binding the keyword arguments of a call with the plan is equivalent to mapping their names
+    with ``_map_names`` and binding them with ``_bind_kwargs_to_func``, without inspecting the
+    signature of ``f`` on every call. Signatures with positional-only parameters, calls with
+    positional arguments, and the signatures rejected by ``_bind_kwargs_to_func`` fall back to
+    these helpers.
+    """
+
+    def __init__(self, f: Callable[..., Any], input_mapping: Optional[Dict[str, str]]) -> None:
+        self.f = f
+        self.input_mapping = input_mapping
+        # The mapping can be modified in place after the plan is computed from it
+        self._input_mapping_snapshot = dict(input_mapping) if input_mapping is not None else None
+        parameters = inspect.signature(f).parameters.values()
+        kinds = {parameter.kind for parameter in parameters}
+        # ``f(*args, **kwargs)`` receives the arguments as they are
+        self._passes_through = len(parameters) == 2 and kinds == {
+            inspect.Parameter.VAR_POSITIONAL,
+            inspect.Parameter.VAR_KEYWORD,
+        }
+        self._filters_kwargs = not kinds & {
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.VAR_POSITIONAL,
+            inspect.Parameter.VAR_KEYWORD,
+        }
+        self._defaults = {
+            parameter.name: parameter.default
+            for parameter in parameters
+            if parameter.default is not inspect.Parameter.empty
+        }
+        # Names of the keyword arguments that are mapped to each parameter
+        self._sources: List[Tuple[str, Tuple[str, ...]]] = []
+        for parameter in parameters:
+            sources = [
+                name
+                for name, mapped_name in (input_mapping or {}).items()
+                if mapped_name == parameter.name
+            ]
+            if input_mapping is None or parameter.name not in input_mapping:
+                sources.append(parameter.name)
+            self._sources.append((parameter.name, tuple(sources)))
+
+    def is_valid_for(self, input_mapping: Optional[Dict[str, str]]) -> bool:
+        """Return whether the plan binds the arguments following ``input_mapping``."""
+        return input_mapping is self.input_mapping and input_mapping == self._input_mapping_snapshot
+
+    def bind(self, *args: Any, **kwargs: Any) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        """Return the positional and keyword arguments to call ``f`` with."""
+        if args or not (self._passes_through or self._filters_kwargs):
+            if self.input_mapping is not None:
+                kwargs = _map_names(kwargs, self.input_mapping)
+            bound_args = _bind_kwargs_to_func(self.f, *args, **kwargs)
+            return bound_args.args, bound_args.kwargs
+
+        if self._passes_through:
+            if self.input_mapping is not None:
+                kwargs = _map_names(kwargs, self.input_mapping)
+            return (), kwargs
+
+        bound_kwargs = dict(self._defaults)
+        for parameter_name, sources in self._sources:
+            if len(sources) == 1:
+                if sources[0] in kwargs:
+                    bound_kwargs[parameter_name] = kwargs[sources[0]]
+                continue
+            # Like ``_map_names``, the last of the arguments mapped to the same name is kept
+            for name, value in kwargs.items():
+                if name in sources:
+                    bound_kwargs[parameter_name] = value
+        return (), bound_kwargs
+
+
 def _chain_exceptions(exceptions: Sequence[Exception]) -> Exception:
     """Produce a causal chain of exceptions for consolidated error reporting."""
     if not exceptions:
@@ -0,0 +1,12 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+from .results_cache import ResultsCache, SqliteResultsCache
+
+__all__ = [
+    "ResultsCache",
+    "SqliteResultsCache",
+]
@@ -0,0 +1,180 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+"""Deterministic fingerprints of metrics, intermediates and of the arguments they are called with.
+
+Fingerprints are JSON-compatible structures that only depend on the content of the objects, so
+that they are stable across processes. They are hashed to build the keys of the results caches.
+"""
+
+import hashlib
+import json
+import logging
+import types
+from typing import Any, Callable, Dict, List
+
+from pydantic import BaseModel
+
+from pyagentspec.component import Component
+from pyagentspec.evaluation._utils import _bind_kwargs_to_func, _map_names
+
+_CACHE_KEY_FORMAT_VERSION = 1
+"""Version of the format of the cache keys, to be increased when fingerprints change"""
+
+
+def _get_type_path(type_: type) -> str:
+    return f"{type_.__module__}.{type_.__qualname__}"
+
+
+def _hash_bytes(value: bytes) -> str:
+    return hashlib.sha256(value).hexdigest()
+
+
+def _fingerprint_code(code: types.CodeType, visited: List[int]) -> Any:
+    return [
+        "code",
+        code.co_name,
+        _hash_bytes(code.co_code),
+        list(code.co_names),
+        [
+            (
+                _fingerprint_code(const, visited)
+                if isinstance(const, types.CodeType)
+                else _fingerprint(const, visited)
+            )
+            for const in code.co_consts
+        ],
+    ]
+
+
+def _fingerprint_function(function: types.FunctionType, visited: List[int]) -> Any:
+    # The code is part of the fingerprint, so that editing a metric invalidates its results
+    closure_values = []
+    for cell in function.__closure__ or ():
+        try:
+            closure_values.append(_fingerprint(cell.cell_contents, visited))
+        except ValueError:
+            # Empty cell, e.g., the closure of a function referencing itself before its definition
+            closure_values.append(None)
+    return [
+        "function",
+        function.__module__,
+        function.__qualname__,
+        _fingerprint_code(function.__code__, visited),
+        _fingerprint(function.__defaults__, visited),
+        closure_values,
+    ]
+
+
+def _fingerprint(value: Any, visited: List[int]) -> Any:
+    """
+    Return a JSON-compatible structure describing ``value``.
+
+    ``visited`` holds the ids of the containers being fingerprinted, to stop on cycles.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, bytes):
+        return ["bytes", _hash_bytes(value)]
+    if hasattr(value, "dtype") and hasattr(value, "tobytes"):
+        # numpy values, as found in the samples of datasets created from pandas dataframes
+        if getattr(value, "shape", None) == ():
+            return _fingerprint(value.item(), visited)
+        return ["array", str(value.dtype), list(value.shape), _hash_bytes(value.tobytes())]
+    if isinstance(value, type):
+        return ["type", _get_type_path(value)]
+    if isinstance(value, types.MethodType):
+        return ["method", value.__func__.__qualname__, _fingerprint(value.__self__, visited)]
+    if isinstance(value, types.FunctionType):
+        return _fingerprint_function(value, visited)
+    if isinstance(value, types.BuiltinFunctionType):
+        return ["builtin", getattr(value, "__module__", None), value.__qualname__]
+    if isinstance(value, types.ModuleType):
+        return ["module", value.__name__]
+    if isinstance(value, logging.Logger):
+        return ["logger", value.name]
+
+    if id(value) in visited:
+        return ["cycle", _get_type_path(type(value))]
+    visited.append(id(value))
+    try:
+        if isinstance(value, (list, tuple)):
+            return [type(value).__name__, [_fingerprint(item, visited) for item in value]]
+        if isinstance(value, (set, frozenset)):
+            items = [_fingerprint(item, visited) for item in value]
+            return ["set", sorted(items, key=lambda item: json.dumps(item, sort_keys=True))]
+        if isinstance(value, dict):
+            entries = [
+                [_fingerprint(key, visited), _fingerprint(item, visited)]
+                for key, item in value.items()
+            ]
+            return ["dict", sorted(entries, key=lambda entry: json.dumps(entry, sort_keys=True))]
+        if isinstance(value, BaseModel):
+            fields = {
+                field_name: _fingerprint(getattr(value, field_name), visited)
+                for field_name in type(value).model_fields
+                # Ids of components are random, they do not change what the component does
+                if not (isinstance(value, Component) and field_name == "id")
+            }
+            return ["model", _get_type_path(type(value)), fields]
+        if hasattr(value, "__dict__"):
+            # Private attributes hold the state of objects (e.g., locks, clients, counters),
+            # or values derived from their public configuration
+            attributes = {
+                name: _fingerprint(attribute, visited)
+                for name, attribute in vars(value).items()
+                if not name.startswith("_")
+            }
+            return ["object", _get_type_path(type(value)), attributes]
+        # Objects without attributes, e.g., locks, are only identified by their type
+        return ["object", _get_type_path(type(value))]
+    finally:
+        visited.pop()
+
+
+def _hash_fingerprint(fingerprint: Any) -> str:
+    serialized_fingerprint = json.dumps(fingerprint, sort_keys=True, default=str)
+    return _hash_bytes(serialized_fingerprint.encode("utf-8"))
+
+
+def _get_callable_fingerprint(callable_: Any) -> str:
+    """Return the hash of the identity, code and configuration of a metric or intermediate."""
+    computed_function = getattr(_get_computed_function(callable_), "__func__", None)
+    return _hash_fingerprint(
+        [
+            _CACHE_KEY_FORMAT_VERSION,
+            _get_type_path(type(callable_)),
+            _fingerprint(computed_function, []),
+            _fingerprint(callable_, []),
+        ]
+    )
+
+
+def _get_computed_function(callable_: Any) -> Callable[..., Any]:
+    """Return the function that receives the arguments bound by the callable."""
+    for method_name in ("compute_metric", "compute_value"):
+        method = getattr(callable_, method_name, None)
+        if method is not None:
+            return method  # type: ignore[no-any-return]
+    return callable_  # type: ignore[no-any-return]
+
+
+def _get_arguments_fingerprint(callable_: Any, sample: Dict[str, Any]) -> str:
+    """
+    Return the hash of the arguments that the callable receives when called on ``sample``.
+
+    The arguments are bound the same way as in ``Metric.__call__`` and ``Intermediate.__call__``,
+    so that the features of the sample that the callable does not use do not change the hash.
+    """
+    input_mapping = getattr(callable_, "input_mapping", None)
+    kwargs = _map_names(sample, input_mapping) if input_mapping is not None else sample
+    computed_function = _get_computed_function(callable_)
+    try:
+        arguments = dict(_bind_kwargs_to_func(computed_function, **kwargs).arguments)
+    except RuntimeError:
+        # The callable will fail the same way when called, the whole sample identifies the call
+        arguments = kwargs
+    return _hash_fingerprint(_fingerprint(arguments, []))
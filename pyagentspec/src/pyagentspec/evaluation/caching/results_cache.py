@@ -0,0 +1,138 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Any, Dict, Optional, Tuple, Type
+
+import anyio
+
+logger = logging.getLogger(__name__)
+
+
+class ResultsCache(ABC):
+    """
+    Base class of the caches of the results of metrics and intermediates.
+
+    A results cache is given to an ``Evaluator`` or to ``add_intermediates`` to skip the
+    computations whose result is already known. Results are identified by a key built from the
+    class, the code and the public attributes of the metric or intermediate, and from the
+    arguments that it receives. Results of metrics whose computation failed are never cached.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """Return the result cached under ``key``, or None if there is none."""
+
+    @abstractmethod
+    async def set(self, key: str, name: str, result: Tuple[Any, Dict[str, Any]]) -> None:
+        """Cache ``result``, computed by the metric or intermediate named ``name``, under ``key``."""
+
+
+class SqliteResultsCache(ResultsCache):
+    """
+    Results cache persisted in a local SQLite database.
+
+    The database can be shared by several evaluations, and reused across processes, so that
+    rerunning an evaluation over a mostly unchanged dataset only computes the new results.
+
+    .. warning::
+        Results are stored with ``pickle``. Only open databases that you trust.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """
+        Parameters
+        ----------
+        path
+            Path of the SQLite database file. It is created if it does not exist.
+        """
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, name TEXT NOT NULL, result BLOB NOT NULL, "
+                "created_at REAL NOT NULL)"
+            )
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT result FROM results WHERE key = ?", (key,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def _set(self, key: str, name: str, serialized_result: bytes) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results (key, name, result, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, name, serialized_result, time.time()),
+            )
+
+    async def get(self, key: str) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        serialized_result = await anyio.to_thread.run_sync(self._get, key)
+        if serialized_result is None:
+            return None
+        try:
+            return pickle.loads(serialized_result)  # type: ignore[no-any-return]
+        except Exception as e:
+            # e.g., the class of a cached value was removed, the result is computed again
+            logger.warning("Cached result `%s` cannot be loaded: %s", key, e)
+            return None
+
+    async def set(self, key: str, name: str, result: Tuple[Any, Dict[str, Any]]) -> None:
+        try:
+            serialized_result = pickle.dumps(result)
+        except Exception as e:
+            logger.warning("The result of `%s` cannot be cached: %s", name, e)
+            return
+        await anyio.to_thread.run_sync(self._set, key, name, serialized_result)
+
+    def clear(self, name: str | None = None) -> None:
+        """
+        Remove the cached results.
+
+        Parameters
+        ----------
+        name
+            If given, only remove the results of the metrics or intermediates with this name.
+        """
+        with self._lock, self._connection:
+            if name is None:
+                self._connection.execute("DELETE FROM results")
+            else:
+                self._connection.execute("DELETE FROM results WHERE name = ?", (name,))
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute("SELECT COUNT(*) FROM results").fetchone()
+        return int(count)
+
+    def __enter__(self) -> "SqliteResultsCache":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -78,15 +78,15 @@ class _DictDataSource(_DataSource):
 
         if features_consistency == "strict":
             for id_, sample in data_iterator:
-                keys = set(sample.keys())
-                if keys != features:
+                # Keys views are compared to the reference set without copying them
+                if sample.keys() != features:
                     raise ValueError(
-                        f"Sample {id_} has keys {keys}, "
+                        f"Sample {id_} has keys {set(sample)}, "
                         f"which differ from reference keys {features}."
                     )
         elif features_consistency == "relaxed":
             for _, sample in data_iterator:
-                features &= set(sample.keys())
+                features &= sample.keys()
         elif features_consistency == "bypass":
             pass
         else:
@@ -0,0 +1,317 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+"""Data sources reading their samples lazily from local files.
+
+The samples of a file are not loaded in memory: the sources only keep the offsets of the
+samples in the file (JSONL and CSV) or the row counts of its row groups (Parquet), so that each
+sample is read from disk when it is fetched, in a worker thread so that the event loop is not
+blocked. Samples are identified by their position in the file, as for datasets created from a
+list of samples.
+"""
+
+import bisect
+import csv
+import io
+import json
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Collection,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import anyio
+
+from pyagentspec._lazy_loader import LazyLoader
+from pyagentspec.evaluation.datasets._data_source import _DataSource
+
+if TYPE_CHECKING:
+    # Important: do not move this import out of the TYPE_CHECKING block so long as pyarrow is an optional dependency.
+    # Otherwise, importing the module when they are not installed would lead to an import error.
+
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+else:
+    pa = LazyLoader("pyarrow")
+    pq = LazyLoader("pyarrow.parquet")
+
+
+class _PositionalDataSource(_DataSource):
+    """Data source whose samples are identified by their position, from ``0`` to ``len - 1``."""
+
+    def _require_position(self, id: Hashable) -> int:
+        if isinstance(id, int) and not isinstance(id, bool) and 0 <= id < len(self):
+            return id
+        raise KeyError(f"No sample with id {id} found in the dataset.")
+
+    async def ids(self) -> AsyncIterator[Hashable]:
+        for position in range(len(self)):
+            yield position
+
+
+class _JsonlDataSource(_PositionalDataSource):
+    """Data source reading the samples of a JSON Lines file, one JSON object per line."""
+
+    def __init__(self, path: str | os.PathLike[str], encoding: str = "utf-8") -> None:
+        """
+        Index the lines of the file and infer the features from its first sample.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Path of the JSON Lines file. Blank lines are ignored.
+
+        encoding : str, default "utf-8"
+            Encoding of the file.
+
+        Raises
+        ------
+        ValueError
+            If the file contains no samples, or its first sample is not a JSON object with
+            features.
+        """
+
+        super().__init__()
+        self.path = os.fspath(path)
+        self.encoding = encoding
+        # Offsets of the samples in the file, only the line breaks are scanned, not the JSON
+        self._offsets = array("q")
+        with open(self.path, "rb") as jsonl_file:
+            offset = 0
+            for line in jsonl_file:
+                if line.strip():
+                    self._offsets.append(offset)
+                offset += len(line)
+        if not self._offsets:
+            raise ValueError("The `DataSource` contains no samples.")
+
+        first_sample = self._read_sample(0)
+        if not first_sample:
+            raise ValueError("No features found in the first sample of the file.")
+        self._features = tuple(first_sample)
+        self._features_set = frozenset(self._features)
+
+    def _read_sample(self, position: int) -> Dict[str, Any]:
+        with open(self.path, "rb") as jsonl_file:
+            jsonl_file.seek(self._offsets[position])
+            sample = json.loads(jsonl_file.readline().decode(self.encoding))
+        if not isinstance(sample, dict):
+            raise ValueError(
+                f"Sample {position} of `{self.path}` is not a JSON object: {type(sample).__name__}."
+            )
+        return sample
+
+    async def get_sample(self, id: Hashable) -> Dict[str, Any]:
+        position = self._require_position(id)
+        sample = await anyio.to_thread.run_sync(self._read_sample, position)
+        if not sample.keys() >= self._features_set:
+            raise ValueError(
+                f"Sample {id} has keys {set(sample)}, "
+                f"which miss some of the reference keys {set(self._features_set)}."
+            )
+        return sample
+
+    def features(self) -> Collection[str]:
+        return self._features
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+
+class _CsvDataSource(_PositionalDataSource):
+    """Data source reading the rows of a CSV file whose header holds the feature names."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        delimiter: str = ",",
+        quotechar: str = '"',
+        encoding: str = "utf-8",
+    ) -> None:
+        """
+        Index the rows of the file and read the features from its header.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Path of the CSV file. Its first row is the header, blank rows are ignored.
+
+        delimiter : str, default ","
+            Character separating the fields of a row.
+
+        quotechar : str, default '"'
+            Character quoting the fields that contain special characters, such as line breaks.
+
+        encoding : str, default "utf-8"
+            Encoding of the file, which must encode the delimiter, the quote character and the
+            line breaks as in ASCII.
+
+        Raises
+        ------
+        ValueError
+            If the file has no header, no features or no samples, or duplicated feature names.
+        """
+
+        super().__init__()
+        self.path = os.fspath(path)
+        self.delimiter = delimiter
+        self.quotechar = quotechar
+        self.encoding = encoding
+        # Offsets of the rows in the file, followed by the end offset of the last row
+        self._offsets = array("q")
+        self._features: Tuple[str, ...] = ()
+
+        end_offset = 0
+        with open(self.path, "rb") as csv_file:
+            # Rows are delimited by the CSV parser itself, which pulls the lines of a row from
+            # this generator, so that its offset after a row is the end offset of the row
+            offset = 0
+
+            def read_lines() -> Iterator[str]:
+                nonlocal offset
+                for line in csv_file:
+                    offset += len(line)
+                    yield line.decode(encoding)
+
+            reader = csv.reader(read_lines(), delimiter=delimiter, quotechar=quotechar)
+            row_offset = 0
+            for row in reader:
+                is_blank_row = len(row) <= 1 and not "".join(row).strip()
+                if not is_blank_row:
+                    if not self._features:
+                        self._features = self._parse_header(row)
+                    else:
+                        self._offsets.append(row_offset)
+                        end_offset = offset
+                row_offset = offset
+        if not self._features:
+            raise ValueError("The CSV file has no header.")
+        if not self._offsets:
+            raise ValueError("The `DataSource` contains no samples.")
+        self._offsets.append(end_offset)
+
+    def _parse_row(self, row: bytes) -> List[str]:
+        reader = csv.reader(
+            io.StringIO(row.decode(self.encoding)),
+            delimiter=self.delimiter,
+            quotechar=self.quotechar,
+        )
+        return next(reader, [])
+
+    def _parse_header(self, features: List[str]) -> Tuple[str, ...]:
+        # Byte order mark written by some spreadsheet applications
+        features[0] = features[0].lstrip("\ufeff")
+        if not any(features):
+            raise ValueError("No features found in the header of the CSV file.")
+        if len(set(features)) != len(features):
+            raise ValueError(f"The header of the CSV file has duplicated features: {features}.")
+        return tuple(features)
+
+    def _read_row(self, position: int) -> List[str]:
+        start, end = self._offsets[position], self._offsets[position + 1]
+        with open(self.path, "rb") as csv_file:
+            csv_file.seek(start)
+            return self._parse_row(csv_file.read(end - start))
+
+    async def get_sample(self, id: Hashable) -> Dict[str, Any]:
+        position = self._require_position(id)
+        row = await anyio.to_thread.run_sync(self._read_row, position)
+        if len(row) != len(self._features):
+            raise ValueError(
+                f"Sample {id} has {len(row)} fields, "
+                f"while the header has {len(self._features)} features."
+            )
+        return dict(zip(self._features, row))
+
+    def features(self) -> Collection[str]:
+        return self._features
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+
+class _ParquetDataSource(_PositionalDataSource):
+    """Data source reading the rows of a Parquet file, one row group at a time."""
+
+    _MAX_CACHED_ROW_GROUPS = 2
+    """Decoded row groups kept in memory, samples are usually fetched in order"""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """
+        Read the schema and the row counts of the row groups of the file.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Path of the Parquet file.
+
+        Raises
+        ------
+        ValueError
+            If the file contains no samples or no features.
+        """
+
+        super().__init__()
+        self.path = os.fspath(path)
+        metadata = pq.read_metadata(self.path)
+        self._features = tuple(metadata.schema.to_arrow_schema().names)
+        if not self._features:
+            raise ValueError("No features found in the schema of the Parquet file.")
+        if metadata.num_rows == 0:
+            raise ValueError("The `DataSource` contains no samples.")
+        # Position of the first row of each row group
+        self._row_group_starts: List[int] = []
+        num_rows = 0
+        for row_group_index in range(metadata.num_row_groups):
+            self._row_group_starts.append(num_rows)
+            num_rows += metadata.row_group(row_group_index).num_rows
+        self._num_rows = num_rows
+        self._row_groups: "OrderedDict[int, pa.Table]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_cached_row_group(self, row_group_index: int) -> Optional["pa.Table"]:
+        with self._lock:
+            row_group = self._row_groups.get(row_group_index)
+            if row_group is not None:
+                self._row_groups.move_to_end(row_group_index)
+            return row_group
+
+    def _read_row_group(self, row_group_index: int) -> "pa.Table":
+        row_group = pq.ParquetFile(self.path).read_row_group(row_group_index)
+        with self._lock:
+            self._row_groups[row_group_index] = row_group
+            while len(self._row_groups) > self._MAX_CACHED_ROW_GROUPS:
+                self._row_groups.popitem(last=False)
+        return row_group
+
+    async def get_sample(self, id: Hashable) -> Dict[str, Any]:
+        position = self._require_position(id)
+        row_group_index = bisect.bisect_right(self._row_group_starts, position) - 1
+        cached_row_group = self._get_cached_row_group(row_group_index)
+        row_group = (
+            cached_row_group
+            if cached_row_group is not None
+            else await anyio.to_thread.run_sync(self._read_row_group, row_group_index)
+        )
+        row = row_group.slice(position - self._row_group_starts[row_group_index], 1)
+        return row.to_pylist()[0]  # type: ignore[no-any-return]
+
+    def features(self) -> Collection[str]:
+        return self._features
+
+    def __len__(self) -> int:
+        return self._num_rows
@@ -0,0 +1,61 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+from typing import Any, AsyncIterator, Collection, Dict, Hashable, Sequence
+
+from pyagentspec.evaluation.datasets._data_source import _DataSource
+
+
+class _MergedDataSource(_DataSource):
+    """
+    Data source adding features to the samples of another data source.
+
+    The samples of the other data source are not copied, they are fetched from it and merged
+    with their additional features when they are requested.
+    """
+
+    def __init__(
+        self,
+        data_source: _DataSource,
+        additional_features: Sequence[str],
+        additional_values: Dict[Hashable, Dict[str, Any]],
+    ) -> None:
+        """
+        Parameters
+        ----------
+        data_source : _DataSource
+            Data source providing the samples and their identifiers.
+
+        additional_features : Sequence[str]
+            Names of the features added to the samples, which take precedence over the features
+            of ``data_source`` with the same names.
+
+        additional_values : Dict[Hashable, Dict[str, Any]]
+            Values of the additional features, by sample identifier. The samples without
+            additional values are returned unchanged.
+        """
+
+        super().__init__()
+        self.data_source = data_source
+        self.additional_values = additional_values
+        features = list(data_source.features())
+        existing_features = set(features)
+        self._features = features + [
+            feature for feature in additional_features if feature not in existing_features
+        ]
+
+    async def get_sample(self, id: Hashable) -> Dict[str, Any]:
+        sample = await self.data_source.get_sample(id)
+        return {**sample, **self.additional_values.get(id, {})}
+
+    def features(self) -> Collection[str]:
+        return self._features
+
+    def ids(self) -> AsyncIterator[Hashable]:
+        return self.data_source.ids()
+
+    def __len__(self) -> int:
+        return len(self.data_source)
@@ -4,11 +4,17 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+import os
 from typing import TYPE_CHECKING, Any, AsyncIterator, Collection, Dict, Hashable, List, Literal
 
 from pyagentspec._lazy_loader import LazyLoader
 from pyagentspec.evaluation.datasets._data_source import _DataSource
 from pyagentspec.evaluation.datasets._dict_data_source import _DictDataSource
+from pyagentspec.evaluation.datasets._file_data_sources import (
+    _CsvDataSource,
+    _JsonlDataSource,
+    _ParquetDataSource,
+)
 
 if TYPE_CHECKING:
     # Important: do not move this import out of the TYPE_CHECKING block so long as pandas is an optional dependency.
@@ -151,3 +157,98 @@ class Dataset(_DataSource):
 
         data = {id_: dict(sample) for id_, sample in df.iterrows()}
         return Dataset(_DictDataSource(data, features_consistency="bypass"))
+
+    @staticmethod
+    def from_jsonl(path: str | os.PathLike[str], encoding: str = "utf-8") -> "Dataset":
+        """
+        Create a dataset reading its samples lazily from a JSON Lines file.
+
+        Only the offsets of the lines are kept in memory, each sample is read from the file when
+        it is fetched. Sample identifiers are the positions of the samples in the file, and the
+        features are the keys of the first sample.
+
+        Parameters
+        ----------
+        path:
+            Path of the JSON Lines file, with one JSON object per line. Blank lines are ignored.
+        encoding:
+            Encoding of the file.
+
+        Returns
+        -------
+        A dataset that reads the samples of the file.
+
+        Raises
+        ------
+        ValueError
+            If the file contains no samples, or its first sample is not a JSON object with
+            features.
+        """
+
+        return Dataset(_JsonlDataSource(path, encoding=encoding))
+
+    @staticmethod
+    def from_csv(
+        path: str | os.PathLike[str],
+        delimiter: str = ",",
+        quotechar: str = '"',
+        encoding: str = "utf-8",
+    ) -> "Dataset":
+        """
+        Create a dataset reading its samples lazily from a CSV file.
+
+        Only the offsets of the rows are kept in memory, each sample is read from the file when
+        it is fetched. Sample identifiers are the positions of the rows after the header, which
+        holds the feature names. Feature values are strings.
+
+        Parameters
+        ----------
+        path:
+            Path of the CSV file. Blank rows are ignored.
+        delimiter:
+            Character separating the fields of a row.
+        quotechar:
+            Character quoting the fields that contain special characters, such as line breaks.
+        encoding:
+            Encoding of the file, which must encode the delimiter, the quote character and the
+            line breaks as in ASCII (e.g., UTF-8 or Latin-1).
+
+        Returns
+        -------
+        A dataset that reads the rows of the file.
+
+        Raises
+        ------
+        ValueError
+            If the file has no header, no features or no samples, or duplicated feature names.
+        """
+
+        return Dataset(
+            _CsvDataSource(path, delimiter=delimiter, quotechar=quotechar, encoding=encoding)
+        )
+
+    @staticmethod
+    def from_parquet(path: str | os.PathLike[str]) -> "Dataset":
+        """
+        Create a dataset reading its samples lazily from a Parquet file.
+
+        The rows are read one row group at a time, when their samples are fetched. Sample
+        identifiers are the positions of the rows in the file, and the features are the columns
+        of its schema. Requires ``pyarrow``.
+
+        Parameters
+        ----------
+        path:
+            Path of the Parquet file.
+
+        Returns
+        -------
+        A dataset that reads the rows of the file.
+
+        Raises
+        ------
+        ValueError
+            If the file contains no samples or no features.
+        """
+
+        return Dataset(_ParquetDataSource(path))
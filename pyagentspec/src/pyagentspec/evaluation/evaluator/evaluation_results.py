@@ -4,7 +4,21 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
-from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Tuple
+import json
+import os
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from pyagentspec._lazy_loader import LazyLoader
 from pyagentspec.evaluation._computers import _result_to_dict
@@ -13,9 +27,193 @@ if TYPE_CHECKING:
     # Important: do not move this import out of the TYPE_CHECKING block so long as pandas is an optional dependency.
     # Otherwise, importing the module when they are not installed would lead to an import error.
 
+    import numpy as np
     import pandas as pd
+    import pyarrow as pa  # type: ignore
+    import pyarrow.feather as pa_feather  # type: ignore
+    import pyarrow.parquet as pa_parquet  # type: ignore
 else:
+    np = LazyLoader("numpy")
     pd = LazyLoader("pandas")
+    pa = LazyLoader("pyarrow")
+    pa_feather = LazyLoader("pyarrow.feather")
+    pa_parquet = LazyLoader("pyarrow.parquet")
+
+_ARROW_METADATA_KEY = b"pyagentspec.evaluation"
+"""Key of the schema metadata describing how the results are stored in Arrow tables"""
+
+_ARROW_FORMAT_VERSION = 1
+"""Version of the layout of the results in Arrow tables, to be increased when it changes"""
+
+
+def _to_object_array(values: Sequence[Any]) -> "np.ndarray":
+    array = np.empty(len(values), dtype=object)
+    # Assigning items one by one, so that sequence values are not broadcast
+    for position, value in enumerate(values):
+        array[position] = value
+    return array
+
+
+def _to_values_array(values: Sequence[Any]) -> "np.ndarray":
+    """Return the values in a typed numpy array if it holds them exactly, in an object one otherwise.
+
+    Typed arrays are only used when all the values have the same kind: booleans, integers that
+    fit in 64 bits, or floats. Columns mixing kinds, e.g., integers and floats, keep the values
+    as they are in an ``object`` array.
+    """
+    if len(values) == 0:
+        return _to_object_array(values)
+    if all(isinstance(value, (bool, np.bool_)) for value in values):
+        return np.array(values, dtype=bool)
+    if all(
+        isinstance(value, (int, np.signedinteger)) and not isinstance(value, bool)
+        for value in values
+    ):
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            return _to_object_array(values)
+    if all(isinstance(value, (float, np.floating)) for value in values):
+        return np.array(values, dtype=np.float64)
+    return _to_object_array(values)
+
+
+def _holds_exactly(values: "np.ndarray", value: Any) -> bool:
+    """Return whether the value can be stored in the array without changing its type."""
+    if values.dtype == object:
+        return True
+    if values.dtype == bool:
+        return isinstance(value, (bool, np.bool_))
+    if values.dtype == np.int64:
+        return (
+            isinstance(value, (int, np.signedinteger))
+            and not isinstance(value, bool)
+            and bool(np.iinfo(np.int64).min <= value <= np.iinfo(np.int64).max)
+        )
+    return isinstance(value, (float, np.floating))
+
+
+class _MetricColumn:
+    """Values and details of the results of one metric, aligned with the samples of the results."""
+
+    def __init__(
+        self,
+        values: "np.ndarray",
+        details: List[Optional[Dict[Hashable, Any]]],
+        present: Optional["np.ndarray"] = None,
+    ) -> None:
+        self.values = values
+        self.details = details
+        # Mask of the samples that have a result, None when every sample has one
+        self.present = present
+
+    @classmethod
+    def from_lists(
+        cls,
+        values: List[Any],
+        details: List[Optional[Dict[Hashable, Any]]],
+        present: Optional["np.ndarray"] = None,
+    ) -> "_MetricColumn":
+        if present is not None and present.all():
+            present = None
+        if present is None:
+            return cls(_to_values_array(values), details)
+        return cls(_to_object_array(values), details, present)
+
+    def has_result(self, position: int) -> bool:
+        return self.present is None or bool(self.present[position])
+
+    def get_value(self, position: int) -> Any:
+        value = self.values[position]
+        # Values of typed arrays are returned as python objects, as they were computed
+        return value if self.values.dtype == object else value.item()
+
+    def set_result(self, position: int, value: Any, details: Dict[Hashable, Any]) -> None:
+        if not _holds_exactly(self.values, value):
+            # Values of typed arrays are converted back to python objects, as they were computed
+            self.values = _to_object_array(self.values.tolist())
+        self.values[position] = value
+        self.details[position] = details
+        if self.present is not None:
+            self.present[position] = True
+
+    def delete_result(self, position: int) -> None:
+        if self.present is None:
+            # Columns with missing results hold their values in object arrays
+            self.values = _to_object_array(self.values.tolist())
+            self.present = np.ones(len(self.details), dtype=bool)
+        self.values[position] = None
+        self.details[position] = None
+        self.present[position] = False
+
+
+class _ResultsView(MutableMapping[Tuple[Hashable, str], Tuple[Any, Dict[Hashable, Any]]]):
+    """Mapping of (sample_id, metric_name) pairs to results, over columnar results.
+
+    Results of the samples and metrics of the evaluation results are read from and written to
+    their columns, the other ones are kept aside.
+    """
+
+    def __init__(self, evaluation_results: "EvaluationResults") -> None:
+        self._evaluation_results = evaluation_results
+
+    def _locate(self, key: Tuple[Hashable, str]) -> Tuple[Optional[_MetricColumn], int]:
+        sample_id, metric_name = key
+        position = self._evaluation_results._sample_positions.get(sample_id)
+        column = self._evaluation_results._columns.get(metric_name)
+        if position is None or column is None:
+            return None, -1
+        return column, position
+
+    def __getitem__(self, key: Tuple[Hashable, str]) -> Tuple[Any, Dict[Hashable, Any]]:
+        column, position = self._locate(key)
+        if column is None:
+            return self._evaluation_results._extra_results[key]
+        if not column.has_result(position):
+            raise KeyError(key)
+        return column.get_value(position), column.details[position]  # type: ignore[return-value]
+
+    def __setitem__(
+        self, key: Tuple[Hashable, str], result: Tuple[Any, Dict[Hashable, Any]]
+    ) -> None:
+        column, position = self._locate(key)
+        if column is None:
+            self._evaluation_results._extra_results[key] = result
+        else:
+            value, details = result
+            column.set_result(position, value, details)
+
+    def __delitem__(self, key: Tuple[Hashable, str]) -> None:
+        column, position = self._locate(key)
+        if column is None:
+            del self._evaluation_results._extra_results[key]
+        elif not column.has_result(position):
+            raise KeyError(key)
+        else:
+            column.delete_result(position)
+
+    def __iter__(self) -> Iterator[Tuple[Hashable, str]]:
+        columns = self._evaluation_results._columns
+        for position, sample_id in enumerate(self._evaluation_results.sample_ids):
+            for metric_name in self._evaluation_results.metric_names:
+                if columns[metric_name].has_result(position):
+                    yield sample_id, metric_name
+        yield from list(self._evaluation_results._extra_results)
+
+    def __len__(self) -> int:
+        num_samples = len(self._evaluation_results.sample_ids)
+        return len(self._evaluation_results._extra_results) + sum(
+            num_samples if column.present is None else int(column.present.sum())
+            for column in self._evaluation_results._columns.values()
+        )
+
+
+def _encode_json(value: Any) -> str:
+    try:
+        return json.dumps(value, default=str)
+    except (TypeError, ValueError):
+        # e.g., dictionaries with tuple keys
+        return json.dumps(str(value))
 
 
 class EvaluationResults:
@@ -26,10 +224,15 @@ class EvaluationResults:
     (sample_id, metric_name) pairs and their corresponding result values and details. It enables exporting
     the results to common formats such as JSON and pandas DataFrame for further analysis or reporting.
 
+    Results are stored by columns: the values of each metric are held in a numpy array aligned with
+    ``sample_ids`` (with a numeric or boolean dtype when possible), next to the list of their details.
+    They can be exported to Arrow tables, Parquet and Feather files without going through Python
+    objects for every result, and the results of sharded evaluations can be combined with ``merge``.
+
     Attributes
     ----------
-    results : Dict[Tuple[Hashable, str], Tuple[Any, Dict[str, Any]]]
-        Dictionary mapping (sample_id, metric_name) pairs to their metric result and related details.
+    results : MutableMapping[Tuple[Hashable, str], Tuple[Any, Dict[str, Any]]]
+        Mapping of (sample_id, metric_name) pairs to their metric result and related details.
 
     sample_ids : List[Hashable]
         List of sample identifiers present in the results.
@@ -37,11 +240,15 @@ class EvaluationResults:
     metric_names : List[str]
         List of metric names present in the results.
 
+    Only the results of the samples in ``sample_ids`` and the metrics in ``metric_names`` are
+    exported, the other results are kept in ``results``. Results, sample ids and metric names
+    are updated by assigning them, or by setting and deleting items of ``results``.
+
     """
 
     def __init__(
         self,
-        results: Dict[Tuple[Hashable, str], Tuple[Any, Dict[Hashable, Any]]],
+        results: Mapping[Tuple[Hashable, str], Tuple[Any, Dict[Hashable, Any]]],
         sample_ids: List[Hashable] | None = None,
         metric_names: List[str] | None = None,
     ) -> None:
@@ -50,9 +257,10 @@ class EvaluationResults:
 
         Parameters
         ----------
-        results : Dict[Tuple[Hashable, str], Tuple[Any, Dict[Hashable, Any]]]
+        results : Mapping[Tuple[Hashable, str], Tuple[Any, Dict[Hashable, Any]]]
             Dictionary mapping (sample_id, metric_name) pairs to result tuples,
             where each tuple consists of a primary value and a details dictionary.
+            The results are copied into columns, the dictionary is not referenced afterwards.
 
         sample_ids : List[Hashable], optional
             List of sample identifiers. If not provided, inferred from the sample IDs present in the results dictionary.
@@ -62,9 +270,122 @@ class EvaluationResults:
 
         """
 
-        self.results = results
-        self.sample_ids = sample_ids or list({sample_id for sample_id, _ in self.results.keys()})
-        self.metric_names = metric_names or list({m_name for _, m_name in self.results.keys()})
+        self._set_results(
+            results,
+            sample_ids or list({sample_id for sample_id, _ in results.keys()}),
+            metric_names or list({m_name for _, m_name in results.keys()}),
+        )
+
+    def _set_results(
+        self,
+        results: Mapping[Tuple[Hashable, str], Tuple[Any, Dict[Hashable, Any]]],
+        sample_ids: List[Hashable],
+        metric_names: List[str],
+    ) -> None:
+        sample_positions = {sample_id: position for position, sample_id in enumerate(sample_ids)}
+        num_samples = len(sample_ids)
+        values: Dict[str, List[Any]] = {name: [None] * num_samples for name in metric_names}
+        details: Dict[str, List[Optional[Dict[Hashable, Any]]]] = {
+            name: [None] * num_samples for name in metric_names
+        }
+        present = {name: np.zeros(num_samples, dtype=bool) for name in metric_names}
+        extra_results: Dict[Tuple[Hashable, str], Tuple[Any, Dict[Hashable, Any]]] = {}
+        for key, result in results.items():
+            sample_id, metric_name = key
+            position = sample_positions.get(sample_id)
+            if position is None or metric_name not in values:
+                extra_results[key] = result
+                continue
+            values[metric_name][position], details[metric_name][position] = result
+            present[metric_name][position] = True
+
+        self._set_columns(
+            sample_ids,
+            metric_names,
+            {
+                name: _MetricColumn.from_lists(values[name], details[name], present[name])
+                for name in metric_names
+            },
+            extra_results,
+        )
+
+    def _set_columns(
+        self,
+        sample_ids: List[Hashable],
+        metric_names: List[str],
+        columns: Dict[str, _MetricColumn],
+        extra_results: Optional[Dict[Tuple[Hashable, str], Tuple[Any, Dict[Hashable, Any]]]] = None,
+    ) -> None:
+        self._sample_ids = sample_ids
+        self._metric_names = metric_names
+        self._sample_positions = {
+            sample_id: position for position, sample_id in enumerate(sample_ids)
+        }
+        self._columns = columns
+        # Results of samples or metrics that are not in `sample_ids` or `metric_names`
+        self._extra_results = extra_results if extra_results is not None else {}
+
+    @classmethod
+    def _from_columns(
+        cls,
+        sample_ids: List[Hashable],
+        metric_names: List[str],
+        columns: Dict[str, _MetricColumn],
+    ) -> "EvaluationResults":
+        evaluation_results = cls.__new__(cls)
+        evaluation_results._set_columns(sample_ids, metric_names, columns)
+        return evaluation_results
+
+    @property
+    def results(self) -> MutableMapping[Tuple[Hashable, str], Tuple[Any, Dict[Hashable, Any]]]:
+        """Mapping of (sample_id, metric_name) pairs to their value and details."""
+        return _ResultsView(self)
+
+    @results.setter
+    def results(
+        self, results: Mapping[Tuple[Hashable, str], Tuple[Any, Dict[Hashable, Any]]]
+    ) -> None:
+        self._set_results(results, self._sample_ids, self._metric_names)
+
+    @property
+    def sample_ids(self) -> List[Hashable]:
+        """Identifiers of the samples of the results, in the order they are exported.
+
+        Assign a new list to change them, the list is not expected to be modified in place.
+        """
+        return self._sample_ids
+
+    @sample_ids.setter
+    def sample_ids(self, sample_ids: List[Hashable]) -> None:
+        self._set_results(dict(self.results), sample_ids, self._metric_names)
+
+    @property
+    def metric_names(self) -> List[str]:
+        """Names of the metrics of the results, in the order they are exported.
+
+        Assign a new list to change them, the list is not expected to be modified in place.
+        """
+        return self._metric_names
+
+    @metric_names.setter
+    def metric_names(self, metric_names: List[str]) -> None:
+        self._set_results(dict(self.results), self._sample_ids, metric_names)
+
+    def get_values(self, metric_name: str) -> "np.ndarray":
+        """Return the values of a metric, aligned with ``sample_ids``.
+
+        The array has a boolean, integer or float dtype when all the values have this type,
+        and the ``object`` dtype otherwise, e.g., for values mixing integers and floats, or when
+        some samples have no result for the metric.
+        """
+        return self._columns[metric_name].values
+
+    def get_details(self, metric_name: str) -> List[Optional[Dict[Hashable, Any]]]:
+        """Return the details of the values of a metric, aligned with ``sample_ids``.
+
+        Samples without a result for the metric have ``None`` details.
+        """
+        return self._columns[metric_name].details
 
     def to_dict(self) -> Dict[Hashable, Dict[str, Dict[str, Any]]]:
         """Return the results keyed by sample and metric in dictionary form.
@@ -76,9 +397,10 @@ class EvaluationResults:
             where each result_dict has keys 'value' and 'details'.
         """
 
+        results = self.results
         return {
             sample_id: {
-                metric_name: _result_to_dict(self.results[(sample_id, metric_name)])
+                metric_name: _result_to_dict(results[(sample_id, metric_name)])
                 for metric_name in self.metric_names
             }
             for sample_id in self.sample_ids
@@ -94,12 +416,255 @@ class EvaluationResults:
             Each cell contains the main result value for the corresponding (sample_id, metric_name) pair
         """
 
-        return pd.DataFrame(
-            {
-                metric_name: [
-                    self.results[(sample_id, metric_name)][0] for sample_id in self.sample_ids
+        columns: Dict[str, Any] = {}
+        for metric_name in self.metric_names:
+            column = self._columns[metric_name]
+            if column.present is not None:
+                missing_position = int(np.argmin(column.present))
+                raise KeyError((self.sample_ids[missing_position], metric_name))
+            # Typed arrays are used as they are, pandas infers the dtype of the other values
+            columns[metric_name] = (
+                column.values if column.values.dtype != object else column.values.tolist()
+            )
+        return pd.DataFrame(columns, index=pd.Series(self.sample_ids))
+
+    def to_arrow(self, include_details: bool = True) -> "pa.Table":
+        """Return the results as a :class:`pyarrow.Table` with one row per sample.
+
+        The table has a ``__sample_id__`` column, a column with the values of every metric, and,
+        if ``include_details`` is True, a ``<metric_name>__details`` column with the details of
+        the values encoded as JSON strings (objects that are not JSON-serializable are stored as
+        strings). Values that Arrow cannot represent are also encoded as JSON strings. The layout
+        is described in the schema metadata, so that ``from_arrow`` can read the table back.
+
+        Requires the ``pyarrow`` package.
+        """
+
+        def to_arrow_array(values: Any, mask: Optional["np.ndarray"]) -> Tuple[Any, str]:
+            try:
+                if isinstance(values, np.ndarray) and values.dtype != object:
+                    return pa.array(values, mask=mask), "arrow"
+                array = pa.array(list(values), mask=mask)
+                # Arrow stores integers mixed with floats as floats, they would not be read back
+                # as they were computed
+                if not (
+                    pa.types.is_floating(array.type)
+                    and any(isinstance(value, (int, np.integer)) for value in values)
+                ):
+                    return array, "arrow"
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, TypeError):
+                pass
+            encoded_values = [
+                _encode_json(value) if mask is None or not mask[position] else None
+                for position, value in enumerate(values)
+            ]
+            return pa.array(encoded_values, type=pa.large_string()), "json"
+
+        arrays = []
+        names = []
+        sample_ids_array, sample_ids_encoding = to_arrow_array(self.sample_ids, None)
+        arrays.append(sample_ids_array)
+        names.append("__sample_id__")
+
+        metrics_layouts = []
+        for metric_name in self.metric_names:
+            column = self._columns[metric_name]
+            missing = ~column.present if column.present is not None else None
+            values_array, values_encoding = to_arrow_array(column.values, missing)
+            arrays.append(values_array)
+            names.append(metric_name)
+            if include_details:
+                arrays.append(
+                    pa.array(
+                        [
+                            _encode_json(details) if column.has_result(position) else None
+                            for position, details in enumerate(column.details)
+                        ],
+                        type=pa.large_string(),
+                    )
+                )
+                names.append(f"{metric_name}__details")
+            if column.present is not None:
+                arrays.append(pa.array(column.present))
+                names.append(f"{metric_name}__present")
+            metrics_layouts.append(
+                {
+                    "name": metric_name,
+                    "values_encoding": values_encoding,
+                    "has_presence": column.present is not None,
+                }
+            )
+
+        metadata = {
+            "format_version": _ARROW_FORMAT_VERSION,
+            "sample_ids_encoding": sample_ids_encoding,
+            "has_details": include_details,
+            "metrics": metrics_layouts,
+        }
+        return pa.Table.from_arrays(
+            arrays, names=names, metadata={_ARROW_METADATA_KEY: json.dumps(metadata)}
+        )
+
+    def to_parquet(
+        self, path: str | os.PathLike[str], include_details: bool = True, **kwargs: Any
+    ) -> None:
+        """Write the results to a Parquet file, with the layout of ``to_arrow``.
+
+        Additional keyword arguments are passed to :func:`pyarrow.parquet.write_table`.
+        Requires the ``pyarrow`` package.
+        """
+        pa_parquet.write_table(self.to_arrow(include_details=include_details), path, **kwargs)
+
+    def to_feather(
+        self, path: str | os.PathLike[str], include_details: bool = True, **kwargs: Any
+    ) -> None:
+        """Write the results to a Feather file, with the layout of ``to_arrow``.
+
+        Additional keyword arguments are passed to :func:`pyarrow.feather.write_feather`.
+        Requires the ``pyarrow`` package.
+        """
+        pa_feather.write_feather(self.to_arrow(include_details=include_details), path, **kwargs)
+
+    @classmethod
+    def from_arrow(cls, table: "pa.Table") -> "EvaluationResults":
+        """Return the results stored in an Arrow table written by ``to_arrow``.
+
+        Details are read back as the JSON-compatible structures they were encoded to, and are
+        empty if the table was written without details.
+        """
+        schema_metadata = table.schema.metadata or {}
+        if _ARROW_METADATA_KEY not in schema_metadata:
+            raise ValueError("The table was not written by `EvaluationResults.to_arrow`.")
+        metadata = json.loads(schema_metadata[_ARROW_METADATA_KEY])
+        if metadata["format_version"] != _ARROW_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported version {metadata['format_version']} of the results layout."
+            )
+
+        def decode(array: Any, encoding: str) -> List[Any]:
+            values = array.to_pylist()
+            if encoding == "json":
+                return [json.loads(value) if value is not None else None for value in values]
+            return values  # type: ignore[no-any-return]
+
+        column_position = 0
+
+        def next_column() -> Any:
+            nonlocal column_position
+            column = table.column(column_position)
+            column_position += 1
+            return column
+
+        sample_ids = decode(next_column(), metadata["sample_ids_encoding"])
+        num_samples = len(sample_ids)
+        columns: Dict[str, _MetricColumn] = {}
+        for layout in metadata["metrics"]:
+            values_array = next_column()
+            details: List[Optional[Dict[Hashable, Any]]] = (
+                [
+                    json.loads(details) if details is not None else None
+                    for details in next_column().to_pylist()
                 ]
-                for metric_name in self.metric_names
+                if metadata["has_details"]
+                else [{} for _ in range(num_samples)]
+            )
+            present = (
+                np.array(next_column().to_pylist(), dtype=bool) if layout["has_presence"] else None
+            )
+            if present is not None:
+                details = [
+                    item if is_present else None for item, is_present in zip(details, present)
+                ]
+            if (
+                present is None
+                and layout["values_encoding"] == "arrow"
+                and values_array.null_count == 0
+                and (
+                    pa.types.is_boolean(values_array.type)
+                    or pa.types.is_integer(values_array.type)
+                    or pa.types.is_floating(values_array.type)
+                )
+            ):
+                columns[layout["name"]] = _MetricColumn(values_array.to_numpy(), details)
+            else:
+                columns[layout["name"]] = _MetricColumn.from_lists(
+                    decode(values_array, layout["values_encoding"]), details, present
+                )
+        return cls._from_columns(
+            sample_ids, [layout["name"] for layout in metadata["metrics"]], columns
+        )
+
+    @classmethod
+    def read_parquet(cls, path: str | os.PathLike[str]) -> "EvaluationResults":
+        """Read results written by ``to_parquet``. Requires the ``pyarrow`` package."""
+        return cls.from_arrow(pa_parquet.read_table(path))
+
+    @classmethod
+    def read_feather(cls, path: str | os.PathLike[str]) -> "EvaluationResults":
+        """Read results written by ``to_feather``. Requires the ``pyarrow`` package."""
+        return cls.from_arrow(pa_feather.read_table(path))
+
+    @classmethod
+    def merge(cls, results: Sequence["EvaluationResults"]) -> "EvaluationResults":
+        """Combine the partial results of sharded evaluations into a single one.
+
+        Shards can hold different samples, different metrics, or both. The samples and metrics
+        of the merged results follow their order of appearance in ``results``. Samples without
+        a result for a metric in any of the shards have no result for it in the merged results.
+        Results that the shards keep outside of their samples and metrics are kept as well.
+
+        Raises
+        ------
+        ValueError
+            If several shards hold a result for the same (sample_id, metric_name) pair.
+        """
+        sample_ids: List[Hashable] = []
+        sample_positions: Dict[Hashable, int] = {}
+        metric_names: List[str] = []
+        for shard in results:
+            for sample_id in shard.sample_ids:
+                if sample_id not in sample_positions:
+                    sample_positions[sample_id] = len(sample_ids)
+                    sample_ids.append(sample_id)
+            metric_names.extend(name for name in shard.metric_names if name not in metric_names)
+
+        num_samples = len(sample_ids)
+        values: Dict[str, List[Any]] = {name: [None] * num_samples for name in metric_names}
+        details: Dict[str, List[Optional[Dict[Hashable, Any]]]] = {
+            name: [None] * num_samples for name in metric_names
+        }
+        present = {name: np.zeros(num_samples, dtype=bool) for name in metric_names}
+        for shard in results:
+            positions = [sample_positions[sample_id] for sample_id in shard.sample_ids]
+            for metric_name in shard.metric_names:
+                column = shard._columns[metric_name]
+                for shard_position, position in enumerate(positions):
+                    if not column.has_result(shard_position):
+                        continue
+                    if present[metric_name][position]:
+                        raise ValueError(
+                            "Several results are merged for sample "
+                            f"`{sample_ids[position]}` and metric `{metric_name}`."
+                        )
+                    values[metric_name][position] = column.get_value(shard_position)
+                    details[metric_name][position] = column.details[shard_position]
+                    present[metric_name][position] = True
+
+        merged_results = cls._from_columns(
+            sample_ids,
+            metric_names,
+            {
+                name: _MetricColumn.from_lists(values[name], details[name], present[name])
+                for name in metric_names
             },
-            index=pd.Series(self.sample_ids),
         )
+        merged_view = merged_results.results
+        for shard in results:
+            for (sample_id, metric_name), result in shard._extra_results.items():
+                if (sample_id, metric_name) in merged_view:
+                    raise ValueError(
+                        "Several results are merged for sample "
+                        f"`{sample_id}` and metric `{metric_name}`."
+                    )
+                merged_view[(sample_id, metric_name)] = result
+        return merged_results
@@ -4,13 +4,16 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
-from typing import Any, Dict, Sequence, Tuple
+import os
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 from pyagentspec.evaluation._computers import _AsyncCallablesComputer
 from pyagentspec.evaluation._utils import _get_duplicates
+from pyagentspec.evaluation.caching import ResultsCache
 from pyagentspec.evaluation.datasets import Dataset
 from pyagentspec.evaluation.evaluator.evaluation_results import EvaluationResults
 from pyagentspec.evaluation.metrics import Metric
+from pyagentspec.evaluation.scheduling import LlmScheduler
 
 
 class Evaluator:
@@ -23,6 +26,9 @@ class Evaluator:
         self,
         metrics: Sequence[Metric[Any]],
         max_concurrency: int = -1,
+        cache: Optional[ResultsCache] = None,
+        scheduler: Optional[LlmScheduler] = None,
+        reuse_llm_responses: bool = False,
     ) -> None:
         """
         Initializes the Evaluator with a collection of metrics and concurrency settings.
@@ -37,6 +43,25 @@ class Evaluator:
             Defaults to -1, which indicates no concurrency limit.
             Must be -1 or a positive (>= 1) integer.
 
+        cache : ResultsCache | None, default None
+            Cache of the metric results, e.g., a ``SqliteResultsCache``.
+            Results found in the cache are not computed again, which makes rerunning an
+            evaluation over a mostly unchanged dataset only compute the new results.
+            Defaults to None, which disables caching.
+
+        scheduler : LlmScheduler | None, default None
+            Scheduler of the LLM requests sent by the LLM-based metrics, enforcing rate limits
+            per LLM configuration and adapting their concurrency to the rate limit errors.
+            ``max_concurrency`` still bounds the number of metrics computed at the same time.
+            Defaults to None, which sends the LLM requests as soon as the metrics need them.
+
+        reuse_llm_responses : bool, default False
+            Whether the LLM-based metrics reuse the response of an identical LLM request (same
+            messages and LLM configuration) that completed in the last minutes, e.g., for
+            duplicated samples, instead of sending it again. Identical requests in flight at
+            the same time always share their response. Retries of failed attempts and the
+            repetitions of ``RepeatMetric`` never reuse responses.
+
         Raises
         ------
         ValueError
@@ -67,8 +92,15 @@ class Evaluator:
 
         self.metrics = metrics
         self.max_concurrency = max_concurrency
+        self.cache = cache
+        self.scheduler = scheduler
+        self.reuse_llm_responses = reuse_llm_responses
 
-    async def evaluate(self, dataset: Dataset) -> EvaluationResults:
+    async def evaluate(
+        self,
+        dataset: Dataset,
+        checkpoint_path: Optional[str | os.PathLike[str]] = None,
+    ) -> EvaluationResults:
         """Execute every metric against ``dataset`` and collect the results.
 
         Parameters
@@ -77,6 +109,14 @@ class Evaluator:
             Dataset exposing async ``ids``/``get_sample`` accessors. Each sample must provide the
             features required by the configured metrics.
 
+        checkpoint_path : str | os.PathLike | None, default None
+            Path of an append-only checkpoint file. Each result is appended to the file as soon as
+            it is computed, and the results already in the file are not computed again, so that
+            an interrupted evaluation can be resumed by calling ``evaluate`` with the same path.
+            Results of metrics whose configuration changed are computed again.
+            Results are stored with ``pickle``, only resume from files that you trust.
+            Defaults to None, which disables checkpointing.
+
         Returns
         -------
         EvaluationResults
@@ -92,6 +132,10 @@ class Evaluator:
             dataset=dataset,
             callables={metric.name: metric for metric in self.metrics},
             max_concurrency=self.max_concurrency,
+            cache=self.cache,
+            checkpoint_path=checkpoint_path,
+            scheduler=self.scheduler,
+            reuse_llm_responses=self.reuse_llm_responses,
         )
         results = await computer.run()
         return EvaluationResults(
@@ -4,6 +4,9 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
-from .exceptions import EvaluationException
+from .exceptions import EvaluationException, RateLimitException
 
-__all__ = ["EvaluationException"]
+__all__ = [
+    "EvaluationException",
+    "RateLimitException",
+]
@@ -7,3 +7,7 @@
 
 class EvaluationException(Exception):
     """Base class for the exceptions in evaluation framework."""
+
+
+class RateLimitException(EvaluationException):
+    """Raised when an LLM provider rejected a request because of its rate limits."""
@@ -4,10 +4,13 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
-from typing import Any, Sequence
+import os
+from typing import Any, Dict, Hashable, Optional, Sequence
 
 from pyagentspec.evaluation._computers import _AsyncCallablesComputer, _result_to_dict
+from pyagentspec.evaluation.caching import ResultsCache
 from pyagentspec.evaluation.datasets import Dataset
+from pyagentspec.evaluation.datasets._merged_data_source import _MergedDataSource
 from pyagentspec.evaluation.intermediates.intermediate import Intermediate
 
 
@@ -15,28 +18,33 @@ async def _compute_intermediates(
     dataset: Dataset,
     intermediates: Sequence[Intermediate[Any]],
     max_concurrency: int = -1,
-) -> Dataset:
+    cache: Optional[ResultsCache] = None,
+    checkpoint_path: Optional[str | os.PathLike[str]] = None,
+) -> Dict[Hashable, Dict[str, Any]]:
+    """Return the values of the intermediates, by sample identifier."""
     computer = _AsyncCallablesComputer(
         dataset=dataset,
         callables={intermediate.name: intermediate for intermediate in intermediates},
         max_concurrency=max_concurrency,
+        cache=cache,
+        checkpoint_path=checkpoint_path,
     )
     results = await computer.run()
-    return Dataset.from_dict(
-        data={
-            sample_id: {
-                intermediate.name: _result_to_dict(results[(sample_id, intermediate.name)])["value"]  # type: ignore
-                for intermediate in intermediates
-            }
-            async for sample_id in dataset.ids()
-        }
-    )
+    # The results are grouped by sample from the registry, the dataset is not iterated again
+    intermediates_values: Dict[Hashable, Dict[str, Any]] = {}
+    for (sample_id, intermediate_name), result in results.items():
+        intermediates_values.setdefault(sample_id, {})[intermediate_name] = _result_to_dict(
+            result  # type: ignore[arg-type]
+        )["value"]
+    return intermediates_values
 
 
 async def add_intermediates(
     dataset: Dataset,
     intermediates: Sequence[Intermediate[Any]],
     max_concurrency: int = -1,
+    cache: Optional[ResultsCache] = None,
+    checkpoint_path: Optional[str | os.PathLike[str]] = None,
 ) -> Dataset:
     """Return a dataset augmented with computed intermediate fields.
 
@@ -55,23 +63,36 @@ async def add_intermediates(
     max_concurrency : int
         Maximum number of concurrent computations. Use ``-1`` to indicate no explicit limit.
 
+    cache : ResultsCache | None
+        Cache of the intermediate results. Results found in the cache are not computed again.
+        Use ``None`` to disable caching.
+
+    checkpoint_path : str | os.PathLike | None
+        Path of an append-only checkpoint file. Each result is appended to the file as soon as it
+        is computed, and the results already in the file are not computed again, so that an
+        interrupted computation can be resumed by calling ``add_intermediates`` with the same path.
+        Results are stored with ``pickle``, only resume from files that you trust.
+        Use ``None`` to disable checkpointing.
+
     Returns
     -------
     Dataset
         A new dataset with intermediate results added to each sample.
 
     """
-    intermediates_data = await _compute_intermediates(
+    intermediates_values = await _compute_intermediates(
         dataset=dataset,
         intermediates=intermediates,
         max_concurrency=max_concurrency,
+        cache=cache,
+        checkpoint_path=checkpoint_path,
     )
-    return Dataset.from_dict(
-        data={
-            sample_id: {
-                **(await dataset.get_sample(sample_id)),
-                **(await intermediates_data.get_sample(sample_id)),
-            }
-            async for sample_id in dataset.ids()
-        }
+    # The samples of ``dataset`` are not copied, they are merged with the values of the
+    # intermediates when they are fetched from the augmented dataset
+    return Dataset(
+        _MergedDataSource(
+            dataset,
+            additional_features=[intermediate.name for intermediate in intermediates],
+            additional_values=intermediates_values,
+        )
     )
@@ -7,7 +7,7 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Generic, Tuple, TypeVar
 
-from pyagentspec.evaluation._utils import _bind_kwargs_to_func, _map_names
+from pyagentspec.evaluation._utils import _ArgumentsBinder
 
 IntermediateValueType = TypeVar("IntermediateValueType")
 
@@ -42,6 +42,7 @@ class Intermediate(ABC, Generic[IntermediateValueType]):
         """
         self.name = name
         self.input_mapping = input_mapping
+        self._arguments_binder = _ArgumentsBinder(self.compute_value, input_mapping)
 
     @abstractmethod
     async def compute_value(
@@ -56,7 +57,13 @@ class Intermediate(ABC, Generic[IntermediateValueType]):
         self, *args: Any, **kwargs: Any
     ) -> Tuple[IntermediateValueType, Dict[str, Any]]:
         """Execute ``compute_value`` after applying the configured name mapping."""
-        if self.input_mapping is not None:
-            kwargs = _map_names(kwargs, self.input_mapping)
-        bound_args = _bind_kwargs_to_func(self.compute_value, *args, **kwargs)
-        return await self.compute_value(*bound_args.args, **bound_args.kwargs)
+        bound_args, bound_kwargs = self._get_arguments_binder().bind(*args, **kwargs)
+        return await self.compute_value(*bound_args, **bound_kwargs)
+
+    def _get_arguments_binder(self) -> _ArgumentsBinder:
+        """Return the binding plan of ``compute_value``, following the current ``input_mapping``."""
+        arguments_binder: _ArgumentsBinder | None = self.__dict__.get("_arguments_binder")
+        if arguments_binder is None or not arguments_binder.is_valid_for(self.input_mapping):
+            arguments_binder = _ArgumentsBinder(self.compute_value, self.input_mapping)
+            self._arguments_binder = arguments_binder
+        return arguments_binder
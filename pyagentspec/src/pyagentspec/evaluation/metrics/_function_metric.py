@@ -7,7 +7,7 @@
 import logging
 from typing import Any, Awaitable, Callable, Dict, Literal, Tuple
 
-from pyagentspec.evaluation._utils import _bind_kwargs_to_func
+from pyagentspec.evaluation._utils import _ArgumentsBinder
 from pyagentspec.evaluation.exceptions.handling_strategies import ExceptionHandlingStrategy
 from pyagentspec.evaluation.metrics.metrics import Metric, MetricValueType
 
@@ -31,10 +31,11 @@ class _FunctionMetric(Metric[MetricValueType]):
             input_mapping=None,
         )
         self.fn = fn
+        self._fn_arguments_binder = _ArgumentsBinder(fn, input_mapping=None)
 
     async def compute_metric(
         self, *args: Any, **kwargs: Any
     ) -> Tuple[MetricValueType, Dict[str, Any]]:
         """Invoke the wrapped function after aligning positional and keyword args."""
-        bound_args = _bind_kwargs_to_func(self.fn, *args, **kwargs)
-        return await self.fn(*bound_args.args, **bound_args.kwargs)
+        bound_args, bound_kwargs = self._fn_arguments_binder.bind(*args, **kwargs)
+        return await self.fn(*bound_args, **bound_kwargs)
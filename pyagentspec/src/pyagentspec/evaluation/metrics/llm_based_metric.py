@@ -7,11 +7,20 @@
 from typing import Any, Dict, List, Literal, Tuple
 
 from pyagentspec.evaluation._llm import complete_conversation
+from pyagentspec.evaluation._llm.invocation import _complete_with_coalescing
+from pyagentspec.evaluation.exceptions import EvaluationException, RateLimitException
 from pyagentspec.evaluation.exceptions.handling_strategies import ExceptionHandlingStrategy
 from pyagentspec.evaluation.metrics.metrics import Metric, MetricValueType
+from pyagentspec.evaluation.scheduling.llm_scheduler import _get_current_llm_scheduler
 from pyagentspec.llms import LlmConfig
 
 
+def _is_rate_limit_error(error: Exception) -> bool:
+    """Return whether ``error`` was raised because the LLM provider rate limited the request."""
+    # e.g., ``litellm.RateLimitError``, without depending on the optional ``litellm`` package
+    return getattr(error, "status_code", None) == 429 or "RateLimit" in type(error).__name__
+
+
 class LlmBasedMetric(Metric[MetricValueType]):
     """Metric base class for scoring via a Language Model invocation."""
 
@@ -37,16 +46,54 @@ class LlmBasedMetric(Metric[MetricValueType]):
             input_mapping=input_mapping,
             num_retries=num_retries,
             on_failure=on_failure,
+            retry_policy=llm_config.retry_policy,
         )
         self.llm_config = llm_config
 
     async def _complete_conversation(self, conversation: List[Dict[str, str]]) -> Dict[str, Any]:
         """Send ``conversation`` to the configured LLM and return the raw payload."""
-        return await complete_conversation(conversation, self.llm_config)
+        # Identical requests are coalesced by ``ask_llm``, before they are scheduled
+        return await complete_conversation(conversation, self.llm_config, coalescing="disabled")
+
+    async def _complete_conversation_or_raise_rate_limit(
+        self, conversation: List[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        try:
+            return await self._complete_conversation(conversation)
+        except Exception as e:
+            if not isinstance(e, EvaluationException) and _is_rate_limit_error(e):
+                raise RateLimitException(
+                    f"The LLM provider rate limited a request of {self.name}: {e}"
+                ) from e
+            raise
+
+    async def _send_scheduled_request(self, conversation: List[Dict[str, str]]) -> Dict[str, Any]:
+        """Send ``conversation`` within the limits of the scheduler of the current evaluation."""
+        scheduler = _get_current_llm_scheduler()
+        if scheduler is None:
+            return await self._complete_conversation_or_raise_rate_limit(conversation)
+        async with scheduler.schedule(self.llm_config, conversation) as scheduled_request:
+            response = await self._complete_conversation_or_raise_rate_limit(conversation)
+            usage = response.get("usage") or {}
+            scheduled_request.record_token_usage(
+                usage.get("prompt_tokens") or 0, usage.get("completion_tokens") or 0
+            )
+        return response
 
     async def ask_llm(self, conversation: List[Dict[str, str]]) -> Tuple[str, Tuple[int, int]]:
-        """Return the assistant message text and token usage from the LLM provider."""
-        response = await self._complete_conversation(conversation)
+        """Return the assistant message text and token usage from the LLM provider.
+
+        When the metric is computed by an ``Evaluator`` with an ``LlmScheduler``, the request
+        waits for the limits of the scheduler, and its token usage is reported to the scheduler.
+        Requests answered by an identical request are not scheduled.
+        Rate limit errors of the provider are raised as ``RateLimitException``, so that they
+        are retried after a delay.
+        """
+        response = await _complete_with_coalescing(
+            conversation,
+            self.llm_config,
+            lambda: self._send_scheduled_request(conversation),
+        )
         if "choices" not in response or len(response["choices"]) == 0:
             raise RuntimeError(
                 f"LLM returned an empty response during the computation of {self.name}"
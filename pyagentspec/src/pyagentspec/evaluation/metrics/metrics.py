@@ -7,20 +7,29 @@
 import logging
 import time
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from typing import Any, Dict, Generic, List, Literal, Sequence, Tuple, TypeVar, cast
 
-from pyagentspec.evaluation._utils import _bind_kwargs_to_func, _map_names
-from pyagentspec.evaluation.exceptions import EvaluationException
+import anyio
+
+from pyagentspec._retrybackoff import _compute_wait_seconds
+from pyagentspec.evaluation._llm.invocation import _use_request_coalescing
+from pyagentspec.evaluation._utils import _ArgumentsBinder
+from pyagentspec.evaluation.exceptions import EvaluationException, RateLimitException
 from pyagentspec.evaluation.exceptions.handling_strategies import (
     ExceptionHandlingStrategy,
     Raise,
     SetConstant,
 )
+from pyagentspec.retrypolicy import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
 MetricValueType = TypeVar("MetricValueType")
 
+_DEFAULT_RATE_LIMIT_RETRY_POLICY = RetryPolicy()
+"""Delays between the attempts failing because of rate limits, for metrics without policy"""
+
 
 class Metric(ABC, Generic[MetricValueType]):
     """
@@ -41,6 +50,7 @@ class Metric(ABC, Generic[MetricValueType]):
         input_mapping: Dict[str, str] | None,
         num_retries: int,
         on_failure: Literal["raise", "set_none", "set_zero"] | ExceptionHandlingStrategy,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
         """
         Parameters
@@ -76,6 +86,15 @@ class Metric(ABC, Generic[MetricValueType]):
                 These strategies handle only ``EvaluationException`` instances.
                 Exceptions arising from implementation errors will not be caught.
 
+        retry_policy
+            Delays between the attempts, which grow exponentially with random jitter following
+            ``initial_retry_delay``, ``backoff_factor``, ``max_retry_delay`` and ``jitter``.
+            Attempts failing because of LLM rate limits (``RateLimitException``) are delayed as
+            throttled requests. The number of attempts is set by ``num_retries``.
+            Defaults to None, in which case failed attempts are retried immediately, except the
+            attempts failing because of LLM rate limits, which are delayed following
+            ``RetryPolicy()``.
+
         """
 
         _on_failure: ExceptionHandlingStrategy | None
@@ -98,6 +117,9 @@ class Metric(ABC, Generic[MetricValueType]):
         self.input_mapping = input_mapping
         self.num_retries = num_retries
         self.on_failure = _on_failure
+        self.retry_policy = retry_policy
+        # Inspecting the signature of ``compute_metric`` costs more than cheap metrics
+        self._arguments_binder = _ArgumentsBinder(self.compute_metric, input_mapping)
 
     @abstractmethod
     async def compute_metric(
@@ -138,6 +160,28 @@ class Metric(ABC, Generic[MetricValueType]):
             "Method `compute_metric` must be implemented for any subclass of `Metric`."
         )
 
+    def _get_arguments_binder(self) -> _ArgumentsBinder:
+        """Return the binding plan of ``compute_metric``, following the current ``input_mapping``."""
+        arguments_binder: _ArgumentsBinder | None = self.__dict__.get("_arguments_binder")
+        if arguments_binder is None or not arguments_binder.is_valid_for(self.input_mapping):
+            arguments_binder = _ArgumentsBinder(self.compute_metric, self.input_mapping)
+            self._arguments_binder = arguments_binder
+        return arguments_binder
+
+    async def _wait_before_retry(self, attempt_id: int, error: EvaluationException) -> None:
+        """Wait before retrying a failed attempt, following the retry policy of the metric."""
+        rate_limited = isinstance(error, RateLimitException)
+        retry_policy = self.retry_policy
+        if retry_policy is None:
+            if not rate_limited:
+                return
+            retry_policy = _DEFAULT_RATE_LIMIT_RETRY_POLICY
+        await anyio.sleep(
+            _compute_wait_seconds(
+                retry_policy, attempt_id, status_code=429 if rate_limited else None
+            )
+        )
+
     def _process_attempts_result(
         self,
         failed_attempts: Sequence[EvaluationException],
@@ -162,16 +206,16 @@ class Metric(ABC, Generic[MetricValueType]):
     ) -> Tuple[MetricValueType | None, Dict[str, Any]]:
         time_start = time.time()
 
-        if self.input_mapping is not None:
-            kwargs = _map_names(kwargs, self.input_mapping)
-
-        bound_args = _bind_kwargs_to_func(self.compute_metric, *args, **kwargs)
+        bound_args, bound_kwargs = self._get_arguments_binder().bind(*args, **kwargs)
 
         failed_attempts: List[EvaluationException] = []
         for attempt_id in range(1 + self.num_retries):
             try:
                 time_attempt_start = time.time()
-                val, val_details = await self.compute_metric(*bound_args.args, **bound_args.kwargs)
+                # Retries send their LLM requests again, instead of sharing the responses of
+                # identical requests, which may be the responses that made the attempt fail
+                with _use_request_coalescing("disabled") if attempt_id > 0 else nullcontext():
+                    val, val_details = await self.compute_metric(*bound_args, **bound_kwargs)
                 time_attempt_end = time.time()
 
                 logger.info(
@@ -197,6 +241,8 @@ class Metric(ABC, Generic[MetricValueType]):
                     exc_info=True,
                 )
                 failed_attempts.append(e)
+                if attempt_id < self.num_retries:
+                    await self._wait_before_retry(attempt_id, e)
 
         logger.error(
             f"Computing {self.name} failed after {1 + self.num_retries} attempts.",
@@ -4,8 +4,10 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+from functools import partial
 from typing import Any, Collection, Dict, Tuple
 
+from pyagentspec.evaluation._concurrency import _gather_within_budget
 from pyagentspec.evaluation._utils import _get_duplicates
 from pyagentspec.evaluation.aggregators.aggregator import (
     AggregatedValueType,
@@ -28,6 +30,9 @@ class EnsembleMetric(Metric[AggregatedValueType]):
     of metric results (e.g., multiple perspectives on a single evaluation) and then aggregate them
     into a single summary value.
 
+    The metrics of the ensemble are computed concurrently. When the ensemble is computed by an
+    ``Evaluator``, they only run concurrently within the ``max_concurrency`` of the evaluator.
+
     EnsembleMetric itself is a ``Metric[AggregatedValueType]``: it returns results of type
     ``AggregatedValueType`` as produced by the aggregator, even if the underlying metrics produce
     a different type ``MetricToAggregateValueType``.
@@ -93,6 +98,10 @@ class EnsembleMetric(Metric[AggregatedValueType]):
     async def compute_metric(
         self, *args: Any, **kwargs: Any
     ) -> Tuple[AggregatedValueType, Dict[str, Any]]:
-        results = {m.name: await m(*args, **kwargs) for m in self.metrics}
+        metrics = list(self.metrics)
+        metrics_results = await _gather_within_budget(
+            [partial(metric, *args, **kwargs) for metric in metrics]
+        )
+        results = {metric.name: result for metric, result in zip(metrics, metrics_results)}
         value = self.aggregator([value for value, _ in results.values()])
         return value, {"results": results}
@@ -4,8 +4,11 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+from functools import partial
 from typing import Any, Dict, Tuple
 
+from pyagentspec.evaluation._concurrency import _gather_within_budget
+from pyagentspec.evaluation._llm.invocation import _use_request_coalescing
 from pyagentspec.evaluation.aggregators.aggregator import (
     AggregatedValueType,
     Aggregator,
@@ -25,6 +28,10 @@ class RepeatMetric(Metric[AggregatedValueType]):
     This is useful for metrics with stochastic or non-deterministic behavior, allowing robust
     estimation by repeated sampling and aggregation.
 
+    The repetitions are computed concurrently. When the metric is computed by an ``Evaluator``,
+    they only run concurrently within the ``max_concurrency`` of the evaluator. Identical LLM
+    requests sent by the repetitions are not coalesced, so that the repetitions are independent.
+
     RepeatMetric itself is a ``Metric[U]``: it returns results of type ``U``, as produced by the
     aggregator, even if the underlying metric returns a different type ``T``.
 
@@ -86,6 +93,9 @@ class RepeatMetric(Metric[AggregatedValueType]):
     async def compute_metric(
         self, *args: Any, **kwargs: Any
     ) -> Tuple[AggregatedValueType, Dict[str, Any]]:
-        results = [await self.metric(*args, **kwargs) for _ in range(self.num_repeats)]
+        with _use_request_coalescing("disabled"):
+            results = await _gather_within_budget(
+                [partial(self.metric, *args, **kwargs)] * self.num_repeats
+            )
         value = self.aggregator([result[0] for result in results])
         return value, {"results": results}
@@ -4,9 +4,12 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+from functools import partial
 from typing import Any, Dict, Literal, Sequence, Tuple
 
+from pyagentspec.evaluation._concurrency import _gather_within_budget, _get_sample_shared_values
 from pyagentspec.evaluation._utils import _get_duplicates
+from pyagentspec.evaluation.caching._fingerprint import _get_arguments_fingerprint
 from pyagentspec.evaluation.exceptions.handling_strategies import ExceptionHandlingStrategy
 from pyagentspec.evaluation.intermediates import Intermediate
 from pyagentspec.evaluation.metrics.metrics import Metric, MetricValueType
@@ -19,6 +22,8 @@ class WithIntermediatesMetric(Metric[MetricValueType | None]):
     the keyword arguments passed to the wrapped metric, and then executes the wrapped metric.
 
     Intermediate values are only computed if their ``name`` is not already present in ``kwargs``.
+    They are computed concurrently, within the ``max_concurrency`` of the ``Evaluator`` computing
+    the metric.
     The returned ``details`` dictionary is augmented with an ``"__intermediates"``
     entry containing the computed intermediate values.
 
@@ -26,6 +31,10 @@ class WithIntermediatesMetric(Metric[MetricValueType | None]):
         - Intermediate names must be unique; duplicates raise ``ValueError``.
         - The wrapper is typed as ``Metric[MetricValueType | None]`` to accommodate failure
           strategies that may set the value to ``None``.
+        - With ``share_intermediates=True``, the values of the intermediates are shared with the
+          other wrappers computed on the same sample by an ``Evaluator``: an intermediate
+          instance given to several such wrappers is computed once per sample instead of once
+          per wrapper, as long as it receives the same arguments.
 
     """
 
@@ -37,6 +46,7 @@ class WithIntermediatesMetric(Metric[MetricValueType | None]):
         num_retries: int,
         on_failure: ExceptionHandlingStrategy | Literal["raise", "set_none", "set_zero"],
         name: str | None = None,
+        share_intermediates: bool = False,
     ) -> None:
         duplicate_intermediates_names = _get_duplicates(
             [intermediate.name for intermediate in intermediates]
@@ -54,15 +64,34 @@ class WithIntermediatesMetric(Metric[MetricValueType | None]):
         )
         self.intermediates = intermediates
         self.metric = metric
+        self.share_intermediates = share_intermediates
 
     async def compute_metric(
         self, *args: Any, **kwargs: Any
     ) -> Tuple[MetricValueType | None, Dict[str, Any]]:
+        intermediates = [
+            intermediate for intermediate in self.intermediates if intermediate.name not in kwargs
+        ]
+        intermediates_results = await _gather_within_budget(
+            [
+                partial(self._compute_intermediate, intermediate, *args, **kwargs)
+                for intermediate in intermediates
+            ]
+        )
         intermediates_values = {
-            intermediate.name: (await intermediate(*args, **kwargs))[0]
-            for intermediate in self.intermediates
-            if intermediate.name not in kwargs
+            intermediate.name: result[0]
+            for intermediate, result in zip(intermediates, intermediates_results)
         }
         combined_kwargs = {**kwargs, **intermediates_values}
         value, details = await self.metric(*args, **combined_kwargs)
         return value, {**details, "__intermediates": intermediates_values}
+
+    async def _compute_intermediate(
+        self, intermediate: Intermediate[Any], *args: Any, **kwargs: Any
+    ) -> Tuple[Any, Dict[str, Any]]:
+        shared_values = _get_sample_shared_values() if self.share_intermediates else None
+        if shared_values is None or args:
+            return await intermediate(*args, **kwargs)
+        # Wrappers sharing the intermediate instance reuse the value computed on their arguments
+        key = f"intermediate:{id(intermediate)}:{_get_arguments_fingerprint(intermediate, kwargs)}"
+        return await shared_values.get_or_compute(key, partial(intermediate, **kwargs))
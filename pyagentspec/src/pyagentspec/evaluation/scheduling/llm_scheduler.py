@@ -0,0 +1,255 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import math
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Dict, Iterator, List, Mapping, Optional
+
+import anyio
+from pydantic import BaseModel, ConfigDict, Field
+
+from pyagentspec.evaluation.exceptions import RateLimitException
+from pyagentspec.llms import LlmConfig
+
+_CHARACTERS_PER_TOKEN = 4
+"""Rough number of characters per token, used to estimate the size of prompts"""
+
+_COMPLETION_TOKENS_SMOOTHING = 0.1
+"""Weight of the last request in the running average of the completion tokens"""
+
+
+class LlmRateLimits(BaseModel):
+    """Limits of the requests sent to the endpoint of an LLM configuration."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    requests_per_minute: Optional[float] = Field(default=None, gt=0)
+    """Maximum number of requests sent per minute. None means no limit."""
+
+    tokens_per_minute: Optional[float] = Field(default=None, gt=0)
+    """
+    Maximum number of tokens (prompt and completion) consumed per minute. None means no limit.
+
+    Tokens are reserved from an estimate of the size of the request before sending it, and the
+    budget is corrected with the token usage reported by the LLM provider in the response.
+    """
+
+    max_concurrency: Optional[int] = Field(default=None, ge=1)
+    """
+    Maximum number of requests running at the same time. None means no limit.
+
+    The number of concurrent requests is halved every time the LLM provider rejects a request
+    because of its rate limits, and slowly increases back up to this maximum as requests succeed.
+    """
+
+
+class _TokenBucket:
+    """Budget of ``amount_per_minute`` units, refilled continuously."""
+
+    def __init__(self, amount_per_minute: float) -> None:
+        self.capacity = amount_per_minute
+        self.refill_rate = amount_per_minute / 60
+        self.available = amount_per_minute
+        self._last_refill_time = time.monotonic()
+        # Acquisitions wait in turn, so that large ones are not starved by small ones
+        self._lock = anyio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(
+            self.capacity, self.available + (now - self._last_refill_time) * self.refill_rate
+        )
+        self._last_refill_time = now
+
+    async def acquire(self, amount: float) -> None:
+        """Wait until ``amount`` units are available, and consume them."""
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self.available < amount:
+                await anyio.sleep((amount - self.available) / self.refill_rate)
+                self._refill()
+            self.available -= amount
+
+    def adjust(self, amount: float) -> None:
+        """Consume ``amount`` more units (or give them back if negative), without waiting."""
+        self._refill()
+        # The budget can go into debt, which delays the next acquisitions
+        self.available = min(self.capacity, self.available - amount)
+
+
+class _AdaptiveConcurrencyLimiter:
+    """
+    Limit of concurrent requests following an additive increase, multiplicative decrease policy.
+    """
+
+    def __init__(self, max_concurrency: Optional[int]) -> None:
+        self.max_concurrency = max_concurrency if max_concurrency is not None else math.inf
+        self.concurrency = self.max_concurrency
+        self.running = 0
+        self._successes_since_last_change = 0
+        self._condition = anyio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            while self.running >= self.concurrency:
+                await self._condition.wait()
+            self.running += 1
+
+    async def release(self, rate_limited: bool) -> None:
+        async with self._condition:
+            if rate_limited:
+                # Halving the requests that were running when the provider started rejecting them
+                self.concurrency = max(1, min(self.concurrency, self.running) // 2)
+                self._successes_since_last_change = 0
+            elif self.concurrency < self.max_concurrency:
+                self._successes_since_last_change += 1
+                if self._successes_since_last_change >= self.concurrency:
+                    self.concurrency += 1
+                    self._successes_since_last_change = 0
+            self.running -= 1
+            self._condition.notify_all()
+
+
+class _LlmLimiter:
+    """Rate limiting state of the requests sent with one LLM configuration."""
+
+    def __init__(self, rate_limits: LlmRateLimits) -> None:
+        self.requests_bucket = (
+            _TokenBucket(rate_limits.requests_per_minute)
+            if rate_limits.requests_per_minute is not None
+            else None
+        )
+        self.tokens_bucket = (
+            _TokenBucket(rate_limits.tokens_per_minute)
+            if rate_limits.tokens_per_minute is not None
+            else None
+        )
+        self.concurrency_limiter = _AdaptiveConcurrencyLimiter(rate_limits.max_concurrency)
+        self.average_completion_tokens = 0.0
+        self._has_token_usage = False
+
+    def record_completion_tokens(self, completion_tokens: int) -> None:
+        if not self._has_token_usage:
+            self.average_completion_tokens = float(completion_tokens)
+            self._has_token_usage = True
+        else:
+            self.average_completion_tokens += _COMPLETION_TOKENS_SMOOTHING * (
+                completion_tokens - self.average_completion_tokens
+            )
+
+
+class _ScheduledLlmRequest:
+    """Request admitted by an ``LlmScheduler``, reporting the tokens it consumed."""
+
+    def __init__(self, limiter: _LlmLimiter, reserved_tokens: float) -> None:
+        self._limiter = limiter
+        self._reserved_tokens = reserved_tokens
+
+    def record_token_usage(self, prompt_tokens: int, completion_tokens: int) -> None:
+        """Correct the token budget with the usage reported by the LLM provider."""
+        if self._limiter.tokens_bucket is not None:
+            self._limiter.tokens_bucket.adjust(
+                prompt_tokens + completion_tokens - self._reserved_tokens
+            )
+        self._limiter.record_completion_tokens(completion_tokens)
+
+
+class LlmScheduler:
+    """
+    Scheduler of the LLM requests sent by the ``LlmBasedMetric`` instances of an evaluation.
+
+    The requests sent with each LLM configuration are scheduled independently: fast endpoints
+    are not slowed down by the limits of slow ones. For every LLM configuration, the scheduler
+    enforces token-bucket limits on the requests and tokens sent per minute, and adapts the
+    number of concurrent requests to the rate limit errors returned by the provider.
+
+    The scheduler is given to an ``Evaluator``, and applies to the metrics it computes. It can
+    be shared by several evaluators running at the same time to share the limits of the
+    endpoints.
+    """
+
+    def __init__(
+        self,
+        rate_limits: Optional[Mapping[str, LlmRateLimits]] = None,
+        default_rate_limits: Optional[LlmRateLimits] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        rate_limits
+            Rate limits of the LLM configurations, indexed by the ``id`` of the configurations.
+
+        default_rate_limits
+            Rate limits of the LLM configurations that are not in ``rate_limits``.
+            Each configuration has its own budget. Defaults to no limit, in which case the
+            concurrency still adapts to the rate limit errors returned by the provider.
+        """
+        self.rate_limits = dict(rate_limits or {})
+        self.default_rate_limits = default_rate_limits or LlmRateLimits()
+        self._limiters: Dict[str, _LlmLimiter] = {}
+
+    def _get_limiter(self, llm_config: LlmConfig) -> _LlmLimiter:
+        limiter = self._limiters.get(llm_config.id)
+        if limiter is None:
+            limiter = _LlmLimiter(self.rate_limits.get(llm_config.id, self.default_rate_limits))
+            self._limiters[llm_config.id] = limiter
+        return limiter
+
+    @asynccontextmanager
+    async def schedule(
+        self, llm_config: LlmConfig, conversation: List[Dict[str, str]]
+    ) -> AsyncIterator[_ScheduledLlmRequest]:
+        """
+        Wait until the request can be sent with ``llm_config``, within the limits of the scheduler.
+
+        A ``RateLimitException`` raised while the request runs reduces the concurrency of the
+        requests sent with this LLM configuration.
+        """
+        limiter = self._get_limiter(llm_config)
+        reserved_tokens = (
+            sum(len(message.get("content") or "") for message in conversation)
+            / _CHARACTERS_PER_TOKEN
+            + limiter.average_completion_tokens
+        )
+        await limiter.concurrency_limiter.acquire()
+        rate_limited = False
+        try:
+            if limiter.requests_bucket is not None:
+                await limiter.requests_bucket.acquire(1)
+            if limiter.tokens_bucket is not None:
+                await limiter.tokens_bucket.acquire(reserved_tokens)
+            yield _ScheduledLlmRequest(limiter, reserved_tokens)
+        except RateLimitException:
+            rate_limited = True
+            raise
+        finally:
+            await limiter.concurrency_limiter.release(rate_limited)
+
+
+_CURRENT_LLM_SCHEDULER: ContextVar[Optional[LlmScheduler]] = ContextVar(
+    "_CURRENT_LLM_SCHEDULER", default=None
+)
+
+
+def _get_current_llm_scheduler() -> Optional[LlmScheduler]:
+    """Return the scheduler of the evaluation running in the current context, if any."""
+    return _CURRENT_LLM_SCHEDULER.get()
+
+
+@contextmanager
+def _use_llm_scheduler(scheduler: Optional[LlmScheduler]) -> Iterator[None]:
+    """Make ``scheduler`` schedule the LLM requests sent in the current context."""
+    if scheduler is None:
+        yield
+        return
+    token = _CURRENT_LLM_SCHEDULER.set(scheduler)
+    try:
+        yield
+    finally:
+        _CURRENT_LLM_SCHEDULER.reset(token)
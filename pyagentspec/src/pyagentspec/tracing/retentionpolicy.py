@@ -0,0 +1,43 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+from pathlib import Path
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SpanRetentionPolicy(BaseModel):
+    """
+    Policy that bounds the memory used by the events recorded in a ``Span``.
+
+    A policy can be attached to a single ``Span``, or to a ``Trace`` to be inherited
+    by all the spans started in its context that do not define their own policy.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    max_events: Optional[int] = Field(default=None, ge=0)
+    """
+    Maximum number of events kept in memory in ``Span.events``.
+    When the limit is exceeded the oldest events are evicted (and spilled to disk if
+    ``spill_directory`` is set). If None, the number of events is not bounded.
+    """
+
+    spill_directory: Optional[Path] = None
+    """
+    Directory where evicted and released events are appended as newline-delimited JSON,
+    one file per span named ``<span_id>.jsonl``. If None, evicted events are discarded.
+    """
+
+    release_events_on_end: bool = False
+    """
+    Whether to drop the events of a span once it ended and all the span processors were
+    notified, keeping only the per-event-type summary available in ``Span.event_counts``.
+    """
+
+    mask_sensitive_information: bool = True
+    """Whether to mask sensitive information in the events written to ``spill_directory``."""
@@ -0,0 +1,143 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import hashlib
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from pyagentspec.tracing.events.event import Event
+from pyagentspec.tracing.events.exception import ExceptionRaised
+from pyagentspec.tracing.spanprocessor import SpanProcessor, _SpanProcessorDispatcher
+
+if TYPE_CHECKING:
+    from pyagentspec.tracing.spans.span import Span
+
+_TRACE_ID_HASH_SPACE = 2**64
+
+
+class TraceSamplingPolicy(BaseModel):
+    """
+    Policy that decides which traces are recorded and forwarded to the span processors.
+
+    Two complementary strategies are supported:
+
+    - head-based sampling: when the trace is created, a deterministic decision is taken from the
+      trace id, so that a ``sampling_rate`` fraction of the traces is recorded;
+    - tail-based sampling: traces that were not selected by head-based sampling are still recorded,
+      but the span processors are only notified when the trace ends, if it raised an exception
+      (``keep_traces_with_errors``) or lasted longer than ``slow_trace_threshold_ms``.
+
+    Traces that are neither head-sampled nor subject to tail-based sampling are not recorded:
+    their spans do not notify any span processor and do not store events.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    sampling_rate: float = Field(default=1.0, ge=0.0, le=1.0)
+    """Fraction of the traces that are recorded, decided from the trace id when it is created."""
+
+    keep_traces_with_errors: bool = False
+    """Whether to keep the traces that were not head-sampled if an ``ExceptionRaised`` event occurred."""
+
+    slow_trace_threshold_ms: Optional[float] = Field(default=None, ge=0.0)
+    """If set, keep the traces that were not head-sampled if they lasted at least this duration."""
+
+    @property
+    def has_tail_sampling(self) -> bool:
+        """Whether this policy can keep a trace based on its outcome."""
+        return self.keep_traces_with_errors or self.slow_trace_threshold_ms is not None
+
+    def should_sample(self, trace_id: str) -> bool:
+        """Head-based sampling decision. Deterministic for a given trace id."""
+        if self.sampling_rate >= 1.0:
+            return True
+        if self.sampling_rate <= 0.0:
+            return False
+        trace_id_hash = hashlib.sha256(trace_id.encode("utf-8")).digest()
+        return int.from_bytes(trace_id_hash[:8], "big") < self.sampling_rate * _TRACE_ID_HASH_SPACE
+
+    def should_keep(self, has_error: bool, duration_ns: Optional[int]) -> bool:
+        """Tail-based sampling decision, taken when a trace that was not head-sampled ends."""
+        if self.keep_traces_with_errors and has_error:
+            return True
+        if self.slow_trace_threshold_ms is not None and duration_ns is not None:
+            return duration_ns >= self.slow_trace_threshold_ms * 1_000_000
+        return False
+
+
+class _DeferredSpanProcessor(SpanProcessor):
+    """
+    SpanProcessor that buffers all the notifications of a trace subject to tail-based sampling.
+
+    The buffered notifications are replayed, in order, on the span processors of the trace
+    only if the trace is kept once it ends. The spans keep all their events until then, their
+    retention policies are applied after the replay, or when the trace is discarded.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: List[Tuple[str, Tuple[Any, ...]]] = []
+        self.spans: List["Span"] = []
+        self.has_error = False
+
+    def _record(self, method_name: str, *args: Any) -> None:
+        self.calls.append((method_name, args))
+
+    def on_start(self, span: "Span") -> None:
+        self.spans.append(span)
+        self._record("on_start", span)
+
+    async def on_start_async(self, span: "Span") -> None:
+        self.on_start(span)
+
+    def on_end(self, span: "Span") -> None:
+        self._record("on_end", span)
+
+    async def on_end_async(self, span: "Span") -> None:
+        self._record("on_end", span)
+
+    def on_event(self, event: Event, span: "Span") -> None:
+        self.has_error = self.has_error or isinstance(event, ExceptionRaised)
+        self._record("on_event", event, span)
+
+    async def on_event_async(self, event: Event, span: "Span") -> None:
+        self.on_event(event, span)
+
+    def startup(self) -> None:
+        pass
+
+    async def startup_async(self) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        pass
+
+    async def shutdown_async(self) -> None:
+        pass
+
+    def discard(self) -> None:
+        """Drop the buffered notifications, and apply the retention policies of the spans."""
+        spans, self.spans, self.calls = self.spans, [], []
+        for span in spans:
+            span._apply_deferred_retention()
+
+    def replay(self, span_processors: List[_SpanProcessorDispatcher]) -> None:
+        try:
+            for method_name, args in self.calls:
+                for span_processor in span_processors:
+                    getattr(span_processor, method_name)(*args)
+        finally:
+            # The releases requested by the span processors during the replay take effect now
+            self.discard()
+
+    async def replay_async(self, span_processors: List[_SpanProcessorDispatcher]) -> None:
+        try:
+            for method_name, args in self.calls:
+                for span_processor in span_processors:
+                    await getattr(span_processor, method_name + "_async")(*args)
+        finally:
+            self.discard()
@@ -0,0 +1,127 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import json
+import os
+import socket
+import threading
+from typing import IO, Any, Dict, Optional, Union
+
+from pyagentspec.tracing.events.event import Event
+from pyagentspec.tracing.spanprocessor import SpanProcessor
+from pyagentspec.tracing.spans.span import Span
+
+
+class NdjsonSpanExporter(SpanProcessor):
+    """
+    SpanProcessor that streams every finished ``Span`` as one line of JSON.
+
+    Each line contains the serialized span, including the full serialization of the events
+    it holds in memory. Once exported, the events of the span are released from memory
+    (see ``Span.release_events``), so that long-lived traces do not accumulate them.
+    """
+
+    def __init__(
+        self,
+        output: Union[str, "os.PathLike[str]", IO[str], socket.socket],
+        mask_sensitive_information: bool = True,
+        release_exported_spans: bool = True,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        output:
+            Where the spans are written. Either the path of a file (spans are appended to it),
+            an already opened text stream, or a connected socket.
+            Streams and sockets are not closed on shutdown.
+        mask_sensitive_information:
+            Whether to mask sensitive information in the exported spans and events.
+        release_exported_spans:
+            Whether to release the events of a span from memory once it was exported.
+        """
+        super().__init__(mask_sensitive_information=mask_sensitive_information)
+        self.output = output
+        self.release_exported_spans = release_exported_spans
+        self._stream: Optional[IO[str]] = None
+        self._owns_stream = False
+        self._lock = threading.Lock()
+
+    def _serialize_span(self, span: Span) -> str:
+        serialized_span: Dict[str, Any] = span.model_dump(
+            mask_sensitive_information=self.mask_sensitive_information
+        )
+        serialized_span["events"] = [self._serialize_event(event) for event in span.events]
+        if span.dropped_events_count > 0:
+            serialized_span["dropped_events_count"] = span.dropped_events_count
+            serialized_span["event_counts"] = span.event_counts
+        return json.dumps(serialized_span, default=str)
+
+    def _serialize_event(self, event: Event) -> Dict[str, Any]:
+        return event.model_dump(mask_sensitive_information=self.mask_sensitive_information)
+
+    def _open(self) -> None:
+        if self._stream is not None or isinstance(self.output, socket.socket):
+            return
+        if isinstance(self.output, (str, os.PathLike)):
+            self._stream = open(self.output, "a", encoding="utf-8")
+            self._owns_stream = True
+        else:
+            self._stream = self.output
+
+    def _write_line(self, line: str) -> None:
+        with self._lock:
+            if isinstance(self.output, socket.socket):
+                self.output.sendall((line + "\n").encode("utf-8"))
+                return
+            self._open()
+            if self._stream is None:
+                raise RuntimeError("NdjsonSpanExporter output stream is not available")
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._stream is not None and self._owns_stream:
+                self._stream.close()
+            self._stream = None
+            self._owns_stream = False
+
+    def _export(self, span: Span) -> None:
+        self._write_line(self._serialize_span(span))
+        if self.release_exported_spans:
+            # The events are released after all the span processors were notified
+            span._request_events_release()
+
+    def on_start(self, span: Span) -> None:
+        pass
+
+    async def on_start_async(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: Span) -> None:
+        self._export(span)
+
+    async def on_end_async(self, span: Span) -> None:
+        self._export(span)
+
+    def on_event(self, event: Event, span: Span) -> None:
+        pass
+
+    async def on_event_async(self, event: Event, span: Span) -> None:
+        pass
+
+    def startup(self) -> None:
+        with self._lock:
+            self._open()
+
+    async def startup_async(self) -> None:
+        self.startup()
+
+    def shutdown(self) -> None:
+        self._close()
+
+    async def shutdown_async(self) -> None:
+        self.shutdown()
@@ -1,22 +1,57 @@
-# Copyright © 2025 Oracle and/or its affiliates.
+# Copyright © 2025, 2026 Oracle and/or its affiliates.
 #
 # This software is under the Apache License 2.0
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+import asyncio
+import threading
+import weakref
 from abc import ABC, abstractmethod
+from enum import Enum
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Coroutine,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
 
 from pyagentspec.tracing.events.event import Event
 from pyagentspec.tracing.spans.span import Span
 
+T = TypeVar("T")
+
+
+class SpanProcessorCapabilities(str, Enum):
+    """Declares which of the sync and async hooks of a ``SpanProcessor`` are implemented."""
+
+    SYNC = "sync"
+    """Only the synchronous hooks are implemented"""
+    ASYNC = "async"
+    """Only the asynchronous hooks are implemented"""
+    SYNC_AND_ASYNC = "sync_and_async"
+    """Both synchronous and asynchronous hooks are implemented"""
+
 
 class SpanProcessor(ABC):
     """
     Interface which allows hooks for `Span` start and end method invocations.
 
     Aligned with OpenTelemetry APIs.
+
+    Span processors that implement only the synchronous or only the asynchronous hooks
+    should declare it through ``capabilities``: spans and traces then call the implemented
+    variant directly, whether they run in synchronous or asynchronous mode.
     """
 
+    capabilities: ClassVar[SpanProcessorCapabilities] = SpanProcessorCapabilities.SYNC_AND_ASYNC
+    """Which of the sync and async hooks of this span processor are implemented"""
+
     def __init__(self, mask_sensitive_information: bool = True) -> None:
         self.mask_sensitive_information = mask_sensitive_information
 
@@ -105,3 +140,142 @@ class SpanProcessor(ABC):
     @abstractmethod
     async def shutdown_async(self) -> None:
         """Called when a `Trace` is shutdown. Asynchronous method."""
+
+
+def _run_event_loop_forever(loop: asyncio.AbstractEventLoop) -> None:
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+class _BackgroundEventLoop:
+    """
+    Event loop running in a daemon thread, on which coroutines are run synchronously.
+
+    Coroutines cannot run on the event loop of the caller, which may be blocked by the call, so
+    they all run on this loop, started with the first one. Resources bound to the loop that
+    ran them, such as async HTTP clients or asyncio locks, can then be reused across the calls.
+    """
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_loop: Optional[Callable[[], Any]] = None
+        self._lock = threading.Lock()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=_run_event_loop_forever,
+                    args=(loop,),
+                    name="agentspec-span-processor-loop",
+                    daemon=True,
+                )
+                self._thread.start()
+                # The loop is stopped when it is closed, or when its owner is garbage collected
+                self._stop_loop = weakref.finalize(self, loop.call_soon_threadsafe, loop.stop)
+                self._loop = loop
+            return self._loop
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        loop = self._get_loop()
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError(
+                "A synchronous span processor hook cannot be called from one of its "
+                "asynchronous hooks."
+            )
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    def close(self) -> None:
+        """Stop the loop and wait for its thread, a new one is started by the next ``run``."""
+        with self._lock:
+            thread, stop_loop = self._thread, self._stop_loop
+            self._loop, self._thread, self._stop_loop = None, None, None
+        if thread is not None and stop_loop is not None:
+            stop_loop()
+            if thread is not threading.current_thread():
+                thread.join()
+
+
+def _as_sync(
+    async_function: Callable[..., Coroutine[Any, Any, T]], event_loop: _BackgroundEventLoop
+) -> Callable[..., T]:
+    def sync_function(*args: Any) -> T:
+        return event_loop.run(async_function(*args))
+
+    return sync_function
+
+
+def _as_async(sync_function: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    async def async_function(*args: Any) -> T:
+        return sync_function(*args)
+
+    return async_function
+
+
+class _SpanProcessorDispatcher:
+    """
+    Precomputed dispatch of the hooks of a ``SpanProcessor``.
+
+    Every hook is resolved once, according to the processor capabilities, into a synchronous
+    and an asynchronous callable, so that spans never have to fall back at call time.
+    """
+
+    _HOOKS = ("on_start", "on_end", "on_event", "startup", "shutdown")
+
+    on_start: Callable[[Span], None]
+    on_start_async: Callable[[Span], Awaitable[None]]
+    on_end: Callable[[Span], None]
+    on_end_async: Callable[[Span], Awaitable[None]]
+    on_event: Callable[[Event, Span], None]
+    on_event_async: Callable[[Event, Span], Awaitable[None]]
+    startup: Callable[[], None]
+    startup_async: Callable[[], Awaitable[None]]
+    shutdown: Callable[[], None]
+    shutdown_async: Callable[[], Awaitable[None]]
+
+    def __init__(self, span_processor: SpanProcessor) -> None:
+        self.span_processor = span_processor
+        capabilities = span_processor.capabilities
+        # The synchronous hooks of asynchronous-only processors all run on the same event loop
+        self._event_loop = (
+            _BackgroundEventLoop() if capabilities == SpanProcessorCapabilities.ASYNC else None
+        )
+        for hook_name in self._HOOKS:
+            sync_hook = getattr(span_processor, hook_name)
+            async_hook = getattr(span_processor, hook_name + "_async")
+            if capabilities == SpanProcessorCapabilities.SYNC:
+                async_hook = _as_async(sync_hook)
+            elif self._event_loop is not None:
+                sync_hook = _as_sync(async_hook, self._event_loop)
+            setattr(self, hook_name, sync_hook)
+            setattr(self, hook_name + "_async", async_hook)
+        if self._event_loop is not None:
+            self.shutdown = self._shutdown_and_close_event_loop
+
+    def _shutdown_and_close_event_loop(self) -> None:
+        if self._event_loop is None:
+            return
+        try:
+            self._event_loop.run(self.span_processor.shutdown_async())
+        finally:
+            self._event_loop.close()
+
+
+def _build_dispatch_plan(
+    span_processors: List[SpanProcessor],
+    previous_dispatch_plan: Sequence[_SpanProcessorDispatcher] = (),
+) -> List[_SpanProcessorDispatcher]:
+    """Return the dispatch plan of the span processors, reusing the dispatchers of the previous one"""
+    previous_dispatchers = {
+        id(dispatcher.span_processor): dispatcher for dispatcher in previous_dispatch_plan
+    }
+    return [
+        previous_dispatchers.get(id(span_processor)) or _SpanProcessorDispatcher(span_processor)
+        for span_processor in span_processors
+    ]
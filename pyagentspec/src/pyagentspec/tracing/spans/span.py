@@ -1,25 +1,28 @@
-# Copyright © 2025 Oracle and/or its affiliates.
+# Copyright © 2025, 2026 Oracle and/or its affiliates.
 #
 # This software is under the Apache License 2.0
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+import json
 import sys
 import time
 import traceback
 import uuid
 from contextvars import ContextVar
+from pathlib import Path
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, List, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
 
 from pydantic import ConfigDict, Field, PrivateAttr
 from typing_extensions import Self
 
 from pyagentspec.tracing._basemodel import BaseModelWithSensitiveInfo
 from pyagentspec.tracing.events.event import Event
+from pyagentspec.tracing.retentionpolicy import SpanRetentionPolicy
 
 if TYPE_CHECKING:
-    from pyagentspec.tracing.spanprocessor import SpanProcessor
+    from pyagentspec.tracing.spanprocessor import _SpanProcessorDispatcher
     from pyagentspec.tracing.trace import Trace
 
 
@@ -101,10 +104,21 @@ class Span(BaseModelWithSensitiveInfo):
     """The list of events recorded in the scope of this span"""
     metadata: dict[str, Any] = Field(default_factory=dict)
     """Metadata related to the span"""
+    retention_policy: Optional[SpanRetentionPolicy] = Field(default=None, exclude=True)
+    """
+    The policy that bounds the events kept in memory by this span.
+    If None, the retention policy of the active Trace (if any) is used when the span starts.
+    """
     _parent_span: Optional["Span"] = PrivateAttr(default=None)
     _end_event_was_triggered: bool = PrivateAttr(default=False)
     _span_was_appended_to_active_stack: bool = PrivateAttr(default=False)
-    _started_span_processors: List["SpanProcessor"] = PrivateAttr(default_factory=list)
+    _started_span_processors: List["_SpanProcessorDispatcher"] = PrivateAttr(default_factory=list)
+    _is_recording: Optional[bool] = PrivateAttr(default=None)
+    _event_counts: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _dropped_events_count: int = PrivateAttr(default=0)
+    _events_released: bool = PrivateAttr(default=False)
+    _events_release_requested: bool = PrivateAttr(default=False)
+    _retention_deferred: bool = PrivateAttr(default=False)
 
     def model_post_init(self, __context: Any) -> None:
         """Set the default name if it is not provided."""
@@ -112,6 +126,15 @@ class Span(BaseModelWithSensitiveInfo):
         if not self.name:
             self.name = self.__class__.__name__
 
+    def _get_private_attributes(self) -> Dict[str, Any]:
+        """
+        Return the private attributes of this span.
+
+        The methods called for every event read them from this dictionary, since accessing them
+        as attributes goes through the slower ``__getattr__`` of pydantic.
+        """
+        return self.__pydantic_private__  # type: ignore[return-value]
+
     @property
     def _trace(self) -> Optional["Trace"]:
         """The Trace where this Span is being stored"""
@@ -119,10 +142,142 @@ class Span(BaseModelWithSensitiveInfo):
 
         return get_trace()
 
+    def is_recording(self) -> bool:
+        """
+        Whether this span records events.
+
+        It is False only when the active Trace was not selected by its sampling policy.
+        Callers can use it to skip building events that would be discarded.
+        """
+        is_recording: Optional[bool] = self._get_private_attributes()["_is_recording"]
+        if is_recording is None:
+            # The span was not started, we check the trace active in the current context
+            trace = self._trace
+            return trace is None or trace.is_recording()
+        return is_recording
+
+    def _prepare_start(self) -> List["_SpanProcessorDispatcher"]:
+        """
+        Capture what this span needs from the active Trace when it starts.
+
+        Returns the dispatch plan of the SpanProcessors to which this Span should be forwarded.
+        """
+        self._parent_span = get_current_span()
+        self.start_time = time.time_ns()
+        trace = self._trace
+        if trace is None:
+            self._is_recording = True
+            return []
+        self._is_recording = trace.is_recording()
+        # Spans of a trace subject to tail-based sampling keep all their events until the
+        # decision, since they are replayed to the span processors if the trace is kept
+        self._retention_deferred = trace._deferred_span_processor is not None
+        if self.retention_policy is None:
+            self.retention_policy = trace.retention_policy
+        return trace._active_dispatch_plan
+
+    @property
+    def event_counts(self) -> Dict[str, int]:
+        """Number of events recorded in this span, by event name, including evicted ones."""
+        return dict(self._event_counts)
+
     @property
-    def _span_processors(self) -> List[Any]:
-        """The list of SpanProcessors to which this Span should be forwarded"""
-        return self._trace.span_processors if self._trace else []
+    def dropped_events_count(self) -> int:
+        """Number of events that were recorded in this span but are no longer kept in memory."""
+        return self._dropped_events_count
+
+    @property
+    def spilled_events_path(self) -> Optional[Path]:
+        """Path of the file where the evicted events of this span are written, if any."""
+        if self.retention_policy is None or self.retention_policy.spill_directory is None:
+            return None
+        return self.retention_policy.spill_directory / f"{self.id}.jsonl"
+
+    def _record_event(self, event: Event) -> Optional[List["_SpanProcessorDispatcher"]]:
+        """
+        Append the event to this span, evicting the oldest ones according to the retention policy.
+
+        Returns the span processors to notify of the event, or None if the span is not recording.
+        """
+        private_attributes = self._get_private_attributes()
+        is_recording = private_attributes["_is_recording"]
+        if not (is_recording or (is_recording is None and self.is_recording())):
+            return None
+        event_counts = private_attributes["_event_counts"]
+        event_name = event.name or event.__class__.__name__
+        event_counts[event_name] = event_counts.get(event_name, 0) + 1
+        if (
+            self.retention_policy is None or private_attributes["_retention_deferred"]
+        ) and not private_attributes["_events_released"]:
+            # Nothing is evicted nor spilled without a retention policy
+            self.events.append(event)
+        else:
+            self._retain_event(event)
+        return private_attributes["_started_span_processors"]  # type: ignore[no-any-return]
+
+    def _retain_event(self, event: Event) -> None:
+        if self._events_released:
+            # The span was already released, we only keep track of the summary
+            self._dropped_events_count += 1
+            self._spill_events([event])
+            return
+        self.events.append(event)
+        self._evict_events_beyond_limit()
+
+    def _evict_events_beyond_limit(self) -> None:
+        max_events = self.retention_policy.max_events if self.retention_policy else None
+        if max_events is not None and len(self.events) > max_events:
+            number_of_evicted_events = len(self.events) - max_events
+            self._spill_events(self.events[:number_of_evicted_events])
+            del self.events[:number_of_evicted_events]
+            self._dropped_events_count += number_of_evicted_events
+
+    def _spill_events(self, events: List[Event]) -> None:
+        spilled_events_path = self.spilled_events_path
+        if spilled_events_path is None or not events or self.retention_policy is None:
+            return
+        mask_sensitive_information = self.retention_policy.mask_sensitive_information
+        spilled_events_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(spilled_events_path, "a", encoding="utf-8") as spill_file:
+            for event in events:
+                serialized_event = event.model_dump(
+                    mask_sensitive_information=mask_sensitive_information
+                )
+                spill_file.write(json.dumps(serialized_event, default=str) + "\n")
+
+    def release_events(self) -> None:
+        """
+        Drop the events kept in memory by this span.
+
+        Only the per-event-type summary in ``event_counts`` is kept. If the retention policy
+        defines a ``spill_directory``, the released events are written there first.
+        """
+        self._spill_events(self.events)
+        self._dropped_events_count += len(self.events)
+        self.events = []
+        self._events_released = True
+
+    def _request_events_release(self) -> None:
+        """Release the events of this span once all the span processors were notified of its end."""
+        self._events_release_requested = True
+
+    def _release_events_if_required(self) -> None:
+        if self._retention_deferred:
+            return
+        if self._events_release_requested or (
+            self.retention_policy is not None and self.retention_policy.release_events_on_end
+        ):
+            self.release_events()
+
+    def _apply_deferred_retention(self) -> None:
+        """Apply the retention policy, once the tail-based sampling decision of the trace is taken."""
+        if not self._retention_deferred:
+            return
+        self._retention_deferred = False
+        if not self._events_released:
+            self._evict_events_beyond_limit()
+        if self.end_time is not None:
+            self._release_events_if_required()
 
     def __enter__(self) -> Self:
         self.start()
@@ -138,7 +293,7 @@ class Span(BaseModelWithSensitiveInfo):
         exc_value: Optional[BaseException],
         traceback_obj: Optional[TracebackType],
     ) -> None:
-        if exc_value is not None:
+        if exc_value is not None and self.is_recording():
             from pyagentspec.tracing.events import ExceptionRaised
 
             self.add_event(
@@ -158,7 +313,7 @@ class Span(BaseModelWithSensitiveInfo):
         exc_value: Optional[BaseException],
         traceback_obj: Optional[TracebackType],
     ) -> None:
-        if exc_value is not None:
+        if exc_value is not None and self.is_recording():
             from pyagentspec.tracing.events import ExceptionRaised
 
             await self.add_event_async(
@@ -179,9 +334,7 @@ class Span(BaseModelWithSensitiveInfo):
         This includes calling the ``on_start`` method of the active SpanProcessors.
         """
         try:
-            self._parent_span = get_current_span()
-            self.start_time = time.time_ns()
-            for span_processor in self._span_processors:
+            for span_processor in self._prepare_start():
                 span_processor.on_start(self)
                 # We remember which span processors were started, so that we call on_end on them only
                 # when we exit, e.g., because of an exception happening
@@ -202,9 +355,7 @@ class Span(BaseModelWithSensitiveInfo):
         This includes calling the ``on_start_async`` method of the active SpanProcessors.
         """
         try:
-            self._parent_span = get_current_span()
-            self.start_time = time.time_ns()
-            for span_processor in self._span_processors:
+            for span_processor in self._prepare_start():
                 await span_processor.on_start_async(self)
                 # We remember which span processors were started, so that we call on_end on them only
                 # when we exit, e.g., because of an exception happening
@@ -242,6 +393,7 @@ class Span(BaseModelWithSensitiveInfo):
             # Whatever happens, we have to pop the span if it is on the active spans stack
             if self._span_was_appended_to_active_stack:
                 _pop_span_from_active_stack()
+            self._release_events_if_required()
 
     async def end_async(self) -> None:
         """
@@ -267,15 +419,18 @@ class Span(BaseModelWithSensitiveInfo):
             # Whatever happens, we have to pop the span if it is on the active spans stack
             if self._span_was_appended_to_active_stack:
                 _pop_span_from_active_stack()
+            self._release_events_if_required()
 
     def add_event(self, event: Event) -> None:
         """Add an event to the span and trigger ``on_event`` on the active ``SpanProcessors``."""
-        self.events.append(event)
-        for span_processor in self._started_span_processors:
-            span_processor.on_event(event, self)
+        span_processors = self._record_event(event)
+        if span_processors:
+            for span_processor in span_processors:
+                span_processor.on_event(event, self)
 
     async def add_event_async(self, event: Event) -> None:
         """Add an event to the span and trigger ``on_event_async`` on the active ``SpanProcessors``."""
-        self.events.append(event)
-        for span_processor in self._started_span_processors:
-            await span_processor.on_event_async(event, self)
+        span_processors = self._record_event(event)
+        if span_processors:
+            for span_processor in span_processors:
+                await span_processor.on_event_async(event, self)
@@ -1,4 +1,4 @@
-# Copyright © 2025 Oracle and/or its affiliates.
+# Copyright © 2025, 2026 Oracle and/or its affiliates.
 #
 # This software is under the Apache License 2.0
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
@@ -7,9 +7,15 @@
 import uuid
 from contextvars import ContextVar
 from types import TracebackType
-from typing import List, Optional, Type
-
-from pyagentspec.tracing.spanprocessor import SpanProcessor
+from typing import Callable, List, Optional, Type
+
+from pyagentspec.tracing.retentionpolicy import SpanRetentionPolicy
+from pyagentspec.tracing.sampling import TraceSamplingPolicy, _DeferredSpanProcessor
+from pyagentspec.tracing.spanprocessor import (
+    SpanProcessor,
+    _build_dispatch_plan,
+    _SpanProcessorDispatcher,
+)
 from pyagentspec.tracing.spans import RootSpan, Span
 
 _TRACE: ContextVar[Optional["Trace"]] = ContextVar("_TRACE", default=None)
@@ -40,6 +46,8 @@ class Trace:
         span_processors: Optional[List[SpanProcessor]] = None,
         shutdown_on_exit: bool = True,
         root_span: Optional[Span] = None,
+        retention_policy: Optional[SpanRetentionPolicy] = None,
+        sampling_policy: Optional[TraceSamplingPolicy] = None,
     ):
         """
         Parameters
@@ -54,17 +62,92 @@ class Trace:
             Whether to call shutdown on span processors when the trace context is closed
         root_span: Optional[Span]
             The root span of the trace. If None, a new RootSpan with default values is used.
+        retention_policy: Optional[SpanRetentionPolicy]
+            The policy that bounds the events kept in memory by the spans of this trace.
+            It applies to all the spans started in the context of this trace that do not define
+            their own retention policy. If None, spans keep all their events.
+        sampling_policy: Optional[TraceSamplingPolicy]
+            The policy that decides whether this trace is recorded and forwarded to the
+            span processors. If None, the trace is always recorded.
         """
         self.name = name or "Trace"
         self.id = id or str(uuid.uuid4())
+        self._span_processors: List[SpanProcessor] = []
+        self._cached_dispatch_plan: List[_SpanProcessorDispatcher] = []
         self.span_processors = span_processors or []
         self.shutdown_on_exit = shutdown_on_exit
+        self.retention_policy: Optional[SpanRetentionPolicy] = retention_policy
+        self.sampling_policy = sampling_policy
         self._root_span = root_span or RootSpan()
         self._is_async_mode_active: bool = False
+        self.is_sampled = sampling_policy is None or sampling_policy.should_sample(self.id)
+        self._end_callbacks: List[Callable[[], None]] = []
+        self._deferred_span_processor: Optional[_DeferredSpanProcessor] = None
+        self._deferred_dispatch_plan: List[_SpanProcessorDispatcher] = []
+        if (
+            not self.is_sampled
+            and sampling_policy is not None
+            and sampling_policy.has_tail_sampling
+        ):
+            self._deferred_span_processor = _DeferredSpanProcessor()
+            self._deferred_dispatch_plan = _build_dispatch_plan([self._deferred_span_processor])
+
+    @property
+    def span_processors(self) -> List[SpanProcessor]:
+        """The list of SpanProcessors active on this trace"""
+        return self._span_processors
+
+    @span_processors.setter
+    def span_processors(self, span_processors: List[SpanProcessor]) -> None:
+        self._span_processors = span_processors
+        self._cached_dispatch_plan = _build_dispatch_plan(span_processors)
+
+    @property
+    def _dispatch_plan(self) -> List[_SpanProcessorDispatcher]:
+        """The dispatch plan of the span processors of this trace"""
+        # The dispatch plan is only computed again when the list of span processors was modified
+        # in place, instead of on every span and event notification
+        span_processors, dispatch_plan = self._span_processors, self._cached_dispatch_plan
+        if len(span_processors) != len(dispatch_plan) or any(
+            span_processor is not dispatcher.span_processor
+            for span_processor, dispatcher in zip(span_processors, dispatch_plan)
+        ):
+            dispatch_plan = _build_dispatch_plan(span_processors, dispatch_plan)
+            self._cached_dispatch_plan = dispatch_plan
+        return dispatch_plan
+
+    def _add_end_callback(self, callback: Callable[[], None]) -> None:
+        """Register a callback releasing some state of this trace when it ends"""
+        self._end_callbacks.append(callback)
+
+    def _run_end_callbacks(self) -> None:
+        for callback in self._end_callbacks:
+            callback()
 
     def is_async_mode_active(self) -> bool:
         return self._is_async_mode_active
 
+    def is_recording(self) -> bool:
+        """Whether the spans and events of this trace are recorded"""
+        return self.is_sampled or self._deferred_span_processor is not None
+
+    @property
+    def _active_dispatch_plan(self) -> List[_SpanProcessorDispatcher]:
+        """The span processors that spans of this trace should notify while the trace is running"""
+        if self.is_sampled:
+            return self._dispatch_plan
+        return self._deferred_dispatch_plan
+
+    def _should_keep_deferred_spans(self) -> bool:
+        if self._deferred_span_processor is None or self.sampling_policy is None:
+            return False
+        duration_ns: Optional[int] = None
+        if self._root_span.start_time is not None and self._root_span.end_time is not None:
+            duration_ns = self._root_span.end_time - self._root_span.start_time
+        return self.sampling_policy.should_keep(
+            has_error=self._deferred_span_processor.has_error, duration_ns=duration_ns
+        )
+
     def __enter__(self) -> "Trace":
         self._start()
         return self
@@ -93,7 +176,7 @@ class Trace:
         if _TRACE.get() is not None:
             raise RuntimeError("A Trace already exists. Cannot create two nested Traces.")
         _TRACE.set(self)
-        for span_processor in self.span_processors:
+        for span_processor in self._dispatch_plan:
             span_processor.startup()
         self._root_span.start()
         self._is_async_mode_active = False
@@ -102,7 +185,7 @@ class Trace:
         if _TRACE.get() is not None:
             raise RuntimeError("A Trace already exists. Cannot create two nested Traces.")
         _TRACE.set(self)
-        for span_processor in self.span_processors:
+        for span_processor in self._dispatch_plan:
             await span_processor.startup_async()
         await self._root_span.start_async()
         self._is_async_mode_active = True
@@ -110,15 +193,31 @@ class Trace:
     def _end(self) -> None:
         self._root_span.end()
         _TRACE.set(None)
-        if self.shutdown_on_exit:
-            for span_processor in self.span_processors:
-                span_processor.shutdown()
-        self._is_async_mode_active = False
+        try:
+            if self._deferred_span_processor is not None:
+                if self._should_keep_deferred_spans():
+                    self._deferred_span_processor.replay(self._dispatch_plan)
+                else:
+                    self._deferred_span_processor.discard()
+        finally:
+            if self.shutdown_on_exit:
+                for span_processor in self._dispatch_plan:
+                    span_processor.shutdown()
+            self._is_async_mode_active = False
+            self._run_end_callbacks()
 
     async def _end_async(self) -> None:
         await self._root_span.end_async()
         _TRACE.set(None)
-        if self.shutdown_on_exit:
-            for span_processor in self.span_processors:
-                await span_processor.shutdown_async()
-        self._is_async_mode_active = False
+        try:
+            if self._deferred_span_processor is not None:
+                if self._should_keep_deferred_spans():
+                    await self._deferred_span_processor.replay_async(self._dispatch_plan)
+                else:
+                    self._deferred_span_processor.discard()
+        finally:
+            if self.shutdown_on_exit:
+                for span_processor in self._dispatch_plan:
+                    await span_processor.shutdown_async()
+            self._is_async_mode_active = False
+            self._run_end_callbacks()
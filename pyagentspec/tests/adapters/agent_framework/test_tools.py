@@ -37,7 +37,7 @@ def remote_tool_with_url_allow_list() -> RemoteTool:
 def test_remote_tool_having_nested_inputs_with_agent_framework() -> None:
     """
     End-to-end: convert an AgentSpec RemoteTool to a Agent Framework FunctionTool and run it.
-    Patch httpx.request to capture the outgoing HTTP call and verify the rendered JSON payload.
+    Patch httpx.Client.request to capture the outgoing HTTP call and verify the rendered JSON payload.
     """
     from pyagentspec.adapters.agent_framework import AgentSpecLoader
 
@@ -66,24 +66,24 @@ def test_remote_tool_having_nested_inputs_with_agent_framework() -> None:
     # Convert to a Agent Framework FunctionTool using the Agent Framework adapter converter.
     msft_af_tool = AgentSpecLoader().load_component(remote_tool)
 
-    # Expected object passed as the `json` kwarg to httpx.request after rendering.
+    # Expected object passed as the `json` kwarg to httpx.Client.request after rendering.
     expected_json = {
         "location": {"city": "Agadir", "coordinates": {"lat": "30.4", "lon": "-9.6"}},
         "meta": ["requested_by:alice", {"note": "helloworld"}],
         "raw": "binary-blob",
     }
 
-    # Patch httpx.request (used inside the converted agent framework tool) to capture the call.
-    with patch("httpx.request", side_effect=mock_request) as patched_request:
+    # Patch httpx.Client.request (used inside the converted agent framework tool) to capture the call.
+    with patch("httpx.Client.request", side_effect=mock_request) as patched_request:
         # Call the underlying function of the FunctionTool directly with keyword args.
         # The Agent Framework converter wraps the function as a FunctionTool with a call method.
         result = msft_af_tool(
             city="Agadir", lat="30.4", lon="-9.6", user="alice", suffix="world", bin_suffix="blob"
         )
-        # Ensure httpx.request was invoked and inspect the kwargs it was called with.
+        # Ensure httpx.Client.request was invoked and inspect the kwargs it was called with.
         patched_request.assert_called_once()
         called_args, called_kwargs = patched_request.call_args
-        # The converter uses `data=remote_tool_data` when calling httpx.request for dict data
+        # The converter uses `data=remote_tool_data` when calling httpx.Client.request for dict data
         assert (
             "json" in called_kwargs
         ), f"Expected 'json' kwarg in request call since data is a dict, got {called_kwargs}"
@@ -98,7 +98,7 @@ def test_remote_tool_rejects_rendered_url_outside_allow_list_with_agent_framewor
 
     msft_af_tool = AgentSpecLoader().load_component(remote_tool_with_url_allow_list)
 
-    with patch("httpx.request", return_value=DummyResponse({"ok": True})) as mocked_request:
+    with patch("httpx.Client.request", return_value=DummyResponse({"ok": True})) as mocked_request:
         with pytest.raises(ValueError, match="Requested URL is not in allowed list"):
             msft_af_tool(host="blocked.example.com")
 
@@ -138,8 +138,8 @@ def test_remote_tool_post_json_array_with_agent_framework() -> None:
         {"location": "Agadir", "temp": "25"},
     ]
 
-    # Patch httpx.request.
-    with patch("httpx.request", side_effect=mock_request) as patched_request:
+    # Patch httpx.Client.request.
+    with patch("httpx.Client.request", side_effect=mock_request) as patched_request:
         # Call the underlying function of the FunctionTool directly with keyword args.
         result = msft_af_tool(
             city="Agadir",
@@ -181,8 +181,8 @@ def test_remote_tool_post_raw_body_with_agent_framework() -> None:
     # Expected rendered data (str).
     expected_data = "request body for city: Agadir with note: urgent"
 
-    # Patch httpx.request.
-    with patch("httpx.request", side_effect=mock_request) as patched_request:
+    # Patch httpx.Client.request.
+    with patch("httpx.Client.request", side_effect=mock_request) as patched_request:
         # Call the underlying function of the FunctionTool directly with keyword args.
         result = msft_af_tool(
             city="Agadir",
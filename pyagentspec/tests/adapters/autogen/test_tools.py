@@ -37,7 +37,7 @@ def remote_tool_with_url_allow_list() -> RemoteTool:
 def test_remote_tool_having_nested_inputs_with_agent() -> None:
     """
     End-to-end: convert an AgentSpec RemoteTool to an AutoGen FunctionTool and run it.
-    Patch httpx.request to capture the outgoing HTTP call and verify the rendered JSON payload.
+    Patch httpx.Client.request to capture the outgoing HTTP call and verify the rendered JSON payload.
     """
     from pyagentspec.adapters.autogen import AgentSpecLoader
 
@@ -66,7 +66,7 @@ def test_remote_tool_having_nested_inputs_with_agent() -> None:
     # Convert to an AutoGen FunctionTool using the autogen adapter converter.
     autogen_tool = AgentSpecLoader().load_component(remote_tool)
 
-    # Expected object passed as the `data` kwarg to httpx.request after rendering.
+    # Expected object passed as the `data` kwarg to httpx.Client.request after rendering.
     expected_data = {
         "location": {"city": "Agadir", "coordinates": {"lat": "30.4", "lon": "-9.6"}},
         "meta": ["requested_by:alice", {"note": "helloworld"}],
@@ -75,8 +75,8 @@ def test_remote_tool_having_nested_inputs_with_agent() -> None:
     expected_url = "https://weatherforecast.example/api/forecast/Agadir"
     expected_headers = {"X-Caller": "alice"}
 
-    # Patch httpx.request (used inside the converted autogen tool) to capture the call.
-    with patch("httpx.request", side_effect=mock_request) as patched_request:
+    # Patch httpx.Client.request (used inside the converted autogen tool) to capture the call.
+    with patch("httpx.Client.request", side_effect=mock_request) as patched_request:
         # Call the underlying function of the FunctionTool directly with keyword args.
         result = autogen_tool._func(
             city="Agadir",
@@ -86,10 +86,10 @@ def test_remote_tool_having_nested_inputs_with_agent() -> None:
             suffix="world",
             bin_suffix="blob",
         )
-        # Ensure httpx.request was invoked and inspect the kwargs it was called with.
+        # Ensure httpx.Client.request was invoked and inspect the kwargs it was called with.
         patched_request.assert_called_once()
         called_args, called_kwargs = patched_request.call_args
-        # The converter uses `data=remote_tool_data` when calling httpx.request for dict data
+        # The converter uses `data=remote_tool_data` when calling httpx.Client.request for dict data
         assert (
             "json" in called_kwargs
         ), f"Expected 'json' kwarg in request call since json is a dict, got {called_kwargs}"
@@ -106,7 +106,7 @@ def test_remote_tool_rejects_rendered_url_outside_allow_list(
 
     autogen_tool = AgentSpecLoader().load_component(remote_tool_with_url_allow_list)
 
-    with patch("httpx.request", return_value=DummyResponse({"ok": True})) as mocked_request:
+    with patch("httpx.Client.request", return_value=DummyResponse({"ok": True})) as mocked_request:
         with pytest.raises(ValueError, match="Requested URL is not in allowed list"):
             autogen_tool._func(host="blocked.example.com")
 
@@ -147,7 +147,7 @@ def test_remote_tool_post_json_array() -> None:
     ]
     expected_headers = {"X-Caller": "alice"}
 
-    with patch("httpx.request", side_effect=mock_request) as patched_request:
+    with patch("httpx.Client.request", side_effect=mock_request) as patched_request:
         result = autogen_tool._func(
             city="Agadir",
             temp="25",
@@ -190,7 +190,7 @@ def test_remote_tool_post_raw_body() -> None:
     expected_data = "request body for city: Agadir with note: urgent"
     expected_headers = {"X-Caller": "alice"}
 
-    with patch("httpx.request", side_effect=mock_request) as patched_request:
+    with patch("httpx.Client.request", side_effect=mock_request) as patched_request:
         result = autogen_tool._func(
             city="Agadir",
             note="urgent",
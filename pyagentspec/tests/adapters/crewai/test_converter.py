@@ -166,7 +166,7 @@ def test_remote_tool_rejects_rendered_url_outside_allow_list_with_crewai(
 
     crewai_tool = AgentSpecLoader().load_component(remote_tool_with_url_allow_list)
 
-    with patch("httpx.request", return_value=DummyResponse({"ok": True})) as mocked_request:
+    with patch("httpx.Client.request", return_value=DummyResponse({"ok": True})) as mocked_request:
         with pytest.raises(ValueError, match="Requested URL is not in allowed list"):
             crewai_tool.func(host="blocked.example.com")
 
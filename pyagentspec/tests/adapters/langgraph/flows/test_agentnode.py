@@ -5,6 +5,7 @@
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
 import os
+from unittest.mock import patch
 
 import pytest
 
@@ -14,6 +15,7 @@ from pyagentspec.flows.flow import Flow
 from pyagentspec.flows.nodes import AgentNode, EndNode, StartNode
 from pyagentspec.llms import VllmConfig
 from pyagentspec.property import StringProperty
+from pyagentspec.tools import RemoteTool
 
 from ....retry_test import retry_test
 
@@ -118,3 +120,106 @@ async def test_agentnode_can_be_executed_async(agent_flow: Flow) -> None:
 
     outputs = result["outputs"]
     assert "car" in outputs
+
+
+def test_agentnode_reuses_agents_per_system_prompt_inputs_with_bounded_cache(
+    agent_flow: Flow,
+) -> None:
+    from unittest.mock import patch
+
+    from langchain_core.runnables import RunnableConfig
+
+    from pyagentspec.adapters.langgraph._langgraphconverter import AgentSpecToLangGraphConverter
+    from pyagentspec.adapters.langgraph._node_execution import AgentNodeExecutor
+
+    agent_node = next(node for node in agent_flow.nodes if isinstance(node, AgentNode))
+    executor = AgentNodeExecutor(
+        agent_node,
+        tool_registry={},
+        converted_components={},
+        checkpointer=None,
+        config=RunnableConfig({}),
+        max_cached_agents=2,
+    )
+
+    with patch.object(
+        AgentSpecToLangGraphConverter,
+        "_create_react_agent_with_given_info",
+        side_effect=lambda **kwargs: object(),
+    ) as create_agent:
+        italian_agent = executor._create_react_agent_with_given_input_values(
+            {"nationality": "Italian", "unused": 1}
+        )
+        # Inputs that are not used in the system prompt do not create new agents
+        assert (
+            executor._create_react_agent_with_given_input_values(
+                {"nationality": "Italian", "unused": 2}
+            )
+            is italian_agent
+        )
+        assert create_agent.call_count == 1
+        assert create_agent.call_args.kwargs["system_prompt"] == (
+            "What is the fastest Italian car?"
+        )
+
+        german_agent = executor._create_react_agent_with_given_input_values(
+            {"nationality": "German"}
+        )
+        # Using the Italian agent makes the German one the least recently used
+        executor._create_react_agent_with_given_input_values({"nationality": "Italian"})
+        executor._create_react_agent_with_given_input_values({"nationality": "French"})
+        assert create_agent.call_count == 3
+        assert len(executor._agents_cache) == 2
+
+        assert (
+            executor._create_react_agent_with_given_input_values({"nationality": "Italian"})
+            is italian_agent
+        )
+        assert (
+            executor._create_react_agent_with_given_input_values({"nationality": "German"})
+            is not german_agent
+        )
+        assert create_agent.call_count == 4
+
+
+def test_agentnode_converts_its_agent_with_the_options_of_the_loader() -> None:
+    from pyagentspec.adapters.httpclientpool import HttpClientPool
+    from pyagentspec.adapters.langgraph import _langgraphconverter
+    from pyagentspec.adapters.langgraph._langgraphconverter import AgentSpecToLangGraphConverter
+
+    remote_tool = RemoteTool(
+        name="lookup",
+        description="Looks up remote data",
+        url="https://example.com/api/value",
+        http_method="GET",
+    )
+    agent = Agent(
+        name="agent",
+        llm_config=VllmConfig(name="llm_config", model_id="model", url="http://localhost:8000"),
+        system_prompt="Look up the value for {{nationality}}.",
+        inputs=[StringProperty(title="nationality")],
+        tools=[remote_tool],
+    )
+    agent_node = AgentNode(name="agent_node", agent=agent)
+
+    with HttpClientPool() as pool:
+        converter = AgentSpecToLangGraphConverter(http_client_pool=pool, stream_llm_outputs=True)
+        executor = converter._agent_node_convert_to_langgraph(
+            agent_node,
+            tool_registry={},
+            converted_components={},
+            checkpointer=None,
+            config={},
+            middleware=[],
+        )
+        with patch.object(
+            _langgraphconverter,
+            "_create_remote_tool_func",
+            wraps=_langgraphconverter._create_remote_tool_func,
+        ) as create_remote_tool_func:
+            executor._create_react_agent_with_given_input_values(  # type: ignore[attr-defined]
+                {"nationality": "Italian"}
+            )
+
+    create_remote_tool_func.assert_called_once_with(remote_tool, pool)
+    assert executor.stream_llm_outputs  # type: ignore[attr-defined]
@@ -79,7 +79,9 @@ def test_apinode_can_be_imported_and_executed(api_node_flow: Flow) -> None:
 
     agent = AgentSpecLoader().load_component(api_node_flow)
 
-    with patch("httpx.request", return_value=DummyResponse({"status": "ok"})) as mocked_request:
+    with patch(
+        "httpx.Client.request", return_value=DummyResponse({"status": "ok"})
+    ) as mocked_request:
         result = agent.invoke({"inputs": {"host": "allowed.example.com", "order_id": "123"}})
 
     assert "outputs" in result
@@ -93,7 +95,7 @@ def test_apinode_rejects_rendered_url_outside_allow_list(api_node_flow: Flow) ->
 
     agent = AgentSpecLoader().load_component(api_node_flow)
 
-    with patch("httpx.request") as mocked_request:
+    with patch("httpx.Client.request") as mocked_request:
         with pytest.raises(ValueError, match="Requested URL is not in allowed list"):
             agent.invoke({"inputs": {"host": "blocked.example.com", "order_id": "123"}})
 
@@ -117,3 +119,22 @@ async def test_apinode_can_be_executed_async(api_node_flow: Flow) -> None:
     assert result["outputs"] == {"status": "ok"}
     mocked_request.assert_awaited_once()
     assert mocked_request.await_args.kwargs["url"] == "https://allowed.example.com/orders/123"
+
+
+def test_apinode_reuses_the_client_of_the_given_http_client_pool(api_node_flow: Flow) -> None:
+    import httpx
+
+    from pyagentspec.adapters.httpclientpool import HttpClientPool
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    with HttpClientPool() as pool:
+        agent = AgentSpecLoader(http_client_pool=pool).load_component(api_node_flow)
+        with patch.object(
+            httpx.Client, "request", autospec=True, return_value=DummyResponse({"status": "ok"})
+        ) as mocked_request:
+            for order_id in ("123", "456"):
+                agent.invoke({"inputs": {"host": "allowed.example.com", "order_id": order_id}})
+
+        assert mocked_request.call_count == 2
+        used_clients = {call.args[0] for call in mocked_request.call_args_list}
+        assert used_clients == {pool.get_client("https://allowed.example.com")}
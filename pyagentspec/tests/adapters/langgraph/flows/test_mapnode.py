@@ -1,4 +1,4 @@
-# Copyright © 2025 Oracle and/or its affiliates.
+# Copyright © 2025, 2026 Oracle and/or its affiliates.
 #
 # This software is under the Apache License 2.0
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
@@ -170,3 +170,125 @@ async def test_mapnode_can_be_executed_async(mapnode_flow: Flow) -> None:
     outputs = result["outputs"]
     assert "collected_input_square" in outputs
     assert outputs["collected_input_square"] == [1.0, 4.0, 9.0, 16.0]
+
+
+class _ConcurrencyTracker:
+    def __init__(self) -> None:
+        import threading
+
+        self._lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def square_tool(self, input: int) -> int:
+        import time
+
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        # Later elements finish first, outputs must still follow the inputs order
+        time.sleep(0.05 + 0.05 / (1 + int(input)))
+        with self._lock:
+            self.running -= 1
+        return int(input) * int(input)
+
+    async def asquare_tool(self, input: int) -> int:
+        import asyncio
+
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.05 + 0.05 / (1 + int(input)))
+        self.running -= 1
+        return int(input) * int(input)
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 3, None])
+def test_mapnode_executes_iterations_concurrently_and_preserves_order(
+    mapnode_flow: Flow, max_concurrency: int | None
+) -> None:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    tracker = _ConcurrencyTracker()
+    agent = AgentSpecLoader(
+        tool_registry={"square_tool": tracker.square_tool},
+        config={"max_concurrency": max_concurrency},
+    ).load_component(mapnode_flow)
+    result = agent.invoke({"inputs": {"input_list": list(range(8))}})
+    assert result["outputs"]["collected_input_square"] == [float(i * i) for i in range(8)]
+    if max_concurrency == 1:
+        assert tracker.max_running == 1
+    else:
+        assert 1 < tracker.max_running <= (max_concurrency or 8)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("max_concurrency", [1, 3, None])
+async def test_mapnode_executes_iterations_concurrently_and_preserves_order_async(
+    mapnode_flow: Flow, max_concurrency: int | None
+) -> None:
+    from langchain_core.tools import StructuredTool
+
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    tracker = _ConcurrencyTracker()
+    tool = StructuredTool.from_function(
+        coroutine=tracker.asquare_tool, name="square_tool", description="Square a number"
+    )
+    agent = AgentSpecLoader(
+        tool_registry={"square_tool": tool},
+        config={"max_concurrency": max_concurrency},
+    ).load_component(mapnode_flow)
+    result = await agent.ainvoke({"inputs": {"input_list": list(range(8))}})
+    assert result["outputs"]["collected_input_square"] == [float(i * i) for i in range(8)]
+    if max_concurrency == 1:
+        assert tracker.max_running == 1
+    else:
+        assert 1 < tracker.max_running <= (max_concurrency or 8)
+
+
+def test_mapnode_propagates_iteration_errors(mapnode_flow: Flow) -> None:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    def square_tool(input: int) -> int:
+        if int(input) == 2:
+            raise ValueError("cannot square 2")
+        return int(input) * int(input)
+
+    agent = AgentSpecLoader(tool_registry={"square_tool": square_tool}).load_component(mapnode_flow)
+    with pytest.raises(ValueError, match="cannot square 2"):
+        agent.invoke({"inputs": {"input_list": [1, 2, 3, 4]}})
+
+
+def test_mapnode_can_be_executed_with_implicit_data_flow_connections(mapnode_flow: Flow) -> None:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    _, square_numbers_map_node, outer_end_node = mapnode_flow.nodes
+    outer_start_node = StartNode(
+        name="outer_start",
+        inputs=[ListProperty(title="iterated_input", item_type=FloatProperty())],
+    )
+    # Data flow connections are inferred from the titles of the inputs and outputs
+    implicit_mapnode_flow = Flow(
+        name="flow to square all elements of a list",
+        start_node=outer_start_node,
+        nodes=[outer_start_node, square_numbers_map_node, outer_end_node],
+        control_flow_connections=[
+            ControlFlowEdge(
+                name="start_to_square_numbers",
+                from_node=outer_start_node,
+                to_node=square_numbers_map_node,
+            ),
+            ControlFlowEdge(
+                name="map_to_end", from_node=square_numbers_map_node, to_node=outer_end_node
+            ),
+        ],
+    )
+
+    def square_tool(input: int) -> int:
+        return int(input) * int(input)
+
+    agent = AgentSpecLoader(tool_registry={"square_tool": square_tool}).load_component(
+        implicit_mapnode_flow
+    )
+    result = agent.invoke({"inputs": {"iterated_input": [1, 2, 3, 4]}})
+    assert result["outputs"] == {"collected_input_square": [1.0, 4.0, 9.0, 16.0]}
@@ -0,0 +1,220 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import asyncio
+import threading
+import time
+from typing import List
+
+import pytest
+
+from pyagentspec.flows.edges import ControlFlowEdge
+from pyagentspec.flows.flow import Flow
+from pyagentspec.flows.node import Node
+from pyagentspec.flows.nodes import EndNode, ParallelFlowNode, StartNode, ToolNode
+from pyagentspec.property import Property, StringProperty
+from pyagentspec.tools import ServerTool
+
+
+def _create_sequential_flow(name: str, nodes: List[Node], inputs: List[Property]) -> Flow:
+    # Data flow connections are inferred from the names of the inputs and outputs
+    return Flow(
+        name=name,
+        start_node=nodes[0],
+        nodes=nodes,
+        control_flow_connections=[
+            ControlFlowEdge(
+                name=f"{source.name}_to_{target.name}", from_node=source, to_node=target
+            )
+            for source, target in zip(nodes, nodes[1:])
+        ],
+        inputs=inputs,
+    )
+
+
+def _create_tool_subflow(tool_name: str, output_title: str) -> Flow:
+    city_property = StringProperty(title="city")
+    output_property = StringProperty(title=output_title)
+    tool = ServerTool(name=tool_name, inputs=[city_property], outputs=[output_property])
+    return _create_sequential_flow(
+        name=f"{tool_name}_flow",
+        nodes=[
+            StartNode(name="start", inputs=[city_property]),
+            ToolNode(name=f"{tool_name}_node", tool=tool),
+            EndNode(name="end", outputs=[output_property]),
+        ],
+        inputs=[city_property],
+    )
+
+
+@pytest.fixture()
+def parallel_flow_node_flow() -> Flow:
+    parallel_flow_node = ParallelFlowNode(
+        name="parallel_flow_node",
+        subflows=[
+            _create_tool_subflow("get_weather", "weather"),
+            _create_tool_subflow("get_population", "population"),
+            _create_tool_subflow("get_country", "country"),
+        ],
+    )
+    city_property = StringProperty(title="city")
+    return _create_sequential_flow(
+        name="city_report_flow",
+        nodes=[
+            StartNode(name="outer_start", inputs=[city_property]),
+            parallel_flow_node,
+            EndNode(name="outer_end", outputs=parallel_flow_node.outputs),
+        ],
+        inputs=[city_property],
+    )
+
+
+class _CityTools:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def _track(self, duration: float) -> None:
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(duration)
+        with self._lock:
+            self.running -= 1
+
+    def get_weather(self, city: str) -> str:
+        self._track(0.1)
+        return f"sunny in {city}"
+
+    def get_population(self, city: str) -> str:
+        self._track(0.1)
+        return f"many people in {city}"
+
+    def get_country(self, city: str) -> str:
+        self._track(0.1)
+        return "Morocco"
+
+    @property
+    def tool_registry(self) -> dict:
+        return {
+            "get_weather": self.get_weather,
+            "get_population": self.get_population,
+            "get_country": self.get_country,
+        }
+
+
+EXPECTED_OUTPUTS = {
+    "weather": "sunny in Agadir",
+    "population": "many people in Agadir",
+    "country": "Morocco",
+}
+
+
+def test_parallelflownode_executes_subflows_concurrently(parallel_flow_node_flow: Flow) -> None:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    tools = _CityTools()
+    agent = AgentSpecLoader(tool_registry=tools.tool_registry).load_component(
+        parallel_flow_node_flow
+    )
+    result = agent.invoke({"inputs": {"city": "Agadir"}})
+    assert result["outputs"] == EXPECTED_OUTPUTS
+    assert tools.max_running > 1
+
+
+def test_parallelflownode_respects_max_concurrency(parallel_flow_node_flow: Flow) -> None:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    tools = _CityTools()
+    agent = AgentSpecLoader(
+        tool_registry=tools.tool_registry, config={"max_concurrency": 1}
+    ).load_component(parallel_flow_node_flow)
+    result = agent.invoke({"inputs": {"city": "Agadir"}})
+    assert result["outputs"] == EXPECTED_OUTPUTS
+    assert tools.max_running == 1
+
+
+@pytest.mark.anyio
+async def test_parallelflownode_can_be_executed_async(parallel_flow_node_flow: Flow) -> None:
+    from langchain_core.tools import StructuredTool
+
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    running_subflows = 0
+    max_running_subflows = 0
+
+    def create_async_tool(name: str, output: str) -> StructuredTool:
+        async def tool(city: str) -> str:
+            nonlocal running_subflows, max_running_subflows
+            running_subflows += 1
+            max_running_subflows = max(max_running_subflows, running_subflows)
+            await asyncio.sleep(0.05)
+            running_subflows -= 1
+            return output
+
+        return StructuredTool.from_function(coroutine=tool, name=name, description=name)
+
+    tool_registry = {
+        "get_weather": create_async_tool("get_weather", "sunny in Agadir"),
+        "get_population": create_async_tool("get_population", "many people in Agadir"),
+        "get_country": create_async_tool("get_country", "Morocco"),
+    }
+    agent = AgentSpecLoader(tool_registry=tool_registry).load_component(parallel_flow_node_flow)
+    result = await agent.ainvoke({"inputs": {"city": "Agadir"}})
+    assert result["outputs"] == EXPECTED_OUTPUTS
+    assert max_running_subflows == 3
+
+
+def test_parallelflownode_propagates_subflow_errors(parallel_flow_node_flow: Flow) -> None:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    def get_population(city: str) -> str:
+        raise ValueError("Population is unknown")
+
+    tools = _CityTools()
+    agent = AgentSpecLoader(
+        tool_registry={**tools.tool_registry, "get_population": get_population}
+    ).load_component(parallel_flow_node_flow)
+    with pytest.raises(ValueError, match="Population is unknown"):
+        agent.invoke({"inputs": {"city": "Agadir"}})
+
+
+@pytest.mark.anyio
+async def test_parallelflownode_cancels_running_subflows_on_error_async(
+    parallel_flow_node_flow: Flow,
+) -> None:
+    from langchain_core.tools import StructuredTool
+
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    cancelled_tools = []
+
+    def create_slow_tool(name: str) -> StructuredTool:
+        async def tool(city: str) -> str:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled_tools.append(name)
+                raise
+            return city
+
+        return StructuredTool.from_function(coroutine=tool, name=name, description=name)
+
+    async def get_country(city: str) -> str:
+        raise ValueError("Country is unknown")
+
+    tool_registry = {
+        "get_weather": create_slow_tool("get_weather"),
+        "get_population": create_slow_tool("get_population"),
+        "get_country": StructuredTool.from_function(
+            coroutine=get_country, name="get_country", description="get_country"
+        ),
+    }
+    agent = AgentSpecLoader(tool_registry=tool_registry).load_component(parallel_flow_node_flow)
+    with pytest.raises(ValueError, match="Country is unknown"):
+        await asyncio.wait_for(agent.ainvoke({"inputs": {"city": "Agadir"}}), timeout=5)
+    assert sorted(cancelled_tools) == ["get_population", "get_weather"]
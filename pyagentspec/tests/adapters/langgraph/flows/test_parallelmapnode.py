@@ -0,0 +1,141 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import asyncio
+from typing import Dict
+
+import pytest
+
+from pyagentspec.flows.edges import ControlFlowEdge, DataFlowEdge
+from pyagentspec.flows.flow import Flow
+from pyagentspec.flows.nodes import EndNode, ParallelMapNode, StartNode, ToolNode
+from pyagentspec.flows.nodes.mapnode import ReductionMethod
+from pyagentspec.property import FloatProperty, ListProperty
+from pyagentspec.tools import ServerTool
+
+
+def _create_parallel_map_flow(reducers: Dict[str, ReductionMethod]) -> Flow:
+    x_property = FloatProperty(title="x")
+    x_square_property = FloatProperty(title="x_square")
+    square_tool = ServerTool(name="square_tool", inputs=[x_property], outputs=[x_square_property])
+
+    inner_start_node = StartNode(name="inner_start", inputs=[x_property])
+    square_tool_node = ToolNode(name="square_tool_node", tool=square_tool)
+    inner_end_node = EndNode(name="inner_end", outputs=[x_square_property])
+    square_flow = Flow(
+        name="square_flow",
+        start_node=inner_start_node,
+        nodes=[inner_start_node, square_tool_node, inner_end_node],
+        control_flow_connections=[
+            ControlFlowEdge(
+                name="start_to_tool", from_node=inner_start_node, to_node=square_tool_node
+            ),
+            ControlFlowEdge(name="tool_to_end", from_node=square_tool_node, to_node=inner_end_node),
+        ],
+        data_flow_connections=[
+            DataFlowEdge(
+                name="x_edge",
+                source_node=inner_start_node,
+                source_output="x",
+                destination_node=square_tool_node,
+                destination_input="x",
+            ),
+            DataFlowEdge(
+                name="x_square_edge",
+                source_node=square_tool_node,
+                source_output="x_square",
+                destination_node=inner_end_node,
+                destination_input="x_square",
+            ),
+        ],
+    )
+
+    parallel_map_node = ParallelMapNode(
+        name="parallel_square_node", subflow=square_flow, reducers=reducers
+    )
+    (collected_property,) = parallel_map_node.outputs or []
+
+    x_list_property = ListProperty(title="x_list", item_type=FloatProperty())
+    start_node = StartNode(name="start", inputs=[x_list_property])
+    end_node = EndNode(name="end", outputs=[collected_property])
+    return Flow(
+        name="parallel_square_flow",
+        start_node=start_node,
+        nodes=[start_node, parallel_map_node, end_node],
+        control_flow_connections=[
+            ControlFlowEdge(name="start_to_map", from_node=start_node, to_node=parallel_map_node),
+            ControlFlowEdge(name="map_to_end", from_node=parallel_map_node, to_node=end_node),
+        ],
+        data_flow_connections=[
+            DataFlowEdge(
+                name="x_list_edge",
+                source_node=start_node,
+                source_output="x_list",
+                destination_node=parallel_map_node,
+                destination_input="iterated_x",
+            ),
+            DataFlowEdge(
+                name="collected_edge",
+                source_node=parallel_map_node,
+                source_output=collected_property.title,
+                destination_node=end_node,
+                destination_input=collected_property.title,
+            ),
+        ],
+    )
+
+
+def square_tool(x: float) -> float:
+    return x * x
+
+
+@pytest.mark.parametrize(
+    "reducer, expected_output",
+    [
+        (ReductionMethod.APPEND, [1.0, 4.0, 9.0, 16.0]),
+        (ReductionMethod.SUM, 30.0),
+        (ReductionMethod.AVERAGE, 7.5),
+        (ReductionMethod.MAX, 16.0),
+        (ReductionMethod.MIN, 1.0),
+    ],
+)
+def test_parallelmapnode_can_be_executed_with_reducers(
+    reducer: ReductionMethod, expected_output: object
+) -> None:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    flow = _create_parallel_map_flow({"x_square": reducer})
+    agent = AgentSpecLoader(tool_registry={"square_tool": square_tool}).load_component(flow)
+    result = agent.invoke({"inputs": {"x_list": [1.0, 2.0, 3.0, 4.0]}})
+    assert result["outputs"] == {"collected_x_square": expected_output}
+
+
+@pytest.mark.anyio
+async def test_parallelmapnode_runs_iterations_concurrently_async() -> None:
+    from langchain_core.tools import StructuredTool
+
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    running = 0
+    max_running = 0
+
+    async def asquare_tool(x: float) -> float:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        # Later elements finish first, outputs must still follow the inputs order
+        await asyncio.sleep(0.05 / x)
+        running -= 1
+        return x * x
+
+    tool = StructuredTool.from_function(
+        coroutine=asquare_tool, name="square_tool", description="Square a number"
+    )
+    flow = _create_parallel_map_flow({"x_square": ReductionMethod.APPEND})
+    agent = AgentSpecLoader(tool_registry={"square_tool": tool}).load_component(flow)
+    result = await agent.ainvoke({"inputs": {"x_list": [1.0, 2.0, 3.0, 4.0]}})
+    assert result["outputs"] == {"collected_x_square": [1.0, 4.0, 9.0, 16.0]}
+    assert max_running == 4
@@ -0,0 +1,219 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import itertools
+from typing import Any, Iterator, List
+from unittest.mock import patch
+
+import pytest
+
+from pyagentspec.agent import Agent
+from pyagentspec.flows.edges import ControlFlowEdge, DataFlowEdge
+from pyagentspec.flows.flow import Flow
+from pyagentspec.flows.node import Node
+from pyagentspec.flows.nodes import AgentNode, EndNode, LlmNode, MapNode, StartNode, ToolNode
+from pyagentspec.llms import OpenAiCompatibleConfig
+from pyagentspec.property import FloatProperty, ListProperty, StringProperty
+from pyagentspec.tools import ServerTool
+
+GENERATED_TEXT = "Agadir is a sunny city"
+
+
+def _create_sequential_flow(name: str, nodes: List[Node]) -> Flow:
+    # Data flow connections are inferred from the names of the inputs and outputs
+    return Flow(
+        name=name,
+        start_node=nodes[0],
+        nodes=nodes,
+        control_flow_connections=[
+            ControlFlowEdge(
+                name=f"{source.name}_to_{target.name}", from_node=source, to_node=target
+            )
+            for source, target in zip(nodes, nodes[1:])
+        ],
+    )
+
+
+@pytest.fixture
+def fake_llm() -> Iterator[None]:
+    from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+    from langchain_core.messages import AIMessage
+
+    from pyagentspec.adapters.langgraph._langgraphconverter import AgentSpecToLangGraphConverter
+
+    class _FakeModel(GenericFakeChatModel):
+        def bind_tools(self, tools: Any, **kwargs: Any) -> Any:
+            return self
+
+    def create_fake_llm(*args: Any, **kwargs: Any) -> Any:
+        # Streams the generated text word by word
+        return _FakeModel(messages=itertools.repeat(AIMessage(content=GENERATED_TEXT)))
+
+    with patch.object(AgentSpecToLangGraphConverter, "_llm_convert_to_langgraph", create_fake_llm):
+        yield
+
+
+@pytest.fixture
+def llm_flow() -> Flow:
+    llm_config = OpenAiCompatibleConfig(name="llm", model_id="fake", url="null")
+    city_property = StringProperty(title="city")
+    description_property = StringProperty(title="description")
+    return _create_sequential_flow(
+        name="llm_flow",
+        nodes=[
+            StartNode(name="start", inputs=[city_property]),
+            LlmNode(
+                name="describe_city",
+                llm_config=llm_config,
+                prompt_template="Describe {{city}}",
+                outputs=[description_property],
+            ),
+            EndNode(name="end", outputs=[description_property]),
+        ],
+    )
+
+
+@pytest.mark.anyio
+async def test_llmnode_streams_llm_outputs_before_node_outputs(
+    fake_llm: None, llm_flow: Flow
+) -> None:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+    from pyagentspec.adapters.langgraph.streaming import LlmOutputChunk, NodeOutputsChunk
+
+    graph = AgentSpecLoader(stream_llm_outputs=True).load_component(llm_flow)
+    chunks = [
+        chunk async for chunk in graph.astream({"inputs": {"city": "Agadir"}}, stream_mode="custom")
+    ]
+
+    llm_output_chunks = [chunk for chunk in chunks if isinstance(chunk, LlmOutputChunk)]
+    assert len(llm_output_chunks) > 1
+    assert {chunk.node_name for chunk in llm_output_chunks} == {"describe_city"}
+    assert "".join(chunk.content for chunk in llm_output_chunks) == GENERATED_TEXT
+
+    node_outputs_chunks = [chunk for chunk in chunks if isinstance(chunk, NodeOutputsChunk)]
+    assert [chunk.node_name for chunk in node_outputs_chunks] == ["start", "describe_city", "end"]
+    assert node_outputs_chunks[1].outputs == {"description": GENERATED_TEXT}
+    assert chunks.index(llm_output_chunks[-1]) < chunks.index(node_outputs_chunks[1])
+
+
+def test_llmnode_does_not_stream_llm_outputs_by_default(fake_llm: None, llm_flow: Flow) -> None:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+    from pyagentspec.adapters.langgraph.streaming import LlmOutputChunk, NodeOutputsChunk
+
+    graph = AgentSpecLoader().load_component(llm_flow)
+    chunks = list(graph.stream({"inputs": {"city": "Agadir"}}, stream_mode="custom"))
+    assert not any(isinstance(chunk, LlmOutputChunk) for chunk in chunks)
+    assert all(isinstance(chunk, NodeOutputsChunk) for chunk in chunks)
+    assert graph.invoke({"inputs": {"city": "Agadir"}})["outputs"] == {
+        "description": GENERATED_TEXT
+    }
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+@pytest.mark.anyio
+async def test_agentnode_streams_llm_outputs(fake_llm: None, use_async: bool) -> None:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+    from pyagentspec.adapters.langgraph.streaming import LlmOutputChunk
+
+    agent = Agent(
+        name="agent",
+        system_prompt="You are a helpful agent.",
+        llm_config=OpenAiCompatibleConfig(name="llm", model_id="fake", url="null"),
+    )
+    flow = _create_sequential_flow(
+        name="agent_flow",
+        nodes=[
+            StartNode(name="start"),
+            AgentNode(name="agent_node", agent=agent),
+            EndNode(name="end"),
+        ],
+    )
+    graph = AgentSpecLoader(stream_llm_outputs=True).load_component(flow)
+    inputs = {"inputs": {}, "messages": [{"role": "user", "content": "Describe Agadir"}]}
+    if use_async:
+        chunks = [chunk async for chunk in graph.astream(inputs, stream_mode=["custom", "values"])]
+    else:
+        chunks = list(graph.stream(inputs, stream_mode=["custom", "values"]))
+
+    llm_output_chunks = [
+        chunk for mode, chunk in chunks if mode == "custom" and isinstance(chunk, LlmOutputChunk)
+    ]
+    assert "".join(chunk.content for chunk in llm_output_chunks) == GENERATED_TEXT
+    final_state = [chunk for mode, chunk in chunks if mode == "values"][-1]
+    assert final_state["messages"][-1].content == GENERATED_TEXT
+
+
+def test_mapnode_streams_iteration_outputs_and_subflow_node_outputs() -> None:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+    from pyagentspec.adapters.langgraph.streaming import MapNodeIterationChunk, NodeOutputsChunk
+
+    x_property = FloatProperty(title="x")
+    x_square_property = FloatProperty(title="x_square")
+    square_tool = ServerTool(name="square_tool", inputs=[x_property], outputs=[x_square_property])
+    square_flow = _create_sequential_flow(
+        name="square_flow",
+        nodes=[
+            StartNode(name="inner_start", inputs=[x_property]),
+            ToolNode(name="square_tool_node", tool=square_tool),
+            EndNode(name="inner_end", outputs=[x_square_property]),
+        ],
+    )
+    map_node = MapNode(name="square_node", subflow=square_flow)
+    (collected_property,) = map_node.outputs or []
+    x_list_property = ListProperty(title="x_list", item_type=FloatProperty())
+    start_node = StartNode(name="start", inputs=[x_list_property])
+    end_node = EndNode(name="end", outputs=[collected_property])
+    flow = Flow(
+        name="map_flow",
+        start_node=start_node,
+        nodes=[start_node, map_node, end_node],
+        control_flow_connections=[
+            ControlFlowEdge(name="start_to_map", from_node=start_node, to_node=map_node),
+            ControlFlowEdge(name="map_to_end", from_node=map_node, to_node=end_node),
+        ],
+        data_flow_connections=[
+            DataFlowEdge(
+                name="x_list_edge",
+                source_node=start_node,
+                source_output="x_list",
+                destination_node=map_node,
+                destination_input="iterated_x",
+            ),
+            DataFlowEdge(
+                name="collected_edge",
+                source_node=map_node,
+                source_output=collected_property.title,
+                destination_node=end_node,
+                destination_input=collected_property.title,
+            ),
+        ],
+    )
+
+    graph = AgentSpecLoader(
+        tool_registry={"square_tool": lambda x: x * x}, config={"max_concurrency": 1}
+    ).load_component(flow)
+    chunks = list(
+        graph.stream({"inputs": {"x_list": [1.0, 2.0, 3.0]}}, stream_mode="custom", subgraphs=True)
+    )
+
+    iteration_chunks = [
+        chunk for namespace, chunk in chunks if isinstance(chunk, MapNodeIterationChunk)
+    ]
+    assert [(chunk.iteration, chunk.outputs) for chunk in iteration_chunks] == [
+        (0, {"x_square": 1.0}),
+        (1, {"x_square": 4.0}),
+        (2, {"x_square": 9.0}),
+    ]
+    # Chunks of the nodes of the subflow are yielded with the namespace of the subflow
+    subflow_tool_chunks = [
+        chunk
+        for namespace, chunk in chunks
+        if namespace and isinstance(chunk, NodeOutputsChunk)
+        if chunk.node_name == "square_tool_node"
+    ]
+    assert len(subflow_tool_chunks) == 3
+    root_node_names = [chunk.node_name for namespace, chunk in chunks if not namespace]
+    assert root_node_names == ["start"] + ["square_node"] * 4 + ["end"]
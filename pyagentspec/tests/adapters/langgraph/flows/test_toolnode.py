@@ -14,6 +14,8 @@ from pyagentspec.flows.edges import ControlFlowEdge, DataFlowEdge
 from pyagentspec.flows.flow import Flow
 from pyagentspec.flows.nodes import EndNode, StartNode, ToolNode
 from pyagentspec.property import (
+    BooleanProperty,
+    IntegerProperty,
     ListProperty,
     NumberProperty,
     ObjectProperty,
@@ -266,3 +268,25 @@ def test_tool_node_multiple_complex_outputs() -> None:
     )
     outputs = _run_flow_and_resume(flow, (7, {"key": "val"}, [1]))
     assert outputs == {"num": 7, "obj": {"key": "val"}, "array": [1]}
+
+
+@pytest.mark.parametrize(
+    "output_prop, returned_value, expected_value",
+    [
+        (IntegerProperty(title="out"), "12", 12),
+        (IntegerProperty(title="out"), 3.0, 3),
+        (NumberProperty(title="out"), " 1.5 ", 1.5),
+        (NumberProperty(title="out"), True, 1.0),
+        (BooleanProperty(title="out"), 0, False),
+        (StringProperty(title="out"), ["a"], '["a"]'),
+    ],
+)
+def test_toolnode_outputs_are_cast_to_their_declared_type(
+    output_prop: Property, returned_value: Any, expected_value: Any
+) -> None:
+    flow = _build_flow_with_client_tool(
+        input_prop=NumberProperty(title="x"), output_props=[output_prop]
+    )
+    outputs = _run_flow_and_resume(flow, returned_value)
+    assert outputs == {"out": expected_value}
+    assert type(outputs["out"]) is type(expected_value)
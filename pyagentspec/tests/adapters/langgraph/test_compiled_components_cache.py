@@ -0,0 +1,116 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+from typing import Iterator
+
+import pytest
+
+from pyagentspec.flows.edges import ControlFlowEdge, DataFlowEdge
+from pyagentspec.flows.flow import Flow
+from pyagentspec.flows.nodes import EndNode, StartNode, ToolNode
+from pyagentspec.property import StringProperty
+from pyagentspec.serialization import AgentSpecSerializer
+from pyagentspec.tools import ServerTool
+
+
+def _create_greeting_flow(greeting_title: str = "greeting") -> Flow:
+    name_property = StringProperty(title="name")
+    greeting_property = StringProperty(title=greeting_title)
+    tool = ServerTool(name="greet", inputs=[name_property], outputs=[greeting_property])
+    start_node = StartNode(name="start", inputs=[name_property])
+    tool_node = ToolNode(name="greet_node", tool=tool)
+    end_node = EndNode(name="end", outputs=[greeting_property])
+    return Flow(
+        name="greeting_flow",
+        start_node=start_node,
+        nodes=[start_node, tool_node, end_node],
+        control_flow_connections=[
+            ControlFlowEdge(name="start_to_tool", from_node=start_node, to_node=tool_node),
+            ControlFlowEdge(name="tool_to_end", from_node=tool_node, to_node=end_node),
+        ],
+        data_flow_connections=[
+            DataFlowEdge(
+                name="name_edge",
+                source_node=start_node,
+                source_output="name",
+                destination_node=tool_node,
+                destination_input="name",
+            ),
+            DataFlowEdge(
+                name="greeting_edge",
+                source_node=tool_node,
+                source_output=greeting_title,
+                destination_node=end_node,
+                destination_input=greeting_title,
+            ),
+        ],
+    )
+
+
+def greet(name: str) -> str:
+    return f"Hello {name}"
+
+
+@pytest.fixture(autouse=True)
+def clear_compiled_components_cache() -> Iterator[None]:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    AgentSpecLoader.clear_compiled_components_cache()
+    yield
+    AgentSpecLoader.clear_compiled_components_cache()
+
+
+def test_loading_same_component_twice_reuses_compiled_component() -> None:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    tool_registry = {"greet": greet}
+    serialized_flow = AgentSpecSerializer().to_yaml(_create_greeting_flow())
+    first_agent = AgentSpecLoader(
+        tool_registry=tool_registry, cache_compiled_components=True
+    ).load_yaml(serialized_flow)
+    second_agent = AgentSpecLoader(
+        tool_registry=tool_registry, cache_compiled_components=True
+    ).load_yaml(serialized_flow)
+    assert first_agent is second_agent
+    result = second_agent.invoke({"inputs": {"name": "Ada"}})
+    assert result["outputs"] == {"greeting": "Hello Ada"}
+
+
+def test_compiled_components_are_not_cached_by_default() -> None:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    flow = _create_greeting_flow()
+    loader = AgentSpecLoader(tool_registry={"greet": greet})
+    assert loader.load_component(flow) is not loader.load_component(flow)
+
+
+def test_different_components_or_loader_options_do_not_share_compiled_component() -> None:
+    from langgraph.checkpoint.memory import InMemorySaver
+
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    flow = _create_greeting_flow()
+    tool_registry = {"greet": greet}
+    agent = AgentSpecLoader(
+        tool_registry=tool_registry, cache_compiled_components=True
+    ).load_component(flow)
+
+    other_flow_agent = AgentSpecLoader(
+        tool_registry=tool_registry, cache_compiled_components=True
+    ).load_component(_create_greeting_flow(greeting_title="salutation"))
+    assert other_flow_agent is not agent
+
+    other_tool_agent = AgentSpecLoader(
+        tool_registry={"greet": lambda name: f"Hi {name}"}, cache_compiled_components=True
+    ).load_component(flow)
+    assert other_tool_agent is not agent
+    assert other_tool_agent.invoke({"inputs": {"name": "Ada"}})["outputs"] == {"greeting": "Hi Ada"}
+
+    # Each load without config creates its own thread id, so it must not be cached
+    checkpointer_loader = AgentSpecLoader(
+        tool_registry=tool_registry, checkpointer=InMemorySaver(), cache_compiled_components=True
+    )
+    assert checkpointer_loader.load_component(flow) is not checkpointer_loader.load_component(flow)
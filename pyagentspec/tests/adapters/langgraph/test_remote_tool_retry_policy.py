@@ -4,8 +4,14 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+import asyncio
 from typing import Any
+from unittest.mock import AsyncMock, patch
 
+import httpx
+import pytest
+
+from pyagentspec.retrypolicy import RetryPolicy
 from pyagentspec.tools import RemoteTool
 
 from ..test_remote_tool_retry_policy_cases import RemoteToolRetryPolicyCases
@@ -18,3 +24,50 @@ class TestRemoteToolRetryPolicy(RemoteToolRetryPolicyCases):
         langgraph_tool = AgentSpecLoader().load_component(remote_tool)
         assert langgraph_tool.func is not None
         return langgraph_tool.func()
+
+
+class TestAsyncRemoteToolRetryPolicy(RemoteToolRetryPolicyCases):
+    is_async_remote_tool = True
+
+    def invoke_remote_tool(self, remote_tool: RemoteTool) -> Any:
+        from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+        langgraph_tool = AgentSpecLoader().load_component(remote_tool)
+        assert langgraph_tool.coroutine is not None
+        return langgraph_tool.coroutine()
+
+
+@pytest.mark.anyio
+async def test_async_remote_tool_retry_backoff_does_not_block_the_event_loop() -> None:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    remote_tool = RemoteTool(
+        name="retry_service",
+        description="A remote service with retry policy",
+        url="https://example.com/api",
+        http_method="GET",
+        retry_policy=RetryPolicy(max_attempts=1, initial_retry_delay=0.3, jitter=None),
+    )
+    langgraph_tool = AgentSpecLoader().load_component(remote_tool)
+    request = httpx.Request("GET", "https://example.com/api")
+
+    ticks = 0
+
+    async def count_ticks_during_backoff() -> None:
+        nonlocal ticks
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+        mock_request.side_effect = [
+            httpx.Response(503, request=request, json={"error": "busy"}),
+            httpx.Response(200, request=request, json={"result": "ok"}),
+        ]
+        result, _ = await asyncio.gather(
+            langgraph_tool.coroutine(), asyncio.wait_for(count_ticks_during_backoff(), 0.25)
+        )
+
+    assert result == {"result": "ok"}
+    assert ticks == 10
+    assert mock_request.await_count == 2
@@ -76,7 +76,7 @@ def remote_tool_with_url_allow_list(url_allow_list: list[str]) -> RemoteTool:
 def test_remote_tool_having_nested_inputs_with_langgraph() -> None:
     """
     End-to-end: convert an AgentSpec RemoteTool to a LangGraph StructuredTool and run it.
-    Patch httpx.request to capture the outgoing HTTP call and verify the rendered JSON payload.
+    Patch httpx.Client.request to capture the outgoing HTTP call and verify the rendered JSON payload.
     """
     from pyagentspec.adapters.langgraph import AgentSpecLoader
 
@@ -104,24 +104,24 @@ def test_remote_tool_having_nested_inputs_with_langgraph() -> None:
     # Convert to a LangGraph StructuredTool using the LangGraph adapter converter.
     lang_tool = AgentSpecLoader().load_component(remote_tool)
 
-    # Expected object passed as the `json` kwarg to httpx.request after rendering.
+    # Expected object passed as the `json` kwarg to httpx.Client.request after rendering.
     expected_json = {
         "location": {"city": "Agadir", "coordinates": {"lat": "30.4", "lon": "-9.6"}},
         "meta": ["requested_by:alice", {"note": "helloworld"}],
         "raw": "binary-blob",
     }
 
-    # Patch httpx.request (used inside the converted langgraph tool) to capture the call.
-    with patch("httpx.request", side_effect=mock_request) as patched_request:
+    # Patch httpx.Client.request (used inside the converted langgraph tool) to capture the call.
+    with patch("httpx.Client.request", side_effect=mock_request) as patched_request:
         # Call the underlying function of the StructuredTool directly with keyword args.
         # The LangGraph converter wraps the function as a StructuredTool with .func attribute.
         result = lang_tool.func(
             city="Agadir", lat="30.4", lon="-9.6", user="alice", suffix="world", bin_suffix="blob"
         )
-        # Ensure httpx.request was invoked and inspect the kwargs it was called with.
+        # Ensure httpx.Client.request was invoked and inspect the kwargs it was called with.
         patched_request.assert_called_once()
         called_args, called_kwargs = patched_request.call_args
-        # The converter uses `json=remote_tool_data` when calling httpx.request for dict data
+        # The converter uses `json=remote_tool_data` when calling httpx.Client.request for dict data
         assert (
             "json" in called_kwargs
         ), f"Expected 'json' kwarg in request call since json is a dict, got {called_kwargs}"
@@ -162,8 +162,8 @@ def test_remote_tool_post_json_array_with_langgraph() -> None:
         {"location": "Agadir", "temp": "25"},
     ]
 
-    # Patch httpx.request.
-    with patch("httpx.request", side_effect=mock_request) as patched_request:
+    # Patch httpx.Client.request.
+    with patch("httpx.Client.request", side_effect=mock_request) as patched_request:
         # Call the underlying function of the StructuredTool directly with keyword args.
         result = lang_tool.func(
             city="Agadir",
@@ -205,8 +205,8 @@ def test_remote_tool_post_raw_body_with_langgraph() -> None:
     # Expected rendered data (str).
     expected_data = "request body for city: Agadir with note: urgent"
 
-    # Patch httpx.request.
-    with patch("httpx.request", side_effect=mock_request) as patched_request:
+    # Patch httpx.Client.request.
+    with patch("httpx.Client.request", side_effect=mock_request) as patched_request:
         # Call the underlying function of the StructuredTool directly with keyword args.
         result = lang_tool.func(
             city="Agadir",
@@ -313,7 +313,7 @@ def test_remote_tool_rejects_rendered_url_outside_allow_list_with_langgraph(
 
     lang_tool = AgentSpecLoader().load_component(remote_tool_with_url_allow_list)
 
-    with patch("httpx.request", return_value=DummyResponse({"ok": True})) as mocked_request:
+    with patch("httpx.Client.request", return_value=DummyResponse({"ok": True})) as mocked_request:
         with pytest.raises(ValueError, match="Requested URL is not in allowed list"):
             lang_tool.func(host="blocked.example.com")
 
@@ -635,7 +635,7 @@ def test_flow_with_remote_tool_confirmation_approve_executes_http_request() -> N
 
     _ = _invoke_until_interrupt(app, {"inputs": {"x": 3}}, config=config)
 
-    with patch("httpx.request", side_effect=mock_request) as patched:
+    with patch("httpx.Client.request", side_effect=mock_request) as patched:
         result = app.invoke(_approve_command(), config=config)
         patched.assert_called_once()
         assert "outputs" in result
@@ -665,7 +665,7 @@ def test_flow_with_remote_tool_confirmation_reject_does_not_call_http() -> None:
 
     _ = _invoke_until_interrupt(app, {"inputs": {"x": 3}}, config=config)
 
-    with patch("httpx.request") as patched:
+    with patch("httpx.Client.request") as patched:
         result = app.invoke(_reject_command("no"), config=config)
         patched.assert_not_called()
         assert "outputs" in result
@@ -4,7 +4,7 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, List, Tuple
 
 from pyagentspec.tracing.events import (
     AgentExecutionEnd,
@@ -459,3 +459,141 @@ def test_langgraph_flow_tracing_collects_tool_inputs() -> None:
     assert tool_request_events[0].inputs == {"city": "Agadir"}
     assert len(tool_response_events) == 1
     assert tool_response_events[0].outputs == {"forecast": {"city": "Agadir", "condition": "sunny"}}
+
+
+def _stream_fake_llm_in_trace(proc: DummySpanProcessor, content: str) -> None:
+    from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+    from langchain_core.messages import AIMessage
+
+    from pyagentspec.adapters.langgraph.tracing import AgentSpecLlmCallbackHandler
+    from pyagentspec.llms import OpenAiConfig
+
+    llm = GenericFakeChatModel(
+        messages=iter([AIMessage(content=content)]),
+        callbacks=[AgentSpecLlmCallbackHandler(OpenAiConfig(name="llm", model_id="model"))],
+    )
+    with Trace(span_processors=[proc]):
+        for _ in llm.stream("hello"):
+            pass
+
+
+def test_langgraph_span_stacks_are_isolated_across_concurrent_traces() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from pyagentspec.adapters.langgraph.tracing import _SPAN_STACK_REGISTRIES
+
+    processors = [DummySpanProcessor() for _ in range(16)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(
+            executor.map(
+                lambda i: _stream_fake_llm_in_trace(processors[i], f"answer number {i}"),
+                range(len(processors)),
+            )
+        )
+
+    for i, proc in enumerate(processors):
+        assert [type(span) for span in proc.starts][1:] == [LlmGenerationSpan]
+        assert proc.ends[0] is proc.starts[1]
+        (response,) = [
+            event for event, _ in proc.events if isinstance(event, LlmGenerationResponse)
+        ]
+        assert response.content == f"answer number {i}"
+    # Registries are released together with their trace, and no span stack is left behind
+    assert all(len(registry) == 0 for registry in _SPAN_STACK_REGISTRIES.values())
+
+
+def test_langgraph_span_stack_registry_is_released_with_its_trace() -> None:
+    import gc
+
+    from pyagentspec.adapters.langgraph.tracing import (
+        _SPAN_STACK_REGISTRIES,
+        _get_span_stack_registry,
+    )
+
+    with Trace() as trace:
+        registry = _get_span_stack_registry()
+        registry["abandoned_run"] = []
+        assert _SPAN_STACK_REGISTRIES[trace] is registry
+    del trace
+    gc.collect()
+    assert registry not in _SPAN_STACK_REGISTRIES.values()
+
+
+def test_langgraph_span_stack_registry_evicts_abandoned_runs(monkeypatch) -> None:
+    import time
+
+    from pyagentspec.adapters.langgraph.tracing import _SpanStackRegistry
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    registry = _SpanStackRegistry(ttl_seconds=10)
+    registry["abandoned_run"] = []
+    registry["active_run"] = []
+    now += 8
+    assert registry.get("active_run") == []
+    now += 8
+    registry["new_run"] = []
+    assert registry.get("abandoned_run") is None
+    assert registry.get("active_run") == []
+    assert len(registry) == 2
+
+
+def test_langgraph_span_stack_registry_is_cleared_when_its_trace_ends() -> None:
+    from pyagentspec.adapters.langgraph.tracing import _get_span_stack_registry
+
+    with Trace():
+        registry = _get_span_stack_registry()
+        registry["abandoned_run"] = []
+        registry.spans["abandoned_run"] = Span()
+    assert len(registry) == 0
+    assert registry.spans == {}
+
+
+def test_langgraph_cancelled_llm_run_ends_its_span_and_releases_its_state() -> None:
+    import asyncio
+
+    from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+    from langchain_core.messages import AIMessage
+
+    from pyagentspec.adapters.langgraph.tracing import (
+        AgentSpecLlmCallbackHandler,
+        _get_span_stack_registry,
+    )
+    from pyagentspec.llms import OpenAiConfig
+
+    class SlowFakeChatModel(GenericFakeChatModel):
+        async def _astream(self, *args: Any, **kwargs: Any) -> Any:
+            async for chunk in super()._astream(*args, **kwargs):
+                yield chunk
+                await asyncio.sleep(10)
+
+    llm = SlowFakeChatModel(
+        messages=iter([AIMessage(content="a long answer streamed token by token")]),
+        callbacks=[AgentSpecLlmCallbackHandler(OpenAiConfig(name="llm", model_id="model"))],
+    )
+    proc = DummySpanProcessor()
+
+    async def cancel_stream_after_first_chunk() -> None:
+        first_chunk_received = asyncio.Event()
+
+        async def stream() -> None:
+            async for _ in llm.astream("hello"):
+                first_chunk_received.set()
+
+        task = asyncio.create_task(stream())
+        await first_chunk_received.wait()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        registry = _get_span_stack_registry()
+        assert registry.spans == {}
+        assert len(registry) == 0
+
+    async def run_in_trace() -> None:
+        async with Trace(span_processors=[proc]):
+            await cancel_stream_after_first_chunk()
+
+    asyncio.run(run_in_trace())
+    llm_span = proc.starts_async[1]
+    assert isinstance(llm_span, LlmGenerationSpan)
+    assert llm_span in proc.ends_async
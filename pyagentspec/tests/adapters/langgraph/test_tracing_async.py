@@ -20,6 +20,7 @@ from pyagentspec.tracing.events import (
     ToolExecutionRequest,
     ToolExecutionResponse,
 )
+from pyagentspec.tracing.spanprocessor import SpanProcessorCapabilities
 from pyagentspec.tracing.spans import (
     AgentExecutionSpan,
     FlowExecutionSpan,
@@ -331,7 +332,7 @@ async def test_langgraph_ainvoke_tracing_emits_async_server_tool_events_for_flow
 
 @pytest.mark.anyio
 @retry_test(max_attempts=3, wait_between_tries=2)
-async def test_langgraph_ainvoke_tracing_falls_back_to_sync_tool_events_for_agent(
+async def test_langgraph_ainvoke_tracing_dispatches_to_sync_only_span_processor(
     weather_agent_server_tool_yaml: str,
 ) -> None:
     """
@@ -345,14 +346,13 @@ async def test_langgraph_ainvoke_tracing_falls_back_to_sync_tool_events_for_agen
 
     from pyagentspec.adapters.langgraph import AgentSpecLoader
 
-    # This verifies the async-tracing fallback in the LangGraph callback handler:
-    # tool events should use sync processor hooks when async tool-event hooks are not implemented,
-    # while the surrounding agent/LLM tracing continues to use async hooks.
-    class SyncToolEventFallbackSpanProcessor(DummySpanProcessor):
+    # Span processors that declare to implement only the sync hooks are called through those,
+    # even when the agent and the trace run in async mode.
+    class SyncOnlySpanProcessor(DummySpanProcessor):
+        capabilities = SpanProcessorCapabilities.SYNC
+
         async def on_event_async(self, event: object, span: Span) -> None:
-            if isinstance(span, ToolExecutionSpan):
-                raise NotImplementedError
-            await super().on_event_async(event, span)
+            raise NotImplementedError
 
     async def get_weather(city: str) -> str:
         return f"The weather in {city} is sunny."
@@ -361,9 +361,9 @@ async def test_langgraph_ainvoke_tracing_falls_back_to_sync_tool_events_for_agen
         weather_agent_server_tool_yaml
     )
 
-    proc = SyncToolEventFallbackSpanProcessor()
+    proc = SyncOnlySpanProcessor()
     async with Trace(
-        name="langgraph_tracing_async_server_tool_sync_fallback_test", span_processors=[proc]
+        name="langgraph_tracing_async_server_tool_sync_only_test", span_processors=[proc]
     ):
         response = await weather_agent.ainvoke(
             input={
@@ -373,20 +373,18 @@ async def test_langgraph_ainvoke_tracing_falls_back_to_sync_tool_events_for_agen
         )
         assert "sunny" in str(response).lower()
 
-    assert proc.started_up is False
-    assert proc.shut_down is False
-    assert proc.started_up_async is True
-    assert proc.shut_down_async is True
+    assert proc.started_up is True
+    assert proc.shut_down is True
+    assert proc.started_up_async is False
+    assert proc.shut_down_async is False
 
     sync_event_types = [type(e) for (e, _s) in proc.events]
+    assert any(issubclass(t, AgentExecutionStart) for t in sync_event_types)
+    assert any(issubclass(t, LlmGenerationRequest) for t in sync_event_types)
     assert any(issubclass(t, ToolExecutionRequest) for t in sync_event_types)
     assert any(issubclass(t, ToolExecutionResponse) for t in sync_event_types)
-
-    async_event_types = [type(e) for (e, _s) in proc.events_async]
-    assert any(issubclass(t, AgentExecutionStart) for t in async_event_types)
-    assert any(issubclass(t, LlmGenerationRequest) for t in async_event_types)
-    assert not any(issubclass(t, ToolExecutionRequest) for t in async_event_types)
-    assert not any(issubclass(t, ToolExecutionResponse) for t in async_event_types)
+    assert proc.events_async == []
+    assert proc.starts_async == []
 
 
 @pytest.mark.anyio
@@ -75,14 +75,14 @@ def test_agentspec_client_tool_converts_and_prompts(monkeypatch) -> None:
     assert result == "approved"
 
 
-def test_agentspec_remote_tool_converts_and_calls_httpx(monkeypatch) -> None:
+def test_agentspec_remote_tool_converts_and_calls_httpx() -> None:
     from pyagentspec.adapters.openaiagents import AgentSpecLoader
     from pyagentspec.adapters.openaiagents._types import (
         OAAgent,
         OAFunctionTool,
     )
 
-    # Build an AgentSpec Agent with a RemoteTool that renders templates and calls httpx.request
+    # Build an AgentSpec Agent with a RemoteTool that renders templates and calls httpx.Client.request
     remote = RemoteTool(
         name="get_weather_remote",
         description="Fetch weather for a city via HTTP.",
@@ -104,7 +104,7 @@ def test_agentspec_remote_tool_converts_and_calls_httpx(monkeypatch) -> None:
 
     serialized = AgentSpecSerializer().to_yaml(agentspec_agent)
 
-    # Mock httpx.request used inside the adapter
+    # Mock httpx.Client.request used inside the adapter
     captured: dict[str, Any] = {}
 
     class _FakeResponse:
@@ -126,13 +126,6 @@ def test_agentspec_remote_tool_converts_and_calls_httpx(monkeypatch) -> None:
         captured["headers"] = headers or {}
         return _FakeResponse({"temp_f": 72, "city": captured["params"].get("city")})
 
-    # Patch the httpx.request imported in the converter module
-    monkeypatch.setattr(
-        "pyagentspec.adapters._tools_common.httpx.request",
-        _fake_request,
-        raising=True,
-    )
-
     loader = AgentSpecLoader(tool_registry={})
     oa_agent = loader.load_yaml(serialized)
     assert isinstance(oa_agent, OAAgent)
@@ -140,12 +133,14 @@ def test_agentspec_remote_tool_converts_and_calls_httpx(monkeypatch) -> None:
     tool = oa_agent.tools[0]
     assert isinstance(tool, OAFunctionTool)
 
-    # Invoke tool and assert that httpx.request was called with rendered inputs
+    # Invoke tool and assert that httpx.Client.request was called with rendered inputs
     async def invoke_tool():
         args = {"city": "San Francisco", "auth": "token-123"}
         return await tool.on_invoke_tool(None, json.dumps(args))  # type: ignore[arg-type]
 
-    result = asyncio.run(invoke_tool())
+    # Patch the request method of the pooled httpx clients used by the converted tool
+    with patch("httpx.Client.request", side_effect=_fake_request):
+        result = asyncio.run(invoke_tool())
 
     assert captured["method"] == "GET"
     assert captured["url"] == "https://api.example.com/weather"
@@ -168,7 +163,7 @@ def test_agentspec_remote_tool_rejects_url_outside_allow_list(
     async def invoke_tool():
         return await tool.on_invoke_tool(None, json.dumps({"host": "blocked.example.com"}))  # type: ignore[arg-type]
 
-    with patch("pyagentspec.adapters._tools_common.httpx.request") as mocked_request:
+    with patch("httpx.Client.request") as mocked_request:
         with pytest.raises(ValueError, match="Requested URL is not in allowed list"):
             asyncio.run(invoke_tool())
 
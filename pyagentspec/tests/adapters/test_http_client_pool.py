@@ -0,0 +1,69 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import asyncio
+
+import httpx
+import pytest
+
+from pyagentspec.adapters.httpclientpool import HttpClientPool, get_default_http_client_pool
+
+
+def test_http_client_pool_reuses_clients_per_base_url_and_tls_settings() -> None:
+    with HttpClientPool() as pool:
+        client = pool.get_client("https://example.com/orders/1")
+        assert pool.get_client("https://example.com/orders/2?q=1") is client
+        assert pool.get_client("https://example.com:443/") is client
+        assert pool.get_client("http://example.com/orders/1") is not client
+        assert pool.get_client("https://example.com:8443/orders/1") is not client
+        assert pool.get_client("https://other.example.com/orders/1") is not client
+        assert pool.get_client("https://example.com/orders/1", verify=False) is not client
+    assert client.is_closed
+
+
+def test_http_client_pool_clients_do_not_persist_cookies() -> None:
+    with HttpClientPool() as pool:
+        client = pool.get_client("https://example.com")
+        response = httpx.Response(
+            200,
+            headers={"set-cookie": "session=secret; Path=/"},
+            request=httpx.Request("GET", "https://example.com/login"),
+        )
+        client.cookies.extract_cookies(response)
+        assert len(client.cookies.jar) == 0
+
+
+def test_http_client_pool_can_be_reused_after_being_closed() -> None:
+    pool = HttpClientPool()
+    client = pool.get_client("https://example.com")
+    pool.close()
+    assert client.is_closed
+    new_client = pool.get_client("https://example.com")
+    assert new_client is not client and not new_client.is_closed
+    pool.close()
+
+
+def test_default_http_client_pool_is_shared() -> None:
+    assert get_default_http_client_pool() is get_default_http_client_pool()
+
+
+@pytest.mark.anyio
+async def test_http_client_pool_reuses_async_clients_within_an_event_loop() -> None:
+    async with HttpClientPool() as pool:
+        async_client = pool.get_async_client("https://example.com/orders/1")
+        assert pool.get_async_client("https://example.com/orders/2") is async_client
+        assert pool.get_async_client("https://other.example.com/") is not async_client
+    assert async_client.is_closed
+
+
+def test_http_client_pool_creates_async_clients_per_event_loop() -> None:
+    async def get_async_client(pool: HttpClientPool) -> httpx.AsyncClient:
+        return pool.get_async_client("https://example.com")
+
+    with HttpClientPool() as pool:
+        first_loop_client = asyncio.run(get_async_client(pool))
+        second_loop_client = asyncio.run(get_async_client(pool))
+    assert first_loop_client is not second_loop_client
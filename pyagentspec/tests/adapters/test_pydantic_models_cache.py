@@ -0,0 +1,96 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+from typing import Any, Dict
+
+import pytest
+
+from pyagentspec.adapters._utils import (
+    _PYDANTIC_MODELS_CACHE,
+    SchemaRegistry,
+    _build_type_from_schema,
+    _PydanticModelsCache,
+    create_pydantic_model_from_properties,
+)
+from pyagentspec.property import IntegerProperty, ObjectProperty, Property, StringProperty
+
+
+@pytest.fixture(autouse=True)
+def clear_pydantic_models_cache() -> None:
+    _PYDANTIC_MODELS_CACHE.clear()
+
+
+def test_identical_schemas_share_the_same_model() -> None:
+    first_model = create_pydantic_model_from_properties(
+        "WeatherArgs", [StringProperty(title="city", description="City name")]
+    )
+    second_model = create_pydantic_model_from_properties(
+        "WeatherArgs", [StringProperty(title="city", description="City name")]
+    )
+    assert first_model is second_model
+    assert first_model(city="Agadir").city == "Agadir"
+
+
+@pytest.mark.parametrize(
+    "model_name, properties",
+    [
+        ("OtherArgs", [StringProperty(title="city", description="City name")]),
+        ("WeatherArgs", [StringProperty(title="town", description="City name")]),
+        ("WeatherArgs", [StringProperty(title="city", description="Town name")]),
+        ("WeatherArgs", [StringProperty(title="city", description="City name", default="a")]),
+        ("WeatherArgs", [IntegerProperty(title="city", description="City name")]),
+    ],
+)
+def test_different_schemas_do_not_share_the_same_model(
+    model_name: str, properties: list[Property]
+) -> None:
+    model = create_pydantic_model_from_properties(
+        "WeatherArgs", [StringProperty(title="city", description="City name")]
+    )
+    assert create_pydantic_model_from_properties(model_name, properties) is not model
+
+
+def test_schemas_with_properties_in_another_order_do_not_share_the_same_model() -> None:
+    def build_model(property_names: list[str]) -> Any:
+        schema = {
+            "type": "object",
+            "properties": {name: {"type": "string"} for name in property_names},
+        }
+        return _build_type_from_schema("Args", schema, SchemaRegistry())
+
+    assert list(build_model(["b", "a"]).model_fields) == ["b", "a"]
+    assert list(build_model(["a", "b"]).model_fields) == ["a", "b"]
+
+
+def test_nested_object_models_are_cached_with_their_registry_names() -> None:
+    address_schema: Dict[str, Any] = ObjectProperty(
+        title="address", properties={"street": StringProperty()}
+    ).json_schema
+
+    first_registry = SchemaRegistry()
+    first_model = _build_type_from_schema("address", address_schema, first_registry)
+    second_registry = SchemaRegistry()
+    second_model = _build_type_from_schema("address", address_schema, second_registry)
+    assert first_model is second_model
+    assert first_registry.models == second_registry.models
+
+    # The same schema gets another name when its name is taken, so it is not shared
+    third_model = _build_type_from_schema("address", address_schema, second_registry)
+    assert third_model is not first_model
+    assert set(second_registry.models) == {"address", "address_2"}
+
+
+def test_pydantic_models_cache_evicts_least_recently_used_models() -> None:
+    cache = _PydanticModelsCache(max_size=2)
+    first_model = create_pydantic_model_from_properties("First", [])
+    second_model = create_pydantic_model_from_properties("Second", [])
+    cache.put("first", (first_model, []))
+    cache.put("second", (second_model, []))
+    cache.get("first")
+    cache.put("third", (first_model, []))
+    assert len(cache) == 2
+    assert cache.get("second") is None
+    assert cache.get("first") is not None
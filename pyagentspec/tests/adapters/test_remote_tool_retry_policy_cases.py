@@ -8,7 +8,7 @@ import ssl
 from collections.abc import Awaitable
 from inspect import isawaitable
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
@@ -38,6 +38,9 @@ class _DummyResponse:
     def close(self) -> None:
         pass
 
+    async def aclose(self) -> None:
+        pass
+
     def raise_for_status(self) -> None:
         if not self.is_success:
             raise httpx.HTTPStatusError(
@@ -89,9 +92,22 @@ class RemoteToolRetryPolicyCases:
     """Shared RemoteTool retry-policy behavior checks for adapter wrappers.
 
     Adapters can reuse these tests by subclassing this class and implementing
-    ``invoke_remote_tool``.
+    ``invoke_remote_tool``. Subclasses testing an async RemoteTool path set
+    ``is_async_remote_tool`` so that the async HTTP client and sleep are patched instead.
     """
 
+    is_async_remote_tool: bool = False
+
+    def _patch_request(self) -> Any:
+        if self.is_async_remote_tool:
+            return patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+        return patch("httpx.Client.request", new_callable=MagicMock)
+
+    def _patch_sleep(self) -> Any:
+        if self.is_async_remote_tool:
+            return patch("pyagentspec.adapters._tools_common.asyncio.sleep", new_callable=AsyncMock)
+        return patch("pyagentspec.adapters._tools_common.time.sleep")
+
     def invoke_remote_tool(self, remote_tool: RemoteTool) -> Any | Awaitable[Any]:
         raise NotImplementedError
 
@@ -124,7 +140,7 @@ class RemoteToolRetryPolicyCases:
         """Verify RemoteTool retry policy timeout configuration is passed only when set."""
         remote_tool = _make_remote_tool_for_retry_tests(retry_policy)
 
-        with patch("pyagentspec.adapters._tools_common.httpx.request") as mock_request:
+        with self._patch_request() as mock_request:
             mock_request.return_value = _DummyResponse({"result": "ok"})
             await self._invoke_remote_tool(remote_tool)
             _, called_kwargs = mock_request.call_args
@@ -187,7 +203,7 @@ class RemoteToolRetryPolicyCases:
         """Verify retry policy succeeds after transient transport or response failures."""
         remote_tool = _make_remote_tool_for_retry_tests(retry_policy)
 
-        with patch("pyagentspec.adapters._tools_common.httpx.request") as mock_request:
+        with self._patch_request() as mock_request:
             mock_request.side_effect = _get_retry_success_side_effects(case_name)
             assert await self._invoke_remote_tool(remote_tool) == {"result": "ok"}
             assert mock_request.call_count == expected_call_count
@@ -216,8 +232,8 @@ class RemoteToolRetryPolicyCases:
         request = httpx.Request("GET", "https://example.com/api")
 
         with (
-            patch("pyagentspec.adapters._tools_common.httpx.request") as mock_request,
-            patch("pyagentspec.adapters._tools_common.time.sleep") as mock_sleep,
+            self._patch_request() as mock_request,
+            self._patch_sleep() as mock_sleep,
         ):
             mock_request.side_effect = [
                 httpx.Response(
@@ -244,7 +260,7 @@ class RemoteToolRetryPolicyCases:
 
         request = httpx.Request("GET", "https://example.com/api")
 
-        with patch("pyagentspec.adapters._tools_common.httpx.request") as mock_request:
+        with self._patch_request() as mock_request:
             mock_request.side_effect = [
                 httpx.Response(503, request=request, json={"error": "busy"}),
                 httpx.Response(503, request=request, json={"error": "still busy"}),
@@ -270,7 +286,7 @@ class RemoteToolRetryPolicyCases:
             try:
                 raise httpx.ConnectError("TLS handshake failed") from cert_error
             except httpx.ConnectError as tls_error:
-                with patch("pyagentspec.adapters._tools_common.httpx.request") as mock_request:
+                with self._patch_request() as mock_request:
                     mock_request.side_effect = tls_error
                     with pytest.raises(httpx.ConnectError, match="TLS handshake failed"):
                         await self._invoke_remote_tool(remote_tool)
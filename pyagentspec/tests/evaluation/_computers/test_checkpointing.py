@@ -0,0 +1,181 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from pyagentspec.evaluation import Dataset, Evaluator
+from pyagentspec.evaluation.exceptions import EvaluationException
+from pyagentspec.evaluation.intermediates import Intermediate, add_intermediates
+from pyagentspec.evaluation.metrics import Metric
+
+
+class _CrashingMetric(Metric[int]):
+    """Multiply the value by a factor, and crash the evaluation on a given value."""
+
+    def __init__(self, factor: int = 2, crash_on_value: int | None = None) -> None:
+        super().__init__(name="crashing", input_mapping=None, num_retries=0, on_failure="raise")
+        self.factor = factor
+        self._crash_on_value = crash_on_value
+        self._computed_values: List[int] = []
+
+    async def compute_metric(self, value: int) -> Tuple[int, Dict[str, Any]]:
+        if value == self._crash_on_value:
+            raise RuntimeError("The evaluation crashed")
+        self._computed_values.append(value)
+        return value * self.factor, {}
+
+
+class _FailingMetric(Metric[int]):
+    """Double the value, and fail on a given value without crashing the evaluation."""
+
+    def __init__(self, fail_on_value: int | None = None) -> None:
+        super().__init__(name="failing", input_mapping=None, num_retries=0, on_failure="set_none")
+        self._fail_on_value = fail_on_value
+        self._computed_values: List[int] = []
+
+    async def compute_metric(self, value: int) -> Tuple[int, Dict[str, Any]]:
+        self._computed_values.append(value)
+        if value == self._fail_on_value:
+            raise EvaluationException("The metric failed")
+        return value * 2, {}
+
+
+class _UpperIntermediate(Intermediate[str]):
+    def __init__(self) -> None:
+        super().__init__(name="upper")
+        self._computed_texts: List[str] = []
+
+    async def compute_value(self, text: str) -> Tuple[str, Dict[str, Any]]:
+        self._computed_texts.append(text)
+        return text.upper(), {}
+
+
+@pytest.fixture()
+def dataset() -> Dataset:
+    return Dataset.from_dict([{"value": value} for value in range(1, 6)])
+
+
+@pytest.mark.anyio
+async def test_interrupted_evaluation_resumes_from_checkpoint(
+    dataset: Dataset, tmp_path: Path
+) -> None:
+    checkpoint_path = tmp_path / "checkpoint.bin"
+    with pytest.raises(Exception):
+        await Evaluator(metrics=[_CrashingMetric(crash_on_value=4)], max_concurrency=1).evaluate(
+            dataset, checkpoint_path=checkpoint_path
+        )
+
+    metric = _CrashingMetric()
+    results = await Evaluator(metrics=[metric], max_concurrency=1).evaluate(
+        dataset, checkpoint_path=checkpoint_path
+    )
+    assert metric._computed_values == [4, 5]
+    assert [results.results[(sample_id, "crashing")][0] for sample_id in range(5)] == [
+        2,
+        4,
+        6,
+        8,
+        10,
+    ]
+
+    # Every result is checkpointed, nothing is computed by a third run
+    metric = _CrashingMetric()
+    await Evaluator(metrics=[metric]).evaluate(dataset, checkpoint_path=checkpoint_path)
+    assert metric._computed_values == []
+
+
+@pytest.mark.anyio
+async def test_checkpointed_results_of_changed_metrics_are_computed_again(
+    dataset: Dataset, tmp_path: Path
+) -> None:
+    checkpoint_path = tmp_path / "checkpoint.bin"
+    await Evaluator(metrics=[_CrashingMetric()]).evaluate(dataset, checkpoint_path=checkpoint_path)
+
+    metric = _CrashingMetric(factor=3)
+    results = await Evaluator(metrics=[metric]).evaluate(dataset, checkpoint_path=checkpoint_path)
+    assert sorted(metric._computed_values) == [1, 2, 3, 4, 5]
+    assert results.results[(0, "crashing")][0] == 3
+
+
+@pytest.mark.anyio
+async def test_failed_results_are_computed_again_when_resuming(
+    dataset: Dataset, tmp_path: Path
+) -> None:
+    checkpoint_path = tmp_path / "checkpoint.bin"
+    results = await Evaluator(metrics=[_FailingMetric(fail_on_value=4)]).evaluate(
+        dataset, checkpoint_path=checkpoint_path
+    )
+    assert results.results[(3, "failing")][0] is None
+
+    metric = _FailingMetric()
+    results = await Evaluator(metrics=[metric]).evaluate(dataset, checkpoint_path=checkpoint_path)
+    assert metric._computed_values == [4]
+    assert results.results[(3, "failing")][0] == 8
+
+
+@pytest.mark.anyio
+async def test_checkpointed_results_of_other_samples_are_ignored(
+    dataset: Dataset, tmp_path: Path
+) -> None:
+    checkpoint_path = tmp_path / "checkpoint.bin"
+    await Evaluator(metrics=[_CrashingMetric()]).evaluate(dataset, checkpoint_path=checkpoint_path)
+
+    metric = _CrashingMetric()
+    results = await Evaluator(metrics=[metric]).evaluate(
+        Dataset.from_dict([{"value": value} for value in range(1, 3)]),
+        checkpoint_path=checkpoint_path,
+    )
+    assert metric._computed_values == []
+    assert results.sample_ids == [0, 1]
+    assert sorted(results.results) == [(0, "crashing"), (1, "crashing")]
+
+
+@pytest.mark.anyio
+async def test_record_truncated_by_an_interruption_is_discarded(
+    dataset: Dataset, tmp_path: Path
+) -> None:
+    checkpoint_path = tmp_path / "checkpoint.bin"
+    await Evaluator(metrics=[_CrashingMetric()], max_concurrency=1).evaluate(
+        dataset, checkpoint_path=checkpoint_path
+    )
+    checkpoint_content = checkpoint_path.read_bytes()
+    checkpoint_path.write_bytes(checkpoint_content[:-3])
+
+    metric = _CrashingMetric()
+    results = await Evaluator(metrics=[metric]).evaluate(dataset, checkpoint_path=checkpoint_path)
+    assert metric._computed_values == [5]
+    assert results.results[(4, "crashing")][0] == 10
+
+    # The new record is appended after the last complete one
+    metric = _CrashingMetric()
+    await Evaluator(metrics=[metric]).evaluate(dataset, checkpoint_path=checkpoint_path)
+    assert metric._computed_values == []
+
+
+@pytest.mark.anyio
+async def test_add_intermediates_resumes_from_checkpoint(tmp_path: Path) -> None:
+    checkpoint_path = tmp_path / "checkpoint.bin"
+    await add_intermediates(
+        Dataset.from_dict([{"text": "a"}, {"text": "b"}]),
+        [_UpperIntermediate()],
+        checkpoint_path=checkpoint_path,
+    )
+
+    intermediate = _UpperIntermediate()
+    augmented = await add_intermediates(
+        Dataset.from_dict([{"text": "a"}, {"text": "b"}, {"text": "c"}]),
+        [intermediate],
+        checkpoint_path=checkpoint_path,
+    )
+    assert intermediate._computed_texts == ["c"]
+    assert [(await augmented.get_sample(sample_id))["upper"] for sample_id in range(3)] == [
+        "A",
+        "B",
+        "C",
+    ]
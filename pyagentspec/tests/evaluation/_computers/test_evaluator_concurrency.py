@@ -7,12 +7,13 @@
 import asyncio
 import random
 from copy import deepcopy
-from typing import Any, Awaitable, Callable, Dict, List, Literal, Tuple
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Literal, Tuple
 
 import pytest
 
 from pyagentspec.evaluation import Dataset
 from pyagentspec.evaluation._computers import _AsyncCallablesComputer
+from pyagentspec.evaluation.datasets._dict_data_source import _DictDataSource
 from pyagentspec.evaluation.metrics import Metric
 
 
@@ -180,3 +181,37 @@ async def test_max_concurrency_is_respected(max_concurrency: int) -> None:
     num_runnings_sequence = await log_registry.get_num_runnings_sequence()
 
     assert all(n <= max_concurrency for n in num_runnings_sequence)
+
+
+class _CountingDataSource(_DictDataSource):
+    def __init__(self, data: List[Dict[str, Any]]) -> None:
+        super().__init__(data)
+        self.num_get_sample_calls = 0
+
+    async def get_sample(self, id: Hashable) -> Dict[str, Any]:
+        self.num_get_sample_calls += 1
+        return await super().get_sample(id)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("max_concurrency", [-1, 1, 5])
+async def test_each_sample_is_fetched_once_for_all_callables(max_concurrency: int) -> None:
+    num_samples = 50
+    data_source = _CountingDataSource([{"dummy_arg": i} for i in range(num_samples)])
+    log_registry = LogRegistry()
+    callables: Dict[str, Callable[..., Awaitable[Any]]] = {
+        f"dummy_callable_{i}": IoIntensiveMetric(log_registry, 1, 5, 1000) for i in range(4)
+    }
+    computer = _AsyncCallablesComputer(
+        dataset=Dataset(data_source),
+        callables=callables,
+        max_concurrency=max_concurrency,
+    )
+    results = await computer.run()
+    num_runnings_sequence = await log_registry.get_num_runnings_sequence()
+
+    assert data_source.num_get_sample_calls == num_samples
+    assert len(results) == 4 * num_samples
+    assert results[(7, "dummy_callable_2")][0] == -7
+    if max_concurrency != -1:
+        assert all(n <= max_concurrency for n in num_runnings_sequence)
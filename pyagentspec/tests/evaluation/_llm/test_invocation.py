@@ -0,0 +1,118 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from pyagentspec.evaluation._llm import invocation
+from pyagentspec.evaluation._llm.invocation import (
+    _get_llm_config_as_litellm_dict,
+    _OciClientConfigsCache,
+)
+from pyagentspec.llms import OciGenAiConfig
+from pyagentspec.llms.ociclientconfig import OciClientConfigWithApiKey
+
+
+class _FakeOci:
+    """Fake ``oci`` module recording the config files it reads."""
+
+    def __init__(self) -> None:
+        self.read_files: List[str] = []
+        self.config = SimpleNamespace(from_file=self.from_file)
+        self.signer = SimpleNamespace(Signer=lambda **kwargs: SimpleNamespace(**kwargs))
+
+    def from_file(self, file_location: str, profile_name: str) -> Dict[str, Any]:
+        self.read_files.append(file_location)
+        region = Path(file_location).read_text().strip()
+        return {
+            "region": region,
+            "tenancy": "tenancy",
+            "user": "user",
+            "fingerprint": "fingerprint",
+            "key_file": str(Path(file_location).parent / "key.pem"),
+        }
+
+
+@pytest.fixture
+def fake_oci(monkeypatch: pytest.MonkeyPatch) -> _FakeOci:
+    fake_oci = _FakeOci()
+    monkeypatch.setattr(invocation, "oci", fake_oci)
+    monkeypatch.setattr(invocation, "_OCI_CLIENT_CONFIGS_CACHE", _OciClientConfigsCache())
+    return fake_oci
+
+
+@pytest.fixture
+def auth_file(tmp_path: Path) -> Path:
+    auth_file = tmp_path / "config"
+    auth_file.write_text("us-chicago-1")
+    (tmp_path / "key.pem").write_text("private key")
+    return auth_file
+
+
+def _make_oci_config(auth_file: Path) -> OciGenAiConfig:
+    return OciGenAiConfig(
+        name="judge",
+        model_id="model",
+        compartment_id="compartment",
+        client_config=OciClientConfigWithApiKey(
+            name="client",
+            service_endpoint="https://endpoint",
+            auth_profile="DEFAULT",
+            auth_file_location=str(auth_file),
+        ),
+    )
+
+
+def _touch(path: Path) -> None:
+    # Some file systems have a coarse modification time, the size changes too
+    path.write_text(path.read_text() + " ")
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000_000))
+
+
+def test_oci_client_config_is_built_once(fake_oci: _FakeOci, auth_file: Path) -> None:
+    llm_config = _make_oci_config(auth_file)
+
+    first_kwargs = _get_llm_config_as_litellm_dict(llm_config)
+    assert _get_llm_config_as_litellm_dict(llm_config) == first_kwargs
+    # Equal configurations share the client configuration
+    assert _get_llm_config_as_litellm_dict(_make_oci_config(auth_file)) == first_kwargs
+    assert fake_oci.read_files == [str(auth_file)]
+    assert first_kwargs["oci_region"] == "us-chicago-1"
+
+
+@pytest.mark.parametrize("changed_file_name", ["config", "key.pem"])
+def test_oci_client_config_is_rebuilt_when_its_files_change(
+    fake_oci: _FakeOci, auth_file: Path, changed_file_name: str
+) -> None:
+    llm_config = _make_oci_config(auth_file)
+    first_kwargs = _get_llm_config_as_litellm_dict(llm_config)
+
+    _touch(auth_file.parent / changed_file_name)
+    second_kwargs = _get_llm_config_as_litellm_dict(llm_config)
+
+    assert len(fake_oci.read_files) == 2
+    assert second_kwargs["oci_signer"] is not first_kwargs["oci_signer"]
+    _get_llm_config_as_litellm_dict(llm_config)
+    assert len(fake_oci.read_files) == 2
+
+
+def test_modified_oci_config_is_not_served_from_the_cache(
+    fake_oci: _FakeOci, auth_file: Path, tmp_path: Path
+) -> None:
+    llm_config = _make_oci_config(auth_file)
+    _get_llm_config_as_litellm_dict(llm_config)
+
+    other_auth_file = tmp_path / "other" / "config"
+    other_auth_file.parent.mkdir()
+    other_auth_file.write_text("eu-frankfurt-1")
+    (other_auth_file.parent / "key.pem").write_text("other private key")
+    llm_config.client_config.auth_file_location = str(other_auth_file)  # type: ignore[attr-defined]
+
+    assert _get_llm_config_as_litellm_dict(llm_config)["oci_region"] == "eu-frankfurt-1"
@@ -0,0 +1,157 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+from typing import Any, Dict, List
+
+import anyio
+import pytest
+
+from pyagentspec.evaluation._llm import invocation
+from pyagentspec.evaluation._llm.invocation import (
+    _RequestCoalescer,
+    _use_request_coalescing,
+    complete_conversation,
+)
+from pyagentspec.evaluation.aggregators.implementations import MeanAggregator
+from pyagentspec.evaluation.exceptions import EvaluationException
+from pyagentspec.evaluation.metrics.metrics import Metric
+from pyagentspec.evaluation.metrics.wrappers import RepeatMetric
+from pyagentspec.llms import OpenAiConfig
+
+
+class _FakeProvider:
+    """Count the requests sent to the LLM provider."""
+
+    def __init__(self) -> None:
+        self.sent_messages: List[List[Dict[str, str]]] = []
+        self.error: Exception | None = None
+
+    async def send_request(self, messages: List[Dict[str, str]], llm_config: Any) -> Dict[str, Any]:
+        self.sent_messages.append(messages)
+        request_number = len(self.sent_messages)
+        await anyio.sleep(0.01)
+        if self.error is not None:
+            raise self.error
+        return {"choices": [{"message": {"content": f"response {request_number}"}}]}
+
+
+@pytest.fixture
+def provider(monkeypatch: pytest.MonkeyPatch) -> _FakeProvider:
+    provider = _FakeProvider()
+    monkeypatch.setattr(invocation, "_send_request", provider.send_request)
+    monkeypatch.setattr(invocation, "_REQUEST_COALESCER", _RequestCoalescer())
+    return provider
+
+
+@pytest.fixture
+def llm_config() -> OpenAiConfig:
+    return OpenAiConfig(name="judge", model_id="gpt-test")
+
+
+@pytest.mark.anyio
+async def test_identical_requests_in_flight_share_one_response(
+    provider: _FakeProvider, llm_config: OpenAiConfig
+) -> None:
+    responses: List[Dict[str, Any]] = []
+
+    async def complete() -> None:
+        responses.append(await complete_conversation("Is it correct?", llm_config))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(5):
+            tg.start_soon(complete)
+
+    assert len(provider.sent_messages) == 1
+    assert all(response == responses[0] for response in responses)
+    # Every caller receives its own copy of the response
+    assert len({id(response) for response in responses}) == 5
+
+
+@pytest.mark.anyio
+async def test_completed_requests_are_only_reused_when_opted_in(
+    provider: _FakeProvider, llm_config: OpenAiConfig
+) -> None:
+    first_response = await complete_conversation("Is it correct?", llm_config)
+    await complete_conversation("Is it correct?", llm_config)
+    assert len(provider.sent_messages) == 2
+
+    with _use_request_coalescing("reuse_completed"):
+        first_response = await complete_conversation("Is it correct?", llm_config)
+        # The id of the configuration does not change the request
+        other_llm_config = OpenAiConfig(name="judge", model_id="gpt-test")
+        assert await complete_conversation("Is it correct?", other_llm_config) == first_response
+        assert len(provider.sent_messages) == 3
+
+        await complete_conversation("Is it wrong?", llm_config)
+        await complete_conversation(
+            "Is it correct?", OpenAiConfig(name="judge", model_id="gpt-other")
+        )
+        await complete_conversation("Is it correct?", llm_config, coalescing="disabled")
+        assert len(provider.sent_messages) == 6
+
+
+@pytest.mark.anyio
+async def test_failed_requests_are_not_reused(
+    provider: _FakeProvider, llm_config: OpenAiConfig
+) -> None:
+    provider.error = RuntimeError("The provider is down")
+    with pytest.raises(RuntimeError, match="The provider is down"):
+        await complete_conversation("Is it correct?", llm_config)
+
+    provider.error = None
+    await complete_conversation("Is it correct?", llm_config)
+    assert len(provider.sent_messages) == 2
+
+
+class _JudgeMetric(Metric[int]):
+    """Return the number of the response of the fake provider."""
+
+    def __init__(self, llm_config: OpenAiConfig) -> None:
+        super().__init__(name="judge", input_mapping=None, num_retries=0, on_failure="raise")
+        self.llm_config = llm_config
+
+    async def compute_metric(self, question: str) -> Any:
+        response = await complete_conversation(question, self.llm_config)
+        return int(response["choices"][0]["message"]["content"].split()[-1]), {}
+
+
+@pytest.mark.anyio
+async def test_repeat_metric_sends_independent_requests(
+    provider: _FakeProvider, llm_config: OpenAiConfig
+) -> None:
+    repeat_metric = RepeatMetric(
+        metric=_JudgeMetric(llm_config), aggregator=MeanAggregator(), num_repeats=3
+    )
+
+    _, details = await repeat_metric(question="Is it correct?")
+
+    assert sorted(value for value, _ in details["results"]) == [1, 2, 3]
+    assert len(provider.sent_messages) == 3
+
+
+class _FailingJudgeMetric(_JudgeMetric):
+    """Fail until the fake provider returns its second response."""
+
+    async def compute_metric(self, question: str) -> Any:
+        value, details = await super().compute_metric(question)
+        if value < 2:
+            raise EvaluationException(f"Cannot parse response {value}")
+        return value, details
+
+
+@pytest.mark.anyio
+async def test_metric_retries_send_their_requests_again(
+    provider: _FakeProvider, llm_config: OpenAiConfig
+) -> None:
+    metric = _FailingJudgeMetric(llm_config)
+    metric.num_retries = 1
+
+    with _use_request_coalescing("reuse_completed"):
+        value, details = await metric(question="Is it correct?")
+
+    assert value == 2
+    assert len(details["__failed_attempts"]) == 1
+    assert len(provider.sent_messages) == 2
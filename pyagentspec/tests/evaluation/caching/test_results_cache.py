@@ -0,0 +1,152 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+"""Tests covering the caching of metric and intermediate results."""
+
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pytest
+
+from pyagentspec.evaluation import Dataset, Evaluator
+from pyagentspec.evaluation.caching import SqliteResultsCache
+from pyagentspec.evaluation.intermediates import Intermediate, add_intermediates
+from pyagentspec.evaluation.metrics import Metric
+from pyagentspec.llms import OpenAiCompatibleConfig
+
+from ..metrics.test_failing_metrics import _FailingMetric
+
+
+class _CountingMetric(Metric[int]):
+    """Multiply the value by a factor and record every computation."""
+
+    def __init__(self, factor: int = 2, input_mapping: Dict[str, str] | None = None) -> None:
+        super().__init__(
+            name="counting", input_mapping=input_mapping, num_retries=0, on_failure="raise"
+        )
+        self.factor = factor
+        self._computed_values: List[int] = []
+
+    async def compute_metric(self, value: int) -> Tuple[int, Dict[str, Any]]:
+        self._computed_values.append(value)
+        return value * self.factor, {"factor": self.factor}
+
+
+class _LengthIntermediate(Intermediate[int]):
+    """Return the length of the text and record every computation."""
+
+    def __init__(self) -> None:
+        super().__init__(name="length")
+        self._computed_texts: List[str] = []
+
+    async def compute_value(self, text: str) -> Tuple[int, Dict[str, Any]]:
+        self._computed_texts.append(text)
+        return len(text), {}
+
+
+@pytest.fixture()
+def cache(tmp_path: Path) -> Iterator[SqliteResultsCache]:
+    with SqliteResultsCache(tmp_path / "results.sqlite") as cache:
+        yield cache
+
+
+@pytest.mark.anyio
+async def test_rerunning_evaluation_only_computes_missing_results(
+    cache: SqliteResultsCache,
+) -> None:
+    metric = _CountingMetric()
+    first_results = await Evaluator(metrics=[metric], cache=cache).evaluate(
+        Dataset.from_dict([{"value": 1}, {"value": 2}])
+    )
+    assert sorted(metric._computed_values) == [1, 2]
+    assert len(cache) == 2
+
+    metric._computed_values.clear()
+    second_results = await Evaluator(metrics=[metric], cache=cache).evaluate(
+        Dataset.from_dict([{"value": 1}, {"value": 2}, {"value": 3}])
+    )
+    assert metric._computed_values == [3]
+    assert second_results.to_dict()[0] == first_results.to_dict()[0]
+    assert second_results.to_dict()[2]["counting"]["value"] == 6
+
+
+@pytest.mark.anyio
+async def test_cached_results_are_reused_across_processes(tmp_path: Path) -> None:
+    dataset = Dataset.from_dict([{"value": 1}])
+    with SqliteResultsCache(tmp_path / "results.sqlite") as cache:
+        await Evaluator(metrics=[_CountingMetric()], cache=cache).evaluate(dataset)
+
+    # A metric created from scratch with the same configuration finds the results
+    metric = _CountingMetric()
+    with SqliteResultsCache(tmp_path / "results.sqlite") as cache:
+        results = await Evaluator(metrics=[metric], cache=cache).evaluate(dataset)
+    assert metric._computed_values == []
+    assert results.to_dict()[0]["counting"]["value"] == 2
+
+
+@pytest.mark.anyio
+async def test_unused_features_and_input_mapping_do_not_invalidate_results(
+    cache: SqliteResultsCache,
+) -> None:
+    await Evaluator(metrics=[_CountingMetric()], cache=cache).evaluate(
+        Dataset.from_dict([{"value": 1}])
+    )
+
+    metric = _CountingMetric()
+    await Evaluator(metrics=[metric], cache=cache).evaluate(
+        Dataset.from_dict([{"value": 1, "unused": "feature"}])
+    )
+    assert metric._computed_values == []
+
+
+@pytest.mark.anyio
+async def test_metric_configuration_changes_invalidate_results(
+    cache: SqliteResultsCache,
+) -> None:
+    dataset = Dataset.from_dict([{"value": 1}])
+    await Evaluator(metrics=[_CountingMetric()], cache=cache).evaluate(dataset)
+
+    metric = _CountingMetric(factor=3)
+    results = await Evaluator(metrics=[metric], cache=cache).evaluate(dataset)
+    assert metric._computed_values == [1]
+    assert results.to_dict()[0]["counting"]["value"] == 3
+
+
+def test_llm_configs_differing_only_by_id_share_the_same_fingerprint() -> None:
+    from pyagentspec.evaluation.caching._fingerprint import _get_callable_fingerprint
+    from pyagentspec.evaluation.metrics.implementations import ExactBinaryMatchMetric
+
+    def create_llm_config(model_id: str) -> OpenAiCompatibleConfig:
+        return OpenAiCompatibleConfig(name="judge", model_id=model_id, url="http://judge")
+
+    fingerprint = _get_callable_fingerprint(create_llm_config("model"))
+    assert _get_callable_fingerprint(create_llm_config("model")) == fingerprint
+    assert _get_callable_fingerprint(create_llm_config("other_model")) != fingerprint
+    assert _get_callable_fingerprint(ExactBinaryMatchMetric()) != fingerprint
+
+
+@pytest.mark.anyio
+async def test_failed_results_are_not_cached(cache: SqliteResultsCache) -> None:
+    dataset = Dataset.from_dict([{"value": 1}])
+    metric = _FailingMetric(num_retries=0, on_failure="set_none")
+    results = await Evaluator(metrics=[metric], cache=cache).evaluate(dataset)
+    assert results.results[(0, "failing")][0] is None
+    assert len(cache) == 0
+
+
+@pytest.mark.anyio
+async def test_add_intermediates_reuses_cached_results(cache: SqliteResultsCache) -> None:
+    dataset = Dataset.from_dict([{"text": "abc"}, {"text": "de"}])
+    await add_intermediates(dataset, [_LengthIntermediate()], cache=cache)
+
+    intermediate = _LengthIntermediate()
+    augmented = await add_intermediates(dataset, [intermediate], cache=cache)
+    assert intermediate._computed_texts == []
+    assert await augmented.get_sample(0) == {"text": "abc", "length": 3}
+
+    cache.clear(name="length")
+    await add_intermediates(dataset, [intermediate], cache=cache)
+    assert sorted(intermediate._computed_texts) == ["abc", "de"]
@@ -19,6 +19,10 @@ def pytest_configure(config: Any) -> None:
         "markers",
         "requires_litellm: marks tests that require the optional litellm dependency",
     )
+    config.addinivalue_line(
+        "markers",
+        "requires_pyarrow: marks tests that require the optional pyarrow dependency",
+    )
 
 
 def _has_evaluation_required_modules() -> bool:
@@ -35,10 +39,10 @@ def pytest_collection_modifyitems(config: Any, items: List[pytest.Item]) -> None
                 item.add_marker(skip_evaluation)
         return
 
-    if importlib.util.find_spec("litellm") is not None:
-        return
-
-    skip_litellm = pytest.mark.skip(reason="`litellm` is not installed")
-    for item in items:
-        if "requires_litellm" in item.keywords:
-            item.add_marker(skip_litellm)
+    for optional_module in ("litellm", "pyarrow"):
+        if importlib.util.find_spec(optional_module) is not None:
+            continue
+        skip_optional_module = pytest.mark.skip(reason=f"`{optional_module}` is not installed")
+        for item in items:
+            if f"requires_{optional_module}" in item.keywords:
+                item.add_marker(skip_optional_module)
@@ -4,6 +4,9 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+import csv
+import json
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -32,7 +35,44 @@ def dict_dataset(data) -> Dataset:
     return Dataset.from_dict(data)
 
 
-@pytest.mark.parametrize("dataset_name", ("df_dataset", "dict_dataset"))
+@pytest.fixture()
+def jsonl_dataset(data, tmp_path: Path) -> Dataset:
+    path = tmp_path / "data.jsonl"
+    path.write_text("".join(json.dumps(sample) + "\n" for sample in data), encoding="utf-8")
+    return Dataset.from_jsonl(path)
+
+
+@pytest.fixture()
+def csv_dataset(data, tmp_path: Path) -> Dataset:
+    path = tmp_path / "data.csv"
+    with open(path, "w", encoding="utf-8", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=["reference", "response"])
+        writer.writeheader()
+        writer.writerows(data)
+    return Dataset.from_csv(path)
+
+
+@pytest.fixture()
+def parquet_dataset(data, tmp_path: Path) -> Dataset:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = tmp_path / "data.parquet"
+    # Several row groups, so that samples are read across them
+    pq.write_table(pa.Table.from_pylist(data), path, row_group_size=2)
+    return Dataset.from_parquet(path)
+
+
+@pytest.mark.parametrize(
+    "dataset_name",
+    (
+        "df_dataset",
+        "dict_dataset",
+        "jsonl_dataset",
+        "csv_dataset",
+        pytest.param("parquet_dataset", marks=pytest.mark.requires_pyarrow),
+    ),
+)
 @pytest.mark.anyio
 async def test_df_loader(
     dataset_name: str, data: list[dict[str, Any]], request: pytest.FixtureRequest
@@ -44,3 +84,53 @@ async def test_df_loader(
     assert [_i async for _i in dataset.ids()] == [0, 1, 2]
     async for _i in dataset.ids():
         assert await dataset.get_sample(_i) == data[_i]
+
+
+@pytest.mark.anyio
+async def test_csv_loader_reads_quoted_line_breaks_and_skips_blank_rows(tmp_path: Path) -> None:
+    path = tmp_path / "data.csv"
+    path.write_bytes(b'question,answer\r\n"Two\r\nlines","Say ""hi"""\r\n\r\nlast,"a,b"\r\n\r\n')
+    dataset = Dataset.from_csv(path)
+
+    assert len(dataset) == 2
+    assert list(dataset.features()) == ["question", "answer"]
+    assert await dataset.get_sample(0) == {"question": "Two\r\nlines", "answer": 'Say "hi"'}
+    assert await dataset.get_sample(1) == {"question": "last", "answer": "a,b"}
+    with pytest.raises(KeyError):
+        await dataset.get_sample(2)
+
+
+@pytest.mark.anyio
+async def test_csv_loader_reads_quotes_inside_unquoted_fields(tmp_path: Path) -> None:
+    path = tmp_path / "data.csv"
+    path.write_bytes(b'name,size\na,5" screen\nb,ok\nc,"multi\nline"\n')
+    dataset = Dataset.from_csv(path)
+
+    assert len(dataset) == 3
+    assert await dataset.get_sample(0) == {"name": "a", "size": '5" screen'}
+    assert await dataset.get_sample(1) == {"name": "b", "size": "ok"}
+    assert await dataset.get_sample(2) == {"name": "c", "size": "multi\nline"}
+
+
+@pytest.mark.anyio
+async def test_jsonl_loader_rejects_samples_missing_features(tmp_path: Path) -> None:
+    path = tmp_path / "data.jsonl"
+    path.write_text('{"a": 1, "b": 2}\n\n{"a": 3}\n', encoding="utf-8")
+    dataset = Dataset.from_jsonl(path)
+
+    assert len(dataset) == 2
+    assert await dataset.get_sample(0) == {"a": 1, "b": 2}
+    with pytest.raises(ValueError, match="miss some of the reference keys"):
+        await dataset.get_sample(1)
+
+
+def test_file_loaders_reject_empty_files(tmp_path: Path) -> None:
+    jsonl_path = tmp_path / "data.jsonl"
+    jsonl_path.write_text("\n", encoding="utf-8")
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("reference,response\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="contains no samples"):
+        Dataset.from_jsonl(jsonl_path)
+    with pytest.raises(ValueError, match="contains no samples"):
+        Dataset.from_csv(csv_path)
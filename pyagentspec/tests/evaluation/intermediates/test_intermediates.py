@@ -96,3 +96,19 @@ async def test_intermediate_call_argument_binding(dataset: Dataset) -> None:
 
     sample = await augmented.get_sample(0)
     assert sample["kw_only"] == 11
+
+
+@pytest.mark.anyio
+async def test_add_intermediates_reads_samples_from_the_source_dataset(tmp_path) -> None:
+    path = tmp_path / "data.jsonl"
+    path.write_text('{"idx": 0, "value": 1}\n{"idx": 1, "value": 2}\n', encoding="utf-8")
+    dataset = Dataset.from_jsonl(path)
+
+    augmented = await add_intermediates(dataset, [_EchoIntermediate()])
+
+    assert len(augmented) == 2
+    assert list(augmented.features()) == ["idx", "value", "echo"]
+    assert [sample_id async for sample_id in augmented.ids()] == [0, 1]
+    # The samples are read from the file when they are fetched, not copied by add_intermediates
+    path.write_text('{"idx": 0, "value": 1, "extra": "x"}\n', encoding="utf-8")
+    assert await augmented.get_sample(0) == {"idx": 0, "value": 1, "extra": "x", "echo": 1}
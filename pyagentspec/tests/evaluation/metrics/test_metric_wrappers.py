@@ -6,8 +6,10 @@
 
 from typing import Any, Dict, Tuple
 
+import anyio
 import pytest
 
+from pyagentspec.evaluation import Dataset, Evaluator
 from pyagentspec.evaluation.aggregators.implementations import MeanAggregator
 from pyagentspec.evaluation.intermediates import Intermediate
 from pyagentspec.evaluation.metrics.metrics import Metric
@@ -66,6 +68,32 @@ class _SumMetric(Metric[int]):
         return value + derived, {"metric": True}
 
 
+class _ConcurrencyTracker:
+    """Track the number of computations running at the same time."""
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.max_running = 0
+
+    async def run(self) -> None:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await anyio.sleep(0.01)
+        self.running -= 1
+
+
+class _SlowMetric(Metric[int]):
+    """Metric sleeping while it is tracked by a shared concurrency tracker."""
+
+    def __init__(self, name: str, tracker: _ConcurrencyTracker) -> None:
+        super().__init__(name=name, input_mapping=None, num_retries=0, on_failure="raise")
+        self._tracker = tracker
+
+    async def compute_metric(self, value: int) -> Tuple[int, Dict[str, Any]]:
+        await self._tracker.run()
+        return value, {}
+
+
 @pytest.fixture
 def aggregator() -> MeanAggregator:
     return MeanAggregator()
@@ -189,3 +217,70 @@ def test_with_intermediates_metric_requires_unique_names(sum_metric, derived_int
             num_retries=0,
             on_failure="raise",
         )
+
+
+@pytest.mark.anyio
+async def test_repeat_metric_computes_repetitions_concurrently(aggregator) -> None:
+    tracker = _ConcurrencyTracker()
+    repeat_metric = RepeatMetric(
+        metric=_SlowMetric("slow", tracker), aggregator=aggregator, num_repeats=4
+    )
+
+    value, details = await repeat_metric(value=2)
+
+    assert value == 2
+    assert len(details["results"]) == 4
+    assert tracker.max_running == 4
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("max_concurrency", [1, 3])
+async def test_wrapped_metrics_run_within_the_concurrency_of_the_evaluator(
+    aggregator, max_concurrency
+) -> None:
+    tracker = _ConcurrencyTracker()
+    ensemble = EnsembleMetric(
+        name="ensemble",
+        metrics=[
+            RepeatMetric(
+                metric=_SlowMetric(f"slow_{i}", tracker), aggregator=aggregator, num_repeats=3
+            )
+            for i in range(3)
+        ],
+        aggregator=aggregator,
+    )
+    dataset = Dataset.from_dict([{"value": value} for value in range(4)])
+
+    results = await Evaluator(metrics=[ensemble], max_concurrency=max_concurrency).evaluate(dataset)
+
+    assert [results.results[(sample_id, "ensemble")][0] for sample_id in range(4)] == [0, 1, 2, 3]
+    assert tracker.max_running == max_concurrency
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("share_intermediates", [True, False])
+async def test_with_intermediates_metrics_share_intermediates_values(
+    derived_intermediate, share_intermediates
+) -> None:
+    wrappers = [
+        WithIntermediatesMetric(
+            intermediates=[derived_intermediate],
+            metric=_SumMetric(),
+            input_mapping=None,
+            num_retries=0,
+            on_failure="raise",
+            name=f"sum_{i}",
+            share_intermediates=share_intermediates,
+        )
+        for i in range(3)
+    ]
+    dataset = Dataset.from_dict([{"value": value} for value in range(4)])
+
+    results = await Evaluator(metrics=wrappers).evaluate(dataset)
+
+    assert all(
+        results.results[(sample_id, f"sum_{i}")][0] == sample_id + sample_id**2
+        for sample_id in range(4)
+        for i in range(3)
+    )
+    assert derived_intermediate.calls == (4 if share_intermediates else 12)
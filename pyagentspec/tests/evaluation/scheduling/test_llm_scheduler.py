@@ -0,0 +1,176 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import time
+from typing import Any, Dict, List
+
+import anyio
+import pytest
+
+from pyagentspec.evaluation import Dataset, Evaluator
+from pyagentspec.evaluation.exceptions import RateLimitException
+from pyagentspec.evaluation.metrics import LlmAsAJudgeMetric
+from pyagentspec.evaluation.scheduling import LlmRateLimits, LlmScheduler
+from pyagentspec.evaluation.scheduling.llm_scheduler import _TokenBucket
+from pyagentspec.llms import OpenAiCompatibleConfig
+from pyagentspec.retrypolicy import RetryPolicy
+
+from ..metrics.test_failing_metrics import _FailingMetric
+
+
+class _RateLimitError(Exception):
+    status_code = 429
+
+
+class _FakeEndpoint:
+    """Complete conversations, rejecting the requests above a number of concurrent requests."""
+
+    def __init__(self, max_running_requests: int) -> None:
+        self.max_running_requests = max_running_requests
+        self.running_requests = 0
+        self.num_rejected_requests = 0
+        self.num_sent_requests = 0
+
+    async def complete_conversation(self, conversation: List[Dict[str, str]]) -> Dict[str, Any]:
+        self.num_sent_requests += 1
+        if self.running_requests >= self.max_running_requests:
+            self.num_rejected_requests += 1
+            raise _RateLimitError("Too many requests")
+        self.running_requests += 1
+        try:
+            await anyio.sleep(0.01)
+        finally:
+            self.running_requests -= 1
+        return {
+            "choices": [{"message": {"content": "<result>1</result>"}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 990},
+        }
+
+
+def _create_judge_metric(endpoint: _FakeEndpoint, num_retries: int = 0) -> LlmAsAJudgeMetric:
+    llm_config = OpenAiCompatibleConfig(
+        name="judge",
+        model_id="judge",
+        url="http://judge",
+        retry_policy=RetryPolicy(initial_retry_delay=0, max_retry_delay=0),
+    )
+    metric: LlmAsAJudgeMetric = LlmAsAJudgeMetric(
+        name="judge",
+        input_mapping=None,
+        num_retries=num_retries,
+        on_failure="raise",
+        llm_config=llm_config,
+        system_prompt="You judge stuff.",
+        user_prompt_template="Score: {{ score }}",
+        value_pattern=r"<result>(.*?)</result>",
+    )
+    metric._complete_conversation = endpoint.complete_conversation  # type: ignore[method-assign]
+    return metric
+
+
+@pytest.mark.anyio
+async def test_rate_limit_errors_are_raised_as_retryable_exceptions() -> None:
+    metric = _create_judge_metric(_FakeEndpoint(max_running_requests=0))
+    with pytest.raises(RateLimitException):
+        await metric.ask_llm([{"role": "user", "content": "Score: 1"}])
+
+
+@pytest.mark.anyio
+async def test_scheduler_adapts_concurrency_to_rate_limit_errors() -> None:
+    endpoint = _FakeEndpoint(max_running_requests=2)
+    metric = _create_judge_metric(endpoint, num_retries=20)
+    scheduler = LlmScheduler()
+
+    results = await Evaluator(metrics=[metric], scheduler=scheduler).evaluate(
+        Dataset.from_dict([{"score": str(score)} for score in range(20)])
+    )
+    assert all(results.results[(sample_id, "judge")][0] == "1" for sample_id in range(20))
+    assert endpoint.num_rejected_requests > 0
+    # The concurrency was unbounded until the first rate limit error
+    (limiter,) = scheduler._limiters.values()
+    assert limiter.concurrency_limiter.concurrency < 20
+
+
+@pytest.mark.anyio
+async def test_scheduler_enforces_requests_per_minute_limit() -> None:
+    endpoint = _FakeEndpoint(max_running_requests=100)
+    metric = _create_judge_metric(endpoint)
+    scheduler = LlmScheduler(
+        rate_limits={metric.llm_config.id: LlmRateLimits(requests_per_minute=600)}
+    )
+    # Empty the budget, requests are then sent at 10 requests per second
+    requests_bucket = scheduler._get_limiter(metric.llm_config).requests_bucket
+    assert requests_bucket is not None
+    await requests_bucket.acquire(600)
+
+    start_time = time.monotonic()
+    await Evaluator(metrics=[metric], scheduler=scheduler).evaluate(
+        Dataset.from_dict([{"score": "1"}, {"score": "2"}, {"score": "3"}])
+    )
+    assert time.monotonic() - start_time >= 0.25
+
+
+@pytest.mark.anyio
+async def test_token_budget_is_corrected_with_reported_token_usage() -> None:
+    endpoint = _FakeEndpoint(max_running_requests=100)
+    metric = _create_judge_metric(endpoint)
+    scheduler = LlmScheduler(default_rate_limits=LlmRateLimits(tokens_per_minute=60_000))
+
+    await Evaluator(metrics=[metric], scheduler=scheduler).evaluate(
+        Dataset.from_dict([{"score": "1"}])
+    )
+    limiter = scheduler._get_limiter(metric.llm_config)
+    assert limiter.tokens_bucket is not None
+    # The fake endpoint reports 1000 tokens per request
+    assert 59_000 <= limiter.tokens_bucket.available < 59_100
+    assert limiter.average_completion_tokens == 990
+
+
+@pytest.mark.anyio
+async def test_coalesced_requests_are_not_scheduled() -> None:
+    endpoint = _FakeEndpoint(max_running_requests=100)
+    metric = _create_judge_metric(endpoint)
+    scheduler = LlmScheduler(default_rate_limits=LlmRateLimits(requests_per_minute=600))
+
+    # Identical samples render identical requests, which are in flight at the same time
+    await Evaluator(metrics=[metric], scheduler=scheduler).evaluate(
+        Dataset.from_dict([{"score": "1"}] * 3)
+    )
+    assert endpoint.num_sent_requests == 1
+    requests_bucket = scheduler._get_limiter(metric.llm_config).requests_bucket
+    assert requests_bucket is not None
+    assert 599 <= requests_bucket.available < 600
+
+
+@pytest.mark.anyio
+async def test_token_bucket_waits_for_refill() -> None:
+    bucket = _TokenBucket(amount_per_minute=600)
+    await bucket.acquire(600)
+    start_time = time.monotonic()
+    await bucket.acquire(2)
+    assert time.monotonic() - start_time >= 0.15
+
+
+@pytest.mark.anyio
+async def test_metric_retries_are_delayed_with_exponential_backoff() -> None:
+    metric = _FailingMetric(num_retries=2, on_failure="set_none")
+    metric.retry_policy = RetryPolicy(initial_retry_delay=0.05, max_retry_delay=1, jitter=None)
+    start_time = time.monotonic()
+    value, details = await metric(value=1)
+    assert value is None
+    assert len(details["__failed_attempts"]) == 3
+    # Delays of 0.05 and 0.1 seconds between the three attempts
+    assert time.monotonic() - start_time >= 0.15
+
+
+@pytest.mark.anyio
+async def test_metric_retries_without_retry_policy_are_immediate() -> None:
+    metric = _FailingMetric(num_retries=3, on_failure="set_none")
+    start_time = time.monotonic()
+    value, details = await metric(value=1)
+    assert value is None
+    assert len(details["__failed_attempts"]) == 4
+    assert time.monotonic() - start_time < 0.5
@@ -0,0 +1,191 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+"""Tests covering the columnar storage, exports and merges of evaluation results."""
+
+from pathlib import Path
+from typing import Any, Dict, Hashable, Tuple
+
+import numpy as np
+import pytest
+
+from pyagentspec.evaluation import EvaluationResults
+
+
+@pytest.fixture()
+def results() -> Dict[Tuple[Hashable, str], Tuple[Any, Dict[Hashable, Any]]]:
+    return {
+        **{
+            (sample_id, "score"): (sample_id / 2, {"justification": f"sample {sample_id}"})
+            for sample_id in range(3)
+        },
+        **{(sample_id, "match"): (sample_id % 2 == 0, {}) for sample_id in range(3)},
+        (0, "label"): ("good", {"__failed_attempts": [ValueError("retried")]}),
+        (1, "label"): (None, {}),
+        (2, "label"): ({"nested": [1, 2]}, {(1, 2): "tuple key"}),
+    }
+
+
+@pytest.fixture()
+def evaluation_results(results: Dict[Any, Any]) -> EvaluationResults:
+    return EvaluationResults(
+        results, sample_ids=[0, 1, 2], metric_names=["score", "match", "label"]
+    )
+
+
+def test_results_are_stored_by_columns(
+    evaluation_results: EvaluationResults, results: Dict[Any, Any]
+) -> None:
+    assert evaluation_results.get_values("score").dtype == np.float64
+    assert evaluation_results.get_values("match").dtype == bool
+    assert evaluation_results.get_values("label").dtype == object
+    assert evaluation_results.get_details("score")[1] == {"justification": "sample 1"}
+
+    assert dict(evaluation_results.results) == results
+    assert type(evaluation_results.results[(0, "match")][0]) is bool
+    with pytest.raises(KeyError):
+        evaluation_results.results[(3, "score")]
+
+
+def test_values_of_mixed_kinds_are_kept_exactly() -> None:
+    evaluation_results = EvaluationResults(
+        {("a", "m"): (1, {}), ("b", "m"): (0.5, {}), ("c", "m"): (2**62 + 1, {})},
+        sample_ids=["a", "b", "c"],
+    )
+
+    assert evaluation_results.get_values("m").dtype == object
+    assert type(evaluation_results.results[("a", "m")][0]) is int
+    assert evaluation_results.to_dict()["a"]["m"]["value"] == 1
+    assert evaluation_results.results[("c", "m")][0] == 2**62 + 1
+
+    large_integers = EvaluationResults({("a", "m"): (2**62 + 1, {}), ("b", "m"): (2**64, {})})
+    assert sorted(value for value, _ in large_integers.results.values()) == [2**62 + 1, 2**64]
+
+
+def test_results_of_other_samples_or_metrics_are_kept_but_not_exported(
+    results: Dict[Any, Any],
+) -> None:
+    evaluation_results = EvaluationResults(results, sample_ids=[0, 1], metric_names=["score"])
+
+    assert dict(evaluation_results.results) == results
+    assert set(evaluation_results.to_dict()) == {0, 1}
+    assert list(evaluation_results.to_df().columns) == ["score"]
+
+    evaluation_results.sample_ids = [0, 1, 2]
+    assert evaluation_results.get_values("score").tolist() == [0.0, 0.5, 1.0]
+    assert dict(evaluation_results.results) == results
+
+
+def test_results_can_be_updated(
+    evaluation_results: EvaluationResults, results: Dict[Any, Any]
+) -> None:
+    evaluation_results.results[(0, "score")] = (1.0, {"justification": "updated"})
+    assert evaluation_results.get_values("score").dtype == np.float64
+    assert evaluation_results.results[(0, "score")] == (1.0, {"justification": "updated"})
+
+    evaluation_results.results[(1, "match")] = (2, {})
+    assert evaluation_results.get_values("match").tolist() == [True, 2, True]
+    assert type(evaluation_results.results[(0, "match")][0]) is bool
+
+    evaluation_results.results[(3, "score")] = (0.25, {})
+    assert evaluation_results.results[(3, "score")] == (0.25, {})
+    assert 3 not in evaluation_results.to_dict()
+
+    del evaluation_results.results[(2, "score")]
+    assert (2, "score") not in evaluation_results.results
+    with pytest.raises(KeyError):
+        evaluation_results.to_df()
+
+    evaluation_results.results = results
+    assert dict(evaluation_results.results) == results
+    assert evaluation_results.to_df()["score"].tolist() == [0.0, 0.5, 1.0]
+
+
+def test_missing_results_are_not_exported(results: Dict[Any, Any]) -> None:
+    del results[(1, "score")]
+    evaluation_results = EvaluationResults(results, sample_ids=[0, 1, 2])
+
+    assert (1, "score") not in evaluation_results.results
+    assert len(evaluation_results.results) == len(results)
+    assert evaluation_results.get_details("score")[1] is None
+    with pytest.raises(KeyError):
+        evaluation_results.to_df()
+
+
+def test_merge_combines_shards_of_samples_and_metrics(
+    evaluation_results: EvaluationResults, results: Dict[Any, Any]
+) -> None:
+    samples_shards = [
+        EvaluationResults(
+            {
+                key: result
+                for key, result in results.items()
+                if key[0] in shard_sample_ids and key[1] != "label"
+            },
+            sample_ids=shard_sample_ids,
+            metric_names=["score", "match"],
+        )
+        for shard_sample_ids in ([2], [0, 1])
+    ]
+    metric_shard = EvaluationResults(
+        {key: result for key, result in results.items() if key[1] == "label"},
+        sample_ids=[0, 1, 2],
+        metric_names=["label"],
+    )
+
+    merged_results = EvaluationResults.merge([*samples_shards, metric_shard])
+
+    assert merged_results.sample_ids == [2, 0, 1]
+    assert merged_results.metric_names == ["score", "match", "label"]
+    assert dict(merged_results.results) == results
+    assert merged_results.get_values("score").dtype == np.float64
+
+    with pytest.raises(ValueError, match="Several results are merged"):
+        EvaluationResults.merge([evaluation_results, samples_shards[0]])
+
+
+@pytest.mark.requires_pyarrow
+@pytest.mark.parametrize("file_format", ["parquet", "feather"])
+def test_results_round_trip_through_files(
+    evaluation_results: EvaluationResults, tmp_path: Path, file_format: str
+) -> None:
+    path = tmp_path / f"results.{file_format}"
+    getattr(evaluation_results, f"to_{file_format}")(path)
+    read_results = getattr(EvaluationResults, f"read_{file_format}")(path)
+
+    assert read_results.sample_ids == [0, 1, 2]
+    assert read_results.metric_names == ["score", "match", "label"]
+    assert read_results.get_values("score").dtype == np.float64
+    assert read_results.to_df().equals(evaluation_results.to_df())
+    assert read_results.get_details("score") == evaluation_results.get_details("score")
+    # Details that are not JSON-serializable are stored as strings
+    assert read_results.get_details("label")[0] == {"__failed_attempts": ["retried"]}
+    assert read_results.results[(2, "label")][0] == {"nested": [1, 2]}
+
+
+@pytest.mark.requires_pyarrow
+def test_arrow_export_of_partial_results(results: Dict[Any, Any]) -> None:
+    del results[(1, "score")]
+    evaluation_results = EvaluationResults(results, sample_ids=[0, 1, 2])
+
+    table = evaluation_results.to_arrow(include_details=False)
+    read_results = EvaluationResults.from_arrow(table)
+
+    assert (1, "score") not in read_results.results
+    assert read_results.results[(1, "label")] == (None, {})
+    assert read_results.results[(2, "score")] == (1.0, {})
+
+
+@pytest.mark.requires_pyarrow
+def test_arrow_export_keeps_values_of_mixed_kinds() -> None:
+    evaluation_results = EvaluationResults(
+        {("a", "m"): (1, {}), ("b", "m"): (0.5, {}), ("c", "m"): (2**64, {})}
+    )
+
+    read_results = EvaluationResults.from_arrow(evaluation_results.to_arrow())
+
+    assert dict(read_results.results) == dict(evaluation_results.results)
+    assert type(read_results.results[("a", "m")][0]) is int
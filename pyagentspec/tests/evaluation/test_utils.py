@@ -0,0 +1,96 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import inspect
+from typing import Any, Callable, Dict, Tuple
+
+import pytest
+
+from pyagentspec.evaluation._utils import _ArgumentsBinder, _bind_kwargs_to_func, _map_names
+from pyagentspec.evaluation.metrics.implementations import ExactBinaryMatchMetric
+
+
+def _keyword_parameters(reference: str, response: str = "default", *, flag: bool = False) -> None:
+    pass
+
+
+def _variadic_parameters(*args: Any, **kwargs: Any) -> None:
+    pass
+
+
+def _named_and_variadic_parameters(reference: str, *args: Any, **kwargs: Any) -> None:
+    pass
+
+
+def _positional_only_parameters(reference: str, /, response: str = "default") -> None:
+    pass
+
+
+def _legacy_bind(
+    f: Callable[..., Any], input_mapping: Dict[str, str] | None, *args: Any, **kwargs: Any
+) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+    if input_mapping is not None:
+        kwargs = _map_names(kwargs, input_mapping)
+    bound_args = _bind_kwargs_to_func(f, *args, **kwargs)
+    return bound_args.args, bound_args.kwargs
+
+
+def _as_call(f: Callable[..., Any], bound: Tuple[Tuple[Any, ...], Dict[str, Any]]) -> Any:
+    """Return the arguments received by ``f`` when called with ``bound``."""
+    args, kwargs = bound
+    bound_args = inspect.signature(f).bind_partial(*args, **kwargs)
+    bound_args.apply_defaults()
+    return dict(bound_args.arguments)
+
+
+@pytest.mark.parametrize(
+    "f",
+    [
+        _keyword_parameters,
+        _variadic_parameters,
+        _named_and_variadic_parameters,
+        _positional_only_parameters,
+    ],
+)
+@pytest.mark.parametrize(
+    "input_mapping",
+    [None, {"gold": "reference"}, {"gold": "reference", "answer": "reference"}],
+)
+@pytest.mark.parametrize("args", [(), ("positional",)])
+def test_arguments_binder_binds_like_the_binding_helpers(
+    f: Callable[..., Any], input_mapping: Dict[str, str] | None, args: Tuple[Any, ...]
+) -> None:
+    kwargs = {"gold": "a", "reference": "b", "answer": "c", "flag": True, "unused": 1}
+    try:
+        expected_bound = _legacy_bind(f, input_mapping, *args, **kwargs)
+    except (RuntimeError, TypeError) as e:
+        with pytest.raises(type(e)):
+            _ArgumentsBinder(f, input_mapping).bind(*args, **kwargs)
+        return
+    bound = _ArgumentsBinder(f, input_mapping).bind(*args, **kwargs)
+    assert _as_call(f, bound) == _as_call(f, expected_bound)
+
+
+def test_arguments_binder_rejects_partially_variadic_signatures() -> None:
+    def f(reference: str, **kwargs: Any) -> None:
+        pass
+
+    with pytest.raises(RuntimeError, match="both `\\*args` and `\\*\\*kwargs`"):
+        _ArgumentsBinder(f, None).bind(reference="a")
+
+
+@pytest.mark.anyio
+async def test_metrics_follow_changes_of_their_input_mapping() -> None:
+    metric = ExactBinaryMatchMetric(reference_feature_name="gold", response_feature_name="answer")
+    assert (await metric(gold="a", answer="a", unused="b"))[0] is True
+
+    assert metric.input_mapping is not None
+    del metric.input_mapping["answer"]
+    metric.input_mapping["other_answer"] = "response"
+    assert (await metric(gold="a", answer="a", other_answer="b"))[0] is False
+
+    metric.input_mapping = None
+    assert (await metric(reference="b", response="b", answer="c"))[0] is True
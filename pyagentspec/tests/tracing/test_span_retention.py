@@ -0,0 +1,182 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import io
+import json
+import socket
+from pathlib import Path
+
+import pytest
+
+from pyagentspec.tracing.events import Event, ExceptionRaised
+from pyagentspec.tracing.retentionpolicy import SpanRetentionPolicy
+from pyagentspec.tracing.spanexporter import NdjsonSpanExporter
+from pyagentspec.tracing.spans import Span
+from pyagentspec.tracing.trace import Trace
+
+from .test_tracing import DummySpanProcessor
+
+
+def test_span_without_retention_policy_keeps_all_events() -> None:
+    with Trace():
+        with Span() as span:
+            for i in range(10):
+                span.add_event(Event(name=f"event_{i}"))
+    assert len(span.events) == 10
+    assert span.dropped_events_count == 0
+
+
+def test_span_max_events_keeps_most_recent_events() -> None:
+    span = Span(retention_policy=SpanRetentionPolicy(max_events=3))
+    with Trace():
+        with span:
+            for i in range(10):
+                span.add_event(Event(name="chunk", metadata={"index": i}))
+    assert [event.metadata["index"] for event in span.events] == [7, 8, 9]
+    assert span.dropped_events_count == 7
+    assert span.event_counts == {"chunk": 10}
+
+
+def test_span_inherits_retention_policy_from_trace() -> None:
+    policy = SpanRetentionPolicy(max_events=1)
+    with Trace(retention_policy=policy) as trace:
+        with Span() as span:
+            span.add_event(Event(name="first"))
+            span.add_event(Event(name="second"))
+        assert trace._root_span.retention_policy is policy
+    assert span.retention_policy is policy
+    assert [event.name for event in span.events] == ["second"]
+
+
+def test_span_own_retention_policy_has_precedence_over_trace_one() -> None:
+    with Trace(retention_policy=SpanRetentionPolicy(max_events=0)):
+        with Span(retention_policy=SpanRetentionPolicy(max_events=2)) as span:
+            for _ in range(3):
+                span.add_event(Event())
+    assert len(span.events) == 2
+
+
+def test_span_retention_policy_is_not_serialized() -> None:
+    span = Span(retention_policy=SpanRetentionPolicy(max_events=2))
+    assert "retention_policy" not in span.model_dump()
+
+
+def test_span_spills_evicted_events_to_disk(tmp_path: Path) -> None:
+    policy = SpanRetentionPolicy(max_events=2, spill_directory=tmp_path)
+    with Trace(retention_policy=policy):
+        with Span() as span:
+            for i in range(5):
+                span.add_event(Event(name="chunk", metadata={"index": i}))
+    assert span.spilled_events_path == tmp_path / f"{span.id}.jsonl"
+    spilled_events = [
+        json.loads(line) for line in span.spilled_events_path.read_text().splitlines()
+    ]
+    assert [event["metadata"]["index"] for event in spilled_events] == [0, 1, 2]
+    assert [event.metadata["index"] for event in span.events] == [3, 4]
+
+
+def test_spilled_events_are_masked_by_default(tmp_path: Path) -> None:
+    policy = SpanRetentionPolicy(max_events=0, spill_directory=tmp_path)
+    with Trace(retention_policy=policy):
+        with Span() as span:
+            span.add_event(ExceptionRaised(exception_type="ValueError", exception_message="secret"))
+    assert span.spilled_events_path is not None
+    (spilled_event,) = [
+        json.loads(line) for line in span.spilled_events_path.read_text().splitlines()
+    ]
+    assert spilled_event["exception_type"] == "ValueError"
+    assert spilled_event["exception_message"] != "secret"
+
+
+def test_span_releases_events_on_end_and_keeps_summary() -> None:
+    processor = DummySpanProcessor()
+    policy = SpanRetentionPolicy(release_events_on_end=True)
+    with Trace(span_processors=[processor], retention_policy=policy):
+        with Span() as span:
+            span.add_event(Event(name="a"))
+            span.add_event(Event(name="a"))
+            span.add_event(Event(name="b"))
+        assert span.events == []
+    assert span.event_counts == {"a": 2, "b": 1}
+    assert span.dropped_events_count == 3
+    # Processors were notified of all the events before they were released
+    assert [event.name for event, _ in processor.events] == ["a", "a", "b"]
+
+
+def test_ndjson_exporter_writes_finished_spans_to_file(tmp_path: Path) -> None:
+    output_file = tmp_path / "traces.jsonl"
+    with Trace(span_processors=[NdjsonSpanExporter(output_file)]):
+        with Span(name="child") as span:
+            span.add_event(ExceptionRaised(exception_type="ValueError", exception_message="boom"))
+        assert span.events == []
+        assert span.event_counts == {"ExceptionRaised": 1}
+    exported_spans = [json.loads(line) for line in output_file.read_text().splitlines()]
+    assert [exported_span["name"] for exported_span in exported_spans] == ["child", "RootSpan"]
+    (exported_event,) = exported_spans[0]["events"]
+    # Events are serialized with all the fields of their own type
+    assert exported_event["type"] == "ExceptionRaised"
+    assert exported_event["exception_type"] == "ValueError"
+
+
+def test_ndjson_exporter_releases_events_after_all_processors_ended() -> None:
+    class EventCountingSpanProcessor(DummySpanProcessor):
+        def __init__(self) -> None:
+            super().__init__()
+            self.number_of_events_on_end: list[int] = []
+
+        def on_end(self, span: Span) -> None:
+            super().on_end(span)
+            self.number_of_events_on_end.append(len(span.events))
+
+    stream = io.StringIO()
+    counting_processor = EventCountingSpanProcessor()
+    with Trace(span_processors=[NdjsonSpanExporter(stream), counting_processor]):
+        with Span() as span:
+            span.add_event(Event())
+    assert counting_processor.number_of_events_on_end == [1, 0]
+    assert span.events == []
+    assert len(stream.getvalue().splitlines()) == 2
+
+
+def test_ndjson_exporter_can_keep_exported_spans_in_memory() -> None:
+    stream = io.StringIO()
+    with Trace(span_processors=[NdjsonSpanExporter(stream, release_exported_spans=False)]):
+        with Span() as span:
+            span.add_event(Event())
+    assert len(span.events) == 1
+    # Streams passed by the user are not closed on shutdown
+    assert not stream.closed
+
+
+def test_ndjson_exporter_writes_to_socket() -> None:
+    reader, writer = socket.socketpair()
+    try:
+        with Trace(span_processors=[NdjsonSpanExporter(writer)]):
+            with Span(name="socket_span"):
+                pass
+        writer.shutdown(socket.SHUT_WR)
+        received = b""
+        while chunk := reader.recv(4096):
+            received += chunk
+    finally:
+        reader.close()
+        writer.close()
+    exported_spans = [json.loads(line) for line in received.decode("utf-8").splitlines()]
+    assert [exported_span["name"] for exported_span in exported_spans] == [
+        "socket_span",
+        "RootSpan",
+    ]
+
+
+@pytest.mark.anyio
+async def test_ndjson_exporter_writes_finished_spans_async(tmp_path: Path) -> None:
+    output_file = tmp_path / "traces.jsonl"
+    async with Trace(span_processors=[NdjsonSpanExporter(output_file)]):
+        async with Span(name="child") as span:
+            await span.add_event_async(Event())
+    assert span.events == []
+    exported_spans = [json.loads(line) for line in output_file.read_text().splitlines()]
+    assert [exported_span["name"] for exported_span in exported_spans] == ["child", "RootSpan"]
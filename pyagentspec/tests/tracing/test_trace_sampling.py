@@ -0,0 +1,176 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import io
+import json
+import time
+import uuid
+
+import pytest
+
+from pyagentspec.tracing.events import Event, ExceptionRaised
+from pyagentspec.tracing.retentionpolicy import SpanRetentionPolicy
+from pyagentspec.tracing.sampling import TraceSamplingPolicy
+from pyagentspec.tracing.spanexporter import NdjsonSpanExporter
+from pyagentspec.tracing.spans import Span
+from pyagentspec.tracing.trace import Trace
+
+from .test_tracing import DummySpanProcessor
+
+
+def test_head_sampling_decision_is_deterministic_per_trace_id() -> None:
+    policy = TraceSamplingPolicy(sampling_rate=0.5)
+    trace_ids = [str(uuid.uuid4()) for _ in range(50)]
+    decisions = [policy.should_sample(trace_id) for trace_id in trace_ids]
+    assert decisions == [policy.should_sample(trace_id) for trace_id in trace_ids]
+
+
+def test_head_sampling_rate_is_respected() -> None:
+    policy = TraceSamplingPolicy(sampling_rate=0.1)
+    number_of_sampled_traces = sum(policy.should_sample(str(uuid.uuid4())) for _ in range(5000))
+    assert 350 < number_of_sampled_traces < 650
+
+
+def test_fully_sampled_trace_notifies_span_processors() -> None:
+    processor = DummySpanProcessor()
+    with Trace(
+        span_processors=[processor], sampling_policy=TraceSamplingPolicy(sampling_rate=1.0)
+    ) as trace:
+        assert trace.is_sampled and trace.is_recording()
+        with Span() as span:
+            span.add_event(Event())
+    assert processor.starts == [trace._root_span, span]
+    assert len(span.events) == 1
+
+
+def test_unsampled_trace_short_circuits_span_processors_and_events() -> None:
+    processor = DummySpanProcessor()
+    with Trace(
+        span_processors=[processor], sampling_policy=TraceSamplingPolicy(sampling_rate=0.0)
+    ) as trace:
+        assert not trace.is_sampled and not trace.is_recording()
+        with pytest.raises(ValueError):
+            with Span() as span:
+                assert not span.is_recording()
+                span.add_event(Event())
+                raise ValueError("not recorded")
+    assert processor.starts == processor.ends == processor.events == []
+    assert span.events == []
+    # Lifecycle hooks of the span processors are still called
+    assert processor.started_up and processor.shut_down
+
+
+def test_tail_sampling_keeps_traces_with_errors_and_replays_notifications() -> None:
+    processor = DummySpanProcessor()
+    policy = TraceSamplingPolicy(sampling_rate=0.0, keep_traces_with_errors=True)
+    with Trace(span_processors=[processor], sampling_policy=policy) as trace:
+        assert trace.is_recording() and not trace.is_sampled
+        with Span(name="ok_span") as ok_span:
+            ok_span.add_event(Event(name="ok_event"))
+        with pytest.raises(ValueError):
+            with Span(name="failing_span") as failing_span:
+                raise ValueError("boom")
+        # Nothing is forwarded while the trace is running
+        assert processor.starts == []
+    assert processor.starts == [trace._root_span, ok_span, failing_span]
+    assert processor.ends == [ok_span, failing_span, trace._root_span]
+    assert [(event.name, span) for event, span in processor.events] == [
+        ("ok_event", ok_span),
+        ("ExceptionRaised", failing_span),
+    ]
+
+
+def test_tail_sampling_drops_traces_without_errors() -> None:
+    processor = DummySpanProcessor()
+    policy = TraceSamplingPolicy(sampling_rate=0.0, keep_traces_with_errors=True)
+    with Trace(span_processors=[processor], sampling_policy=policy):
+        with Span() as span:
+            span.add_event(Event())
+    assert processor.starts == processor.ends == processor.events == []
+    # Spans are still recorded, as the decision could only be taken at the end
+    assert len(span.events) == 1
+
+
+def test_tail_sampling_applies_retention_policies_after_the_replay() -> None:
+    class EventCountingSpanProcessor(DummySpanProcessor):
+        def __init__(self) -> None:
+            super().__init__()
+            self.number_of_events_on_end: list[int] = []
+
+        def on_end(self, span: Span) -> None:
+            super().on_end(span)
+            self.number_of_events_on_end.append(len(span.events))
+
+    processor = EventCountingSpanProcessor()
+    with Trace(
+        span_processors=[processor],
+        sampling_policy=TraceSamplingPolicy(sampling_rate=0.0, keep_traces_with_errors=True),
+        retention_policy=SpanRetentionPolicy(max_events=1, release_events_on_end=True),
+    ):
+        with pytest.raises(ValueError):
+            with Span() as span:
+                span.add_event(Event(name="a"))
+                span.add_event(Event(name="b"))
+                raise ValueError("boom")
+        # The events are kept until the sampling decision
+        assert [event.name for event in span.events] == ["a", "b", "ExceptionRaised"]
+    assert processor.number_of_events_on_end == [3, 0]
+    assert span.events == []
+    assert span.event_counts == {"a": 1, "b": 1, "ExceptionRaised": 1}
+    assert span.dropped_events_count == 3
+
+
+def test_tail_sampling_applies_retention_policies_of_dropped_traces() -> None:
+    with Trace(
+        sampling_policy=TraceSamplingPolicy(sampling_rate=0.0, keep_traces_with_errors=True),
+        retention_policy=SpanRetentionPolicy(max_events=1),
+    ):
+        with Span() as span:
+            span.add_event(Event(name="a"))
+            span.add_event(Event(name="b"))
+    assert [event.name for event in span.events] == ["b"]
+    assert span.dropped_events_count == 1
+
+
+def test_ndjson_exporter_releases_replayed_spans() -> None:
+    stream = io.StringIO()
+    policy = TraceSamplingPolicy(sampling_rate=0.0, keep_traces_with_errors=True)
+    with Trace(span_processors=[NdjsonSpanExporter(stream)], sampling_policy=policy):
+        with pytest.raises(ValueError):
+            with Span(name="failing_span") as span:
+                span.add_event(Event(name="a"))
+                raise ValueError("boom")
+    exported_span = json.loads(stream.getvalue().splitlines()[0])
+    assert [event["name"] for event in exported_span["events"]] == ["a", "ExceptionRaised"]
+    assert span.events == []
+
+
+def test_tail_sampling_keeps_slow_traces() -> None:
+    fast_processor, slow_processor = DummySpanProcessor(), DummySpanProcessor()
+    policy = TraceSamplingPolicy(sampling_rate=0.0, slow_trace_threshold_ms=20)
+    with Trace(span_processors=[fast_processor], sampling_policy=policy):
+        with Span():
+            pass
+    with Trace(span_processors=[slow_processor], sampling_policy=policy):
+        with Span():
+            time.sleep(0.03)
+    assert fast_processor.starts == []
+    assert len(slow_processor.starts) == 2
+
+
+@pytest.mark.anyio
+async def test_tail_sampling_replays_notifications_async() -> None:
+    processor = DummySpanProcessor()
+    policy = TraceSamplingPolicy(sampling_rate=0.0, keep_traces_with_errors=True)
+    async with Trace(span_processors=[processor], sampling_policy=policy) as trace:
+        async with Span() as span:
+            await span.add_event_async(
+                ExceptionRaised(exception_type="ValueError", exception_message="boom")
+            )
+    assert processor.starts_async == [trace._root_span, span]
+    assert processor.ends_async == [span, trace._root_span]
+    assert len(processor.events_async) == 1
+    assert processor.starts == []
@@ -1,4 +1,4 @@
-# Copyright © 2025 Oracle and/or its affiliates.
+# Copyright © 2025, 2026 Oracle and/or its affiliates.
 #
 # This software is under the Apache License 2.0
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
@@ -12,7 +12,7 @@ from typing import List, Tuple
 import pytest
 
 from pyagentspec.tracing.events import Event, ExceptionRaised
-from pyagentspec.tracing.spanprocessor import SpanProcessor
+from pyagentspec.tracing.spanprocessor import SpanProcessor, SpanProcessorCapabilities
 from pyagentspec.tracing.spans import RootSpan
 from pyagentspec.tracing.spans.span import (
     Span,
@@ -447,3 +447,121 @@ async def test_trace_startup_shutdown_and_nesting_async(
                 pass
     assert dummy_span_processor.shut_down is False
     assert dummy_span_processor.shut_down_async is True
+
+
+class SyncOnlySpanProcessor(DummySpanProcessor):
+
+    capabilities = SpanProcessorCapabilities.SYNC
+
+    async def on_start_async(self, span: Span) -> None:
+        raise NotImplementedError
+
+    async def on_end_async(self, span: Span) -> None:
+        raise NotImplementedError
+
+    async def on_event_async(self, event: Event, span: Span) -> None:
+        raise NotImplementedError
+
+
+class AsyncOnlySpanProcessor(DummySpanProcessor):
+
+    capabilities = SpanProcessorCapabilities.ASYNC
+
+    def on_start(self, span: Span) -> None:
+        raise NotImplementedError
+
+    def on_end(self, span: Span) -> None:
+        raise NotImplementedError
+
+    def on_event(self, event: Event, span: Span) -> None:
+        raise NotImplementedError
+
+
+@pytest.mark.anyio
+async def test_sync_only_span_processor_is_called_through_sync_hooks_in_async_mode() -> None:
+    processor = SyncOnlySpanProcessor()
+    async with Trace(span_processors=[processor]) as trace:
+        async with Span() as s:
+            await s.add_event_async(Event(name="async_ev"))
+    assert processor.started_up and processor.shut_down
+    assert processor.starts == [trace._root_span, s]
+    assert [event.name for event, _ in processor.events] == ["async_ev"]
+    assert processor.ends == [s, trace._root_span]
+    assert processor.starts_async == processor.events_async == processor.ends_async == []
+
+
+def test_async_only_span_processor_is_called_through_async_hooks_in_sync_mode() -> None:
+    processor = AsyncOnlySpanProcessor()
+    with Trace(span_processors=[processor]) as trace:
+        with Span() as s:
+            s.add_event(Event(name="sync_ev"))
+    assert processor.started_up_async and processor.shut_down_async
+    assert processor.starts_async == [trace._root_span, s]
+    assert [event.name for event, _ in processor.events_async] == ["sync_ev"]
+    assert processor.ends_async == [s, trace._root_span]
+    assert processor.starts == processor.events == processor.ends == []
+
+
+@pytest.mark.anyio
+async def test_async_only_span_processor_can_be_used_in_sync_mode_inside_event_loop() -> None:
+    processor = AsyncOnlySpanProcessor()
+    with Trace(span_processors=[processor]):
+        with Span() as s:
+            s.add_event(Event(name="sync_ev"))
+    assert [event.name for event, _ in processor.events_async] == ["sync_ev"]
+
+
+class LoopRecordingSpanProcessor(AsyncOnlySpanProcessor):
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.loops: List[asyncio.AbstractEventLoop] = []
+
+    async def on_event_async(self, event: Event, span: Span) -> None:
+        self.loops.append(asyncio.get_running_loop())
+        await super().on_event_async(event, span)
+
+
+@pytest.mark.anyio
+async def test_async_only_span_processor_hooks_run_on_one_loop_inside_event_loop() -> None:
+    processor = LoopRecordingSpanProcessor()
+    with Trace(span_processors=[processor]):
+        with Span() as s:
+            s.add_event(Event(name="first_ev"))
+            s.add_event(Event(name="second_ev"))
+    first_loop, second_loop = processor.loops
+    assert first_loop is second_loop
+    assert first_loop is not asyncio.get_running_loop()
+    # The loop is stopped when the processor is shut down
+    assert processor.shut_down_async
+    for _ in range(100):
+        if first_loop.is_closed():
+            break
+        await asyncio.sleep(0.01)
+    assert first_loop.is_closed()
+
+
+def test_trace_dispatch_plan_follows_span_processors_updates() -> None:
+    first_processor, second_processor = DummySpanProcessor(), DummySpanProcessor()
+    with Trace(span_processors=[first_processor]) as trace:
+        trace.span_processors = [second_processor]
+        with Span() as s:
+            pass
+    assert s not in first_processor.starts
+    assert second_processor.starts == [s]
+
+
+def test_trace_dispatch_plan_follows_in_place_span_processors_updates() -> None:
+    first_processor, second_processor = DummySpanProcessor(), AsyncOnlySpanProcessor()
+    with Trace(span_processors=[first_processor]) as trace:
+        trace.span_processors.append(second_processor)
+        with Span() as first_span:
+            pass
+        first_dispatcher = trace._dispatch_plan[0]
+        trace.span_processors.remove(second_processor)
+        with Span() as second_span:
+            pass
+        # The dispatchers of the span processors that are still active are reused
+        assert trace._dispatch_plan[0] is first_dispatcher
+    assert first_processor.starts[1:] == [first_span, second_span]
+    assert second_processor.starts_async == [first_span]